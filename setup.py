@@ -51,7 +51,8 @@ setup(
     install_requires=INSTALL_REQUIRES,
     tests_require=TESTS_REQUIRE,
     extras_require={
-        "rnn": ["numba>=0.34.0"]  # GRU and vanilla RNN require numba-acceleration
+        "rnn": ["numba>=0.34.0"],  # GRU and vanilla RNN require numba-acceleration
+        "sparse": ["scipy"],  # mygrad.sparse is backed by scipy.sparse
     },
     url=URL,
     download_url="https://github.com/rsokl/mygrad/tarball/" + versioneer.get_version(),
@@ -4,7 +4,10 @@ from mygrad.tensor_base import (  # isort:skip  # avoid an import cycle
     tensor,
     Tensor,
 )
+from importlib import import_module as _import_module
+
 from mygrad._dtype_mirrors import *
+from mygrad._utils.backward_scheduling import parallel_backward
 from mygrad._utils.graph_tracking import no_autodiff
 from mygrad._utils.lock_management import (
     mem_guard_active,
@@ -13,32 +16,235 @@ from mygrad._utils.lock_management import (
     turn_memory_guarding_off,
     turn_memory_guarding_on,
 )
-from mygrad.indexing_routines.funcs import *
-from mygrad.linalg.funcs import einsum
-from mygrad.math.arithmetic.funcs import *
+from mygrad._utils.precision import mixed_precision
 from mygrad.math.consts import *
-from mygrad.math.exp_log.funcs import *
-from mygrad.math.hyperbolic_trig.funcs import *
-from mygrad.math.misc.funcs import *
-from mygrad.math.nondifferentiable import any, argmax, argmin
-from mygrad.math.sequential.funcs import *
-from mygrad.math.sequential.funcs import max, min
-from mygrad.math.trigonometric.funcs import *
-from mygrad.nnet.layers.utils import sliding_window_view
-from mygrad.no_grad_funcs import *
-from mygrad.tensor_creation.funcs import *
-from mygrad.tensor_manip.array_shape.funcs import *
-from mygrad.tensor_manip.tensor_joining.funcs import *
-from mygrad.tensor_manip.tiling.funcs import *
-from mygrad.tensor_manip.transpose_like.funcs import *
-from mygrad.ufuncs._ufunc_creators import ufunc
-
-from . import random
-from ._version import get_versions
-
-__version__ = get_versions()["version"]
-del get_versions
-
-
-setattr(Tensor, "clip", clip)
+from mygrad.serialization import load, save
+
+# The following are only imported upon first access, via the module-level
+# `__getattr__`, so that `import mygrad` is fast.
+#
+# module -> the public names that it provides. These modules register mygrad's
+# overrides of NumPy's functions and ufuncs upon being imported.
+_LAZY_FUNCTION_MODULES = {
+    "mygrad.indexing_routines.funcs": ("where",),
+    "mygrad.linalg.funcs": ("einsum",),
+    "mygrad.math.arithmetic.funcs": (
+        "add",
+        "add_sequence",
+        "divide",
+        "multiply",
+        "multiply_sequence",
+        "negative",
+        "positive",
+        "power",
+        "reciprocal",
+        "square",
+        "subtract",
+        "true_divide",
+    ),
+    "mygrad.math.exp_log.funcs": (
+        "exp",
+        "exp2",
+        "expm1",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "logaddexp2",
+    ),
+    "mygrad.math.hyperbolic_trig.funcs": (
+        "arccosh",
+        "arccoth",
+        "arccsch",
+        "arcsinh",
+        "arctanh",
+        "cosh",
+        "coth",
+        "csch",
+        "sech",
+        "sinh",
+        "tanh",
+    ),
+    "mygrad.math.misc.funcs": (
+        "abs",
+        "absolute",
+        "cbrt",
+        "clip",
+        "matmul",
+        "maximum",
+        "minimum",
+        "multi_matmul",
+        "sqrt",
+    ),
+    "mygrad.math.nondifferentiable": ("any", "argmax", "argmin"),
+    "mygrad.math.sequential.funcs": (
+        "amax",
+        "amin",
+        "cumprod",
+        "cumsum",
+        "max",
+        "mean",
+        "min",
+        "prod",
+        "std",
+        "sum",
+        "var",
+    ),
+    "mygrad.math.trigonometric.funcs": (
+        "arccos",
+        "arccot",
+        "arccsc",
+        "arcsec",
+        "arcsin",
+        "arctan",
+        "arctan2",
+        "cos",
+        "cot",
+        "csc",
+        "sec",
+        "sin",
+        "sinc",
+        "tan",
+    ),
+    "mygrad.no_grad_funcs": (
+        "allclose",
+        "bincount",
+        "can_cast",
+        "ceil",
+        "copyto",
+        "divmod",
+        "equal",
+        "floor",
+        "floor_divide",
+        "fmod",
+        "greater",
+        "greater_equal",
+        "isclose",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "isnat",
+        "less",
+        "less_equal",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "may_share_memory",
+        "min_scalar_type",
+        "mod",
+        "not_equal",
+        "remainder",
+        "result_type",
+        "rint",
+        "shape",
+        "shares_memory",
+        "sign",
+        "signbit",
+        "trunc",
+    ),
+    "mygrad.tensor_creation.funcs": (
+        "arange",
+        "empty",
+        "empty_like",
+        "eye",
+        "from_dlpack",
+        "full",
+        "full_like",
+        "geomspace",
+        "identity",
+        "linspace",
+        "logspace",
+        "ones",
+        "ones_like",
+        "zeros",
+        "zeros_like",
+    ),
+    "mygrad.tensor_manip.array_shape.funcs": (
+        "broadcast_to",
+        "expand_dims",
+        "ravel",
+        "reshape",
+        "squeeze",
+    ),
+    "mygrad.tensor_manip.tensor_joining.funcs": ("concatenate", "stack"),
+    "mygrad.tensor_manip.tensor_splitting.funcs": ("split", "unstack"),
+    "mygrad.tensor_manip.tiling.funcs": ("repeat",),
+    "mygrad.tensor_manip.transpose_like.funcs": (
+        "moveaxis",
+        "roll",
+        "swapaxes",
+        "transpose",
+    ),
+    "mygrad.ufuncs._ufunc_creators": ("ufunc",),
+}
+
+_LAZY_SUBMODULES = (
+    "amp",
+    "data",
+    "linalg",
+    "math",
+    "nnet",
+    "optim",
+    "parallel",
+    "random",
+    "tensor_creation",
+    "testing",
+)
+
+# name -> module
+_LAZY_NAMES = {
+    "custom_op": "mygrad.custom_ops",
+    "data_parallel": "mygrad.parallel",
+    "graph_memory": "mygrad.memory",
+    "sliding_window_view": "mygrad.nnet.layers.utils",
+}
+_LAZY_NAMES.update(
+    (name, module) for module, names in _LAZY_FUNCTION_MODULES.items() for name in names
+)
+
+_function_modules_loaded = False
+
+
+def _load_function_modules() -> bool:
+    """Imports all of the lazily-loaded function modules, so that mygrad's
+    overrides of NumPy's functions and ufuncs are registered.
+
+    Returns ``True`` if this call imported the modules."""
+    global _function_modules_loaded
+    if _function_modules_loaded:
+        return False
+    for module in _LAZY_FUNCTION_MODULES:
+        _import_module(module)
+    _function_modules_loaded = True
+    return True
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(_import_module(_LAZY_NAMES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = _import_module(f"{__name__}.{name}")
+    elif name == "__version__":
+        # versioneer writes the version into `_version.py` at build-time; from a
+        # source checkout, computing it can require calls to git
+        from ._version import get_versions
+
+        value = get_versions()["version"]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_SUBMODULES))
+
+
 execute_op = Tensor._op
+
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_")}.union(_LAZY_NAMES)
+)
@@ -1,20 +1,23 @@
 from abc import ABC, abstractmethod
-from functools import wraps
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from typing import (
     TYPE_CHECKING,
     Callable,
-    Dict,
     Generator,
     Generic,
     Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
 from weakref import ReferenceType
 
+import numpy as np
+
 if TYPE_CHECKING:  # pragma: no cover
     from mygrad import Tensor
     from mygrad.operation_base import Operation
@@ -108,6 +111,34 @@ class SkipGradient(Exception):
     been computed, scaled, and back-propped, skip gradient calculation."""
 
 
+@lru_cache(maxsize=1024)
+def _reduction_plan(
+    grad_shape: Tuple[int, ...], var_shape: Tuple[int, ...]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Returns ``(axes, out_shape)``: the axes of a gradient of shape
+    `grad_shape` that must be sum-reduced so that it matches `var_shape` - its
+    leading axes, followed by the axes along which the variable was
+    broadcast - and the shape of the reduced gradient.
+
+    This is memoized, since the same pairs of shapes recur on each pass
+    through a computational graph."""
+    if len(grad_shape) < len(var_shape):
+        raise ValueError(
+            f"The dimensionality of the gradient of the broadcasted "
+            f"operation ({len(grad_shape)}) is less than that of its associated "
+            f"variable ({len(var_shape)})"
+        )
+    num_leading = len(grad_shape) - len(var_shape)
+    keepdims = tuple(
+        n for n, i in enumerate(grad_shape[num_leading:]) if i != var_shape[n]
+    )
+    axes = tuple(range(num_leading)) + tuple(n + num_leading for n in keepdims)
+    out_shape = tuple(
+        1 if n in keepdims else i for n, i in enumerate(grad_shape[num_leading:])
+    )
+    return axes, out_shape
+
+
 def reduce_broadcast(grad, var_shape):
     """Sum-reduce axes of `grad` so its shape matches `var_shape.
 
@@ -132,28 +163,19 @@ def reduce_broadcast(grad, var_shape):
     if grad.shape == var_shape:
         return grad
 
-    if grad.ndim != len(var_shape):
-        if grad.ndim < len(var_shape):
-            raise ValueError(
-                f"The dimensionality of the gradient of the broadcasted "
-                f"operation ({grad.ndim}) is less than that of its associated variable "
-                f"({len(var_shape)})"
-            )
-        grad = grad.sum(axis=tuple(range(grad.ndim - len(var_shape))))
-
-    keepdims = tuple(n for n, i in enumerate(grad.shape) if i != var_shape[n])
-    if keepdims:
-        grad = grad.sum(axis=keepdims, keepdims=True)
-
-    return grad
+    # the leading axes and the broadcast axes are reduced in a single pass
+    axes, out_shape = _reduction_plan(grad.shape, var_shape)
+    return np.add.reduce(grad, axis=axes).reshape(out_shape)
 
 
 class ContextTracker(ABC):
     """A context manager and decorator for managing a boolean
-    global state"""
+    global state.
 
-    # tracks context depth
-    _depth = 0  # type: int
+    The states that are restored upon exiting nested contexts are
+    tracked per-thread (and per asyncio task), thus a context tracker
+    can be used concurrently by multiple threads as long as its
+    ``state`` is also context-local."""
 
     # the value that the state is set to upon entering the context
     _enter_set_value: Optional[bool] = None
@@ -169,20 +191,27 @@ class ContextTracker(ABC):
         raise NotImplementedError()
 
     def __init__(self):
-        # keeps track of what MemGuard was at a given depth
-        self._depth_tracker: Dict[int, bool] = dict()
+        # keeps track of what the state was prior to entering each
+        # level of nested contexts
+        self._saved_states: ContextVar[Tuple[bool, ...]] = ContextVar(
+            f"{type(self).__name__}_saved_states", default=()
+        )
+
+    @property
+    def _depth(self) -> int:
+        return len(self._saved_states.get())
 
     def __bool__(self) -> bool:  # pragma: no cover
         return self.state
 
     def __enter__(self):
-        self._depth_tracker[self._depth] = self.state
-        self._depth += 1
+        self._saved_states.set(self._saved_states.get() + (self.state,))
         self.state = self._enter_set_value
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._depth -= 1
-        self.state = self._depth_tracker.pop(self._depth)
+        saved_states = self._saved_states.get()
+        self._saved_states.set(saved_states[:-1])
+        self.state = saved_states[-1]
 
     def __call__(self, func: Callable) -> Callable:
         """Decorates a function within the context"""
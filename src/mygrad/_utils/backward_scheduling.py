@@ -0,0 +1,333 @@
+"""
+Provides user interface for back-propagating through independent branches of a
+computational graph concurrently
+"""
+import os
+import sys
+import threading
+from contextvars import ContextVar, copy_context
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+import mygrad._utils.precision as _precision
+from mygrad._utils import ContextTracker
+from mygrad.operation_base import _GRAD_SINK, Operation, _owned_grad
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from mygrad import Tensor
+    from mygrad._utils import WeakRef
+
+__all__ = ["parallel_backward", "parallel_backprop"]
+
+
+# If `True`, `Tensor.backward()` back-propagates through independent branches of
+# the computational graph concurrently, using a pool of threads.
+#
+# This state is local to each thread (and asyncio task). It is accessed as
+# the module attribute `PARALLEL_BACKWARD`.
+_PARALLEL_BACKWARD = ContextVar(
+    "PARALLEL_BACKWARD", default=False
+)  # type: ContextVar[bool]
+
+
+def _set_parallel_backward(value: bool):
+    if not isinstance(value, bool):  # pragma: no cover
+        raise TypeError(
+            f"PARALLEL_BACKWARD must be set to a boolean value, got {value} (type={type(value)})"
+        )
+    _PARALLEL_BACKWARD.set(value)
+
+
+class _BackwardSchedulingModule(ModuleType):
+    @property
+    def PARALLEL_BACKWARD(self) -> bool:
+        return _PARALLEL_BACKWARD.get()
+
+    @PARALLEL_BACKWARD.setter
+    def PARALLEL_BACKWARD(self, value: bool):
+        _set_parallel_backward(value)
+
+
+sys.modules[__name__].__class__ = _BackwardSchedulingModule
+
+
+_NUM_THREADS = int(os.environ.get("MYGRAD_BACKWARD_THREADS", os.cpu_count() or 1))
+
+# the pool is shared by all back-propagations and is created upon first use
+_executor: Optional["ThreadPoolExecutor"] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> "ThreadPoolExecutor":
+    # imported here, rather than at module-level, to keep `import mygrad` fast
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, _NUM_THREADS),
+                thread_name_prefix="mygrad-backward",
+            )
+        return _executor
+
+
+# (var, backed_grad, upstream_grad) for each gradient computed by an operation
+Contributions = List[Tuple["Tensor", np.ndarray, np.ndarray]]
+
+
+def _run_backward(op: Operation, grad: np.ndarray, graph) -> Contributions:
+    """Computes the gradients that `op` back-propagates to its inputs, without
+    accumulating them."""
+    contributions = []
+    _GRAD_SINK.set(contributions)
+    op.backward(grad, graph=graph)
+    return contributions
+
+
+class _Accumulator:
+    """Sums the gradients back-propagated to a tensor by the operations that
+    consume it, in a fixed order - the ranks of those operations - regardless of
+    the order in which the operations finish."""
+
+    __slots__ = ("var", "ranks", "num_summed", "pending", "total")
+
+    def __init__(self, var: "Tensor"):
+        self.var = var
+        self.ranks: List[int] = []
+        self.num_summed = 0
+        self.pending: Dict[int, Contributions] = {}
+        self.total: Optional[np.ndarray] = None
+
+    def add(self, rank: int, contributions: Contributions) -> bool:
+        """Records the gradients from operation-`rank`; returns `True` once all
+        of the operations that consume the tensor have been recorded."""
+        self.pending[rank] = contributions
+        while (
+            self.num_summed < len(self.ranks)
+            and self.ranks[self.num_summed] in self.pending
+        ):
+            for _, backed_grad, upstream in self.pending.pop(
+                self.ranks[self.num_summed]
+            ):
+                if self.total is None:
+                    self.total = _owned_grad(
+                        backed_grad,
+                        upstream,
+                        _precision.accumulation_dtype(self.var.dtype),
+                    )
+                else:
+                    self.total += backed_grad
+            self.num_summed += 1
+        return self.num_summed == len(self.ranks)
+
+    def finalize(self, graph: Set["WeakRef[Operation]"]) -> bool:
+        """Sets the tensor's gradient; returns `True` if the tensor has a
+        gradient to back-propagate."""
+        var = self.var
+        total = self.total
+        self.total = None
+
+        var._ops.difference_update(graph)
+        var._accum_ops.clear()
+
+        if total is None:
+            return var._grad is not None
+
+        if var._grad is not None:
+            # an operation wrote to the gradient directly (e.g. GRU)
+            var._grad += total
+            return True
+
+        buffer = var._grad_buffer
+        if buffer is not None and buffer.dtype == total.dtype:
+            # gradient is written into preallocated (shared) memory
+            np.copyto(buffer, total)
+            total = buffer
+        var._grad = total
+        return True
+
+
+def parallel_backprop(tensor: "Tensor", graph: Set["WeakRef[Operation]"]):
+    """Back-propagates ``tensor.grad`` through ``graph``, executing the
+    ``backward`` methods of operations whose upstream gradients are complete
+    concurrently.
+
+    Gradients are only ever accumulated on the calling thread, and the
+    gradients flowing into a tensor are always summed in the same order.
+    Thus the results do not depend on the order in which concurrently-run
+    operations finish.
+
+    Parameters
+    ----------
+    tensor : Tensor
+        The terminal node of the graph, whose gradient has been set.
+
+    graph : Set[WeakRef[Operation]]
+        The set of all operations relevant to ``tensor``.
+    """
+    # Rank the operations in a depth-first order from the terminal node, and
+    # record which operations consume each (non-constant) tensor.
+    ranks: Dict[int, int] = {}  # id(op) -> rank
+    accumulators: Dict[int, _Accumulator] = {}  # id(var) -> accumulator
+    inputs: List[List[_Accumulator]] = []  # rank -> unique inputs of op
+
+    stack = [tensor.creator]
+    while stack:
+        op = stack.pop()
+        if id(op) in ranks:
+            continue
+        rank = ranks[id(op)] = len(inputs)
+
+        op_inputs = []
+        for var in op.variables:
+            if var.constant:
+                continue
+            acc = accumulators.get(id(var))
+            if acc is None:
+                acc = accumulators[id(var)] = _Accumulator(var)
+            if acc.ranks and acc.ranks[-1] == rank:
+                continue
+            acc.ranks.append(rank)
+            op_inputs.append(acc)
+        inputs.append(op_inputs)
+
+        stack.extend(
+            var.creator
+            for var in reversed(op.variables)
+            if not var.constant and var.creator is not None
+        )
+
+    executor = None
+    ready: List[Tuple[Operation, np.ndarray]] = []
+    running: Dict["Future", Operation] = {}
+
+    def schedule(var: "Tensor"):
+        # schedules the back-propagation through the creator of `var`, whose
+        # gradient is complete
+        op = var.creator
+        if op._outputs is None:
+            ready.append((op, var._grad))
+            return
+
+        # an operation with multiple outputs back-propagates once all of its
+        # outputs have received their gradients
+        grads = op._gather_output_grads(var, graph)
+        if grads is not None:
+            ready.append((op, grads))
+
+    def complete(op: Operation, contributions: Contributions):
+        rank = ranks[id(op)]
+        by_var: Dict[int, Contributions] = {id(acc.var): [] for acc in inputs[rank]}
+        for item in contributions:
+            by_var[id(item[0])].append(item)
+
+        for acc in inputs[rank]:
+            if acc.add(rank, by_var[id(acc.var)]):
+                if acc.finalize(graph) and acc.var.creator is not None:
+                    schedule(acc.var)
+
+    schedule(tensor)
+
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    try:
+        while ready or running:
+            if ready:
+                # Offload all but one of the ready operations to the pool; the
+                # last one is run on this thread. Thus a chain of dependent
+                # operations never incurs the overhead of the pool.
+                if len(ready) > 1 and executor is None:
+                    executor = _get_executor()
+
+                while len(ready) > 1:
+                    op, grad = ready.pop(0)
+                    future = executor.submit(
+                        copy_context().run, _run_backward, op, grad, graph
+                    )
+                    running[future] = op
+
+                op, grad = ready.pop()
+                complete(op, copy_context().run(_run_backward, op, grad, graph))
+
+            if running:
+                # collect finished operations; block only if there is nothing
+                # else to do
+                done, _ = wait(
+                    running,
+                    timeout=0 if ready else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    op = running.pop(future)
+                    complete(op, future.result())
+    finally:
+        # don't leave operations running in the background (e.g. if an
+        # operation raised)
+        if running:
+            wait(running)
+
+
+class _ParallelBackward(ContextTracker):
+    """Serves as a context manager and decorator for enabling parallel
+    back-propagation.
+
+    Within this context, ``Tensor.backward()`` executes the back-propagation
+    through independent branches of the computational graph - e.g. the
+    branches of a multi-branch model or the members of an ensemble, up until
+    the point where they merge - concurrently on a pool of threads.
+
+    This yields a speedup when the operations in the branches spend their time
+    in NumPy routines that release the GIL, such as large ``matmul``,
+    ``tensordot``, and ``einsum`` calls. Chains of dependent operations are
+    executed on the calling thread, thus a graph with no independent branches
+    is back-propagated as usual.
+
+    Notes
+    -----
+    The results are deterministic: the gradients that flow into a tensor from
+    multiple operations are always summed in the same order, regardless of the
+    order in which the concurrently-run operations finish. This order can differ
+    from that of a sequential back-propagation, so results may differ from
+    those computed outside of this context by floating-point round-off.
+
+    The number of threads in the pool defaults to the number of CPUs; it can be
+    set via the environment variable ``MYGRAD_BACKWARD_THREADS``. Consider
+    limiting the number of threads used by NumPy's BLAS library accordingly.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> x = mg.tensor([1.0, 2.0])
+    >>> w1 = mg.tensor([[1.0], [2.0]])
+    >>> w2 = mg.tensor([[3.0], [4.0]])
+    >>> with mg.parallel_backward:
+    ...     # the two branches of the graph are back-propagated concurrently
+    ...     loss = mg.sum(x @ w1) * mg.sum(x @ w2)
+    ...     loss.backward()
+    >>> x.grad
+    array([26., 42.])
+
+    Demonstrating ``parallel_backward`` as a decorator
+
+    >>> @mg.parallel_backward
+    ... def train_step(loss):
+    ...     loss.backward()
+    """
+
+    _enter_set_value = True
+
+    @property
+    def state(self):
+        return _PARALLEL_BACKWARD.get()
+
+    @state.setter
+    def state(self, value: bool):
+        _set_parallel_backward(value)
+
+
+parallel_backward = _ParallelBackward()
@@ -81,8 +81,15 @@ def make_placeholder_tensor(
     placeholder = type(original)([])
     mirror_tensor(target=placeholder, source=original)
     placeholder._base = base
+    # only the original tensor writes its gradient into a packed buffer
+    placeholder.__dict__.pop("_grad_buffer", None)
     # point all ops involving `self` to old_tensor instead
     reroute_ops_through(target=placeholder, source=original)
+
+    creator = original._creator
+    if creator is not None and creator._outputs is not None:
+        # the placeholder holds the output of a multi-output operation
+        creator._replace_output(original, placeholder)
     return placeholder
 
 
@@ -1,7 +1,10 @@
 """
 Provides user interface for suspending computational graph tracking and back-propagation
 """
+import sys
+from contextvars import ContextVar
 from functools import wraps
+from types import ModuleType
 from typing import Callable
 
 import numpy as np
@@ -11,8 +14,33 @@ from mygrad._utils import ContextTracker
 __all__ = ["no_autodiff"]
 
 
-# If `False`, suspends all computational graph tracking and backprop
-TRACK_GRAPH = True  # type: bool
+# If `False`, suspends all computational graph tracking and backprop.
+#
+# This state is local to each thread (and asyncio task), so that, e.g., one
+# thread can run inference under `no_autodiff` while another builds a graph.
+# It is accessed as the module attribute `TRACK_GRAPH`.
+_TRACK_GRAPH = ContextVar("TRACK_GRAPH", default=True)  # type: ContextVar[bool]
+
+
+def _set_track_graph(value: bool):
+    if not isinstance(value, bool):  # pragma: no cover
+        raise TypeError(
+            f"TRACK_GRAPH must be set to a boolean value, got {value} (type={type(value)})"
+        )
+    _TRACK_GRAPH.set(value)
+
+
+class _GraphTrackingModule(ModuleType):
+    @property
+    def TRACK_GRAPH(self) -> bool:
+        return _TRACK_GRAPH.get()
+
+    @TRACK_GRAPH.setter
+    def TRACK_GRAPH(self, value: bool):
+        _set_track_graph(value)
+
+
+sys.modules[__name__].__class__ = _GraphTrackingModule
 
 
 class _NoAutoDiff(ContextTracker):
@@ -59,17 +87,11 @@ class _NoAutoDiff(ContextTracker):
 
     @property
     def state(self):
-        return TRACK_GRAPH
+        return _TRACK_GRAPH.get()
 
     @state.setter
     def state(self, value: bool):
-        if not isinstance(value, bool):  # pragma: no cover
-            raise TypeError(
-                f"TRACK_GRAPH must be set to a boolean value, got {value} (type={type(value)})"
-            )
-
-        global TRACK_GRAPH
-        TRACK_GRAPH = value
+        _set_track_graph(value)
 
     def __call__(self, func: Callable, to_numpy: bool = False) -> Callable:
         """Decorates a function so that it will have graph-tracking suspended
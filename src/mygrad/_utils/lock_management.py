@@ -2,8 +2,12 @@
 Provides utilities responsible for locking/releasing array writeability.
 """
 import os
+import sys
+import threading
 from collections import Counter, defaultdict
-from typing import TYPE_CHECKING, DefaultDict, Dict, Generator, Iterable
+from contextvars import ContextVar
+from types import ModuleType
+from typing import TYPE_CHECKING, DefaultDict, Dict, Generator, Iterable, Optional
 from weakref import finalize, ref
 
 import numpy as np
@@ -28,6 +32,12 @@ _views_waiting_for_unlock = defaultdict(
     set
 )  # type: DefaultDict[int, Set[int]] # base-id -> set of view-ids
 
+# Guards the above tables (and the writeability flags of the arrays that
+# they track) so that graphs can be built and cleared concurrently by
+# multiple threads. Re-entrant since releasing a lock can trigger garbage
+# collection, which can run finalizers that release other locks.
+_lock_tables_mutex = threading.RLock()
+
 __all__ = [
     "lock_arr_writeability",
     "release_writeability_lock_on_op",
@@ -41,7 +51,8 @@ def array_is_tracked(arr: np.ndarray) -> bool:
     """Returns True if the provided array, or a view of it, is currently
     involved in one or more mygrad operation."""
     arr_id = id(arr)
-    return arr_id in _array_tracker and _array_tracker[arr_id]() is not None
+    with _lock_tables_mutex:
+        return arr_id in _array_tracker and _array_tracker[arr_id]() is not None
 
 
 def lock_arr_writeability(arr: np.ndarray, force_lock: bool = False) -> np.ndarray:
@@ -60,12 +71,17 @@ def lock_arr_writeability(arr: np.ndarray, force_lock: bool = False) -> np.ndarr
     -------
     numpy.ndarray
         The locked array"""
+    with _lock_tables_mutex:
+        return _lock_arr_writeability(arr, force_lock)
+
+
+def _lock_arr_writeability(arr: np.ndarray, force_lock: bool) -> np.ndarray:
     arr_id = id(arr)
     if not array_is_tracked(arr):
         if (
             not force_lock
             and not arr.flags.writeable
-            and (arr.base is None or not array_is_tracked(arr.base))
+            and (not isinstance(arr.base, np.ndarray) or not array_is_tracked(arr.base))
         ):
             # array is natively read-only; don't do anything
             return arr
@@ -98,7 +114,10 @@ def unique_arrs_and_bases(
             # We must yield array bases first so that base's
             # writeability is restored first.
             # Then view's writeability can be restored
-            if arr.base is not None:
+            #
+            # An array can also be backed by a non-array buffer (e.g. shared
+            # memory), which has no writeability flag to manage
+            if isinstance(arr.base, np.ndarray):
                 base_id = id(arr.base)
                 if base_id not in seen:
                     seen.add(base_id)
@@ -121,7 +140,7 @@ def _release_lock_on_arr_writeability(arr: np.ndarray):
         # okay to unlock array
         del _array_counter[arr_id]
 
-        if arr.base is not None and arr.base.flags.writeable is False:
+        if isinstance(arr.base, np.ndarray) and arr.base.flags.writeable is False:
             # Array is view and must wait until its base is released
             # before it can be unlocked
             # Thus we are still tracking this array
@@ -139,7 +158,7 @@ def _release_lock_on_arr_writeability(arr: np.ndarray):
         _array_counter[arr_id] = num_active_ops - 1
 
     if (
-        arr.base is None
+        not isinstance(arr.base, np.ndarray)
         and arr.flags.writeable
         and (arr_id in _views_waiting_for_unlock)
     ):
@@ -190,40 +209,85 @@ def release_writeability_lock_on_op(arr_refs: WeakRefIterable[np.ndarray]):
         The arrays to be unlocked. Only one lock is released
         on each array, even if the same array occurs
         multiple times in the iterable."""
-    for arr in arr_refs:
-        _release_lock_on_arr_writeability(arr)
+    with _lock_tables_mutex:
+        for arr in arr_refs:
+            _release_lock_on_arr_writeability(arr)
+
 
+def release_all_writeability_locks(arr: np.ndarray):
+    """Releases every lock held on an array, regardless of the number of
+    ops that it is involved in.
 
-MEM_GUARD = os.environ.get("MYGRAD_MEM_GUARD", True)
+    This is for arrays that are being discarded by their tensors: the ops
+    that locked such an array can only release it while it is alive.
 
-if MEM_GUARD in {"True", "true", "1", 1, True}:
-    MEM_GUARD = True
-elif MEM_GUARD in {"False", "false", "0", 0, False}:  # pragma: no cover
-    MEM_GUARD = False
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        The array to be unlocked."""
+    with _lock_tables_mutex:
+        if array_is_tracked(arr) and _array_counter[id(arr)] > 0:
+            _array_counter[id(arr)] = 1
+            _release_lock_on_arr_writeability(arr)
+
+
+_MEM_GUARD_DEFAULT = os.environ.get("MYGRAD_MEM_GUARD", True)
+
+if _MEM_GUARD_DEFAULT in {"True", "true", "1", 1, True}:
+    _MEM_GUARD_DEFAULT = True
+elif _MEM_GUARD_DEFAULT in {"False", "false", "0", 0, False}:  # pragma: no cover
+    _MEM_GUARD_DEFAULT = False
 else:  # pragma: no cover
     from warnings import warn
 
     warn(
-        f"Environment variable MYGRAD_MEM_GUARD was set to an unknown value {MEM_GUARD}. "
-        f"Proceeding with `MEM_GUARD=True`"
+        f"Environment variable MYGRAD_MEM_GUARD was set to an unknown value "
+        f"{_MEM_GUARD_DEFAULT}. Proceeding with `MEM_GUARD=True`"
     )
-    MEM_GUARD = True
+    _MEM_GUARD_DEFAULT = True
+
+# The memory-guarding state local to each thread (and asyncio task). `None`
+# indicates that the process-wide default, `_MEM_GUARD_DEFAULT`, applies; this
+# default is what `turn_memory_guarding_on/off` sets.
+#
+# The resolved state is accessed as the module attribute `MEM_GUARD`.
+_MEM_GUARD = ContextVar("MEM_GUARD", default=None)  # type: ContextVar[Optional[bool]]
+
+
+def _get_mem_guard() -> bool:
+    state = _MEM_GUARD.get()
+    return _MEM_GUARD_DEFAULT if state is None else state
+
+
+def _set_mem_guard(value: bool):
+    if not isinstance(value, bool):  # pragma: no cover
+        raise TypeError(
+            f"MEM_GUARD must be set to a boolean value, got {value} (type={type(value)})"
+        )
+    _MEM_GUARD.set(value)
+
+
+class _LockManagementModule(ModuleType):
+    @property
+    def MEM_GUARD(self) -> bool:
+        return _get_mem_guard()
+
+    @MEM_GUARD.setter
+    def MEM_GUARD(self, value: bool):
+        _set_mem_guard(value)
+
+
+sys.modules[__name__].__class__ = _LockManagementModule
 
 
 class MemStateContext(ContextTracker):
     @property
     def state(self):
-        return MEM_GUARD
+        return _get_mem_guard()
 
     @state.setter
     def state(self, value: bool):
-        if not isinstance(value, bool):  # pragma: no cover
-            raise TypeError(
-                f"MEM_GUARD must be set to a boolean value, got {value} (type={type(value)})"
-            )
-
-        global MEM_GUARD
-        MEM_GUARD = value
+        _set_mem_guard(value)
 
 
 class _NoMemGuard(MemStateContext):
@@ -280,6 +344,9 @@ def turn_memory_guarding_off():
     """Globally disables all memory-guarding mechanisms, except
     for in contexts where they are explicitly enabled.
 
+    This sets the default for all threads; the ``mem_guard_off`` and
+    ``mem_guard_on`` contexts only affect the thread that enters them.
+
     Notes
     -----
     With memory guarding disabled, arrays participating in active
@@ -317,14 +384,18 @@ def turn_memory_guarding_off():
     >>> y.grad  # would be array([0., 1., 2.]) if graph wasn't corrupted
     array([0., 0., 0.])
     """
-    global MEM_GUARD
-    MEM_GUARD = False
+    global _MEM_GUARD_DEFAULT
+    _MEM_GUARD_DEFAULT = False
+    _MEM_GUARD.set(None)
 
 
 def turn_memory_guarding_on():
     """Globally enables all memory-guarding mechanisms, except
     for in contexts where they are explicitly disabled.
 
+    This sets the default for all threads; the ``mem_guard_off`` and
+    ``mem_guard_on`` contexts only affect the thread that enters them.
+
     Notes
     -----
     Memory guarding is enabled by default. It ensures that arrays
@@ -372,8 +443,9 @@ def turn_memory_guarding_on():
     >>> y.grad  # correct gradient is computed
     array([0., 1., 2.])
     """
-    global MEM_GUARD
-    MEM_GUARD = True
+    global _MEM_GUARD_DEFAULT
+    _MEM_GUARD_DEFAULT = True
+    _MEM_GUARD.set(None)
 
 
 def mem_guard_active() -> bool:
@@ -386,15 +458,16 @@ def mem_guard_active() -> bool:
     mem_guard_off : context manager & decorator for suspending memory guarding
     mem_guard_on : context manager & decorator for enabling memory guarding
     """
-    return MEM_GUARD
+    return _get_mem_guard()
 
 
 def force_lock_tensor_and_creators(tensor: "Tensor"):
-    unique_arrs = tuple(
-        lock_arr_writeability(arr)
-        for arr in unique_arrs_and_bases(tensor.creator.variables)
-    )
-    lock_arr_writeability(tensor.data, force_lock=True)
+    with _lock_tables_mutex:
+        unique_arrs = tuple(
+            lock_arr_writeability(arr)
+            for arr in unique_arrs_and_bases(tensor.creator.variables)
+        )
+        lock_arr_writeability(tensor.data, force_lock=True)
     tensor_refs = WeakRefIterable(unique_arrs)
     tensor_refs.append(tensor.data)
     finalize(
@@ -0,0 +1,105 @@
+"""
+Provides user interface for mixed-precision gradient accumulation
+"""
+import sys
+from contextvars import ContextVar
+from types import ModuleType
+
+import numpy as np
+
+from mygrad._utils import ContextTracker
+
+__all__ = ["mixed_precision", "accumulation_dtype"]
+
+
+# If `True`, gradients of half-precision tensors are accumulated, and
+# sequential reductions of half-precision data are computed, in float32.
+#
+# This state is local to each thread (and asyncio task). It is accessed as
+# the module attribute `FP32_ACCUMULATION`.
+_FP32_ACCUMULATION = ContextVar(
+    "FP32_ACCUMULATION", default=False
+)  # type: ContextVar[bool]
+
+
+def _set_fp32_accumulation(value: bool):
+    if not isinstance(value, bool):  # pragma: no cover
+        raise TypeError(
+            f"FP32_ACCUMULATION must be set to a boolean value, got {value} (type={type(value)})"
+        )
+    _FP32_ACCUMULATION.set(value)
+
+
+class _PrecisionModule(ModuleType):
+    @property
+    def FP32_ACCUMULATION(self) -> bool:
+        return _FP32_ACCUMULATION.get()
+
+    @FP32_ACCUMULATION.setter
+    def FP32_ACCUMULATION(self, value: bool):
+        _set_fp32_accumulation(value)
+
+
+sys.modules[__name__].__class__ = _PrecisionModule
+
+_HALF = np.dtype(np.float16)
+_SINGLE = np.dtype(np.float32)
+
+
+def accumulation_dtype(dtype: np.dtype) -> np.dtype:
+    """Returns the data type in which a gradient for a tensor of the
+    specified dtype is accumulated.
+
+    This is float32 for half-precision tensors when mixed-precision
+    mode is active; otherwise it is ``dtype`` itself."""
+    if dtype == _HALF and _FP32_ACCUMULATION.get():
+        return _SINGLE
+    return dtype
+
+
+class _MixedPrecision(ContextTracker):
+    """Serves as a context manager and decorator for enabling mixed-precision
+    mode.
+
+    Within this context, half-precision (float16) tensors continue to store
+    their data in float16, but:
+
+    - gradients back-propagated to float16 tensors are accumulated in float32
+      (i.e. ``tensor.grad.dtype == float32``)
+    - sequential reductions (sum, mean, var, std, prod, cumsum, cumprod) of float16
+      data are computed in float32 before being stored as float16
+
+    This is best used in conjunction with :class:`mygrad.amp.LossScaler`, which
+    prevents small gradients from underflowing in float16 intermediates.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import numpy as np
+    >>> x = mg.tensor([1.0, 2.0], dtype=np.float16)
+    >>> with mg.mixed_precision:
+    ...     (x * x).sum().backward()
+    >>> x.grad.dtype
+    dtype('float32')
+
+    Demonstrating ``mixed_precision`` as a decorator
+
+    >>> @mg.mixed_precision
+    ... def train_step(x):
+    ...     # gradients of float16 tensors are accumulated
+    ...     # in float32 within this function
+    ...     pass
+    """
+
+    _enter_set_value = True
+
+    @property
+    def state(self):
+        return _FP32_ACCUMULATION.get()
+
+    @state.setter
+    def state(self, value: bool):
+        _set_fp32_accumulation(value)
+
+
+mixed_precision = _MixedPrecision()
@@ -0,0 +1,186 @@
+"""
+Utilities for mixed-precision training: tensors store their data in float16,
+while gradients are accumulated - and parameter updates are performed - in
+float32.
+"""
+from numbers import Real
+from typing import List, Sequence
+
+import numpy as np
+
+from mygrad._utils.precision import mixed_precision
+from mygrad.tensor_base import Tensor
+
+__all__ = [
+    "mixed_precision",
+    "LossScaler",
+    "make_master_copies",
+    "copy_grads_to_master",
+    "copy_master_to_model",
+]
+
+
+class LossScaler:
+    """Scales a loss prior to back-propagation so that small gradients do not
+    underflow in half precision, and dynamically adjusts the scale factor
+    based on whether or not the scaled gradients overflowed.
+
+    Parameters
+    ----------
+    init_scale : Real, optional (default=2.**16)
+        The initial scale factor.
+
+    growth_factor : Real, optional (default=2.)
+        The factor by which the scale is multiplied after ``growth_interval``
+        consecutive steps without overflow.
+
+    backoff_factor : Real, optional (default=0.5)
+        The factor by which the scale is multiplied after a step in which
+        non-finite gradients were encountered.
+
+    growth_interval : int, optional (default=2000)
+        The number of consecutive overflow-free steps after which the scale is
+        grown.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import numpy as np
+    >>> from mygrad.amp import LossScaler
+    >>> w = mg.tensor([1.0, -2.0], dtype=np.float16)
+    >>> scaler = LossScaler()
+    >>> with mg.mixed_precision:
+    ...     loss = (w ** 2).sum()
+    ...     scaler.scale(loss).backward()
+    >>> if scaler.unscale([w]):  # grads are unscaled in-place; False on overflow
+    ...     w.data -= (0.1 * w.grad).astype(w.dtype)
+    >>> scaler.update()
+    """
+
+    def __init__(
+        self,
+        init_scale: Real = 2.0 ** 16,
+        growth_factor: Real = 2.0,
+        backoff_factor: Real = 0.5,
+        growth_interval: int = 2000,
+    ):
+        if init_scale <= 0:
+            raise ValueError(f"`init_scale` must be positive, got {init_scale}")
+        if growth_factor <= 1:
+            raise ValueError(
+                f"`growth_factor` must be greater than 1, got {growth_factor}"
+            )
+        if not 0 < backoff_factor < 1:
+            raise ValueError(
+                f"`backoff_factor` must fall within (0, 1), got {backoff_factor}"
+            )
+        if growth_interval < 1:
+            raise ValueError(
+                f"`growth_interval` must be a positive integer, got {growth_interval}"
+            )
+
+        self.scale_factor = float(init_scale)
+        self.growth_factor = float(growth_factor)
+        self.backoff_factor = float(backoff_factor)
+        self.growth_interval = int(growth_interval)
+
+        # number of consecutive steps without overflow
+        self._growth_tracker = 0
+
+        # whether or not the most recently-unscaled gradients overflowed
+        self._found_inf = False
+
+    def scale(self, loss: Tensor) -> Tensor:
+        """Returns ``loss * scale_factor``, computed in (at least) float32.
+
+        Parameters
+        ----------
+        loss : Tensor
+            The (scalar) loss to be back-propagated.
+
+        Returns
+        -------
+        Tensor
+            The scaled loss."""
+        # a 0D half-precision loss is promoted to float32 by a float32 scalar
+        return loss * np.float32(self.scale_factor)
+
+    def unscale(self, params: Sequence[Tensor]) -> bool:
+        """Divides each parameter's gradient by the scale factor, in-place, and
+        checks the gradients for overflow.
+
+        Parameters
+        ----------
+        params : Sequence[Tensor]
+            The tensors whose gradients were produced by back-propagating
+            a scaled loss. Tensors without gradients are skipped.
+
+        Returns
+        -------
+        bool
+            ``True`` if all of the gradients are finite - i.e. the update step
+            should be taken - ``False`` if an overflow occurred.
+        """
+        inv_scale = 1.0 / self.scale_factor
+        found_inf = False
+        for p in params:
+            grad = p.grad
+            if grad is None:
+                continue
+            grad *= inv_scale
+            if not found_inf and not np.isfinite(grad).all():
+                found_inf = True
+        self._found_inf = found_inf
+        return not found_inf
+
+    def update(self):
+        """Updates the scale factor based on the outcome of the most recent
+        call to ``unscale``.
+
+        The scale is reduced by ``backoff_factor`` if an overflow was detected,
+        otherwise it is grown by ``growth_factor`` once ``growth_interval``
+        consecutive overflow-free steps have been taken."""
+        if self._found_inf:
+            self.scale_factor *= self.backoff_factor
+            self._growth_tracker = 0
+        else:
+            self._growth_tracker += 1
+            if self._growth_tracker == self.growth_interval:
+                self.scale_factor *= self.growth_factor
+                self._growth_tracker = 0
+        self._found_inf = False
+
+
+def make_master_copies(params: Sequence[Tensor]) -> List[Tensor]:
+    """Creates float32 "master" copies of the provided parameters.
+
+    Parameter updates should be applied to the master copies, which are then
+    cast back into the (half-precision) model parameters via
+    :func:`copy_master_to_model`.
+
+    Parameters
+    ----------
+    params : Sequence[Tensor]
+
+    Returns
+    -------
+    List[Tensor]
+        float32, non-constant copies of ``params``."""
+    return [Tensor(p.data, dtype=np.float32, constant=False) for p in params]
+
+
+def copy_grads_to_master(params: Sequence[Tensor], masters: Sequence[Tensor]):
+    """Sets the gradient of each master copy from its model parameter.
+
+    No copy is made for gradients that were already accumulated in float32
+    (i.e. in mixed-precision mode)."""
+    for p, m in zip(params, masters):
+        grad = p.grad
+        m._grad = None if grad is None else grad.astype(m.dtype, copy=False)
+
+
+def copy_master_to_model(masters: Sequence[Tensor], params: Sequence[Tensor]):
+    """Writes the values of the master copies into the model parameters,
+    casting them to the parameters' data types."""
+    for m, p in zip(masters, params):
+        np.copyto(p.data, m.data, casting="unsafe")
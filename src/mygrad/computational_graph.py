@@ -1,9 +1,444 @@
+"""
+Provides tools for inspecting, visualizing, and exporting computational graphs
+"""
+import json
+from collections import defaultdict, deque
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
 import numpy as np
-from graphviz import Digraph
 
+from mygrad.operation_base import Operation
 from mygrad.tensor_base import Tensor
 
-__all__ = ["build_graph"]
+if TYPE_CHECKING:  # pragma: no cover
+    from graphviz import Digraph
+
+__all__ = ["build_graph", "export_graph", "graph_summary", "GraphSummary"]
+
+
+# ("tensor", tensor, collapsed) | ("op", op, None) | ("edge", source, target)
+_Record = Tuple[str, Any, Any]
+
+
+def _walk(
+    fin: Tensor,
+    max_nodes: Optional[int] = None,
+    collapse: Optional[Collection[Tensor]] = None,
+) -> Iterator[_Record]:
+    """Walks the computational graph that produced ``fin`` breadth-first,
+    beginning at ``fin``, and yields its tensors, operations, and edges.
+
+    Each tensor and operation is yielded once. An edge is yielded only after
+    both of its endpoints have been yielded.
+
+    Parameters
+    ----------
+    fin : Tensor
+        The terminal node of the graph.
+
+    max_nodes : Optional[int]
+        The maximum number of tensors to yield. The tensors that are nearest to
+        ``fin`` are yielded first.
+
+    collapse : Optional[Collection[Tensor]]
+        Tensors whose creators (and the subgraphs upstream of them) are not
+        walked.
+
+    Yields
+    ------
+    Tuple[str, Any, Any]
+        ``("tensor", tensor, collapsed)``, ``("op", op, None)``, or
+        ``("edge", source, target)``
+    """
+    collapsed_ids = set() if collapse is None else {id(t) for t in collapse}
+
+    seen_tensors: Set[int] = {id(fin)}
+    seen_ops: Set[int] = set()
+
+    # edges (var -> op) that await the yielding of `var`
+    pending_edges: Dict[int, List[Operation]] = defaultdict(list)
+
+    queue = deque([fin])
+    num_tensors = 0
+    while queue:
+        if max_nodes is not None and num_tensors >= max_nodes:
+            return
+
+        t = queue.popleft()
+        num_tensors += 1
+        op = t.creator
+        is_collapsed = op is not None and id(t) in collapsed_ids
+        yield "tensor", t, is_collapsed
+
+        for consumer in pending_edges.pop(id(t), ()):
+            yield "edge", t, consumer
+
+        if op is None or is_collapsed:
+            continue
+
+        if id(op) not in seen_ops:
+            seen_ops.add(id(op))
+            yield "op", op, None
+            # an input that appears multiple times (e.g. `x * x`) has one edge
+            for var in {id(var): var for var in op.variables}.values():
+                if id(var) not in seen_tensors:
+                    seen_tensors.add(id(var))
+                    queue.append(var)
+                pending_edges[id(var)].append(op)
+        yield "edge", op, t
+
+
+class GraphSummary:
+    """Summary statistics of a computational graph.
+
+    Attributes
+    ----------
+    num_tensors : int
+        The number of tensors in the graph.
+
+    num_ops : int
+        The number of operations in the graph.
+
+    op_counts : Dict[str, int]
+        The number of operations of each type, sorted in descending order.
+
+    depth : int
+        The number of operations along the longest path through the graph.
+
+    max_fan_in : int
+        The largest number of inputs of any operation.
+
+    max_fan_out : int
+        The largest number of operations, within the graph, that any tensor is
+        an input to.
+
+    nbytes : int
+        The total bytes of the data of the graph's tensors. The memory shared by
+        views is counted once per view; see :func:`~mygrad.graph_memory` for
+        deduplicated measurements.
+
+    max_nbytes : int
+        The bytes of the data of the graph's largest tensor.
+    """
+
+    def __init__(
+        self,
+        num_tensors: int,
+        num_ops: int,
+        op_counts: Dict[str, int],
+        depth: int,
+        max_fan_in: int,
+        max_fan_out: int,
+        nbytes: int,
+        max_nbytes: int,
+    ):
+        self.num_tensors = num_tensors
+        self.num_ops = num_ops
+        self.op_counts = op_counts
+        self.depth = depth
+        self.max_fan_in = max_fan_in
+        self.max_fan_out = max_fan_out
+        self.nbytes = nbytes
+        self.max_nbytes = max_nbytes
+
+    def __repr__(self) -> str:
+        return (
+            f"GraphSummary(num_tensors={self.num_tensors}, num_ops={self.num_ops}, "
+            f"depth={self.depth}, max_fan_in={self.max_fan_in}, "
+            f"max_fan_out={self.max_fan_out}, nbytes={self.nbytes}, "
+            f"op_counts={self.op_counts})"
+        )
+
+
+def graph_summary(fin: Tensor) -> GraphSummary:
+    """Computes summary statistics of the computational graph that produced
+    ``fin``: the number of tensors and operations, the operation counts by
+    type, the graph's depth, fan-in and fan-out, and the bytes of its tensors.
+
+    The graph is traversed iteratively, in time that is linear in its size,
+    thus this is suitable for graphs of any size. The data of the tensors is
+    not inspected.
+
+    Parameters
+    ----------
+    fin : Tensor
+        The terminal node of the graph.
+
+    Returns
+    -------
+    GraphSummary
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.computational_graph import graph_summary
+    >>> x = mg.tensor([1.0, 2.0])
+    >>> y = x * x
+    >>> summary = graph_summary(mg.sum(y + x))
+    >>> summary.num_tensors, summary.num_ops
+    (4, 3)
+    >>> summary.op_counts
+    {'Sum': 1, 'Add': 1, 'Multiply': 1}
+    >>> summary.depth  # x -> y -> y + x -> sum
+    3
+    >>> summary.max_fan_out  # x feeds two operations
+    2
+    """
+    assert isinstance(fin, Tensor), "fin must be a Tensor"
+
+    op_counts: Dict[str, int] = defaultdict(int)
+    fan_out: Dict[int, int] = defaultdict(int)
+    num_tensors = 0
+    max_fan_in = 0
+    nbytes = 0
+    max_nbytes = 0
+
+    for kind, node, _ in _walk(fin):
+        if kind == "tensor":
+            num_tensors += 1
+            nbytes += node.data.nbytes
+            max_nbytes = max(max_nbytes, node.data.nbytes)
+        elif kind == "op":
+            op_counts[type(node).__name__] += 1
+            max_fan_in = max(max_fan_in, len(node.variables))
+            for var_id in {id(var) for var in node.variables}:
+                fan_out[var_id] += 1
+
+    # The depth of each tensor is computed by a post-order traversal, which is
+    # iterative to accommodate arbitrarily-deep graphs
+    depths: Dict[int, int] = {}
+    stack = [fin]
+    while stack:
+        t = stack[-1]
+        if id(t) in depths:
+            stack.pop()
+            continue
+        op = t.creator
+        if op is None:
+            depths[id(t)] = 0
+            stack.pop()
+            continue
+        unvisited = [var for var in op.variables if id(var) not in depths]
+        if unvisited:
+            stack.extend(unvisited)
+            continue
+        depths[id(t)] = 1 + max((depths[id(var)] for var in op.variables), default=0)
+        stack.pop()
+
+    return GraphSummary(
+        num_tensors=num_tensors,
+        num_ops=sum(op_counts.values()),
+        op_counts=dict(sorted(op_counts.items(), key=lambda x: x[1], reverse=True)),
+        depth=depths[id(fin)],
+        max_fan_in=max_fan_in,
+        max_fan_out=max(fan_out.values(), default=0),
+        nbytes=nbytes,
+        max_nbytes=max_nbytes,
+    )
+
+
+def _name_lookup(
+    names: Optional[Dict[str, Any]]
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """Returns the mappings: id(tensor) -> name and id(array) -> name.
+
+    These are constructed once, so that labeling each node of a graph is
+    independent of the number of names."""
+    tensor_names: Dict[int, str] = {}
+    array_names: Dict[int, str] = {}
+    if names is None:
+        return tensor_names, array_names
+
+    for key, value in names.items():
+        if isinstance(value, Tensor):
+            tensor_names.setdefault(id(value), key)
+        elif isinstance(value, np.ndarray):
+            array_names.setdefault(id(value), key)
+    return tensor_names, array_names
+
+
+def _op_label(op: Operation) -> str:
+    return type(op).__name__
+
+
+def export_graph(
+    fin: Tensor,
+    file: IO[str],
+    *,
+    format: str = "dot",
+    names: Optional[Dict[str, Union[Tensor, np.ndarray]]] = None,
+    max_nodes: Optional[int] = None,
+    collapse: Optional[Collection[Tensor]] = None,
+) -> int:
+    """Writes the structure of the computational graph that produced ``fin``
+    to a text file, node by node.
+
+    The graph is traversed iteratively and is streamed to ``file``; neither the
+    graph nor its serialized form is accumulated in memory, thus this is
+    suitable for graphs of any size. The data of the tensors is not inspected.
+    Graphviz is not required.
+
+    Parameters
+    ----------
+    fin : Tensor
+        The terminal node of the graph.
+
+    file : IO[str]
+        A writable text-file object.
+
+    format : str, optional (default="dot")
+        The format of the output. Supported values are:
+
+        - ``"dot"``: the graph, in the DOT language of Graphviz.
+        - ``"jsonl"``: JSON Lines - one JSON object per node and per edge.
+
+    names : Optional[Dict[str, Union[Tensor, numpy.ndarray]]]
+        Maps names to tensors (or to the arrays underlying tensors). A tensor
+        that appears in ``names`` is labeled by its name. E.g. pass
+        ``names=locals()`` to use the names of the local environment.
+
+    max_nodes : Optional[int]
+        The maximum number of tensors to include. The graph is traversed
+        breadth-first, starting from ``fin``, thus the tensors that are nearest
+        to ``fin`` are included.
+
+    collapse : Optional[Collection[Tensor]]
+        Tensors whose upstream subgraphs are collapsed: these tensors are
+        included, but the operations that produced them (and their inputs) are
+        not traversed.
+
+    Returns
+    -------
+    int
+        The number of tensors written.
+
+    Notes
+    -----
+    Each tensor-node records the tensor's label, shape, dtype, the bytes of its
+    data, and whether it is a constant or a collapsed subgraph. Each op-node
+    records the type of the operation. An edge connects each input tensor to
+    its operation, and each operation to its output(s).
+
+    The JSON objects are of the forms::
+
+        {"kind": "tensor", "id": ..., "label": ..., "shape": [...], "dtype": ...,
+         "nbytes": ..., "constant": ..., "collapsed": ...}
+        {"kind": "op", "id": ..., "type": ...}
+        {"kind": "edge", "source": ..., "target": ...}
+
+    Examples
+    --------
+    >>> import io
+    >>> import mygrad as mg
+    >>> from mygrad.computational_graph import export_graph
+    >>> x = mg.tensor([1.0, 2.0])
+    >>> y = mg.sum(x * x)
+    >>> file = io.StringIO()
+    >>> export_graph(y, file, format="jsonl", names={"x": x, "y": y})
+    3
+    >>> print(file.getvalue())  # doctest: +SKIP
+    {"kind": "tensor", "id": "t0", "label": "y", "shape": [], "dtype": "float64", ...}
+    {"kind": "op", "id": "o0", "type": "Sum"}
+    {"kind": "edge", "source": "o0", "target": "t0"}
+    ...
+
+    Exporting the neighborhood of the output of a very large graph
+
+    >>> with open("graph.dot", "w") as f:  # doctest: +SKIP
+    ...     export_graph(y, f, max_nodes=500)
+    """
+    assert isinstance(fin, Tensor), "fin must be a Tensor"
+    if format not in {"dot", "jsonl"}:
+        raise ValueError(f"`format` must be one of: 'dot', 'jsonl'; got {format!r}")
+
+    tensor_names, array_names = _name_lookup(names)
+
+    # Nodes are identified by compact, sequential ids
+    node_ids: Dict[int, str] = {}
+
+    def node_id(node: Union[Tensor, Operation]) -> str:
+        key = id(node)
+        if key not in node_ids:
+            node_ids[key] = ("t" if isinstance(node, Tensor) else "o") + str(
+                len(node_ids)
+            )
+        return node_ids[key]
+
+    def tensor_label(t: Tensor) -> str:
+        if id(t) in tensor_names:
+            return tensor_names[id(t)]
+        if id(t.data) in array_names:
+            return array_names[id(t.data)]
+        if not t.ndim:
+            return str(t.data)
+        return "Constant" if t.constant else "Tensor"
+
+    write: Callable[[str], Any] = file.write
+    if format == "dot":
+        write("digraph {\n")
+        write('    node [fontsize="12"]\n')
+
+    num_tensors = 0
+    for kind, a, b in _walk(fin, max_nodes=max_nodes, collapse=collapse):
+        if kind == "tensor":
+            num_tensors += 1
+            t: Tensor = a
+            if format == "dot":
+                label = f"{tensor_label(t)}\n{t.shape} {t.dtype}\n{t.data.nbytes} bytes"
+                if b:
+                    label += "\n(collapsed)"
+                style = ' style="dashed"' if b else ""
+                write(f"    {node_id(t)} [label={json.dumps(label)}{style}]\n")
+            else:
+                record = {
+                    "kind": "tensor",
+                    "id": node_id(t),
+                    "label": tensor_label(t),
+                    "shape": list(t.shape),
+                    "dtype": str(t.dtype),
+                    "nbytes": t.data.nbytes,
+                    "constant": t.constant,
+                    "collapsed": b,
+                }
+                write(json.dumps(record) + "\n")
+        elif kind == "op":
+            if format == "dot":
+                write(
+                    f"    {node_id(a)} [label={json.dumps(_op_label(a))} "
+                    'shape="box" style="filled" fillcolor="red"]\n'
+                )
+            else:
+                write(
+                    json.dumps({"kind": "op", "id": node_id(a), "type": _op_label(a)})
+                    + "\n"
+                )
+        else:
+            if format == "dot":
+                write(f"    {node_id(a)} -> {node_id(b)}\n")
+            else:
+                write(
+                    json.dumps(
+                        {"kind": "edge", "source": node_id(a), "target": node_id(b)}
+                    )
+                    + "\n"
+                )
+
+    if format == "dot":
+        write("}\n")
+    return num_tensors
 
 
 def build_graph(
@@ -15,6 +450,8 @@ def build_graph(
     dims=False,
     dtypes=False,
     sum_stats=False,
+    max_nodes=None,
+    collapse=None,
 ):
     """Builds and renders a computational graph.
 
@@ -68,14 +505,26 @@ def build_graph(
         If True, Tensor minimums, maximums, medians, and means are
         added to Node labels. These will not be displayed for scalar values.
 
+    max_nodes : Optional[int]
+        The maximum number of Tensors to include in the graph. The Tensors
+        nearest to ``fin`` are included.
+
+    collapse : Optional[Collection[mygrad.Tensor]]
+        Tensors whose upstream subgraphs are not drawn.
+
     Returns
     -------
     Union[graphviz.Digraph, None]
 
     Notes
     -----
-    build_graph requires that Graphviz is installed.
+    build_graph requires that Graphviz is installed. Use
+    :func:`~mygrad.computational_graph.export_graph` to export, and
+    :func:`~mygrad.computational_graph.graph_summary` to summarize, large graphs
+    without Graphviz.
     """
+    from graphviz import Digraph
+
     assert isinstance(fin, Tensor), "fin must be a Tensor"
     assert isinstance(names, (dict, type(None)))
     assert isinstance(render, bool)
@@ -87,7 +536,16 @@ def build_graph(
     graph = Digraph(strict=True)
     graph.node_attr.update(fontsize="12")
 
-    _add_node(fin, graph, names=names, dims=dims, dtypes=dtypes, sum_stats=sum_stats)
+    _add_nodes(
+        fin,
+        graph,
+        names=names,
+        dims=dims,
+        dtypes=dtypes,
+        sum_stats=sum_stats,
+        max_nodes=max_nodes,
+        collapse=collapse,
+    )
 
     if save:
         graph.render(filename="computational_graph", cleanup=True)
@@ -96,57 +554,73 @@ def build_graph(
         return graph
 
 
-def _add_node(node, graph, op_id=None, **kwargs):
-    """ Recursively traces computational graph and adds nodes to Digraph. """
-    node_id = str(id(node))
-    node_lab = repr(node)
-    if kwargs["names"] is not None:
-        for key in kwargs["names"]:
-            if id(kwargs["names"][key]) == id(node):
-                node_lab = key
-                break
-            elif id(kwargs["names"][key]) == id(node.data):
-                node_lab = key + "\n*Constant*"
-                node_id = str(id(node.data))
-                break
-        if node_lab == repr(node):
-            if not node.ndim:
+def _add_nodes(
+    fin: Tensor,
+    graph: "Digraph",
+    *,
+    names,
+    dims: bool,
+    dtypes: bool,
+    sum_stats: bool,
+    max_nodes: Optional[int],
+    collapse: Optional[Collection[Tensor]],
+):
+    """Traces computational graph and adds nodes to Digraph."""
+    tensor_names, array_names = _name_lookup(names)
+
+    def tensor_id(node: Tensor) -> str:
+        # tensors that are named by their underlying arrays share a node
+        if id(node) not in tensor_names and id(node.data) in array_names:
+            return str(id(node.data))
+        return str(id(node))
+
+    for kind, node, other in _walk(fin, max_nodes=max_nodes, collapse=collapse):
+        if kind == "op":
+            graph.node(
+                name=str(id(node)),
+                label=_op_label(node),
+                style="filled",
+                fillcolor="red",
+            )
+            continue
+
+        if kind == "edge":
+            graph.edge(
+                tensor_id(node) if isinstance(node, Tensor) else str(id(node)),
+                tensor_id(other) if isinstance(other, Tensor) else str(id(other)),
+            )
+            continue
+
+        node_lab = repr(node)
+        if names is not None:
+            if id(node) in tensor_names:
+                node_lab = tensor_names[id(node)]
+            elif id(node.data) in array_names:
+                node_lab = array_names[id(node.data)] + "\n*Constant*"
+            elif not node.ndim:
                 node_lab = str(node.data)
             elif node._constant:
                 node_lab = "*Constant*"
             else:
                 node_lab = "Intermediary Tensor"
 
-    if node.ndim:
-        if kwargs["dims"]:
-            node_lab += f"\nDims: {node.shape}"
-        if kwargs["dtypes"]:
-            node_lab += f"\nDtype: {node.dtype}"
-        if kwargs["sum_stats"]:
-            node_lab += (
-                f"\nMin: {np.amin(node.data)}"
-                f"\nMedian: {np.median(node.data)}"
-                f"\nMean: {np.mean(node.data)}"
-                f"\nMax: {np.amax(node.data)}"
-            )
-    else:
-        if kwargs["dtypes"]:
-            node_lab += f"\nDtype: {node.dtype}"
-
-    graph.node(name=node_id, label=node_lab)
-
-    if node._creator is None:
-        if op_id is not None:
-            graph.edge(node_id, op_id)
-        return
-    else:
-        op_lab = repr(node._creator).rpartition(".")[-1].split(" ")[0]
-        if op_id is not None:
-            graph.edge(node_id, op_id)
-        op_id = str(id(node._creator))
-
-        graph.node(name=op_id, label=op_lab, style="filled", fillcolor="red")
-        graph.edge(op_id, node_id)
-
-        for var in node._creator.variables:
-            _add_node(var, graph, op_id=op_id, **kwargs)
+        if node.ndim:
+            if dims:
+                node_lab += f"\nDims: {node.shape}"
+            if dtypes:
+                node_lab += f"\nDtype: {node.dtype}"
+            if sum_stats:
+                node_lab += (
+                    f"\nMin: {np.amin(node.data)}"
+                    f"\nMedian: {np.median(node.data)}"
+                    f"\nMean: {np.mean(node.data)}"
+                    f"\nMax: {np.amax(node.data)}"
+                )
+        else:
+            if dtypes:
+                node_lab += f"\nDtype: {node.dtype}"
+
+        if other:
+            node_lab += "\n(collapsed)"
+
+        graph.node(name=tensor_id(node), label=node_lab)
@@ -0,0 +1,244 @@
+"""
+Provides a decorator for defining differentiable operations from a pair of
+forward and backward kernels
+"""
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from mygrad._utils import SkipGradient
+from mygrad.errors import InvalidGradient
+from mygrad.operation_base import Operation
+from mygrad.tensor_base import Tensor
+from mygrad.typing import ArrayLike
+
+__all__ = ["custom_op", "CustomOperation"]
+
+
+class _Kernel:
+    """Calls a forward or backward kernel. If `jit` is `True`, the kernel is
+    compiled by numba once for each signature of its arguments - i.e. their
+    dtypes, dimensionalities and memory layouts - and the compiled
+    specializations are cached."""
+
+    __slots__ = ("py_func", "jit", "specializations")
+
+    def __init__(self, py_func: Callable, jit: bool):
+        self.py_func = py_func
+        self.jit = jit
+        self.specializations: Dict[Tuple[Any, ...], Callable] = {}
+
+    def __call__(self, *args):
+        if not self.jit:
+            return self.py_func(*args)
+
+        import numba
+
+        sig = tuple(numba.typeof(arg) for arg in args)
+        compiled = self.specializations.get(sig)
+        if compiled is None:
+            compiled = self.specializations[sig] = numba.njit(sig)(self.py_func)
+        return compiled(*args)
+
+
+class CustomOperation(Operation):
+    """The base class of the operations created by ``custom_op``.
+
+    The forward kernel computes the operation's output from the arrays
+    underlying its inputs; the backward kernel computes the gradients for all of
+    its inputs at once."""
+
+    _forward_kernel: _Kernel
+    _backward_kernel: _Kernel
+    broadcast: bool
+
+    _saved_buffers = ("_grads",)
+
+    def __call__(self, *input_vars: Tensor) -> np.ndarray:
+        self.variables = input_vars
+        self._grads: Optional[Tuple[Optional[np.ndarray], ...]] = None
+        self._out = self.forward(*(var.data for var in input_vars))
+        return self._out
+
+    @classmethod
+    def forward(cls, *arrays: np.ndarray) -> np.ndarray:
+        if cls.broadcast:
+            arrays = np.broadcast_arrays(*arrays)
+        out = np.asarray(cls._forward_kernel(*arrays))
+
+        if any(np.may_share_memory(out, arr) for arr in arrays):
+            # the output must not be a view of an input
+            out = out.copy()
+        return out
+
+    def backward_var(self, grad, index, **kwargs):
+        if self._grads is None:
+            # the kernel computes the gradients for all of the inputs at once
+            arrays = tuple(var.data for var in self.variables)
+            if self.broadcast:
+                arrays = np.broadcast_arrays(*arrays)
+
+            grads = self._backward_kernel(grad, self._out, *arrays)
+            if len(arrays) == 1 and not isinstance(grads, (tuple, list)):
+                grads = (grads,)
+
+            if not isinstance(grads, (tuple, list)) or len(grads) != len(arrays):
+                raise InvalidGradient(
+                    f"The backward kernel of `{type(self).__name__}` must return a "
+                    f"sequence of {len(arrays)} gradients - one for each input of "
+                    f"the operation - got: {type(grads)}"
+                )
+            self._grads = tuple(grads)
+
+        out = self._grads[index]
+        if out is None:
+            raise SkipGradient()
+        return out
+
+
+def custom_op(
+    forward: Optional[Callable[..., np.ndarray]] = None,
+    *,
+    backward: Callable[..., Any],
+    jit: bool = False,
+    broadcast: bool = True,
+) -> Callable[..., Tensor]:
+    """Creates a differentiable mygrad function from a forward kernel and a
+    backward kernel.
+
+    This can be used as a decorator of the forward kernel. The kernels operate on
+    NumPy arrays; optionally they are compiled by numba.
+
+    The resulting function accepts array-likes and tensors; it handles the
+    ``constant`` status of its output, broadcasting, and the locking of the
+    memory of its inputs and output, as do all of mygrad's functions.
+
+    Parameters
+    ----------
+    forward : Callable[[ndarray, ...], ndarray]
+        The forward kernel: ``forward(x1, ..., xn) -> out``. Each of its
+        positional arguments is an array underlying an input of the operation.
+        It must return the result as a new array (i.e. not as a view of an
+        input).
+
+    backward : Callable[[ndarray, ndarray, ndarray, ...], Tuple[Optional[ndarray], ...]]
+        (keyword-only argument) The backward kernel:
+        ``backward(grad, out, x1, ..., xn) -> (dx1, ..., dxn)``. Given
+        ``grad = dℒ/d(out)``, this computes ``dℒ/dxi`` for all of the inputs
+        at once, returning one gradient per input; ``None`` indicates that no
+        gradient is back-propagated to the corresponding input. A single-input
+        operation may return its gradient directly.
+
+    jit : bool, optional (default=False)
+        (keyword-only argument) If ``True``, both kernels are compiled by numba in
+        nopython mode. Each kernel is compiled for the signature (the dtypes,
+        dimensionalities and memory layouts) of the arrays that it is called
+        with, upon first encountering that signature, and the compiled
+        specializations are cached. Requires numba.
+
+    broadcast : bool, optional (default=True)
+        (keyword-only argument) If ``True``, the inputs are broadcast against one
+        another before they are passed to the kernels, thus the kernels can
+        assume that all of their array arguments have the same shape.
+        Gradients that the backward kernel returns for broadcast inputs are
+        sum-reduced to the shapes of the inputs.
+
+    Returns
+    -------
+    Callable[[ArrayLike, ..., Optional[bool]], Tensor]
+        ``f(x1, ..., xn, *, constant=None)``. Its ``Op`` attribute is the
+        underlying subclass of ``CustomOperation``.
+
+    Raises
+    ------
+    ImportError
+        ``jit=True`` was specified but numba is not installed.
+
+    Notes
+    -----
+    Numba compiles a kernel in "nopython" mode, thus it must consist only of
+    numba-compatible code, and keyword arguments are not supported.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import mygrad as mg
+
+    Defining a differentiable ``f(x, y) = x * sin(y)``
+
+    >>> def x_sin_y_bkwd(grad, out, x, y):
+    ...     return grad * np.sin(y), grad * x * np.cos(y)
+
+    >>> @mg.custom_op(backward=x_sin_y_bkwd)
+    ... def x_sin_y(x, y):
+    ...     return x * np.sin(y)
+
+    >>> x = mg.tensor([1.0, 2.0])
+    >>> y = mg.tensor(0.0)
+    >>> out = x_sin_y(x, y)
+    >>> out
+    Tensor([0., 0.])
+    >>> out.backward()
+    >>> x.grad  # sin(0)
+    array([0., 0.])
+    >>> y.grad  # the gradient is reduced to the shape of `y`
+    array(3.)
+
+    The backward kernel can make use of the output of the forward pass
+
+    >>> softplus = mg.custom_op(
+    ...     lambda x: np.logaddexp(0, x),
+    ...     backward=lambda grad, out, x: grad * (1 - np.exp(-out)),
+    ... )
+    >>> x = mg.tensor([0.0, 10.0])
+    >>> softplus(x).backward()
+    >>> x.grad
+    array([0.5      , 0.9999546])
+
+    Compiling loop-based kernels with numba (requires numba)
+
+    >>> def clip_grad(grad, out, x):
+    ...     dx = np.empty_like(grad)
+    ...     for i in range(x.size):
+    ...         dx.flat[i] = grad.flat[i] if abs(x.flat[i]) < 1 else 0.0
+    ...     return dx
+
+    >>> @mg.custom_op(backward=clip_grad, jit=True)  # doctest: +SKIP
+    ... def clip(x):
+    ...     out = np.empty_like(x)
+    ...     for i in range(x.size):
+    ...         out.flat[i] = min(max(x.flat[i], -1.0), 1.0)
+    ...     return out
+    """
+    if jit:
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The package `numba` must be installed in order to jit-compile a "
+                "custom operation."
+            )
+
+    def wrapper(forward: Callable[..., np.ndarray]) -> Callable[..., Tensor]:
+        Op: Type[CustomOperation] = type(
+            getattr(forward, "__name__", "CustomOperation"),
+            (CustomOperation,),
+            {
+                "_forward_kernel": _Kernel(forward, jit),
+                "_backward_kernel": _Kernel(backward, jit),
+                "broadcast": broadcast,
+                "__module__": getattr(forward, "__module__", __name__),
+            },
+        )
+
+        @wraps(forward)
+        def func(*inputs: ArrayLike, constant: Optional[bool] = None) -> Tensor:
+            return Tensor._op(Op, *inputs, constant=constant)
+
+        func.Op = Op
+        return func
+
+    if forward is None:
+        return wrapper
+    return wrapper(forward)
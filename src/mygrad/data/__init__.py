@@ -0,0 +1,4 @@
+from .dataset import NpyDataset
+from .loader import DataLoader
+
+__all__ = ["DataLoader", "NpyDataset"]
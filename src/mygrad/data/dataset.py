@@ -0,0 +1,116 @@
+import os
+from typing import Tuple, Union
+
+import numpy as np
+
+__all__ = ["NpyDataset"]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class NpyDataset:
+    """A dataset of one or more aligned arrays, whose rows are the dataset's
+    samples.
+
+    Arrays stored in ``.npy`` files are memory-mapped (read-only) rather than
+    loaded, so that only the rows that are actually sampled are ever read from
+    disk.
+
+    Parameters
+    ----------
+    *sources : Union[PathLike, numpy.ndarray]
+        The ``.npy`` files (or arrays) storing the data. All of the arrays must
+        have the same length along their leading axis.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mygrad.data import NpyDataset
+    >>> np.save("x.npy", np.arange(12.).reshape(6, 2))
+    >>> np.save("y.npy", np.arange(6))
+    >>> dataset = NpyDataset("x.npy", "y.npy")
+    >>> len(dataset)
+    6
+    >>> dataset[2]
+    (memmap([4., 5.]), 2)
+    >>> dataset.take([0, 3])
+    (array([[0., 1.],
+           [6., 7.]]), array([0, 3]))
+    """
+
+    def __init__(self, *sources: Union[PathLike, np.ndarray]):
+        if not sources:
+            raise ValueError("`NpyDataset` requires at least one data source")
+
+        arrays = []
+        for source in sources:
+            if isinstance(source, np.ndarray):
+                arr = source
+            elif isinstance(source, (str, os.PathLike)):
+                arr = np.load(source, mmap_mode="r", allow_pickle=False)
+            else:
+                raise TypeError(
+                    f"`NpyDataset` sources must be paths to .npy files or numpy "
+                    f"arrays, got: {type(source)}"
+                )
+
+            if arr.ndim == 0:
+                raise ValueError(
+                    "The arrays of a `NpyDataset` must have at least one dimension"
+                )
+            arrays.append(arr)
+
+        lengths = set(len(arr) for arr in arrays)
+        if len(lengths) != 1:
+            raise ValueError(
+                f"All of the arrays of a `NpyDataset` must have the same length "
+                f"along their leading axis, got lengths: {sorted(lengths)}"
+            )
+
+        self.arrays: Tuple[np.ndarray, ...] = tuple(arrays)
+
+    def __len__(self) -> int:
+        return len(self.arrays[0])
+
+    def __getitem__(self, index: int) -> Tuple[np.ndarray, ...]:
+        return tuple(arr[index] for arr in self.arrays)
+
+    def take(self, indices, out=None) -> Tuple[np.ndarray, ...]:
+        """Gathers the samples at the specified indices.
+
+        Parameters
+        ----------
+        indices : ArrayLike[int], shape-(N,)
+            The indices of the samples.
+
+        out : Optional[Tuple[numpy.ndarray, ...]]
+            Arrays - one per data source, each with ``N`` rows - that the
+            samples are written into.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, ...]
+            The gathered samples."""
+        if out is None:
+            return tuple(
+                np.take(np.asarray(arr), indices, axis=0) for arr in self.arrays
+            )
+
+        indices = np.asarray(indices)
+        if indices.size and not (
+            -len(self) <= indices.min() and indices.max() < len(self)
+        ):
+            raise IndexError(
+                f"Sample indices must fall within [{-len(self)}, {len(self)}), got: "
+                f"[{indices.min()}, {indices.max()}]"
+            )
+
+        if indices.size and indices.min() < 0:
+            # "clip" mode does not support negative indices
+            indices = indices % len(self)
+
+        for arr, buffer in zip(self.arrays, out):
+            # indices have been validated; `mode="clip"` lets numpy write directly
+            # to `out` rather than to an intermediate buffer
+            np.take(arr, indices, axis=0, out=buffer, mode="clip")
+        return tuple(out)
@@ -0,0 +1,269 @@
+import queue
+import threading
+import weakref
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+from .dataset import NpyDataset
+
+__all__ = ["DataLoader"]
+
+Batch = Union[Tensor, Tuple[Tensor, ...]]
+
+# signals that all batches of an epoch have been produced
+_DONE = object()
+
+
+class DataLoader:
+    """Iterates over minibatches of a dataset, assembling upcoming batches in a
+    background thread so that disk I/O and batch assembly overlap with
+    computation (e.g. ``backward()``) on the main thread.
+
+    Batches are gathered into a small pool of preallocated arrays that are
+    reused across batches and epochs, and are yielded as constant tensors that
+    share memory with these arrays (i.e. no copy is made).
+
+    Parameters
+    ----------
+    dataset : NpyDataset
+        The dataset to be sampled.
+
+    batch_size : int
+        The number of samples in each batch.
+
+    shuffle : bool, optional (default=True)
+        If ``True``, the samples are drawn in a new random order each epoch.
+
+    drop_last : bool, optional (default=False)
+        If ``True``, the final batch of an epoch is dropped if it contains fewer
+        than ``batch_size`` samples.
+
+    prefetch : int, optional (default=2)
+        The number of batches to assemble ahead of time. If ``0``, batches are
+        assembled on the main thread, when requested.
+
+    seed : Optional[int]
+        Seeds the random shuffling of the samples.
+
+    Notes
+    -----
+    The memory of a yielded batch is reused once the *next* batch is requested.
+    Thus a batch must not be used after advancing the iterator, unless it was
+    copied. The exception to this is a batch that is still participating in a
+    computational graph: MyGrad's memory-guarding marks the batch's array as
+    read-only, and such an array is never overwritten - it is replaced in the
+    pool by a newly-allocated array instead.
+
+    Within a shuffled batch, the samples are ordered by their positions in the
+    dataset so that memory-mapped files are read sequentially.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mygrad.data import DataLoader, NpyDataset
+    >>> dataset = NpyDataset(np.arange(10.).reshape(5, 2), np.arange(5))
+    >>> loader = DataLoader(dataset, batch_size=2, shuffle=False)
+    >>> len(loader)
+    3
+    >>> for x, y in loader:
+    ...     print(x.shape, y)
+    (2, 2) Tensor([0, 1])
+    (2, 2) Tensor([2, 3])
+    (1, 2) Tensor([4])
+    """
+
+    def __init__(
+        self,
+        dataset: NpyDataset,
+        batch_size: int,
+        *,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        prefetch: int = 2,
+        seed: Optional[int] = None,
+    ):
+        if not isinstance(dataset, NpyDataset):
+            raise TypeError(
+                f"`dataset` must be an instance of `NpyDataset`, got: {type(dataset)}"
+            )
+
+        if batch_size < 1:
+            raise ValueError(
+                f"`batch_size` must be a positive integer, got {batch_size}"
+            )
+
+        if prefetch < 0:
+            raise ValueError(
+                f"`prefetch` must be a non-negative integer, got {prefetch}"
+            )
+
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = prefetch
+        self._rng = np.random.default_rng(seed)
+
+        # The pool of reusable batch-buffers. Each buffer is a tuple of arrays,
+        # one per data source.
+        self._buffers: List[Tuple[np.ndarray, ...]] = [
+            self._new_buffer() for _ in range(prefetch + 1)
+        ]
+        self._active: Optional["weakref.ReferenceType[_PrefetchIterator]"] = None
+
+    def _new_buffer(self) -> Tuple[np.ndarray, ...]:
+        return tuple(
+            np.empty((self.batch_size,) + arr.shape[1:], dtype=arr.dtype)
+            for arr in self.dataset.arrays
+        )
+
+    def __len__(self) -> int:
+        num_batches, remainder = divmod(len(self.dataset), self.batch_size)
+        if remainder and not self.drop_last:
+            num_batches += 1
+        return num_batches
+
+    def _batch_indices(self) -> List[np.ndarray]:
+        num_samples = len(self.dataset)
+        if self.shuffle:
+            order = self._rng.permutation(num_samples)
+        else:
+            order = np.arange(num_samples)
+
+        batches = [
+            order[start : start + self.batch_size]
+            for start in range(0, num_samples, self.batch_size)
+        ]
+        if batches and self.drop_last and len(batches[-1]) < self.batch_size:
+            batches.pop()
+
+        if self.shuffle:
+            for batch in batches:
+                batch.sort()
+        return batches
+
+    def _fill(self, slot: int, indices: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Gathers the specified samples into the buffer at ``self._buffers[slot]``"""
+        buffer = self._buffers[slot]
+        if not all(arr.flags.writeable for arr in buffer):
+            # A previously-yielded batch is still involved in a computational
+            # graph, which has locked its memory. Leave it be.
+            buffer = self._new_buffer()
+            self._buffers[slot] = buffer
+
+        out = tuple(arr[: len(indices)] for arr in buffer)
+        return self.dataset.take(indices, out=out)
+
+    def __iter__(self) -> Iterator[Batch]:
+        batches = self._batch_indices()
+        if not self.prefetch:
+            return self._iter_sync(batches)
+
+        # concurrent iterations would share buffers; only one may be active
+        active = self._active() if self._active is not None else None
+        if active is not None:
+            active.close()
+
+        iterator = _PrefetchIterator(self, batches)
+        self._active = weakref.ref(iterator)
+        return iterator
+
+    def _iter_sync(self, batches: List[np.ndarray]) -> Iterator[Batch]:
+        for indices in batches:
+            yield _as_batch(self._fill(0, indices))
+
+
+def _as_batch(arrays: Tuple[np.ndarray, ...]) -> Batch:
+    tensors = tuple(Tensor(arr, constant=True, copy=False) for arr in arrays)
+    return tensors if len(tensors) > 1 else tensors[0]
+
+
+def _produce(
+    loader: DataLoader,
+    batches: List[np.ndarray],
+    free: queue.Queue,
+    ready: queue.Queue,
+    stop: threading.Event,
+):
+    """Fills free buffer-slots with batches, in order, and places them on the
+    ready-queue. Runs in a background thread."""
+    try:
+        for indices in batches:
+            while True:
+                if stop.is_set():
+                    return
+                try:
+                    slot = free.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    continue
+            ready.put((slot, loader._fill(slot, indices)))
+    except BaseException as e:  # propagated to the consumer
+        ready.put(e)
+        return
+    ready.put(_DONE)
+
+
+class _PrefetchIterator:
+    """Yields the batches assembled by a background thread.
+
+    Buffer-slots cycle between the producer (background) and the consumer
+    (main thread): the producer fills free slots, and the consumer returns a
+    slot to the free-queue once the batch after it is requested."""
+
+    def __init__(self, loader: DataLoader, batches: List[np.ndarray]):
+        self._free = queue.Queue()  # slots available for filling
+        self._ready = queue.Queue()  # (slot, arrays) | exception | _DONE
+        self._stop = threading.Event()
+        self._held_slot: Optional[int] = None
+        self._finished = False
+
+        for slot in range(len(loader._buffers)):
+            self._free.put(slot)
+
+        # the thread must not reference `self`, so that an abandoned iterator
+        # can be garbage-collected (which stops the thread)
+        self._thread = threading.Thread(
+            target=_produce,
+            args=(loader, batches, self._free, self._ready, self._stop),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __iter__(self) -> "_PrefetchIterator":
+        return self
+
+    def __next__(self) -> Batch:
+        if self._finished:
+            raise StopIteration
+
+        if self._held_slot is not None:
+            # the consumer is done with the previous batch
+            self._free.put(self._held_slot)
+            self._held_slot = None
+
+        item = self._ready.get()
+
+        if item is _DONE:
+            self.close()
+            raise StopIteration
+
+        if isinstance(item, BaseException):
+            self.close()
+            raise item
+
+        self._held_slot, arrays = item
+        return _as_batch(arrays)
+
+    def close(self):
+        """Stops the background thread"""
+        self._finished = True
+        self._stop.set()
+        self._thread.join()
+
+    def __del__(self):
+        if not self._finished:
+            self.close()
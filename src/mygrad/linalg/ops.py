@@ -8,8 +8,8 @@ from typing import Optional
 import numpy as np
 from numpy.lib.stride_tricks import as_strided
 
+import mygrad._utils.graph_tracking as _tracking
 from mygrad._utils import SkipGradient, reduce_broadcast
-from mygrad._utils.graph_tracking import TRACK_GRAPH
 from mygrad.operation_base import Operation
 
 __all__ = ["EinSum", "Norm"]
@@ -278,7 +278,7 @@ class Norm(Operation):
                 "mygrad.linalg.norm(..., ord=0) is not a differentiable operation"
             )
 
-        if TRACK_GRAPH:
+        if _tracking.TRACK_GRAPH:
             if hasattr(axis, "__len__"):
                 (axis,) = axis
 
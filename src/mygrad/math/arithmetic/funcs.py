@@ -2,15 +2,19 @@ from typing import Optional, Union
 
 from numpy import ndarray
 
+from mygrad.math.sequential.ops import CumProd, CumSum, Prod, Sum
 from mygrad.tensor_base import Tensor
 from mygrad.typing import ArrayLike, DTypeLikeReals, Mask
 from mygrad.ufuncs._ufunc_creators import ufunc_creator
 
 from .ops import (
     Add,
+    AddAt,
+    AddReduceat,
     AddSequence,
     Divide,
     Multiply,
+    MultiplyOuter,
     MultiplySequence,
     Negative,
     Positive,
@@ -18,6 +22,7 @@ from .ops import (
     Reciprocal,
     Square,
     Subtract,
+    SubtractAt,
 )
 
 __all__ = [
@@ -36,7 +41,13 @@ __all__ = [
 ]
 
 
-@ufunc_creator(Add)
+@ufunc_creator(
+    Add,
+    at_op=AddAt,
+    accumulate_op=CumSum,
+    reduce_op=Sum,
+    reduceat_op=AddReduceat,
+)
 def add(
     x1: ArrayLike,
     x2: ArrayLike,
@@ -114,7 +125,7 @@ def add(
     ...
 
 
-@ufunc_creator(Subtract)
+@ufunc_creator(Subtract, at_op=SubtractAt)
 def subtract(
     x1: ArrayLike,
     x2: ArrayLike,
@@ -193,7 +204,7 @@ def subtract(
     ...
 
 
-@ufunc_creator(Multiply)
+@ufunc_creator(Multiply, accumulate_op=CumProd, outer_op=MultiplyOuter, reduce_op=Prod)
 def multiply(
     x1: ArrayLike,
     x2: ArrayLike,
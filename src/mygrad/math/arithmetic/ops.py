@@ -20,6 +20,10 @@ __all__ = [
     "Negative",
     "AddSequence",
     "MultiplySequence",
+    "AddAt",
+    "SubtractAt",
+    "AddReduceat",
+    "MultiplyOuter",
 ]
 
 # Binary Ops
@@ -126,6 +130,8 @@ class AddSequence(Operation):
 class MultiplySequence(Operation):
     """ Performs f(a, b, ..., z) = a * b * ... * z"""
 
+    _saved_buffers = ("_product",)
+
     def __call__(self, *input_vars: "Tensor") -> np.ndarray:
         self.variables = input_vars
         assert 2 <= len(self.variables)
@@ -154,3 +160,114 @@ class MultiplySequence(Operation):
                 lambda x, y: x * y,
                 (var.data for n, var in enumerate(self.variables) if n != index),
             )
+
+
+# Ufunc Methods
+
+
+class AddAt(Operation):
+    """Performs ``numpy.add.at(a, indices, b)``: an unbuffered, in-place addition
+    of ``b`` to the elements of ``a`` that are specified by ``indices``.
+
+    Elements that are indexed multiple times are incremented once per occurrence."""
+
+    numpy_ufunc = np.add
+
+    def __call__(self, a, b, indices, *, out=None):
+        """
+        Parameters
+        ----------
+        a : mygrad.Tensor
+            The tensor whose entries are being updated.
+
+        b : mygrad.Tensor
+            `b` must be broadcast-compatible with `a[indices]`
+
+        indices : valid-array-index
+            Specifies the entries of `a` that are updated.
+
+        out : Optional[numpy.ndarray]
+            The data to be mutated; must store the same values as `a`. A copy of
+            `a` is made if this is not specified."""
+        self.variables = (a, b)
+        self.index = indices if isinstance(indices, tuple) else (indices,)
+        if out is None:
+            out = np.copy(a.data)
+        self.numpy_ufunc.at(out, indices, b.data)
+        return out
+
+    def backward_var(self, grad, index, **kwargs):
+        if index == 0:
+            return grad
+
+        # Each element of `b` updates an element of `a`; its gradient is that of
+        # the updated element, regardless of how many times that element is indexed
+        b = self.variables[1]
+        grad_sel = np.asarray(grad[self.index])
+        if grad_sel.ndim < b.ndim:
+            # `b` contains excess leading singleton dimensions
+            grad_sel = grad_sel.reshape(
+                (1,) * (b.ndim - grad_sel.ndim) + grad_sel.shape
+            )
+        return grad_sel
+
+
+class SubtractAt(AddAt):
+    """Performs ``numpy.subtract.at(a, indices, b)``"""
+
+    numpy_ufunc = np.subtract
+
+    def backward_var(self, grad, index, **kwargs):
+        grad = super().backward_var(grad, index, **kwargs)
+        return grad if index == 0 else np.negative(grad)
+
+
+class AddReduceat(Operation):
+    """Performs ``numpy.add.reduceat(a, indices, axis)``: the sums of the segments
+    of `a`, along `axis`, that begin at each of `indices`."""
+
+    def __call__(self, a, indices, axis=0, dtype=None, out=None):
+        self.variables = (a,)
+        self.indices = np.asarray(indices)
+        self.axis = axis
+        return np.add.reduceat(a.data, self.indices, axis=axis, dtype=dtype, out=out)
+
+    def backward_var(self, grad, index, **kwargs):
+        (a,) = self.variables
+        axis = self.axis % a.ndim
+        size = a.shape[axis]
+        starts = self.indices
+
+        # Segment-i spans [starts[i], stops[i]) along `axis`. Per numpy, a
+        # segment whose start does not precede the next start consists of
+        # its first element alone, and the last segment extends to the end
+        stops = np.empty_like(starts)
+        stops[:-1] = np.where(starts[:-1] < starts[1:], starts[1:], starts[:-1] + 1)
+        stops[-1:] = size
+
+        # Each segment's gradient is broadcast across the elements that it spans.
+        # This is accumulated as a difference-array, whose cumulative sum is the
+        # gradient of `a`; segments can overlap and appear in any order.
+        grad = np.moveaxis(grad, axis, 0)
+        dgrad = np.zeros((size + 1,) + grad.shape[1:], dtype=grad.dtype)
+        np.add.at(dgrad, starts, grad)
+        np.subtract.at(dgrad, stops, grad)
+        return np.moveaxis(np.cumsum(dgrad[:-1], axis=0), 0, axis)
+
+
+class MultiplyOuter(Operation):
+    """Performs ``numpy.multiply.outer(a, b)``
+
+    The gradients are computed by contracting the gradient of the output against
+    the other input, which avoids materializing an output-sized intermediate."""
+
+    def __call__(self, a, b, *, dtype=None, out=None):
+        self.variables = (a, b)
+        return np.multiply.outer(a.data, b.data, dtype=dtype, out=out)
+
+    def backward_var(self, grad, index, **kwargs):
+        a, b = self.variables
+        if index == 0:
+            return np.tensordot(grad, b.data, axes=b.ndim)
+        else:
+            return np.tensordot(a.data, grad, axes=a.ndim)
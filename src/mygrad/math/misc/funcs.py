@@ -5,11 +5,12 @@ from numpy import ndarray
 
 import mygrad as mg
 from mygrad.math.misc.ops import MatMul
+from mygrad.math.sequential.ops import Max, Min
 from mygrad.tensor_base import Tensor, implements_numpy_override
 from mygrad.typing import ArrayLike, DTypeLikeReals, Mask
 from mygrad.ufuncs import ufunc_creator
 
-from .ops import Abs, Cbrt, Maximum, Minimum, Sqrt
+from .ops import Abs, Cbrt, Maximum, MaximumAccumulate, Minimum, MinimumAccumulate, Sqrt
 
 __all__ = [
     "abs",
@@ -246,7 +247,7 @@ def cbrt(
     ...
 
 
-@ufunc_creator(Maximum)
+@ufunc_creator(Maximum, accumulate_op=MaximumAccumulate, reduce_op=Max)
 def maximum(
     x1: ArrayLike,
     x2: ArrayLike,
@@ -331,7 +332,7 @@ def maximum(
     ...
 
 
-@ufunc_creator(Minimum)
+@ufunc_creator(Minimum, accumulate_op=MinimumAccumulate, reduce_op=Min)
 def minimum(
     x1: ArrayLike,
     x2: ArrayLike,
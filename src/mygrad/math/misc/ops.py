@@ -3,9 +3,17 @@ from typing import Optional
 
 import numpy as np
 
-from mygrad.operation_base import BinaryUfunc, UnaryUfunc
+from mygrad.operation_base import BinaryUfunc, Operation, UnaryUfunc
 
-__all__ = ["Abs", "Sqrt", "Cbrt", "Maximum", "Minimum"]
+__all__ = [
+    "Abs",
+    "Sqrt",
+    "Cbrt",
+    "Maximum",
+    "Minimum",
+    "MaximumAccumulate",
+    "MinimumAccumulate",
+]
 
 
 class Abs(UnaryUfunc):
@@ -35,6 +43,8 @@ class Cbrt(UnaryUfunc):
 
 
 class _MaxMin(BinaryUfunc, ABC):
+    _saved_buffers = ("_where_tensor_a_was_selected",)
+
     @staticmethod
     @abstractmethod
     def _comparison(
@@ -81,6 +91,44 @@ class Minimum(_MaxMin):
     _comparison = staticmethod(np.less)
 
 
+class _MaxMinAccumulate(Operation, ABC):
+    """A base class that implements common functionality for back-propping
+    through numpy.maximum.accumulate and numpy.minimum.accumulate"""
+
+    numpy_ufunc: np.ufunc
+
+    def __call__(self, a, axis=0, dtype=None, out=None):
+        self.variables = (a,)
+        self.axis = axis
+        return self.numpy_ufunc.accumulate(a.data, axis=axis, dtype=dtype, out=out)
+
+    def backward_var(self, grad, index, **kwargs):
+        (a,) = self.variables
+        x = np.moveaxis(a.data, self.axis, 0)
+        running = self.numpy_ufunc.accumulate(x, axis=0)
+
+        # The running extremum at step-k was attained at step-source[k]; ties
+        # are attributed to the first occurrence, in accord with `mygrad.max`
+        changed = np.ones(x.shape, dtype=bool)
+        changed[1:] = running[1:] != running[:-1]
+        steps = np.arange(len(x)).reshape((-1,) + (1,) * (x.ndim - 1))
+        source = np.maximum.accumulate(np.where(changed, steps, 0), axis=0)
+
+        indices = list(np.indices(x.shape, sparse=True))
+        indices[0] = source
+        dx = np.zeros(x.shape, dtype=grad.dtype)
+        np.add.at(dx, tuple(indices), np.moveaxis(grad, self.axis, 0))
+        return np.moveaxis(dx, 0, self.axis)
+
+
+class MaximumAccumulate(_MaxMinAccumulate):
+    numpy_ufunc = np.maximum
+
+
+class MinimumAccumulate(_MaxMinAccumulate):
+    numpy_ufunc = np.minimum
+
+
 class MatMul(BinaryUfunc):
     numpy_ufunc = np.matmul
     _supports_where = False
@@ -117,4 +165,4 @@ class MatMul(BinaryUfunc):
                 dfdx = a[:, np.newaxis] * np.expand_dims(grad, -2)
             return dfdx
         else:  # pragma: no cover
-            raise ValueError()
\ No newline at end of file
+            raise ValueError()
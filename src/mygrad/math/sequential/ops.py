@@ -5,6 +5,7 @@ from typing import Optional, Tuple, Union
 
 import numpy as np
 
+import mygrad._utils.precision as _precision
 from mygrad.operation_base import Sequential
 
 __all__ = [
@@ -122,15 +123,16 @@ class Sum(Sequential):
 
     def backward_var(self, grad, index, **kwargs):
         (a,) = self.variables
+        grad_dtype = _precision.accumulation_dtype(a.dtype)
         if self.axis is None:
-            return np.full(a.shape, grad, dtype=a.dtype)
+            return np.full(a.shape, grad, dtype=grad_dtype)
 
         if not self.keepdims:
             index = [slice(None) for i in range(a.ndim)]
             for i in self.axis:
                 index[i] = np.newaxis
             grad = grad[tuple(index)]
-        return np.broadcast_to(grad, a.shape).astype(a.dtype, copy=False)
+        return np.broadcast_to(grad, a.shape).astype(grad_dtype, copy=False)
 
 
 class Mean(Sum):
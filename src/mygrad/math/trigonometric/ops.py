@@ -174,6 +174,7 @@ class Arccot(Operation):
 
 class Arctan2(BinaryUfunc):
     numpy_ufunc = np.arctan2
+    _saved_buffers = ("cached_denom",)
 
     def __init__(self):
         super().__init__()
@@ -0,0 +1,152 @@
+"""
+Provides tools for measuring the memory held by computational graphs
+"""
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mygrad import Tensor
+
+__all__ = ["graph_memory", "GraphMemory"]
+
+
+class GraphMemory:
+    """The memory, in bytes, held by a computational graph.
+
+    Attributes
+    ----------
+    tensors : int
+        The bytes held by the data of the graph's tensors.
+
+    saved : int
+        The bytes held by the buffers that the graph's operations save for
+        back-propagation (beyond the data of their input tensors).
+
+    by_op : Dict[str, int]
+        The bytes held by saved buffers, by operation type.
+
+    by_tensor : List[Tuple[Tensor, int]]
+        The bytes held by each tensor's data, sorted in descending order.
+    """
+
+    def __init__(
+        self,
+        tensors: int,
+        saved: int,
+        by_op: Dict[str, int],
+        by_tensor: List[Tuple["Tensor", int]],
+    ):
+        self.tensors = tensors
+        self.saved = saved
+        self.by_op = by_op
+        self.by_tensor = by_tensor
+
+    @property
+    def total(self) -> int:
+        """The total bytes held by the graph."""
+        return self.tensors + self.saved
+
+    def __repr__(self) -> str:
+        return (
+            f"GraphMemory(total={self.total}, tensors={self.tensors}, "
+            f"saved={self.saved}, by_op={self.by_op})"
+        )
+
+
+def _memory_block(arr: np.ndarray) -> Tuple[int, int]:
+    """Returns ``(key, nbytes)`` for the block of memory underlying ``arr``;
+    views of the same array share a key."""
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    if arr.base is not None:
+        # the array views memory owned by another type of object (e.g. an
+        # `mmap`); its size is unknown, so only the viewed bytes are counted
+        return id(arr.base), arr.nbytes
+    return id(arr), arr.nbytes
+
+
+def graph_memory(tensor: "Tensor") -> GraphMemory:
+    """Reports the memory held by the computational graph that produced
+    ``tensor``: the data of all of the tensors in the graph, and the
+    buffers that its operations have saved for back-propagation.
+
+    Memory is deduplicated: each block of memory is counted once, and is
+    attributed to the first tensor (or saved buffer) found to reference it.
+    Thus tensors that are views of other tensors, and saved buffers that
+    are the data of tensors, are reported as holding zero bytes.
+
+    Parameters
+    ----------
+    tensor : Tensor
+        The terminal node of the graph.
+
+    Returns
+    -------
+    GraphMemory
+
+    Notes
+    -----
+    The buffers saved by an operation are reported by
+    :meth:`~mygrad.operation_base.Operation.saved_buffers`.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> x = mg.ones((100, 10))  # float32 -> 4000 bytes
+    >>> y = mg.nnet.softmax(x)
+    >>> mem = mg.graph_memory(mg.sum(y))
+    >>> mem.tensors  # x, y, and the sum
+    8004
+    >>> mem.by_op  # softmax saves its output, which is `y`
+    {'Sum': 0, 'Softmax': 0}
+    """
+    seen_blocks: Set[int] = set()
+
+    def measure(arr: np.ndarray) -> int:
+        key, nbytes = _memory_block(arr)
+        if key in seen_blocks:
+            return 0
+        seen_blocks.add(key)
+        return nbytes
+
+    tensors: List["Tensor"] = []
+    ops = []
+    seen_tensors: Set[int] = {id(tensor)}
+    seen_ops: Set[int] = set()
+
+    stack = [tensor]
+    while stack:
+        t = stack.pop()
+        tensors.append(t)
+        op = t.creator
+        if op is None or id(op) in seen_ops:
+            continue
+        seen_ops.add(id(op))
+        ops.append(op)
+        for var in op.variables:
+            if id(var) not in seen_tensors:
+                seen_tensors.add(id(var))
+                stack.append(var)
+
+    # Tensor data is measured first, so that saved buffers that alias it are
+    # not counted twice. Tensors that own their data are measured before views,
+    # so that memory is attributed to its owner.
+    by_tensor = [
+        (t, measure(t.data))
+        for t in sorted(tensors, key=lambda t: t.data.base is not None)
+    ]
+
+    by_op: Dict[str, int] = defaultdict(int)
+    for op in ops:
+        by_op[type(op).__name__] += sum(
+            measure(buffer) for buffer in op.saved_buffers().values()
+        )
+
+    return GraphMemory(
+        tensors=sum(n for _, n in by_tensor),
+        saved=sum(by_op.values()),
+        by_op=dict(by_op),
+        by_tensor=sorted(by_tensor, key=lambda x: x[1], reverse=True),
+    )
@@ -16,6 +16,8 @@ class ELU(Operation):
     The ELU is given by `ɑ(exp(x) - 1) for x < 0 and x for x ≥ 0`.
     """
 
+    _saved_buffers = ("exp",)
+
     def __call__(self, x, alpha):
         """
         Parameters
@@ -8,11 +8,17 @@ from mygrad.typing import ArrayLike
 
 
 class ReLu(Operation):
+    _saved_buffers = ("back",)
+
     def __call__(self, a):
         self.variables = (a,)
         self.back = np.asarray(a > 0, dtype=a.dtype)
         return a.data * self.back
 
+    @staticmethod
+    def forward(a):
+        return a * np.asarray(a > 0, dtype=a.dtype)
+
     def backward_var(self, grad, index, **kwargs):
         return grad * self.back
 
@@ -25,6 +25,8 @@ class SELU(Operation):
     at https://arxiv.org/abs/1706.02515
     """
 
+    _saved_buffers = ("exp",)
+
     def __call__(self, x):
         """
         Parameters
@@ -8,14 +8,20 @@ from mygrad.typing import ArrayLike
 
 
 class Sigmoid(Operation):
+    _saved_buffers = ("sigmoid",)
+
     def __call__(self, a):
         self.variables = (a,)
-        x = np.asarray(-1.0 * a.data)
+        self.sigmoid = self.forward(a.data)
+        return self.sigmoid
+
+    @staticmethod
+    def forward(a):
+        x = np.asarray(-1.0 * a)
         np.exp(x, out=x)
         x += 1
         np.reciprocal(x, out=x)
-        self.sigmoid = x
-        return self.sigmoid
+        return x
 
     def backward_var(self, grad, index, **kwargs):
         return grad * self.sigmoid * (1.0 - self.sigmoid)
@@ -23,6 +23,8 @@ def _softmax(x, kwargs):
 
 
 class Softmax(Operation):
+    _saved_buffers = ("_cached_output",)
+
     def __call__(self, a, axis=-1):
         self.variables = (a,)
         x = a.data
@@ -31,6 +33,10 @@ class Softmax(Operation):
         self._cached_output = _softmax(x, self._kw)
         return self._cached_output
 
+    @staticmethod
+    def forward(a, axis=-1):
+        return _softmax(a, dict(axis=axis, keepdims=True))
+
     def backward_var(self, grad, index, **kwargs):
         _ = self.variables[index]  # check index error
         soft = self._cached_output
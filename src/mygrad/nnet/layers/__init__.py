@@ -1,8 +1,9 @@
 from .batchnorm import batchnorm
 from .conv import conv_nd
+from .conv_transpose import conv_transpose_nd
 from .pooling import max_pool
 
-__all__ = ["conv_nd", "max_pool", "batchnorm"]
+__all__ = ["conv_nd", "conv_transpose_nd", "max_pool", "batchnorm"]
 
 
 try:
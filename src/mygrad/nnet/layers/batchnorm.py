@@ -23,6 +23,8 @@ class BatchNorm(Operation):
     calling the batch-norm instance.
     """
 
+    _saved_buffers = ("x_norm", "mean", "var", "_std")
+
     def __call__(self, x, gamma, beta, *, eps):
         """
         y(x) = (x - E[x]) / sqrt(Var[x} + eps)
@@ -11,8 +11,54 @@ from mygrad.typing import ArrayLike
 __all__ = ["conv_nd"]
 
 
+def _fast_len(n: int) -> int:
+    """Returns the smallest integer, greater than or equal to ``n``, of the form
+    2^a 3^b 5^c; ``numpy.fft`` is fastest for such sizes."""
+    best = 1 << max(int(n) - 1, 0).bit_length()  # the next power of 2
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            p235 = p35
+            while p235 < n:
+                p235 *= 2
+            best = min(best, p235)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _zero_insert(arr: np.ndarray, step: Tuple[int, ...]) -> np.ndarray:
+    """Inserts ``step - 1`` zeros between neighboring elements along each of
+    the trailing (convolved) axes of ``arr``.
+
+    This dilates a kernel, or "un-strides" the gradient of a strided convolution.
+    """
+    if all(s == 1 for s in step):
+        return arr
+    num_lead = arr.ndim - len(step)
+    shape = arr.shape[:num_lead] + tuple(
+        (n - 1) * s + 1 for n, s in zip(arr.shape[num_lead:], step)
+    )
+    out = np.zeros(shape, dtype=arr.dtype)
+    out[(..., *(slice(None, None, s) for s in step))] = arr
+    return out
+
+
+def _mix_channels(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(P, Q, S0, ...) x (Q, R, S0, ...) -> (P, R, S0, ...), contracting over Q
+    for each frequency (S0, ...) via a batched matrix-multiplication."""
+    spatial = a.shape[2:]
+    a = np.moveaxis(a.reshape(a.shape[:2] + (-1,)), -1, 0)  # (S, P, Q)
+    b = np.moveaxis(b.reshape(b.shape[:2] + (-1,)), -1, 0)  # (S, Q, R)
+    out = np.matmul(a, b)  # (S, P, R)
+    return np.moveaxis(out, 0, -1).reshape(out.shape[1:] + spatial)
+
+
 class ConvND(Operation):
-    def __call__(self, x, w, *, stride, padding=0, dilation=1):
+    _saved_buffers = ("_grad_fft",)
+
+    def __call__(self, x, w, *, stride, padding=0, dilation=1, method="direct"):
         self.variables = (x, w)
         # x ... data:    (N, C, X0, X1, ...)
         # w ... filters: (F, C, W0, W1, ...)
@@ -76,11 +122,16 @@ class ConvND(Operation):
         self.padding = padding
         self.stride = stride
         self.dilation = dilation
+        self.method = method
+        self._grad_fft = None
 
         # symmetric 0-padding for X0, X1, ... dimensions
         axis_pad = tuple((i, i) for i in (0, 0, *padding))
         x = np.pad(x, axis_pad, mode="constant") if sum(padding) else x
 
+        if method == "fft":
+            return self._fft_forward(x, w)
+
         # (G0, ...) is the tuple of grid-positions for placing each window (not including stride)
         # (N, C, X0, ...) -> (G0, ..., N, C, W0, ...)
         windowed_data = sliding_window_view(
@@ -102,12 +153,94 @@ class ConvND(Operation):
         out = np.moveaxis(conv_out, source=-1, destination=0)
         return out if out.flags["C_CONTIGUOUS"] else np.ascontiguousarray(out)
 
+    def _fft_shape(self, x_shape: Tuple[int, ...]) -> Tuple[int, ...]:
+        # The cross-correlations computed via the FFT are circular. Transforms
+        # at least as long as the (padded) data ensure that the entries that we
+        # keep are free of wrap-around.
+        return tuple(_fast_len(n + 2 * p) for n, p in zip(x_shape[2:], self.padding))
+
+    def _fft_forward(self, x: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """Computes the convolution via FFTs, at a cost of O(X log X), rather
+        than O(G * W), where X, G, and W are the sizes of the data, output, and
+        kernel, respectively.
+
+        Parameters
+        ----------
+        x : numpy.ndarray, shape=(N, C, X0, ...)
+            The padded data.
+
+        w : numpy.ndarray, shape=(F, C, W0, ...)
+
+        Returns
+        -------
+        numpy.ndarray, shape=(N, F, G0, ...)"""
+        out_dtype = np.result_type(x, w)
+        axes = tuple(range(2, x.ndim))
+        fft_shape = tuple(_fast_len(n) for n in x.shape[2:])
+        w = _zero_insert(w, self.dilation)
+
+        x_fft = np.fft.rfftn(x, s=fft_shape, axes=axes)  # (N, C, S0, ...)
+        w_fft = np.fft.rfftn(w, s=fft_shape, axes=axes)  # (F, C, S0, ...)
+
+        # correlation: x ⋆ w <-> X * conj(W)
+        # (N, C, S0, ...) x (C, F, S0, ...) -> (N, F, S0, ...)
+        out = _mix_channels(x_fft, np.swapaxes(w_fft, 0, 1).conj())
+        out = np.fft.irfftn(out, s=fft_shape, axes=axes)
+
+        # the valid placements of the (dilated) kernel, subsampled by the stride
+        valid = tuple(
+            slice(0, n - k + 1, s)
+            for n, k, s in zip(x.shape[2:], w.shape[2:], self.stride)
+        )
+        return np.ascontiguousarray(out[(..., *valid)], dtype=out_dtype)
+
+    def _fft_backward_var(self, grad: np.ndarray, index: int) -> np.ndarray:
+        x, w = (i.data for i in self.variables)
+        axes = tuple(range(2, x.ndim))
+        fft_shape = self._fft_shape(x.shape)
+
+        if self._grad_fft is None:
+            # the transformed gradient is used to back-propagate to both x and w
+            self._grad_fft = np.fft.rfftn(
+                _zero_insert(grad, self.stride), s=fft_shape, axes=axes
+            )
+        grad_fft = self._grad_fft  # (N, F, S0, ...)
+
+        if index == 0:  # backprop through x
+            # dx = (un-strided grad) * (dilated w); a full convolution
+            w_fft = np.fft.rfftn(_zero_insert(w, self.dilation), s=fft_shape, axes=axes)
+
+            # (N, F, S0, ...) x (F, C, S0, ...) -> (N, C, S0, ...)
+            dx = np.fft.irfftn(_mix_channels(grad_fft, w_fft), s=fft_shape, axes=axes)
+
+            # remove padding from dx
+            no_pads = tuple(slice(p, p + n) for n, p in zip(x.shape[2:], self.padding))
+            return dx[(..., *no_pads)].astype(x.dtype, copy=False)
+
+        else:  # backprop through w
+            # dw = x ⋆ (un-strided grad), sampled at the dilated kernel positions
+            axis_pad = tuple((i, i) for i in (0, 0, *self.padding))
+            x = np.pad(x, axis_pad, mode="constant") if sum(self.padding) else x
+            x_fft = np.fft.rfftn(x, s=fft_shape, axes=axes)
+
+            # (F, N, S0, ...) x (N, C, S0, ...) -> (F, C, S0, ...)
+            dw = _mix_channels(np.swapaxes(grad_fft, 0, 1).conj(), x_fft)
+            dw = np.fft.irfftn(dw, s=fft_shape, axes=axes)
+
+            kernel = tuple(
+                slice(0, (k - 1) * d + 1, d) for k, d in zip(w.shape[2:], self.dilation)
+            )
+            return dw[(..., *kernel)].astype(w.dtype, copy=False)
+
     def backward_var(self, grad, index, **kwargs):
         """Computes dX, where X is the data batch
 
         Parameters
         ----------
         grad : numpy.ndarray, shape=(N, F, G0, ...)"""
+        if self.method == "fft":
+            return self._fft_backward_var(grad, index)
+
         x, w = (i.data for i in self.variables)
         num_conv_channels = grad.ndim - 2
 
@@ -162,6 +295,7 @@ def conv_nd(
     stride: Union[int, Tuple[int, ...]],
     padding: Union[int, Tuple[int, ...]] = 0,
     dilation: Union[int, Tuple[int, ...]] = 1,
+    method: str = "direct",
     constant: Optional[bool] = None,
 ) -> Tensor:
     """Use ``filter_bank`` (``w``) to perform strided N-dimensional neural network-style
@@ -215,6 +349,21 @@ def conv_nd(
         If a single integer is provided, that dilation value is used for all
         of the convolved axes
 
+    method : str, optional (default="direct")
+        (keyword-only argument) How the convolution, and its back-propagation,
+        is computed:
+
+        - ``"direct"``: by summing the products of the kernel with each of the
+          windows of the data
+        - ``"fft"``: by multiplying the Fourier transforms of the data and the
+          kernel
+
+        The cost of the direct method scales with the size of the output times
+        the size of the kernel, whereas the FFT-based method scales roughly with
+        the size of the data alone; thus ``"fft"`` is typically faster for large
+        kernels. Its results agree with those of the direct method up to
+        floating-point precision.
+
     constant : Optional[None]
         If True, the resulting Tensor is a constant.
 
@@ -361,6 +510,13 @@ def conv_nd(
 
     Extrapolating further, ``conv_nd`` is capable of performing ND convolutions!
 
+    Large kernels can be convolved via FFTs
+
+    >>> x = mg.random.rand(1, 1, 256)
+    >>> k = mg.random.rand(1, 1, 129)
+    >>> conv_nd(x, k, stride=1, method="fft").shape
+    (1, 1, 128)
+
     Performing a convolution over a batch of single-channel, "spatial-3D" tensor data:
 
     >>> # shape-(N=1, C=1, X=10, Y=12, Z=10)
@@ -386,10 +542,18 @@ def conv_nd(
             f"`x.shape[1]` ({x.shape[1]}) must match `filter_bank.shape[1]` ({filter_bank.shape[1]})"
         )
 
+    if method not in {"direct", "fft"}:
+        raise ValueError(f"`method` must be either 'direct' or 'fft', got: {method!r}")
+
     return Tensor._op(
         ConvND,
         x,
         filter_bank,
-        op_kwargs={"stride": stride, "padding": padding, "dilation": dilation},
+        op_kwargs={
+            "stride": stride,
+            "padding": padding,
+            "dilation": dilation,
+            "method": method,
+        },
         constant=constant,
     )
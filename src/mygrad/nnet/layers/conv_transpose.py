@@ -0,0 +1,297 @@
+from numbers import Integral
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from mygrad.nnet.layers.utils import sliding_window_view
+from mygrad.operation_base import Operation
+from mygrad.tensor_base import Tensor
+from mygrad.typing import ArrayLike
+
+__all__ = ["conv_transpose_nd"]
+
+
+class ConvTransposeND(Operation):
+    def __call__(self, x, w, *, stride, padding=0, dilation=1, output_padding=0):
+        self.variables = (x, w)
+        # x ... data:    (N, F, G0, G1, ...)
+        # w ... filters: (F, C, W0, W1, ...)
+
+        x = x.data
+        w = w.data
+
+        assert x.ndim > 2
+        assert x.ndim == w.ndim
+        assert (
+            w.shape[0] == x.shape[1]
+        ), "The channel-depth of the batch must match the number of filters"
+
+        num_conv_channels = w.ndim - 2
+        x_shape = np.array(
+            x.shape[2:]
+        )  # (G0, ...): shape of the channels being upsampled
+        w_shape = np.array(w.shape[2:])  # (W0, ...): shape of each conv filter
+
+        dilation = (
+            np.array((dilation,) * num_conv_channels)
+            if isinstance(dilation, Integral)
+            else np.array(dilation, dtype=int)
+        )
+        assert len(dilation) == num_conv_channels and all(
+            d >= 1 and isinstance(d, Integral) for d in dilation
+        )
+
+        padding = (
+            np.array((padding,) * num_conv_channels)
+            if isinstance(padding, Integral)
+            else np.array(padding, dtype=int)
+        )
+        assert len(padding) == num_conv_channels and all(
+            p >= 0 and isinstance(p, Integral) for p in padding
+        )
+
+        stride = (
+            np.array((stride,) * num_conv_channels)
+            if isinstance(stride, Integral)
+            else np.asarray(stride, dtype=int)
+        )
+        assert len(stride) == num_conv_channels and all(
+            s >= 1 and isinstance(s, Integral) for s in stride
+        )
+
+        output_padding = (
+            np.array((output_padding,) * num_conv_channels)
+            if isinstance(output_padding, Integral)
+            else np.array(output_padding, dtype=int)
+        )
+        assert len(output_padding) == num_conv_channels and all(
+            0 <= op < max(s, d) and isinstance(op, Integral)
+            for op, s, d in zip(output_padding, stride, dilation)
+        ), "`output_padding` must be smaller than either `stride` or `dilation`"
+
+        # the shape of the (padded) output, prior to cropping
+        full_shape = (x_shape - 1) * stride + (w_shape - 1) * dilation + 1
+        full_shape += output_padding
+        out_shape = full_shape - 2 * padding
+
+        if not all(i > 0 for i in out_shape):
+            msg = "Stride and kernel dimensions are incompatible: \n"
+            msg += f"Input dimensions: {tuple(x_shape)}\n"
+            msg += f"Stride dimensions: {tuple(stride)}\n"
+            msg += f"Kernel dimensions: {tuple(w_shape)}\n"
+            msg += f"Padding dimensions: {tuple(padding)}\n"
+            msg += f"Dilation dimensions: {tuple(dilation)}\n"
+            msg += f"Output-padding dimensions: {tuple(output_padding)}\n"
+            raise ValueError(msg)
+
+        self.padding = padding
+        self.stride = stride
+        self.dilation = dilation
+
+        # col2im: each datum is multiplied against each filter element, and the
+        # products are scattered into the output in a single pass per element
+        # of the filter.
+        # (N, F, G0, ...) -tdot- (F, C, W0, ...) --> (N, G0, ..., C, W0, ...)
+        cols = np.tensordot(x, w, axes=[[1], [0]])
+
+        # (N, G0, ..., C, W0, ...) --> (N, C, G0, ..., W0, ...)
+        cols = np.moveaxis(cols, num_conv_channels + 1, 1)
+
+        out = np.zeros(x.shape[:1] + w.shape[1:2] + tuple(full_shape), dtype=cols.dtype)
+        for ind in np.ndindex(w.shape[2:]):
+            # ind: (w0, ...) - position within the filter
+            slices = tuple(
+                slice(i * d, i * d + (g - 1) * s + 1, s)
+                for i, g, s, d in zip(ind, x.shape[2:], self.stride, self.dilation)
+            )
+            # out[N, C, w0*d0 : w0*d0 + (G0 - 1)*s0 + 1 : s0, (...)] += cols[N, C, G0, (...), w0, (...)]
+            out[(..., *slices)] += cols[(..., *ind)]
+
+        # remove padding from the output
+        if sum(padding):
+            no_pads = tuple(slice(p, p + n) for p, n in zip(padding, out_shape))
+            out = np.ascontiguousarray(out[(..., *no_pads)])
+        return out
+
+    def backward_var(self, grad, index, **kwargs):
+        """Computes dX, where X is the data batch
+
+        Parameters
+        ----------
+        grad : numpy.ndarray, shape=(N, C, X0, ...)"""
+        x, w = (i.data for i in self.variables)
+        num_conv_channels = grad.ndim - 2
+
+        # The transposed convolution is the gradient of a convolution, thus its
+        # gradients are computed via a convolution of `grad` with the filters.
+        # `sliding_window_view` requires that `window * dilation` fits within
+        # `grad`, thus the trailing ends of `grad` are padded by `dilation - 1`.
+        axis_pad = ((0, 0), (0, 0)) + tuple(
+            (p, p + d - 1) for p, d in zip(self.padding, self.dilation)
+        )
+        if sum(sum(i) for i in axis_pad):
+            grad = np.pad(grad, axis_pad, mode="constant")
+
+        # (N, C, X0, ...) -> (G0, ..., N, C, W0, ...)
+        windowed_grad = sliding_window_view(
+            grad, window_shape=w.shape[2:], step=self.stride, dilation=self.dilation
+        )
+        # padding can permit additional windows
+        windowed_grad = windowed_grad[tuple(slice(None, g) for g in x.shape[2:])]
+
+        if index == 0:  # backprop through x
+            # (G0, ..., N, C, W0, ...) -tdot- (F, C, W0, ...) --> (G0, ..., N, F)
+            window_axes = list(range(num_conv_channels + 1, 2 * num_conv_channels + 2))
+            w_axes = list(range(1, num_conv_channels + 2))  # C, W0, ...
+            dx = np.tensordot(windowed_grad, w, axes=[window_axes, w_axes])
+
+            # (G0, ..., N, F) -> (N, F, G0, ...)
+            dx = np.moveaxis(dx, source=(-2, -1), destination=(0, 1))
+            return dx if dx.flags["C_CONTIGUOUS"] else np.ascontiguousarray(dx)
+
+        else:  # backprop through w
+            # (N, F, G0, ...) -tdot- (G0, ..., N, C, W0, ...) --> (F, C, W0, ...)
+            x_axes = [0] + list(range(2, num_conv_channels + 2))  # (N, G0, ...)
+            window_axes = [num_conv_channels] + list(range(num_conv_channels))
+            return np.tensordot(x, windowed_grad, axes=[x_axes, window_axes])
+
+
+def conv_transpose_nd(
+    x: ArrayLike,
+    filter_bank: ArrayLike,
+    *,
+    stride: Union[int, Tuple[int, ...]],
+    padding: Union[int, Tuple[int, ...]] = 0,
+    dilation: Union[int, Tuple[int, ...]] = 1,
+    output_padding: Union[int, Tuple[int, ...]] = 0,
+    constant: Optional[bool] = None,
+) -> Tensor:
+    """Use ``filter_bank`` (``w``) to perform a strided N-dimensional transposed
+    convolution (a.k.a. a "fractionally-strided" convolution) over ``x``.::
+
+            shapes:
+            x : (N, F, G0, ...)
+            w : (F, C, W0, ...)
+            out : (N, C, X0, ...)
+
+    This is the operation that maps the output of ``conv_nd(·, w)`` back to the
+    shape of its input: it is the gradient of that convolution with respect to
+    its input (see Notes). It is commonly used to upsample data, e.g. in decoder
+    networks.
+
+    This does not support complex-valued inputs.
+
+    This is a "scalar-only" function, meaning that it does not support in-place
+    operations.
+
+    Parameters
+    ----------
+    x : ArrayLike, shape=(N, F, G0, ...)
+        The data batch to be upsampled, where ``F`` is the number of filters.
+
+    filter_bank : ArrayLike, shape=(F, C, W0, ...)
+        The filters, of the same layout as those used by ``conv_nd``. I.e. each
+        of the ``F`` filters has ``C`` channels, and ``C`` is the number of
+        channels of the output.
+
+    stride : Union[int, Tuple[int, ...]]
+        (keyword-only argument) The step-size with which each
+        filter is placed along the output.
+
+    padding : Union[int, Tuple[int, ...]], optional (default=0)
+        (keyword-only argument) The number of entries that are cropped from
+        both ends of each convolved dimension of the output. This matches the
+        padding of the corresponding ``conv_nd``.
+
+    dilation : Union[int, Tuple[int, ...]], optional (default=1)
+        (keyword-only argument) The spacing between the elements of each
+        filter when they are placed along the output.
+
+    output_padding : Union[int, Tuple[int, ...]], optional (default=0)
+        (keyword-only argument) The number of entries added to the trailing
+        end of each convolved dimension of the output. A strided convolution
+        maps several input-shapes to the same output-shape; this specifies
+        which of these shapes is produced. Must be smaller than either
+        the stride or the dilation.
+
+    constant : Optional[None]
+        If True, the resulting Tensor is a constant.
+
+    Returns
+    -------
+    Tensor, shape=(N, C, X0, ...)
+        Where ``Xi = (Gi - 1)*si - 2*pi + (Wi - 1)*di + 1 + opi``, for
+        stride ``s``, padding ``p``, dilation ``d``, and output-padding ``op``.
+
+    Notes
+    -----
+    For ``y = conv_nd(x, w, stride=s, padding=p, dilation=d)``,
+    ``conv_transpose_nd(grad, w, stride=s, padding=p, dilation=d)`` is the
+    gradient, ``dL/dx``, given ``grad = dL/dy``.
+
+    Each element of ``x`` scales a copy of its filter, which is added into
+    the output (a "col2im" operation). Unlike expressing this operation via
+    ``conv_nd`` – by interleaving ``x`` with zeros and convolving it with a
+    flipped filter – no stride-upsampled intermediate is created, and no
+    multiplications are performed against zeros.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.nnet import conv_transpose_nd
+
+    Each entry of ``x`` places a (scaled) copy of the filter in the output,
+    spaced apart by the stride
+
+    >>> x = mg.tensor([[[1.0, 2.0, 3.0]]])  # shape-(N=1, F=1, G=3)
+    >>> w = mg.tensor([[[1.0, 10.0]]])  # shape-(F=1, C=1, W=2)
+    >>> conv_transpose_nd(x, w, stride=2)
+    Tensor([[[ 1., 10.,  2., 20.,  3., 30.]]])
+
+    Overlapping placements are summed
+
+    >>> conv_transpose_nd(x, w, stride=1)
+    Tensor([[[ 1., 12., 23., 30.]]])
+
+    Upsampling a batch of 16x16, 8-channel images to 32x32, 3-channel images
+
+    >>> x = mg.random.rand(4, 8, 16, 16)  # shape-(N=4, F=8, G0=16, G1=16)
+    >>> w = mg.random.rand(8, 3, 4, 4)  # shape-(F=8, C=3, W0=4, W1=4)
+    >>> out = conv_transpose_nd(x, w, stride=2, padding=1)
+    >>> out.shape
+    (4, 3, 32, 32)
+
+    This inverts the shape-transformation of the corresponding convolution
+
+    >>> from mygrad.nnet import conv_nd
+    >>> conv_nd(out, w, stride=2, padding=1).shape
+    (4, 8, 16, 16)
+    """
+    if x.ndim < 3:
+        raise ValueError(
+            f"`x` must possess at least three " f"dimensions, got {x.ndim} dimensions"
+        )
+
+    if x.ndim != filter_bank.ndim:
+        raise ValueError(
+            f"`x` ({x.ndim}-dimensions) must have the same dimensionality as "
+            f"`filter_bank` ({filter_bank.ndim}-dimensions)"
+        )
+
+    if filter_bank.shape[0] != x.shape[1]:
+        raise ValueError(
+            f"`x.shape[1]` ({x.shape[1]}) must match `filter_bank.shape[0]` ({filter_bank.shape[0]})"
+        )
+
+    return Tensor._op(
+        ConvTransposeND,
+        x,
+        filter_bank,
+        op_kwargs={
+            "stride": stride,
+            "padding": padding,
+            "dilation": dilation,
+            "output_padding": output_padding,
+        },
+        constant=constant,
+    )
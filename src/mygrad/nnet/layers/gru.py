@@ -165,6 +165,18 @@ def _backprop(var, grad):  # pragma: no cover
 
 
 class GRUnit(Operation):
+    _saved_buffers = (
+        "_z",
+        "_r",
+        "_h",
+        "_dropUz",
+        "_dropUr",
+        "_dropUh",
+        "_dropWz",
+        "_dropWr",
+        "_dropWh",
+    )
+
     def __call__(
         self, X, Uz, Wz, bz, Ur, Wr, br, Uh, Wh, bh, s0=None, bp_lim=None, dropout=0.0
     ):
@@ -414,10 +426,6 @@ class GRUnit(Operation):
                 self.X, dLdX.astype(self.X.dtype, copy=False)
             )  # self.X.backward(dLdX, **kwargs)
 
-        del self._z
-        del self._r
-        del self._h
-
         super().backward(grad, graph=graph)
 
 
@@ -6,7 +6,7 @@ from numpy.lib.stride_tricks import as_strided
 
 def sliding_window_view(arr, window_shape, step, dilation=None):
     """Create a sliding window view over the trailing dimensions of an array.
-    No copy is made unless the input array is not contiguous in memory.
+    No copy is made, regardless of the memory layout of the input array.
 
     The window is applied only to valid regions of ``arr``, but is applied greedily.
 
@@ -15,10 +15,11 @@ def sliding_window_view(arr, window_shape, step, dilation=None):
     Parameters
     ----------
     arr : numpy.ndarray, shape=(..., [x, (...), z])
-        C-contiguous array over which sliding view-window is applied along the trailing
+        Array over which sliding view-window is applied along the trailing
         dimensions ``[x, ..., z]``, as determined by the length of ``window_shape``.
 
-        If ``arr`` is not C-contiguous, it will be replaced by ``numpy.ascontiguousarray(arr)``
+        ``arr`` can have any memory layout - e.g. it can be a transposed or
+        otherwise-strided view of another array.
 
     window_shape : Sequence[int]
         Specifies the shape of the view-window: ``[Wx, (...), Wz]``.
@@ -195,28 +196,25 @@ def sliding_window_view(arr, window_shape, step, dilation=None):
                 f"dimensions of `arr` ({arr.shape[-len(window_shape) :]})"
             )
 
-    if not arr.flags["C_CONTIGUOUS"]:
-        arr = np.ascontiguousarray(arr)
-
     step = np.array(step)  # (Sx, ..., Sz)
     window_shape = np.array(window_shape)  # (Wx, ..., Wz)
     in_shape = np.array(arr.shape[-len(step) :])  # (x, ... , z)
-    nbyte = arr.strides[-1]  # size, in bytes, of element in `arr`
 
-    # per-byte strides required to fill a window
-    win_stride = tuple(np.cumprod(arr.shape[:0:-1])[::-1]) + (1,)
+    # The strides of the view are derived directly from those of `arr`, thus
+    # arbitrarily-strided arrays (e.g. transposed or channel-last views) are
+    # windowed without being copied.
+    # see: 'internal memory layout of an ndarray'
+    leading_strides = arr.strides[: -len(step)]  # bytes to traverse (...) dims
+    # bytes to traverse x, ..., z
+    trailing_strides = np.array(arr.strides[-len(step) :])
 
     # per-byte strides required to advance the window
-    step_stride = tuple(win_stride[-len(step) :] * step)
+    step_stride = tuple(trailing_strides * step)
 
-    # update win_stride to accommodate dilation
-    win_stride = np.array(win_stride)
-    win_stride[-len(step) :] *= dilation
-    win_stride = tuple(win_stride)
+    # per-byte strides required to fill a (dilated) window
+    win_stride = tuple(trailing_strides * dilation)
 
-    # tuple of bytes to step to traverse corresponding dimensions of view
-    # see: 'internal memory layout of an ndarray'
-    stride = tuple(int(nbyte * i) for i in step_stride + win_stride)
+    stride = tuple(int(i) for i in step_stride + leading_strides + win_stride)
 
     # number of window placements along x-dim: X = (x - (Wx - 1)*Dx + 1) // Sx + 1
     out_shape = tuple((in_shape - ((window_shape - 1) * dilation + 1)) // step + 1)
@@ -33,6 +33,8 @@ class FocalLoss(Operation):
     It is recommended in the paper that you normalize by the number of foreground samples.
     """
 
+    _saved_buffers = ("back", "label_locs")
+
     def __call__(self, class_probs, targets, alpha, gamma):
         """
         Parameters
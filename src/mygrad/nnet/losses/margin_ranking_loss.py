@@ -10,6 +10,8 @@ from mygrad.typing import ArrayLike
 
 
 class MarginRanking(Operation):
+    _saved_buffers = ("_grad",)
+
     def __call__(self, x1, x2, y, margin):
         """Computes the margin ranking loss between ``x1``
         and ``x2``.
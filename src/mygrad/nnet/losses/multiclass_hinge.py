@@ -11,6 +11,8 @@ from ._utils import check_loss_inputs
 
 
 class MulticlassHinge(Operation):
+    _saved_buffers = ("back",)
+
     def __call__(self, a, y, hinge=1.0):
         """Computes the average multiclass hinge loss.
 
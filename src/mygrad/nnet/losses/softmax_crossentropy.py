@@ -18,6 +18,8 @@ class SoftmaxCrossEntropy(Operation):
 
     log-softmax is used for improved numerical stability"""
 
+    _saved_buffers = ("back",)
+
     def __call__(self, x, y_true):
         """Parameters
         ----------
@@ -46,6 +48,15 @@ class SoftmaxCrossEntropy(Operation):
             self.back /= scores.shape[0]
         return loss
 
+    @staticmethod
+    def forward(x, y_true):
+        if isinstance(y_true, Tensor):
+            y_true = y_true.data
+
+        check_loss_inputs(x, y_true)
+        log_softmax = x - logsumexp(x, axis=-1, keepdims=True)
+        return -np.sum(log_softmax[(range(len(x)), y_true)]) / x.shape[0]
+
     def backward_var(self, grad, index, **kwargs):
         return grad * self.back
 
@@ -2,12 +2,14 @@
 Defines the base class for mathematical operations capable of back-propagating
 gradients to their input tensors."""
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from numbers import Real
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, Union
-from weakref import ReferenceType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from weakref import ReferenceType, finalize
 
 import numpy as np
 
+import mygrad._utils.precision as _precision
 from mygrad._utils import SkipGradient, reduce_broadcast
 from mygrad.errors import InvalidBackprop, InvalidGradient
 from mygrad.typing import DTypeLike, Mask
@@ -26,6 +28,41 @@ __all__ = [
 
 Axis = Optional[Union[int, Tuple[int, ...]]]
 
+# When set - by the parallel backward-scheduler - `Operation.backward` appends
+# the gradients that it computes for its inputs to this list, as
+# `(var, backed_grad, upstream_grad)`, instead of accumulating them and
+# back-propagating further. This is local to each thread (and asyncio task).
+_GRAD_SINK = ContextVar(
+    "GRAD_SINK", default=None
+)  # type: ContextVar[Optional[List[Tuple[Tensor, np.ndarray, np.ndarray]]]]
+
+
+def _owned_grad(
+    backed_grad: np.ndarray,
+    upstream_grad: Union[np.ndarray, Tuple[Optional[np.ndarray], ...]],
+    grad_dtype: np.dtype,
+) -> np.ndarray:
+    """Returns `backed_grad` as an array of `grad_dtype` that can be augmented
+    in-place (copying it if necessary).
+
+    `upstream_grad` is a tuple of gradients for an operation with multiple
+    outputs."""
+    backed_grad = (
+        np.copy(backed_grad)
+        # `backed_grad` is view of grad; we want to be able to
+        # augment tmp-grad inplace later
+        if backed_grad.base is not None
+        or (backed_grad is upstream_grad)
+        or (
+            isinstance(upstream_grad, tuple)
+            and any(backed_grad is g for g in upstream_grad)
+        )
+        else backed_grad
+    )
+    if backed_grad.dtype != grad_dtype:
+        backed_grad = backed_grad.astype(grad_dtype, copy=False)
+    return backed_grad
+
 
 class _NoValueType:
     """Special keyword value.
@@ -76,6 +113,33 @@ class Operation(ABC):
     # Stores the input tensors that the operation will backprop through.
     variables: Tuple["Tensor", ...]
 
+    # The names of the attributes in which the operation stores the arrays that
+    # it saves for its backward pass; these are released as soon as the
+    # operation has back-propagated gradients to its inputs. If `None`, all of
+    # the operation's array-valued attributes are reported as saved buffers
+    # (see `saved_buffers`), but none are released.
+    _saved_buffers: Optional[Tuple[str, ...]] = None
+
+    # A pure forward kernel: computes the operation's output from the arrays
+    # underlying its inputs, without saving any state for back-propagation. It
+    # shares the signature of `__call__`, with arrays in place of tensors.
+    # When defined, `Tensor._op` calls it directly - without instantiating the
+    # operation or wrapping its inputs in tensors - whenever the computational
+    # graph is not being tracked (e.g. within `mygrad.no_autodiff`).
+    forward: Optional[Callable[..., np.ndarray]] = None
+
+    # Set by `Tensor._op` for an operation whose `__call__` returns a tuple of
+    # arrays: references to the tensors that hold its outputs. Such an operation
+    # is back-propagated through once, when the gradients of all of its outputs
+    # have been accumulated; its `backward_var` then receives a tuple of the
+    # outputs' gradients (see `_gather_output_grads`).
+    _outputs: Optional[List["WeakRef[Tensor]"]] = None
+
+    # Set by `Tensor._op` for an operation with multiple outputs, while memory
+    # guarding is enabled: releases the lock that the operation holds on the
+    # array of each of its outputs (see `_release_output_lock`).
+    _output_locks: Optional[List[finalize]] = None
+
     def __init__(self):
         # Stores positional and keyword arguments used to call op.
         # Can be set optionally - only if op needs to be "replayed",
@@ -85,6 +149,109 @@ class Operation(ABC):
         self.replay_force_constant: Optional[bool] = None
         self.where: Mask = True
 
+    def saved_buffers(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays, by attribute name, that the operation keeps alive
+        for its backward pass.
+
+        These are the attributes named by the class attribute ``_saved_buffers``
+        or, if it is not declared, all of the operation's array-valued
+        attributes. Arrays stored in a tuple or list are reported as
+        ``"<name>[<index>]"``.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]"""
+        if self._saved_buffers is not None:
+            names = self._saved_buffers
+        else:
+            names = [name for name in vars(self) if not name.startswith("replay_")]
+
+        buffers = {}
+        for name in names:
+            value = getattr(self, name, None)
+            if isinstance(value, np.ndarray):
+                buffers[name] = value
+            elif isinstance(value, (tuple, list)):
+                for n, item in enumerate(value):
+                    if isinstance(item, np.ndarray):
+                        buffers[f"{name}[{n}]"] = item
+        return buffers
+
+    def release_saved_buffers(self):
+        """Drops the operation's references to the buffers declared by its
+        ``_saved_buffers`` attribute.
+
+        This is called by ``Operation.backward`` as soon as the operation has
+        back-propagated gradients to all of its inputs, so that memory is freed
+        progressively over the course of back-propagation, rather than only
+        once the whole computational graph is cleared."""
+        if self._saved_buffers is None:
+            return
+
+        for name in self._saved_buffers:
+            if getattr(self, name, None) is not None:
+                setattr(self, name, None)
+
+    def _set_outputs(self, outputs: Tuple["Tensor", ...]):
+        """Records the tensors that hold the outputs of a multi-output operation."""
+        self._outputs = [ReferenceType(t) for t in outputs]
+        self._output_index = {id(t): n for n, t in enumerate(outputs)}
+        self._output_grads: Optional[List[Optional[np.ndarray]]] = None
+        self._num_pending_outputs = 0
+        self._gathering_graph: Optional[Set["WeakRef[Operation]"]] = None
+
+    def _release_output_lock(self, output: "Tensor"):
+        """Releases the lock held on the array of one of the operation's outputs,
+        once that output has been removed from the computational graph.
+
+        Otherwise, the lock is released only once the operation is garbage
+        collected, which does not occur for as long as any of its outputs live."""
+        if self._output_locks is None:
+            return
+        n = self._output_index.get(id(output))
+        if n is not None:
+            self._output_locks[n]()
+
+    def _replace_output(self, original: "Tensor", replacement: "Tensor"):
+        """Designates `replacement` as the tensor that holds the output
+        formerly held by `original` (e.g. a placeholder created for an in-place
+        operation)."""
+        n = self._output_index.pop(id(original))
+        self._output_index[id(replacement)] = n
+        self._outputs[n] = ReferenceType(replacement)
+
+    def _gather_output_grads(
+        self, output: "Tensor", graph: Set["WeakRef[Operation]"]
+    ) -> Optional[Tuple[Optional[np.ndarray], ...]]:
+        """Records the gradient of one of the operation's outputs.
+
+        Returns the tuple of the gradients of all of its outputs once the last of
+        the outputs that participate in ``graph`` has reported its gradient, and
+        ``None`` otherwise. The gradient of an output that does not participate
+        in ``graph`` is ``None``."""
+        if self._output_grads is None or self._gathering_graph is not graph:
+            self._output_grads = [None] * len(self._outputs)
+            self._gathering_graph = graph
+            # the outputs - other than `output` - that are yet to receive their
+            # gradients
+            self._num_pending_outputs = sum(
+                1
+                for t in (ref() for ref in self._outputs)
+                if t is not None and t is not output and not t._ops.isdisjoint(graph)
+            )
+        else:
+            self._num_pending_outputs -= 1
+
+        self._output_grads[self._output_index[id(output)]] = output._grad
+
+        if self._num_pending_outputs:
+            return None
+
+        grads = tuple(self._output_grads)
+        self._output_grads = None
+        self._gathering_graph = None
+        return grads
+
     @staticmethod
     def grad_post_process_fn(
         grad: np.ndarray, var_shape: Tuple[int, ...]
@@ -117,8 +284,10 @@ class Operation(ABC):
 
         Returns
         -------
-        numpy.ndarray
-            The output of the forward pass function.
+        Union[numpy.ndarray, Tuple[numpy.ndarray, ...]]
+            The output of the forward pass function. An operation with
+            multiple outputs returns a tuple of arrays; these must not be views
+            of the inputs' data.
 
         Notes
         -----
@@ -142,6 +311,10 @@ class Operation(ABC):
             operation: dℒ/df. This will have the same shape as f, the result
             of the forward pass.
 
+            For an operation with multiple outputs, this is a tuple of the
+            derivatives with respect to each output; the entry for an output
+            that does not participate in the computation of ℒ is ``None``.
+
         index : int
             The index-location of ``var`` in ``self.variables``
 
@@ -169,14 +342,17 @@ class Operation(ABC):
 
         Parameters
         ----------
-        grad : numpy.ndarray
+        grad : Union[numpy.ndarray, Tuple[Optional[numpy.ndarray], ...]]
             The back-propagated total derivative with respect to the present
-            operation (`f`): d(out)/df
+            operation (`f`): d(out)/df. A tuple of derivatives - one per output -
+            for an operation with multiple outputs.
 
         graph : Set[Operation]
             The set of all operations relevant to the terminal node of the computational graph,
             which triggered back-propagation.
         """
+        sink = _GRAD_SINK.get()
+
         for index, var in enumerate(self.variables):
             if not var.constant:
                 if not var._ops:
@@ -209,21 +385,32 @@ class Operation(ABC):
 
                 backed_grad = self.grad_post_process_fn(backed_grad, var.shape)
                 assert backed_grad.shape == var.shape, (backed_grad.shape, var.shape)
-                if var._grad is None:
-                    backed_grad = (
-                        np.copy(backed_grad)
-                        # `backed_grad` is view of grad; we want to be able to
-                        # augment tmp-grad inplace later
-                        if backed_grad.base is not None or (backed_grad is grad)
-                        else backed_grad
-                    )
-                    if backed_grad.dtype != var.dtype:
-                        backed_grad = backed_grad.astype(var.dtype, copy=False)
 
-                    var._grad = backed_grad
+                if sink is not None:
+                    sink.append((var, backed_grad, grad))
+                elif var._grad is None:
+                    grad_dtype = _precision.accumulation_dtype(var.dtype)
+                    buffer = var._grad_buffer
+
+                    if buffer is not None and buffer.dtype == grad_dtype:
+                        # gradient is written into preallocated (shared) memory
+                        np.copyto(buffer, backed_grad)
+                        var._grad = buffer
+                        continue
+
+                    var._grad = _owned_grad(backed_grad, grad, grad_dtype)
                 else:
                     var._grad += backed_grad
 
+        # the operation's inputs have received their gradients; its saved
+        # buffers are no longer needed
+        self.release_saved_buffers()
+
+        if sink is not None:
+            # the scheduler accumulates the gradients and schedules the
+            # back-propagation through upstream operations
+            return
+
         # Avoid visiting the same node multiple times. Note that we don't store
         # these by the node itself, since Tensors are unhashable, but by its `id`.
         visited = set()
@@ -310,7 +497,18 @@ class UnaryUfunc(Ufunc, ABC):
         self.variables: Tuple["Tensor"] = (x1,)
         if where is not True:
             self.where = where
-        return self.numpy_ufunc(x1.data, out=out, where=where, dtype=dtype)
+        return self.forward(x1.data, out=out, where=where, dtype=dtype)
+
+    @classmethod
+    def forward(
+        cls,
+        x1: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        *,
+        where: Mask = True,
+        dtype: DTypeLike = None,
+    ) -> np.ndarray:
+        return cls.numpy_ufunc(x1, out=out, where=where, dtype=dtype)
 
 
 class BinaryUfunc(Ufunc, ABC):
@@ -378,9 +576,22 @@ class BinaryUfunc(Ufunc, ABC):
         self.variables: Tuple["Tensor", "Tensor"] = (x1, x2)
         if where is not True and where is not _NoValue:
             self.where = where
-            return self.numpy_ufunc(x1.data, x2.data, out=out, where=where, dtype=dtype)
+        return self.forward(x1.data, x2.data, out=out, where=where, dtype=dtype)
+
+    @classmethod
+    def forward(
+        cls,
+        x1: np.ndarray,
+        x2: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        *,
+        where: Mask = True,
+        dtype: DTypeLike = None,
+    ) -> np.ndarray:
+        if where is not True and where is not _NoValue:
+            return cls.numpy_ufunc(x1, x2, out=out, where=where, dtype=dtype)
         else:
-            return self.numpy_ufunc(x1.data, x2.data, out=out, dtype=dtype)
+            return cls.numpy_ufunc(x1, x2, out=out, dtype=dtype)
 
 
 class Sequential(Operation, ABC):
@@ -442,6 +653,33 @@ class Sequential(Operation, ABC):
         else:
             self.axis = axis
 
+        out = self.forward(
+            a.data,
+            axis=axis,
+            dtype=dtype,
+            out=out,
+            keepdims=keepdims,
+            initial=initial,
+            where=where,
+            ddof=ddof,
+        )
+        self.out_shape = out.shape
+
+        return out
+
+    @classmethod
+    def forward(
+        cls,
+        a: np.ndarray,
+        axis: Axis = None,
+        dtype=None,
+        out: Optional[np.ndarray] = None,
+        keepdims: bool = _NoValue,
+        initial: Real = _NoValue,
+        *,
+        where: Union[bool, np.ndarray] = _NoValue,
+        ddof: int = _NoValue,
+    ) -> np.ndarray:
         kwargs = {}
 
         if keepdims is not _NoValue:
@@ -456,10 +694,15 @@ class Sequential(Operation, ABC):
         if ddof is not _NoValue:
             kwargs["ddof"] = ddof
 
-        if dtype is not _NoValue:
+        if dtype is not _NoValue and dtype is not None:
             kwargs["dtype"] = dtype
 
-        out = self.numpy_func(a.data, axis=axis, out=out, **kwargs)
-        self.out_shape = out.shape
-
-        return out
+        if (
+            dtype is None
+            and out is None
+            and _precision.accumulation_dtype(a.dtype) != a.dtype
+        ):
+            # mixed-precision mode: reduce half-precision data in float32
+            kwargs["dtype"] = _precision.accumulation_dtype(a.dtype)
+            return cls.numpy_func(a, axis=axis, **kwargs).astype(a.dtype)
+        return cls.numpy_func(a, axis=axis, out=out, **kwargs)
@@ -0,0 +1,7 @@
+from .adam import Adam
+from .base import Optimizer
+from .flat import FlatParameters
+from .rmsprop import RMSProp
+from .sgd import SGD
+
+__all__ = ["Adam", "FlatParameters", "Optimizer", "RMSProp", "SGD"]
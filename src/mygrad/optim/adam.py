@@ -0,0 +1,102 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+from .base import Optimizer
+
+__all__ = ["Adam"]
+
+
+class Adam(Optimizer):
+    """The Adam optimizer [1]_.
+
+    Parameters
+    ----------
+    params : Iterable[Tensor]
+        The non-constant tensors to be updated.
+
+    lr : float, optional (default=1e-3)
+        The learning rate.
+
+    betas : Tuple[float, float], optional (default=(0.9, 0.999))
+        The exponential decay rates for the first and second moment estimates.
+
+    eps : float, optional (default=1e-8)
+        Added to the denominator for numerical stability.
+
+    weight_decay : float, optional (default=0.)
+        The L2 penalty factor; ``weight_decay * param`` is added to each gradient.
+
+    References
+    ----------
+    .. [1] Kingma, D. P., & Ba, J. (2014). Adam: A method for stochastic
+           optimization. arXiv preprint arXiv:1412.6980.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.optim import Adam
+    >>> w = mg.tensor([1.0, -2.0])
+    >>> optim = Adam([w], lr=0.1)
+    >>> mg.sum(w ** 2).backward()
+    >>> optim.step()
+    >>> w
+    Tensor([ 0.9, -1.9])
+    """
+
+    _state_names = ("exp_avg", "exp_avg_sq")
+
+    def __init__(
+        self,
+        params: Iterable[Tensor],
+        *,
+        lr: float = 1e-3,
+        betas: Tuple[float, float] = (0.9, 0.999),
+        eps: float = 1e-8,
+        weight_decay: float = 0.0,
+    ):
+        if not all(0.0 <= b < 1.0 for b in betas) or len(betas) != 2:
+            raise ValueError(f"`betas` must be two values within [0, 1), got {betas}")
+
+        if eps <= 0:
+            raise ValueError(f"`eps` must be positive, got {eps}")
+
+        if weight_decay < 0:
+            raise ValueError(f"`weight_decay` must be non-negative, got {weight_decay}")
+
+        self.betas = tuple(betas)
+        self.eps = eps
+        self.weight_decay = weight_decay
+        super().__init__(params, lr=lr)
+
+    @property
+    def _needs_params(self) -> bool:
+        return bool(self.weight_decay)
+
+    def _compute_step(
+        self,
+        grad: np.ndarray,
+        state: Dict[str, np.ndarray],
+        params: Optional[np.ndarray],
+    ) -> np.ndarray:
+        if self.weight_decay:
+            grad = grad + self.weight_decay * params
+
+        beta1, beta2 = self.betas
+        m = state["exp_avg"]
+        v = state["exp_avg_sq"]
+
+        m *= beta1
+        m += (1 - beta1) * grad
+
+        v *= beta2
+        v += (1 - beta2) * np.square(grad)
+
+        bias_correction1 = 1 - beta1 ** self.t
+        bias_correction2 = 1 - beta2 ** self.t
+
+        denom = np.sqrt(v / bias_correction2)
+        denom += self.eps
+        return (self.lr / bias_correction1) * m / denom
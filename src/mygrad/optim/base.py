@@ -0,0 +1,209 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+from .flat import FlatParameters
+
+__all__ = ["Optimizer"]
+
+
+class Optimizer(ABC):
+    """Base class for optimizers that update all of their parameters with
+    vectorized NumPy calls over flat state buffers.
+
+    The gradients of all of the parameters are gathered into a single flat
+    buffer, the update is computed with a handful of whole-buffer NumPy
+    operations, and the update is then written back into each parameter's
+    array in-place.
+
+    If the parameters are provided as a :class:`~mygrad.optim.FlatParameters`
+    group, then its contiguous data and gradient buffers are operated on
+    directly, and no per-parameter copies are made.
+
+    Parameters whose arrays are locked by a live computational graph are
+    read-only; attempting to update them raises a ``ValueError``, per MyGrad's
+    memory-guarding rules. Gradients are cleared - and thus arrays unlocked -
+    once ``backward()`` completes, so a typical training step never encounters
+    this.
+
+    Notes
+    -----
+    Subclasses declare their per-element state via ``_state_names`` and
+    implement ``_compute_step``."""
+
+    # names of the flat, per-element state buffers required by the optimizer
+    _state_names: Tuple[str, ...] = ()
+
+    def __init__(self, params: Union[Iterable[Tensor], FlatParameters], *, lr: float):
+        self._group = params if isinstance(params, FlatParameters) else None
+        self.params: Tuple[Tensor, ...] = tuple(params)
+
+        if not self.params:
+            raise ValueError("An optimizer must be given at least one parameter")
+
+        for p in self.params:
+            if not isinstance(p, Tensor):
+                raise TypeError(
+                    f"Optimizers can only update mygrad tensors, got: {type(p)}"
+                )
+            if p.constant:
+                raise ValueError(
+                    "Optimizers can only update non-constant tensors; a constant "
+                    "tensor was provided"
+                )
+
+        if lr < 0:
+            raise ValueError(f"`lr` must be non-negative, got {lr}")
+
+        self.lr = lr
+
+        # number of steps taken
+        self.t = 0
+
+        sizes = [p.size for p in self.params]
+        bounds = np.cumsum([0] + sizes)
+        self._sizes = np.array(sizes)
+        self._slices: List[slice] = [
+            slice(int(start), int(stop)) for start, stop in zip(bounds, bounds[1:])
+        ]
+        self._numel = int(bounds[-1])
+
+        # State is stored in (at least) single precision so that half-precision
+        # parameters do not accumulate optimizer state in float16
+        self._dtype = np.result_type(np.float32, *(p.dtype for p in self.params))
+
+        self._flat_grad = (
+            np.empty(self._numel, dtype=self._dtype) if self._group is None else None
+        )
+        self.state: Dict[str, np.ndarray] = {
+            name: np.zeros(self._numel, dtype=self._dtype) for name in self._state_names
+        }
+
+    def _gather_grads(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Copies all of the parameters' gradients into a single flat buffer.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, Optional[numpy.ndarray]]
+            The flat gradient, and a boolean mask indicating which elements
+            have a gradient (``None`` if all of the parameters have gradients).
+        """
+        if self._group is not None:
+            # the group reports which of its tensors have gradients while
+            # gathering them
+            flat, has_grad = self._group._gather_grad()
+            if has_grad.all():
+                return flat, None
+            return flat, np.repeat(has_grad, self._sizes)
+
+        flat = self._flat_grad
+        has_grad = None
+        for n, (p, sl) in enumerate(zip(self.params, self._slices)):
+            grad = p.grad
+            if grad is None:
+                if has_grad is None:
+                    has_grad = np.ones(len(self.params), dtype=bool)
+                has_grad[n] = False
+                continue
+            flat[sl] = grad.reshape(-1)
+
+        if has_grad is None:
+            return flat, None
+        return flat, np.repeat(has_grad, self._sizes)
+
+    def _gather_params(self) -> np.ndarray:
+        """Returns the parameters' values as a flat array"""
+        if self._group is not None:
+            return self._group.data
+        return np.concatenate([p.data.reshape(-1) for p in self.params]).astype(
+            self._dtype, copy=False
+        )
+
+    def _apply_step(self, step: np.ndarray):
+        """Subtracts ``step`` from the parameters, in-place.
+
+        No parameter is modified unless all of them can be written to."""
+        if self._group is not None:
+            writeable = self._group.data.flags.writeable
+        else:
+            writeable = all(p.data.flags.writeable for p in self.params)
+
+        if not writeable:
+            raise ValueError(
+                "An optimizer cannot update a parameter whose data is read-only. "
+                "The parameter is likely participating in a computational graph "
+                "that has not been cleared (e.g. via `backward()` or "
+                "`clear_graph()`)."
+            )
+        if self._group is not None:
+            data = self._group.data
+            data -= step
+            return
+
+        for p, sl in zip(self.params, self._slices):
+            p.data -= step[sl].reshape(p.shape)
+
+    @abstractmethod
+    def _compute_step(
+        self,
+        grad: np.ndarray,
+        state: Dict[str, np.ndarray],
+        params: Optional[np.ndarray],
+    ) -> np.ndarray:
+        """Computes the step to be subtracted from the (flat) parameters.
+
+        Parameters
+        ----------
+        grad : numpy.ndarray, shape-(M,)
+            The flat gradient.
+
+        state : Dict[str, numpy.ndarray]
+            The optimizer's flat, shape-(M,) state buffers. These should be
+            updated in-place.
+
+        params : Optional[numpy.ndarray], shape-(M,)
+            The flat parameter values; provided only if ``self._needs_params``
+            is ``True``.
+
+        Returns
+        -------
+        numpy.ndarray, shape-(M,)
+            The step: ``new_params = params - step``."""
+        raise NotImplementedError()  # pragma: no cover
+
+    @property
+    def _needs_params(self) -> bool:
+        return False
+
+    def step(self):
+        """Updates all of the parameters based on their current gradients.
+
+        Parameters whose gradients are ``None`` are left unchanged, as is
+        their associated optimizer state."""
+        grad, mask = self._gather_grads()
+        params = self._gather_params() if self._needs_params else None
+        self.t += 1
+
+        if mask is None:
+            step = self._compute_step(grad, self.state, params)
+        else:
+            # only the elements of parameters with gradients participate
+            state = {k: v[mask] for k, v in self.state.items()}
+            sub_step = self._compute_step(
+                grad[mask], state, params[mask] if params is not None else None
+            )
+            for k, v in state.items():
+                self.state[k][mask] = v
+
+            step = np.zeros_like(grad)
+            step[mask] = sub_step
+
+        self._apply_step(step)
+
+    def null_grads(self):
+        """Sets the gradient of each parameter to ``None``"""
+        for p in self.params:
+            p.null_grad()
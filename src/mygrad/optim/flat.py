@@ -0,0 +1,239 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+from mygrad.typing import DTypeLikeReals
+
+__all__ = ["FlatParameters"]
+
+
+class FlatParameters:
+    """Packs a collection of tensors into a single, contiguous buffer so that
+    they - and their gradients - can be operated on collectively with single,
+    vectorized NumPy calls.
+
+    Each tensor is modified in-place: its data is copied into the flat buffer,
+    and the tensor then refers to (a reshaped view of) its segment of that
+    buffer. The tensors remain ordinary leaf tensors - i.e. their ``.base`` is
+    ``None`` - and views of them behave as usual. Gradients computed for the
+    tensors during back-propagation are written directly into the matching
+    segments of a flat gradient buffer.
+
+    Parameters
+    ----------
+    tensors : Iterable[Tensor]
+        The leaf tensors to be packed. All of the tensors must be of the same
+        floating-point dtype.
+
+    grad_dtype : Optional[DTypeLikeReals]
+        The dtype of the flat gradient buffer. Defaults to the dtype of the
+        tensors. Use ``grad_dtype=numpy.float32`` for half-precision tensors that
+        are trained under :func:`~mygrad.mixed_precision`.
+
+    Notes
+    -----
+    A tensor's gradient and its segment of ``FlatParameters.grad`` share memory;
+    this buffer is overwritten by subsequent back-propagations.
+
+    Gradients that are not written directly into the flat buffer (e.g. because
+    their dtype differs from ``grad_dtype``) are copied into it upon accessing
+    ``FlatParameters.grad``; segments associated with tensors that have no
+    gradient are zero-filled.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.optim import FlatParameters
+    >>> w = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+    >>> b = mg.tensor([-1.0])
+    >>> params = FlatParameters([w, b])
+    >>> params.data
+    array([ 1.,  2.,  3.,  4., -1.])
+
+    ``w`` and ``b`` now store their data in ``params.data``
+
+    >>> params.data[:] *= 2
+    >>> w
+    Tensor([[2., 4.],
+            [6., 8.]])
+
+    and their gradients are written into ``params.grad``
+
+    >>> (mg.sum(w ** 2) + 3 * b).backward()
+    >>> params.grad
+    array([ 4.,  8., 12., 16.,  3.])
+    >>> w.grad
+    array([[ 4.,  8.],
+           [12., 16.]])
+
+    Operating on the gradients of all of the tensors only requires a single
+    vectorized call
+
+    >>> params.clip_grad_norm(1.0)
+    22.11334...
+    >>> round(float(params.grad_norm()), 6)
+    1.0
+    """
+
+    def __init__(
+        self,
+        tensors: Iterable[Tensor],
+        *,
+        grad_dtype: Optional[DTypeLikeReals] = None,
+    ):
+        tensors = tuple(tensors)
+
+        if not tensors:
+            raise ValueError("`FlatParameters` requires at least one tensor")
+
+        if len(set(id(t) for t in tensors)) != len(tensors):
+            raise ValueError("`FlatParameters` cannot pack the same tensor twice")
+
+        for t in tensors:
+            if not isinstance(t, Tensor):
+                raise TypeError(
+                    f"`FlatParameters` can only pack mygrad tensors, got: {type(t)}"
+                )
+
+            if t.creator is not None or t.base is not None:
+                raise ValueError(
+                    "`FlatParameters` can only pack leaf tensors that are not "
+                    "views of other tensors"
+                )
+
+            if any(True for _ in t._view_children):
+                raise ValueError(
+                    "`FlatParameters` cannot pack a tensor that has existing views"
+                )
+
+        dtypes = set(t.dtype for t in tensors)
+        if len(dtypes) != 1:
+            raise ValueError(
+                f"All of the tensors packed by `FlatParameters` must have the "
+                f"same dtype, got: {sorted(str(d) for d in dtypes)}"
+            )
+
+        (dtype,) = dtypes
+        if not np.issubdtype(dtype, np.floating):
+            raise TypeError(
+                f"`FlatParameters` can only pack floating-point tensors, got: {dtype}"
+            )
+
+        self._tensors: Tuple[Tensor, ...] = tensors
+
+        sizes = [t.size for t in tensors]
+        bounds = np.cumsum([0] + sizes)
+        self._slices: List[slice] = [
+            slice(int(start), int(stop)) for start, stop in zip(bounds, bounds[1:])
+        ]
+
+        self._data = np.empty(int(bounds[-1]), dtype=dtype)
+        self._grad = np.zeros(
+            int(bounds[-1]), dtype=dtype if grad_dtype is None else grad_dtype
+        )
+
+        for t, sl in zip(tensors, self._slices):
+            self._data[sl] = t.data.reshape(-1)
+            t.data = self._data[sl].reshape(t.shape)
+            t._grad_buffer = self._grad[sl].reshape(t.shape)
+
+            if t._grad is not None:
+                np.copyto(t._grad_buffer, t._grad)
+                t._grad = t._grad_buffer
+
+    @property
+    def tensors(self) -> Tuple[Tensor, ...]:
+        """The packed tensors"""
+        return self._tensors
+
+    @property
+    def slices(self) -> Tuple[slice, ...]:
+        """The segment of the flat buffers associated with each tensor"""
+        return tuple(self._slices)
+
+    @property
+    def data(self) -> np.ndarray:
+        """The flat, contiguous array that stores the data of all of the tensors.
+
+        Modifying this array in-place modifies the tensors."""
+        return self._data
+
+    @property
+    def grad(self) -> np.ndarray:
+        """The flat, contiguous array that stores the gradients of all of the
+        tensors.
+
+        Segments associated with tensors that have no gradient are zero-filled."""
+        return self._gather_grad()[0]
+
+    def _gather_grad(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the flat gradient buffer (see ``grad``), along with a
+        boolean array indicating which of the tensors have a gradient."""
+        has_grad = np.ones(len(self._tensors), dtype=bool)
+        for n, (t, sl) in enumerate(zip(self._tensors, self._slices)):
+            grad = t._grad
+            if grad is None:
+                has_grad[n] = False
+                self._grad[sl] = 0
+            elif grad is not t._grad_buffer:
+                np.copyto(t._grad_buffer, grad, casting="unsafe")
+                if grad.dtype == self._grad.dtype:
+                    t._grad = t._grad_buffer
+        return self._grad, has_grad
+
+    def grad_norm(self, ord: Union[int, float] = 2) -> np.floating:
+        """Computes the norm of the gradients of all of the tensors, as if they
+        were concatenated into a single vector.
+
+        Parameters
+        ----------
+        ord : Union[int, float], optional (default=2)
+            The order of the vector-norm (see ``numpy.linalg.norm``).
+
+        Returns
+        -------
+        numpy.floating"""
+        return np.linalg.norm(self.grad, ord=ord)
+
+    def clip_grad_norm(
+        self, max_norm: float, ord: Union[int, float] = 2
+    ) -> np.floating:
+        """Rescales the gradients of all of the tensors, in-place, so that their
+        collective norm does not exceed ``max_norm``.
+
+        Parameters
+        ----------
+        max_norm : float
+            The maximum permitted norm.
+
+        ord : Union[int, float], optional (default=2)
+            The order of the vector-norm (see ``numpy.linalg.norm``).
+
+        Returns
+        -------
+        numpy.floating
+            The norm of the gradients prior to clipping."""
+        if max_norm < 0:
+            raise ValueError(f"`max_norm` must be non-negative, got {max_norm}")
+
+        grad = self.grad
+        total_norm = np.linalg.norm(grad, ord=ord)
+        if total_norm > max_norm:
+            grad *= max_norm / (total_norm + 1e-6)
+        return total_norm
+
+    def __len__(self) -> int:
+        return len(self._tensors)
+
+    def __iter__(self) -> Iterator[Tensor]:
+        return iter(self._tensors)
+
+    def __getitem__(self, index: int) -> Tensor:
+        return self._tensors[index]
+
+    def __repr__(self) -> str:
+        return (
+            f"FlatParameters(num_tensors={len(self._tensors)}, "
+            f"size={self._data.size}, dtype={self._data.dtype})"
+        )
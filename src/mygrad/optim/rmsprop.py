@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+from .base import Optimizer
+
+__all__ = ["RMSProp"]
+
+
+class RMSProp(Optimizer):
+    """The RMSProp optimizer.
+
+    Parameters
+    ----------
+    params : Iterable[Tensor]
+        The non-constant tensors to be updated.
+
+    lr : float, optional (default=1e-2)
+        The learning rate.
+
+    alpha : float, optional (default=0.99)
+        The smoothing constant of the moving average of squared gradients.
+
+    eps : float, optional (default=1e-8)
+        Added to the denominator for numerical stability.
+
+    momentum : float, optional (default=0.)
+        The momentum factor.
+
+    weight_decay : float, optional (default=0.)
+        The L2 penalty factor; ``weight_decay * param`` is added to each gradient.
+
+    Notes
+    -----
+    The update is::
+
+        s = alpha * s + (1 - alpha) * grad ** 2
+        param = param - lr * grad / (sqrt(s) + eps)
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.optim import RMSProp
+    >>> w = mg.tensor([1.0, -2.0])
+    >>> optim = RMSProp([w], lr=0.01)
+    >>> mg.sum(w ** 2).backward()
+    >>> optim.step()
+    >>> w
+    Tensor([ 0.9, -1.9])
+    """
+
+    def __init__(
+        self,
+        params: Iterable[Tensor],
+        *,
+        lr: float = 1e-2,
+        alpha: float = 0.99,
+        eps: float = 1e-8,
+        momentum: float = 0.0,
+        weight_decay: float = 0.0,
+    ):
+        if not 0.0 <= alpha < 1.0:
+            raise ValueError(f"`alpha` must fall within [0, 1), got {alpha}")
+
+        if eps <= 0:
+            raise ValueError(f"`eps` must be positive, got {eps}")
+
+        if momentum < 0:
+            raise ValueError(f"`momentum` must be non-negative, got {momentum}")
+
+        if weight_decay < 0:
+            raise ValueError(f"`weight_decay` must be non-negative, got {weight_decay}")
+
+        self.alpha = alpha
+        self.eps = eps
+        self.momentum = momentum
+        self.weight_decay = weight_decay
+
+        self._state_names = ("square_avg",) + (("velocity",) if momentum else ())
+        super().__init__(params, lr=lr)
+
+    @property
+    def _needs_params(self) -> bool:
+        return bool(self.weight_decay)
+
+    def _compute_step(
+        self,
+        grad: np.ndarray,
+        state: Dict[str, np.ndarray],
+        params: Optional[np.ndarray],
+    ) -> np.ndarray:
+        if self.weight_decay:
+            grad = grad + self.weight_decay * params
+
+        s = state["square_avg"]
+        s *= self.alpha
+        s += (1 - self.alpha) * np.square(grad)
+
+        denom = np.sqrt(s)
+        denom += self.eps
+        step = grad / denom
+
+        if not self.momentum:
+            step *= self.lr
+            return step
+
+        v = state["velocity"]
+        v *= self.momentum
+        v += step
+        return self.lr * v
@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+from .base import Optimizer
+
+__all__ = ["SGD"]
+
+
+class SGD(Optimizer):
+    """Stochastic gradient descent, with optional (Nesterov) momentum and
+    weight decay.
+
+    Parameters
+    ----------
+    params : Iterable[Tensor]
+        The non-constant tensors to be updated.
+
+    lr : float
+        The learning rate.
+
+    momentum : float, optional (default=0.)
+        The momentum factor.
+
+    nesterov : bool, optional (default=False)
+        If ``True``, Nesterov momentum is used.
+
+    weight_decay : float, optional (default=0.)
+        The L2 penalty factor; ``weight_decay * param`` is added to each gradient.
+
+    Notes
+    -----
+    With momentum, the update is::
+
+        v = momentum * v + grad
+        param = param - lr * v
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from mygrad.optim import SGD
+    >>> w = mg.tensor([1.0, 2.0])
+    >>> b = mg.tensor(0.5)
+    >>> optim = SGD([w, b], lr=0.1, momentum=0.9)
+    >>> mg.sum(w ** 2 + b).backward()
+    >>> optim.step()
+    >>> w
+    Tensor([0.8, 1.6])
+    >>> b
+    Tensor(0.3)
+    """
+
+    def __init__(
+        self,
+        params: Iterable[Tensor],
+        *,
+        lr: float,
+        momentum: float = 0.0,
+        nesterov: bool = False,
+        weight_decay: float = 0.0,
+    ):
+        if momentum < 0:
+            raise ValueError(f"`momentum` must be non-negative, got {momentum}")
+
+        if nesterov and not momentum:
+            raise ValueError("Nesterov momentum requires a non-zero `momentum`")
+
+        if weight_decay < 0:
+            raise ValueError(f"`weight_decay` must be non-negative, got {weight_decay}")
+
+        self.momentum = momentum
+        self.nesterov = nesterov
+        self.weight_decay = weight_decay
+
+        if momentum:
+            self._state_names = ("velocity",)
+
+        super().__init__(params, lr=lr)
+
+    @property
+    def _needs_params(self) -> bool:
+        return bool(self.weight_decay)
+
+    def _compute_step(
+        self,
+        grad: np.ndarray,
+        state: Dict[str, np.ndarray],
+        params: Optional[np.ndarray],
+    ) -> np.ndarray:
+        if self.weight_decay:
+            grad = grad + self.weight_decay * params
+
+        if not self.momentum:
+            return self.lr * grad
+
+        v = state["velocity"]
+        v *= self.momentum
+        v += grad
+
+        if self.nesterov:
+            return self.lr * (grad + self.momentum * v)
+        return self.lr * v
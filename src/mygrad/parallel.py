@@ -0,0 +1,508 @@
+"""
+Provides data-parallel gradient computation across a pool of local processes.
+"""
+import atexit
+import multiprocessing as mp
+import queue
+import threading
+import traceback
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "`mygrad.parallel` relies on `multiprocessing.shared_memory`, which "
+        "requires Python 3.8 or later."
+    )
+
+__all__ = ["DataParallel", "data_parallel"]
+
+# (byte-offset, shape, dtype) of an array stored in a shared-memory segment
+_ArrayLayout = Tuple[int, Tuple[int, ...], str]
+
+_ALIGNMENT = 64
+
+
+def _layout_arrays(
+    shapes: Sequence[Tuple[int, ...]], dtypes: Sequence[np.dtype]
+) -> Tuple[List[_ArrayLayout], int]:
+    """Returns the cache-line-aligned layout of the specified arrays within a
+    single buffer, and the total number of bytes required."""
+    layout = []
+    offset = 0
+    for shape, dtype in zip(shapes, dtypes):
+        dtype = np.dtype(dtype)
+        layout.append((offset, tuple(shape), dtype.str))
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        offset += -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+    return layout, max(offset, 1)
+
+
+def _arrays_from_layout(buf, layout: Sequence[_ArrayLayout]) -> List[np.ndarray]:
+    return [
+        np.ndarray(shape, dtype=np.dtype(dtype), buffer=buf, offset=offset)
+        for offset, shape, dtype in layout
+    ]
+
+
+def _worker(
+    rank: int,
+    n_workers: int,
+    fn: Callable,
+    param_shm_name: str,
+    param_layout: List[_ArrayLayout],
+    grad_shm_name: str,
+    grad_dtype: str,
+    num_grad_elements: int,
+    commands: mp.Queue,
+    results: mp.Queue,
+    barrier,
+):
+    """The loop run by each worker process.
+
+    Each step, the worker:
+      1. runs ``fn`` on its shard of the batch and back-propagates
+      2. writes its (weighted) flat gradient to its row of the shared grad-table
+      3. once all workers have done so, sums its assigned chunk of columns of
+         the table into the shared result row (a shared-memory reduce-scatter;
+         the all-gather is implicit since all processes share the result)"""
+    param_shm = SharedMemory(name=param_shm_name)
+    grad_shm = SharedMemory(name=grad_shm_name)
+    batch_shm: Optional[SharedMemory] = None
+
+    params = [
+        Tensor(arr, copy=False)
+        for arr in _arrays_from_layout(param_shm.buf, param_layout)
+    ]
+    sizes = [p.size for p in params]
+    bounds = np.cumsum([0] + sizes)
+
+    # rows 0, ..., n_workers - 1: per-worker gradients; row n_workers: result
+    grad_table = np.ndarray(
+        (n_workers + 1, num_grad_elements), dtype=grad_dtype, buffer=grad_shm.buf
+    )
+    own_grad = grad_table[rank]
+    chunk = np.array_split(np.arange(num_grad_elements), n_workers)[rank]
+    chunk = slice(chunk[0], chunk[-1] + 1) if chunk.size else slice(0, 0)
+
+    try:
+        while True:
+            command = commands.get()
+            if command is None:
+                break
+
+            batch_shm_name, batch_layout, start, stop, weight = command
+            try:
+                if batch_shm is None or batch_shm.name != batch_shm_name:
+                    if batch_shm is not None:
+                        batch_shm.close()
+                    batch_shm = SharedMemory(name=batch_shm_name)
+
+                if start == stop:
+                    # more workers than samples
+                    own_grad[...] = 0
+                    loss_value = 0.0
+                else:
+                    batch = [
+                        Tensor(arr[start:stop], constant=True, copy=False)
+                        for arr in _arrays_from_layout(batch_shm.buf, batch_layout)
+                    ]
+                    loss = fn(*params, *batch)
+                    loss.backward()
+                    loss_value = float(np.asarray(loss)) * weight
+                    del loss, batch
+
+                    for p, lo, hi in zip(params, bounds[:-1], bounds[1:]):
+                        if p.grad is None:
+                            own_grad[lo:hi] = 0
+                        else:
+                            np.multiply(p.grad.reshape(-1), weight, out=own_grad[lo:hi])
+                        p.null_grad()
+            except BaseException:
+                barrier.abort()
+                results.put((rank, None, traceback.format_exc()))
+                continue
+
+            try:
+                barrier.wait()
+                np.sum(grad_table[:n_workers, chunk], axis=0, out=grad_table[-1, chunk])
+            except BaseException:
+                results.put((rank, None, traceback.format_exc()))
+                continue
+            results.put((rank, loss_value, None))
+    finally:
+        del params, grad_table, own_grad
+        param_shm.close()
+        grad_shm.close()
+        if batch_shm is not None:
+            batch_shm.close()
+
+
+class DataParallel:
+    """Computes the gradients of a loss across shards of a batch in parallel,
+    using a persistent pool of local worker processes.
+
+    Each call broadcasts the current values of the parameters, and the batch,
+    to the workers through shared memory. Each worker wraps its shard of the
+    batch and the parameters as tensors - without copying - and runs forward
+    and back-propagation. The workers' gradients are then summed through shared
+    memory (no arrays are pickled) and are set as the parameters' gradients.
+
+    Parameters
+    ----------
+    fn : Callable[..., Tensor]
+        Computes the scalar loss: ``fn(*params, *batch_shard) -> Tensor``.
+        This is run in the worker processes, and thus must be picklable
+        if the "spawn" start method is used.
+
+    params : Iterable[Tensor]
+        The tensors with respect to which gradients are computed (e.g. a
+        :class:`~mygrad.optim.FlatParameters` group).
+
+    n_workers : Optional[int]
+        The number of worker processes. Defaults to the number of CPUs.
+
+    reduction : str, optional (default="mean")
+        If ``"mean"``, ``fn`` is assumed to return the mean loss over the samples
+        in its shard, and the shards' losses and gradients are averaged, weighted
+        by the shards' sizes. If ``"sum"``, they are summed.
+
+    mp_context : Optional[str]
+        The multiprocessing start method to use (e.g. ``"spawn"``).
+
+    Notes
+    -----
+    ``DataParallel`` should be closed - via ``close()`` or by using it as a
+    context manager - to shut down its workers and free its shared memory.
+
+    ``DataParallel`` requires Python 3.8 or later.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import numpy as np
+    >>> from mygrad.parallel import DataParallel
+    >>> def loss_fn(w, x, y):
+    ...     return mg.mean((x @ w - y) ** 2)
+    >>> w = mg.zeros(3)
+    >>> x = np.random.rand(64, 3)
+    >>> y = x @ np.array([1.0, 2.0, 3.0])
+    >>> with DataParallel(loss_fn, [w], n_workers=4) as parallel:
+    ...     for _ in range(100):
+    ...         loss = parallel((x, y))
+    ...         w.data -= 0.5 * w.grad
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Tensor],
+        params: Sequence[Tensor],
+        n_workers: Optional[int] = None,
+        *,
+        reduction: str = "mean",
+        mp_context: Optional[str] = None,
+    ):
+        params = tuple(params)
+
+        if not params:
+            raise ValueError("`DataParallel` requires at least one parameter")
+
+        for p in params:
+            if not isinstance(p, Tensor) or p.constant:
+                raise TypeError(
+                    "The parameters of `DataParallel` must be non-constant tensors"
+                )
+
+        if n_workers is None:
+            n_workers = mp.cpu_count()
+
+        if n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive integer, got {n_workers}")
+
+        if reduction not in {"mean", "sum"}:
+            raise ValueError(f"`reduction` must be 'mean' or 'sum', got {reduction!r}")
+
+        self.fn = fn
+        self.params = params
+        self.n_workers = n_workers
+        self.reduction = reduction
+        self._closed = False
+
+        param_layout, nbytes = _layout_arrays(
+            [p.shape for p in params], [p.dtype for p in params]
+        )
+        self._param_shm = SharedMemory(create=True, size=nbytes)
+        self._shared_params = _arrays_from_layout(self._param_shm.buf, param_layout)
+
+        self._grad_dtype = np.result_type(*(p.dtype for p in params))
+        self._sizes = [p.size for p in params]
+        num_grad_elements = sum(self._sizes)
+        self._grad_shm = SharedMemory(
+            create=True,
+            size=max(
+                (n_workers + 1) * num_grad_elements * self._grad_dtype.itemsize, 1
+            ),
+        )
+        self._grad_result = np.ndarray(
+            (n_workers + 1, num_grad_elements),
+            dtype=self._grad_dtype,
+            buffer=self._grad_shm.buf,
+        )[-1]
+
+        self._batch_shm: Optional[SharedMemory] = None
+
+        ctx = mp.get_context(mp_context)
+        self._barrier = ctx.Barrier(n_workers)
+        self._results = ctx.Queue()
+        self._commands = [ctx.Queue() for _ in range(n_workers)]
+        self._workers = [
+            ctx.Process(
+                target=_worker,
+                args=(
+                    rank,
+                    n_workers,
+                    fn,
+                    self._param_shm.name,
+                    param_layout,
+                    self._grad_shm.name,
+                    self._grad_dtype.str,
+                    num_grad_elements,
+                    self._commands[rank],
+                    self._results,
+                    self._barrier,
+                ),
+                daemon=True,
+            )
+            for rank in range(n_workers)
+        ]
+        for w in self._workers:
+            w.start()
+
+    def _stage_batch(
+        self, batch: Sequence[np.ndarray]
+    ) -> Tuple[str, List[_ArrayLayout]]:
+        """Copies the batch into shared memory, reusing the existing segment
+        when it is large enough."""
+        layout, nbytes = _layout_arrays(
+            [b.shape for b in batch], [b.dtype for b in batch]
+        )
+        if self._batch_shm is None or self._batch_shm.size < nbytes:
+            self._free_batch_shm()
+            self._batch_shm = SharedMemory(create=True, size=nbytes)
+
+        for src, dest in zip(batch, _arrays_from_layout(self._batch_shm.buf, layout)):
+            np.copyto(dest, src)
+        return self._batch_shm.name, layout
+
+    def _free_batch_shm(self):
+        if self._batch_shm is not None:
+            self._batch_shm.close()
+            self._batch_shm.unlink()
+            self._batch_shm = None
+
+    def __call__(self, batch: Union[np.ndarray, Sequence[np.ndarray]]) -> float:
+        """Computes the loss and the parameters' gradients for a batch.
+
+        Parameters
+        ----------
+        batch : Union[ArrayLike, Sequence[ArrayLike]]
+            The batch (or a sequence of arrays comprising the batch), which is
+            sharded along its leading axis across the workers.
+
+        Returns
+        -------
+        float
+            The loss over the entire batch."""
+        if self._closed:
+            raise RuntimeError("This `DataParallel` instance has been closed")
+
+        if isinstance(batch, (np.ndarray, Tensor)):
+            batch = (batch,)
+        batch = tuple(np.asarray(b) for b in batch)
+
+        lengths = set(len(b) for b in batch)
+        if len(lengths) != 1:
+            raise ValueError(
+                "All of the arrays in the batch must have the same leading dimension"
+            )
+        (batch_size,) = lengths
+
+        # broadcast the parameters' current values
+        for src, dest in zip(self.params, self._shared_params):
+            np.copyto(dest, src.data)
+
+        name, layout = self._stage_batch(batch)
+
+        bounds = np.linspace(0, batch_size, self.n_workers + 1).astype(int)
+        for rank, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+            weight = (stop - start) / batch_size if self.reduction == "mean" else 1.0
+            self._commands[rank].put((name, layout, int(start), int(stop), weight))
+
+        losses = [None] * self.n_workers
+        errors = []
+        for _ in range(self.n_workers):
+            rank, loss, error = self._get_result()
+            losses[rank] = loss
+            if error is not None:
+                errors.append((rank, error))
+
+        if errors:
+            self._barrier.reset()
+            # report the root cause rather than a resulting broken barrier
+            rank, error = min(
+                errors, key=lambda x: ("BrokenBarrierError" in x[1], x[0])
+            )
+            raise RuntimeError(f"`DataParallel` worker {rank} failed:\n{error}")
+
+        lo = 0
+        for p, size in zip(self.params, self._sizes):
+            grad = self._grad_result[lo : lo + size].reshape(p.shape)
+            lo += size
+            buffer = p._grad_buffer
+            if buffer is not None and buffer.dtype == grad.dtype:
+                np.copyto(buffer, grad)
+                p._grad = buffer
+            else:
+                p._grad = grad.astype(p.dtype, copy=True)
+        return sum(losses)
+
+    def _get_result(self):
+        while True:
+            try:
+                return self._results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [n for n, w in enumerate(self._workers) if not w.is_alive()]
+                if dead:
+                    self.close()
+                    raise RuntimeError(
+                        f"`DataParallel` worker(s) {dead} exited unexpectedly"
+                    )
+
+    def close(self):
+        """Shuts down the workers and frees all shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+
+        for w, commands in zip(self._workers, self._commands):
+            if w.is_alive():
+                commands.put(None)
+        for w in self._workers:
+            w.join(timeout=5)
+            if w.is_alive():  # pragma: no cover
+                w.terminate()
+                w.join()
+
+        del self._shared_params, self._grad_result
+        self._param_shm.close()
+        self._param_shm.unlink()
+        self._grad_shm.close()
+        self._grad_shm.unlink()
+        self._free_batch_shm()
+
+    def __enter__(self) -> "DataParallel":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if not getattr(self, "_closed", True):
+            self.close()
+
+
+# The pool used by `data_parallel`; reused across calls with matching settings
+_pool: Optional[DataParallel] = None
+_pool_lock = threading.Lock()
+
+
+def _close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+atexit.register(_close_pool)
+
+
+def data_parallel(
+    fn: Callable[..., Tensor],
+    batch: Union[np.ndarray, Sequence[np.ndarray]],
+    n_workers: Optional[int] = None,
+    *,
+    params: Sequence[Tensor],
+    reduction: str = "mean",
+) -> float:
+    """Computes the loss ``fn(*params, *batch)`` and the gradients of the
+    parameters by sharding the batch across a pool of worker processes.
+
+    The worker pool persists across calls that use the same ``fn``, ``params``,
+    ``n_workers``, and ``reduction``; see :class:`~mygrad.parallel.DataParallel`
+    for details.
+
+    Parameters
+    ----------
+    fn : Callable[..., Tensor]
+        Computes the scalar loss: ``fn(*params, *batch_shard) -> Tensor``.
+
+    batch : Union[ArrayLike, Sequence[ArrayLike]]
+        The batch (or a sequence of arrays comprising the batch), which is
+        sharded along its leading axis.
+
+    n_workers : Optional[int]
+        The number of worker processes. Defaults to the number of CPUs.
+
+    params : Sequence[Tensor]
+        The tensors with respect to which gradients are computed.
+
+    reduction : str, optional (default="mean")
+        ``"mean"`` if ``fn`` returns the mean loss over the samples of a shard,
+        or ``"sum"`` if it returns the sum.
+
+    Returns
+    -------
+    float
+        The loss over the entire batch. The gradients of ``params`` are set
+        in-place.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import numpy as np
+    >>> def loss_fn(w, x, y):
+    ...     return mg.mean((x @ w - y) ** 2)
+    >>> w = mg.tensor([0.0, 0.0])
+    >>> x = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 1.0]])
+    >>> y = np.array([1.0, 2.0, 3.0, 4.0])
+    >>> mg.data_parallel(loss_fn, (x, y), n_workers=2, params=[w])
+    7.5
+    >>> w.grad
+    array([-6. , -4.5])
+    """
+    global _pool
+
+    params = tuple(params)
+    with _pool_lock:
+        pool = _pool
+        if (
+            pool is None
+            or pool._closed
+            or pool.fn is not fn
+            or pool.reduction != reduction
+            or (n_workers is not None and pool.n_workers != n_workers)
+            or len(pool.params) != len(params)
+            or any(a is not b for a, b in zip(pool.params, params))
+        ):
+            if pool is not None:
+                pool.close()
+            pool = _pool = DataParallel(
+                fn, params, n_workers=n_workers, reduction=reduction
+            )
+    return pool(batch)
@@ -0,0 +1,198 @@
+"""
+Provides a single-file, zero-copy checkpoint format for tensors.
+
+File layout::
+
+    magic string (7 bytes) | format version (1 byte) | header length (uint64-LE)
+    header: JSON, padded with spaces so that the data-blocks are aligned
+    data-blocks: the raw, C-ordered bytes of each array, each aligned to
+                 ``ALIGNMENT`` bytes
+
+Each header-entry records the name, dtype, shape, ``constant`` flag, and the
+offset of the associated array's data-block.
+"""
+import json
+import os
+from typing import Dict, Mapping, Union
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+from mygrad.typing import ArrayLike
+
+__all__ = ["save", "load"]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"\x93MYGRAD"
+VERSION = 1
+ALIGNMENT = 64
+
+_PREFIX_SIZE = len(MAGIC) + 1 + 8
+
+
+def _aligned(n: int) -> int:
+    return -(-n // ALIGNMENT) * ALIGNMENT
+
+
+def save(path: PathLike, tensors: Mapping[str, Union[Tensor, ArrayLike]]):
+    """Saves a collection of named tensors to a single file.
+
+    The file stores the raw data of each tensor in an aligned block, so that it
+    can be loaded - with :func:`~mygrad.load` - without copying, via memory-
+    mapping. Only the tensors' data and ``constant`` flags are saved; their
+    computational graphs and gradients are not.
+
+    Parameters
+    ----------
+    path : PathLike
+        The file to be written. An existing file is overwritten.
+
+    tensors : Mapping[str, Union[Tensor, ArrayLike]]
+        The tensors, by name. Array-likes are saved as tensors whose
+        ``constant`` flag is inferred from their dtype upon loading.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from pathlib import Path
+    >>> from tempfile import mkdtemp
+    >>> path = Path(mkdtemp()) / "checkpoint.mg"
+    >>> w = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+    >>> mg.save(path, {"w": w, "step": mg.tensor(10)})
+    >>> mg.load(path)
+    {'w': Tensor([[1., 2.],
+            [3., 4.]]), 'step': Tensor(10)}
+    """
+    entries = []
+    arrays = []
+    for name, tensor in tensors.items():
+        if not isinstance(name, str):
+            raise TypeError(f"Tensors must be saved by `str` names, got: {name!r}")
+
+        if isinstance(tensor, Tensor):
+            constant = tensor.constant
+            arr = tensor.data
+        else:
+            constant = None
+            arr = np.asarray(tensor)
+
+        if arr.dtype.hasobject:
+            raise TypeError(
+                f"`mygrad.save` cannot save arrays of dtype {arr.dtype} (entry {name!r})"
+            )
+
+        entries.append(
+            {
+                "name": name,
+                "dtype": np.lib.format.dtype_to_descr(arr.dtype),
+                "shape": list(arr.shape),
+                "constant": constant,
+                "nbytes": arr.nbytes,
+            }
+        )
+        arrays.append(arr)
+
+    # The size of the header depends on the offsets that it records; reserve
+    # enough room for offsets of any size, then pad.
+    for entry in entries:
+        entry["offset"] = 10 ** 20
+    header_size = _aligned(_PREFIX_SIZE + len(json.dumps(entries).encode()))
+
+    offset = header_size
+    for entry in entries:
+        entry["offset"] = offset
+        offset = _aligned(offset + entry["nbytes"])
+
+    header = json.dumps(entries).encode()
+    header += b" " * (header_size - _PREFIX_SIZE - len(header))
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(bytes([VERSION]))
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+
+        for entry, arr in zip(entries, arrays):
+            f.seek(entry["offset"])
+            # writes directly from the array's memory
+            f.write(np.ascontiguousarray(arr).reshape(-1).view(np.uint8).data)
+
+        # pads the file out to its full size
+        f.truncate(offset)
+
+
+def load(path: PathLike, *, mmap: bool = False) -> Dict[str, Tensor]:
+    """Loads the tensors saved by :func:`~mygrad.save`.
+
+    Parameters
+    ----------
+    path : PathLike
+        The file to be read.
+
+    mmap : bool, optional (default=False)
+        If ``True``, the file is memory-mapped and the tensors' data are
+        views of the mapping; data is only read from disk as it is accessed,
+        thus loading is instantaneous regardless of the file's size.
+
+        The mapping is copy-on-write: the tensors can be modified in-place
+        (e.g. by an optimizer), but these changes are never written to the
+        file.
+
+    Returns
+    -------
+    Dict[str, Tensor]
+        The tensors, by name, in the order that they were saved. The tensors
+        have no computational graphs.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> from pathlib import Path
+    >>> from tempfile import mkdtemp
+    >>> path = Path(mkdtemp()) / "embeddings.mg"
+    >>> mg.save(path, {"table": mg.ones((4, 3))})
+    >>> table = mg.load(path, mmap=True)["table"]
+    >>> table.sum()
+    Tensor(12., dtype=float32)
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX_SIZE)
+        if len(prefix) != _PREFIX_SIZE or not prefix.startswith(MAGIC):
+            raise ValueError(f"{path} is not a file written by `mygrad.save`")
+
+        version = prefix[len(MAGIC)]
+        if version > VERSION:
+            raise ValueError(
+                f"{path} was written using format version {version}; this "
+                f"version of mygrad only supports versions <= {VERSION}"
+            )
+
+        header_len = int.from_bytes(prefix[len(MAGIC) + 1 :], "little")
+        entries = json.loads(f.read(header_len).decode())
+
+        if mmap:
+            size = max((e["offset"] + e["nbytes"] for e in entries), default=0)
+            buffer = (
+                np.memmap(f, dtype=np.uint8, mode="c", shape=(size,))
+                if size
+                else np.empty(0, dtype=np.uint8)
+            )
+
+        out = {}
+        for entry in entries:
+            dtype = np.lib.format.descr_to_dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            start = entry["offset"]
+
+            if mmap:
+                block = buffer[start : start + entry["nbytes"]]
+                arr = block.view(dtype).reshape(shape)
+            else:
+                arr = np.empty(shape, dtype=dtype)
+                f.seek(start)
+                if f.readinto(arr.reshape(-1).view(np.uint8).data) != arr.nbytes:
+                    raise ValueError(f"{path} is truncated")
+
+            out[entry["name"]] = Tensor(arr, constant=entry["constant"], copy=False)
+    return out
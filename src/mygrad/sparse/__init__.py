@@ -0,0 +1,12 @@
+"""
+Differentiable operations on sparse matrices, backed by ``scipy.sparse``.
+
+A sparse operand is specified by a ``scipy.sparse`` matrix - which defines its
+sparsity pattern - along with an optional tensor of the values of its stored
+entries. Gradients with respect to these values are restricted to the sparsity
+pattern, and the cost of each operation scales with the number of stored
+entries. This module requires ``scipy`` to be installed.
+"""
+from .funcs import gather_rows, matmul, sum
+
+__all__ = ["matmul", "sum", "gather_rows"]
@@ -0,0 +1,269 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from mygrad.tensor_base import Tensor
+from mygrad.typing import ArrayLike
+
+from .ops import SparseMatMul, SparseSum, sp
+
+__all__ = ["matmul", "sum", "gather_rows"]
+
+
+def _as_coo(a) -> "sp.coo_matrix":
+    if not sp.issparse(a):
+        raise TypeError(
+            f"`a` must be a scipy.sparse matrix, got an object of type: {type(a)}"
+        )
+    if a.ndim != 2:  # pragma: no cover
+        raise ValueError(f"`a` must be a 2D sparse matrix, got a {a.ndim}D matrix")
+    # the order of the stored entries is preserved for COO, CSR, and CSC matrices
+    return a.tocoo(copy=False)
+
+
+def _check_values(values: ArrayLike, pattern: "sp.coo_matrix") -> ArrayLike:
+    if values is None:
+        return pattern.data
+
+    if np.shape(values) != pattern.data.shape:
+        raise ValueError(
+            f"`values` must have one entry per stored entry of `a`; expected "
+            f"shape-{pattern.data.shape}, got shape-{np.shape(values)}"
+        )
+    return values
+
+
+def matmul(
+    a,
+    x: ArrayLike,
+    *,
+    values: Optional[ArrayLike] = None,
+    constant: Optional[bool] = None,
+) -> Tensor:
+    r"""Matrix product of a sparse matrix and a dense tensor: ``a @ x``.
+
+    The computation, as well as the back-propagation through it, scales with
+    the number of stored entries of ``a``.
+
+    Parameters
+    ----------
+    a : scipy.sparse.spmatrix, shape-(M, N)
+        The sparse matrix. Its stored entries define the sparsity pattern of the
+        operand.
+
+    x : ArrayLike, shape-(N,) or shape-(N, K)
+        The dense operand.
+
+    values : Optional[ArrayLike], shape-(nnz,)
+        The values of the stored entries of ``a``, aligned with
+        ``a.tocoo().data`` - which is simply ``a.data`` for a COO, CSR, or
+        CSC matrix. If provided, these are used in place of ``a``'s values,
+        and the gradient of ``values`` is computed; otherwise ``a``'s values
+        are treated as a constant.
+
+    constant : Optional[bool]
+        If ``True``, this tensor is treated as a constant, and thus does not
+        facilitate back propagation (i.e. ``constant.grad`` will always return
+        ``None``).
+
+        Defaults to ``False`` for float-type data.
+        Defaults to ``True`` for integer-type data.
+
+        Integer-type tensors must be constant.
+
+    Returns
+    -------
+    Tensor, shape-(M,) or shape-(M, K)
+
+    Notes
+    -----
+    The gradient of ``values`` is restricted to the sparsity pattern of ``a``;
+    duplicate entries in ``a`` are summed, thus each receives the same gradient.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import scipy.sparse as sp
+    >>> from mygrad.sparse import matmul
+
+    A graph-convolution over a sparse adjacency matrix
+
+    >>> adjacency = sp.csr_matrix([[0., 1., 1.], [1., 0., 0.], [1., 0., 0.]])
+    >>> features = mg.tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    >>> out = matmul(adjacency, features)
+    >>> out
+    Tensor([[ 8., 10.],
+            [ 1.,  2.],
+            [ 1.,  2.]])
+    >>> out.backward()
+    >>> features.grad
+    array([[2., 2.],
+           [1., 1.],
+           [1., 1.]])
+
+    Learning the weights of the graph's edges
+
+    >>> weights = mg.tensor(adjacency.data)
+    >>> out = matmul(adjacency, features, values=weights)
+    >>> out.backward()
+    >>> weights.grad  # one gradient per edge: d(sum(out))/dA[i, j] = sum(x[j])
+    array([ 7., 11.,  3.,  3.])
+    """
+    pattern = _as_coo(a)
+    values = _check_values(values, pattern)
+    return Tensor._op(SparseMatMul, values, x, op_args=(pattern,), constant=constant)
+
+
+def sum(
+    a,
+    axis: Optional[int] = None,
+    *,
+    values: Optional[ArrayLike] = None,
+    constant: Optional[bool] = None,
+) -> Tensor:
+    """Sums the entries of a sparse matrix over the given axis.
+
+    Parameters
+    ----------
+    a : scipy.sparse.spmatrix, shape-(M, N)
+        The sparse matrix.
+
+    axis : Optional[int]
+        The axis of ``a`` to sum over. By default all of its entries are summed.
+
+    values : Optional[ArrayLike], shape-(nnz,)
+        The values of the stored entries of ``a``, aligned with
+        ``a.tocoo().data``. If provided, these are used in place of ``a``'s
+        values, and the gradient of ``values`` is computed.
+
+    constant : Optional[bool]
+        If ``True``, this tensor is treated as a constant, and thus does not
+        facilitate back propagation (i.e. ``constant.grad`` will always return
+        ``None``).
+
+        Defaults to ``False`` for float-type data.
+        Defaults to ``True`` for integer-type data.
+
+        Integer-type tensors must be constant.
+
+    Returns
+    -------
+    Tensor, shape-(), shape-(N,), or shape-(M,)
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import scipy.sparse as sp
+    >>> from mygrad.sparse import sum
+    >>> a = sp.coo_matrix(([1.0, 2.0, 3.0], ([0, 0, 1], [1, 2, 0])), shape=(2, 3))
+    >>> values = mg.tensor([1.0, 2.0, 3.0])
+    >>> out = sum(a, axis=1, values=values)  # the sum of each row
+    >>> out
+    Tensor([3., 3.])
+    >>> (out * mg.tensor([1.0, 10.0])).backward()
+    >>> values.grad
+    array([ 1.,  1., 10.])
+    """
+    pattern = _as_coo(a)
+    values = _check_values(values, pattern)
+
+    if axis is not None:
+        if not -2 <= axis < 2:
+            raise ValueError(f"`axis` must be one of: None, -2, -1, 0, 1; got {axis}")
+        axis %= 2
+
+    return Tensor._op(SparseSum, values, op_args=(pattern, axis), constant=constant)
+
+
+def gather_rows(
+    a, rows: ArrayLike, *, values: Optional[ArrayLike] = None
+) -> Tuple["sp.coo_matrix", Tensor]:
+    """Gathers rows of a sparse matrix, e.g. the rows of an adjacency matrix
+    that correspond to a mini-batch of nodes.
+
+    Only the stored entries of the gathered rows are touched, thus the cost
+    scales with the number of gathered entries, rather than with the size of
+    ``a``.
+
+    Parameters
+    ----------
+    a : scipy.sparse.spmatrix, shape-(M, N)
+        The sparse matrix.
+
+    rows : ArrayLike[int], shape-(R,)
+        The indices of the rows to gather. Indices may be negative and may
+        repeat.
+
+    values : Optional[ArrayLike], shape-(nnz,)
+        The values of the stored entries of ``a``, aligned with
+        ``a.tocoo().data``. If provided, the gathered values are a
+        differentiable function of ``values``.
+
+    Returns
+    -------
+    Tuple[scipy.sparse.coo_matrix, Tensor]
+        The shape-(R, N) sparse matrix of gathered rows, and a tensor of the
+        values of its stored entries. These can be passed to the other functions
+        in ``mygrad.sparse``, as ``a`` and ``values`` respectively.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> import scipy.sparse as sp
+    >>> from mygrad.sparse import gather_rows, matmul
+    >>> a = sp.csr_matrix([[0., 1.], [2., 0.], [3., 4.]])
+    >>> values = mg.tensor(a.data)
+    >>> batch, batch_values = gather_rows(a, [2, 0], values=values)
+    >>> batch.toarray()
+    array([[3., 4.],
+           [0., 1.]])
+    >>> matmul(batch, mg.tensor([1.0, 1.0]), values=batch_values).backward()
+    >>> values.grad
+    array([1., 0., 1., 1.])
+    """
+    pattern = _as_coo(a)
+    if values is not None:
+        values = _check_values(values, pattern)
+
+    num_rows = pattern.shape[0]
+    rows = np.asarray(rows.data if isinstance(rows, Tensor) else rows)
+    if rows.ndim != 1 or not (
+        issubclass(rows.dtype.type, np.integer) or rows.size == 0
+    ):
+        raise TypeError("`rows` must be a 1D array of integers")
+    if rows.size and not (-num_rows <= rows.min() and rows.max() < num_rows):
+        raise IndexError(
+            f"Row indices must fall within [{-num_rows}, {num_rows}), got: "
+            f"[{rows.min()}, {rows.max()}]"
+        )
+    rows = rows.astype(np.intp) % max(num_rows, 1)
+
+    # the stored entries, grouped by row
+    order = np.argsort(pattern.row, kind="stable")
+    counts = np.bincount(pattern.row, minlength=num_rows)
+    starts = np.cumsum(counts) - counts
+
+    # the positions, in `order`, of the entries of the gathered rows
+    gathered_counts = counts[rows]
+    num_gathered = gathered_counts.sum()
+    offsets = starts[rows] - (np.cumsum(gathered_counts) - gathered_counts)
+    entries = order[np.repeat(offsets, gathered_counts) + np.arange(num_gathered)]
+
+    gathered = sp.coo_matrix(
+        (
+            pattern.data[entries],
+            (
+                np.repeat(np.arange(len(rows)), gathered_counts),
+                pattern.col[entries],
+            ),
+        ),
+        shape=(len(rows), pattern.shape[1]),
+    )
+
+    if values is None:
+        gathered_values = Tensor(gathered.data, constant=True)
+    else:
+        if not isinstance(values, Tensor):
+            values = Tensor(values, copy=False)
+        gathered_values = values[entries]
+    return gathered, gathered_values
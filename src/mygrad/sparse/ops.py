@@ -0,0 +1,110 @@
+from typing import Optional
+
+import numpy as np
+
+from mygrad.operation_base import Operation
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "The package `scipy` must be installed in order to access `mygrad.sparse`."
+    )
+
+__all__ = ["SparseMatMul", "SparseSum"]
+
+
+def _to_csr(values: np.ndarray, pattern: "sp.coo_matrix") -> "sp.csr_matrix":
+    """Returns the CSR matrix whose stored entries are ``values``, arranged
+    according to the sparsity pattern of ``pattern``. Duplicate entries are
+    summed."""
+    return sp.csr_matrix((values, (pattern.row, pattern.col)), shape=pattern.shape)
+
+
+class SparseMatMul(Operation):
+    """f(values, x) -> A @ x, where A is the sparse matrix whose stored entries
+    are ``values``"""
+
+    _saved_buffers = ("_mat",)
+
+    def __call__(self, values, x, pattern: "sp.coo_matrix"):
+        """
+        Parameters
+        ----------
+        values : mygrad.Tensor, shape-(nnz,)
+            The stored entries of the sparse matrix, aligned with
+            ``pattern.data``.
+
+        x : mygrad.Tensor, shape-(N,) or shape-(N, K)
+            The dense operand.
+
+        pattern : scipy.sparse.coo_matrix, shape-(M, N)
+            Specifies the rows and columns of the stored entries.
+
+        Returns
+        -------
+        numpy.ndarray, shape-(M,) or shape-(M, K)"""
+        self.variables = (values, x)
+        self.pattern = pattern
+        self._mat: Optional["sp.csr_matrix"] = _to_csr(values.data, pattern)
+        return np.asarray(self._mat @ x.data)
+
+    def backward_var(self, grad, index, **kwargs):
+        values, x = self.variables
+        if index == 0:
+            # the gradient only exists for the stored entries:
+            # dL/dA[i, j] = grad[i] . x[j]
+            row, col = self.pattern.row, self.pattern.col
+            if x.ndim == 1:
+                return grad[row] * x.data[col]
+            return np.einsum("ij,ij->i", grad[row], x.data[col])
+        else:
+            return np.asarray(self._mat.T @ grad)
+
+
+class SparseSum(Operation):
+    """f(values) -> sum(A, axis), where A is the sparse matrix whose stored
+    entries are ``values``"""
+
+    def __call__(self, values, pattern: "sp.coo_matrix", axis: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        values : mygrad.Tensor, shape-(nnz,)
+            The stored entries of the sparse matrix, aligned with
+            ``pattern.data``.
+
+        pattern : scipy.sparse.coo_matrix, shape-(M, N)
+            Specifies the rows and columns of the stored entries.
+
+        axis : Optional[int]
+            The axis of the matrix to sum over.
+
+        Returns
+        -------
+        numpy.ndarray, shape-(), shape-(N,) or shape-(M,)"""
+        self.variables = (values,)
+        self.pattern = pattern
+        self.axis = axis
+
+        if axis is None:
+            return np.sum(values.data)
+
+        index = pattern.col if axis == 0 else pattern.row
+        size = pattern.shape[1 - axis]
+        dtype = np.sum(values.data[:0]).dtype
+
+        if issubclass(values.dtype.type, np.floating):
+            # `bincount` is much faster than `add.at`
+            out = np.bincount(index, weights=values.data, minlength=size)
+            return out.astype(dtype, copy=False)
+
+        out = np.zeros(size, dtype=dtype)
+        np.add.at(out, index, values.data)
+        return out
+
+    def backward_var(self, grad, index, **kwargs):
+        (values,) = self.variables
+        if self.axis is None:
+            return np.full(values.shape, grad, dtype=grad.dtype)
+        return grad[self.pattern.col if self.axis == 0 else self.pattern.row]
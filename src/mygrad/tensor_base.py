@@ -3,6 +3,7 @@ This module defines the base tensor class along with all of its essential
 attributes and special methods. Public math methods, e.g. ``sum``, ``mean``,
 etc., are bound to the Tensor class in ``mygrad.__init__.py``.
 """
+from contextlib import contextmanager
 from numbers import Integral, Number
 from typing import (
     TYPE_CHECKING,
@@ -23,9 +24,11 @@ from weakref import ReferenceType, finalize
 
 import numpy as np
 
+import mygrad._utils.backward_scheduling as _sched
 import mygrad._utils.duplicating_graph as _dup
 import mygrad._utils.graph_tracking as _track
 import mygrad._utils.lock_management as _mem
+import mygrad._utils.precision as _precision
 from mygrad._tensor_core_ops.indexing import GetItem, SetItem
 from mygrad._utils import (
     WeakRef,
@@ -410,6 +413,21 @@ _REGISTERED_NO_DIFF_NUMPY_FUNCS: Set[Callable[..., np.ndarray]] = {
 }
 
 
+_overrides_loaded = False
+
+
+def _load_numpy_overrides():
+    """mygrad's function modules, which register the overrides of NumPy's
+    functions and ufuncs, are imported lazily (see ``mygrad.__getattr__``).
+    This imports them prior to the first dispatch of a NumPy function to a
+    tensor."""
+    global _overrides_loaded
+    import mygrad
+
+    mygrad._load_function_modules()
+    _overrides_loaded = True
+
+
 class implements_numpy_override:
     """Registers a mygrad-based override for a NumPy function of the same name, via
     the standard __array_function__ interface. [1]_
@@ -627,6 +645,12 @@ class Tensor:
 
     __array_priority__ = 15.0
 
+    # If set, a preallocated array (of shape ``self.shape``) that this tensor's
+    # gradient gets written into during back-propagation. This is used to pack
+    # the gradients of many tensors into a single, contiguous buffer; see
+    # ``mygrad.optim.FlatParameters``
+    _grad_buffer: Optional[np.ndarray] = None
+
     def __array_ufunc__(
         self, ufunc: Type[np.ufunc], method: str, *inputs: ArrayLike, **kwargs
     ) -> Union["Tensor", np.ndarray]:
@@ -684,6 +708,9 @@ class Tensor:
         >>> np.less_equal(x, 1)
         array([ True, False])
         """
+        if not _overrides_loaded:
+            _load_numpy_overrides()
+
         out = kwargs.pop("out", (None,))
         if len(out) > 1:  # pragma: no cover
             raise ValueError(
@@ -695,7 +722,9 @@ class Tensor:
 
         try:
             # differentiable ufunc implemented by mygrad
-            return getattr(_REGISTERED_UFUNC[ufunc], method)(*inputs, **kwargs, out=out)
+            if out is not None:
+                kwargs["out"] = out
+            return getattr(_REGISTERED_UFUNC[ufunc], method)(*inputs, **kwargs)
         except KeyError:
             pass
 
@@ -721,6 +750,9 @@ class Tensor:
     def __array_function__(
         self, func: Callable[..., np.ndarray], types, args, kwargs
     ) -> Union["Tensor", np.ndarray]:
+        if not _overrides_loaded:
+            _load_numpy_overrides()
+
         if func in _REGISTERED_DIFFERENTIABLE_NUMPY_FUNCS:
             return _REGISTERED_DIFFERENTIABLE_NUMPY_FUNCS[func](*args, **kwargs)
         elif func in _REGISTERED_NO_DIFF_NUMPY_FUNCS:
@@ -737,6 +769,37 @@ class Tensor:
     def __array__(self, dtype: DTypeLike = None) -> np.ndarray:
         return np.array(self.data, dtype=dtype, copy=False)
 
+    def __dlpack__(self, stream: None = None):
+        """Exports the tensor's data as a DLPack capsule, for consumption by
+        other array libraries (see :func:`~mygrad.from_dlpack`).
+
+        The capsule shares memory with the tensor; no copy is made.
+
+        Notes
+        -----
+        Requires NumPy 1.22 or later.
+
+        DLPack cannot mark memory as read-only. Thus, if the tensor's memory is
+        read-only - e.g. because it is locked by MyGrad's memory guard while the
+        tensor participates in a computational graph - a copy of the data is
+        exported instead, so that the consumer cannot corrupt the graph.
+
+        The memory of a tensor that was exported prior to participating in a
+        graph is not protected against writes made by the consumer."""
+        data = self.data
+        if not hasattr(data, "__dlpack__"):  # pragma: no cover
+            raise NotImplementedError(
+                "Exporting a tensor via DLPack requires NumPy 1.22 or later; the "
+                f"installed version is {np.__version__}"
+            )
+        if not data.flags.writeable:
+            data = np.copy(data)
+        return data.__dlpack__(stream=stream)
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        """The DLPack device-type and device-ID of the tensor's memory"""
+        return self.data.__dlpack_device__()
+
     def __init__(
         self,
         x: ArrayLike,
@@ -910,7 +973,15 @@ class Tensor:
         if self._base is None:
             return self._grad
 
-        if self._view_grad is not None and self._view_grad.base is self._base._grad:
+        if self._view_grad is not None and (
+            self._view_grad.base is self._base._grad
+            or (
+                # base's gradient resides in a preallocated buffer
+                self._base._grad is not None
+                and self._base._grad.base is not None
+                and self._view_grad.base is self._base._grad.base
+            )
+        ):
             # view grad has been computed already
             return self._view_grad
 
@@ -1065,6 +1136,36 @@ class Tensor:
 
         out: Optional[np.ndarray]
 
+        if Op.forward is not None and not _track.TRACK_GRAPH:
+            # No graph is tracked: skip the creation of the operation and of
+            # tensors for its inputs, and run its forward kernel directly
+            arrays = [
+                var.data if isinstance(var, Tensor) else np.asarray(var)
+                for var in input_vars
+            ]
+            if op_args is None:
+                op_args = ()
+
+            if op_kwargs is None:
+                op_kwargs = {}
+
+            if out is not None:
+                op_kwargs = dict(op_kwargs, out=out)
+
+            op_out = Op.forward(*arrays, *op_args, **op_kwargs)
+            if isinstance(op_out, tuple):
+                return tuple(
+                    cls(arr, constant=constant, copy=False, _creator=None, _base=None)
+                    for arr in op_out
+                )
+            return cls(
+                op_out,
+                constant=constant,
+                copy=False,
+                _creator=None,
+                _base=None,
+            )
+
         _uniques_bases_then_arrs = ()
 
         tensor_vars = tuple(
@@ -1072,8 +1173,13 @@ class Tensor:
             for var in input_vars
         )
 
+        # graph-tracking and memory-guarding states are context-local;
+        # read them once
+        track_graph = _track.TRACK_GRAPH
+        mem_guard = _mem.MEM_GUARD
+
         # cast all input-vars to tensors
-        if _track.TRACK_GRAPH and _mem.MEM_GUARD:
+        if track_graph and mem_guard:
             # lock memory of array data
             _uniques_bases_then_arrs = WeakRefIterable(
                 _mem.lock_arr_writeability(x)
@@ -1088,19 +1194,49 @@ class Tensor:
 
         f = Op()
 
+        # The output of an operation whose inputs are all constants is itself a
+        # constant, which is never back-propagated through. Thus its forward
+        # kernel is run in place of `f.__call__`, which would compute and save
+        # state for back-propagation. The operation is still recorded in the
+        # graph, for the sake of memory-locking and in-place/view semantics.
+        forward_only = (
+            track_graph
+            and Op.forward is not None
+            and constant is not False
+            and not Op.can_return_view
+            and all(var._constant for var in tensor_vars)
+        )
+
         try:
-            if out is None:
+            if forward_only:
+                f.variables = tensor_vars
+                where = op_kwargs.get("where", True)
+                if where is not True and where is not _NoValue:
+                    # an in-place update consults the mask of the operation
+                    # that performed it
+                    f.where = where
+                arrays = (var.data for var in tensor_vars)
+                if out is None:
+                    op_out = Op.forward(*arrays, *op_args, **op_kwargs)
+                else:
+                    op_out = Op.forward(*arrays, *op_args, **op_kwargs, out=out)
+            elif out is None:
                 op_out: np.ndarray = f(*tensor_vars, *op_args, **op_kwargs)
             else:
                 op_out: np.ndarray = f(*tensor_vars, *op_args, **op_kwargs, out=out)
         except Exception as e:
-            if _track.TRACK_GRAPH and _mem.MEM_GUARD:
+            if track_graph and mem_guard:
                 _mem.release_writeability_lock_on_op(_uniques_bases_then_arrs)
             raise e
 
-        if not _track.TRACK_GRAPH:
+        if not track_graph:
             # execute operation without tracking creator or any graph
             # information
+            if isinstance(op_out, tuple):
+                return tuple(
+                    cls(arr, constant=constant, copy=False, _creator=None, _base=None)
+                    for arr in op_out
+                )
             return cls(
                 op_out,
                 constant=constant,  # constant not determined by graph info
@@ -1118,8 +1254,8 @@ class Tensor:
 
         # Determine whether or not op was a view; if so, `base`
         # points to parent Tensor
-        op_out_base = op_out.base
-        if f.can_return_view and op_out_base is not None:
+        if f.can_return_view and op_out.base is not None:
+            op_out_base = op_out.base
             vars_can_share_mem = (
                 isinstance(var, (np.ndarray, Tensor)) for var in input_vars
             )
@@ -1172,6 +1308,33 @@ class Tensor:
         for var in tensor_vars:
             var._ops.add(ref_f)
 
+        if isinstance(op_out, tuple):
+            # the operation has multiple outputs; these are never views
+            tensor_outs = tuple(
+                cls(arr, constant=constant, copy=False, _creator=f, _base=None)
+                for arr in op_out
+            )
+            f._set_outputs(tensor_outs)
+
+            if mem_guard:
+                # an output can be a numpy scalar, which the tensor holds as an
+                # array of its own
+                out_arrs = tuple(t.data for t in tensor_outs)
+                for arr in out_arrs:
+                    _mem.lock_arr_writeability(arr)
+                finalize(
+                    f, _mem.release_writeability_lock_on_op, _uniques_bases_then_arrs
+                )
+                # An output can be garbage-collected well before the op, which
+                # lives as long as any of its outputs do; each output array is
+                # held by its finalizer so that its lock is released along with
+                # the op, or once the output is removed from the graph
+                f._output_locks = [
+                    finalize(f, _mem.release_writeability_lock_on_op, (arr,))
+                    for arr in out_arrs
+                ]
+            return tensor_outs
+
         tensor_out = cls(
             op_out,
             constant=constant,
@@ -1183,7 +1346,7 @@ class Tensor:
         if parent_var is not None:
             parent_var._view_children.append(tensor_out)
 
-        if _mem.MEM_GUARD:
+        if mem_guard:
             if out is not None and tensor_out.data.base is not None:
                 _mem.lock_arr_writeability(tensor_out.data.base)
                 _uniques_bases_then_arrs.append(tensor_out.data.base)
@@ -1282,19 +1445,23 @@ class Tensor:
 
         # don't set self._grad yet because there is a grad-clearing step that
         # occurs during graph creation
+        # gradients of half-precision tensors are accumulated in
+        # float32 in mixed-precision mode
+        grad_dtype = _precision.accumulation_dtype(self.dtype)
+
         if grad is not None:
             # `self` is guaranteed to be a tensor of floats
             # so we can simply cast `grad` to be the same dtype
-            _grad = asarray(grad, dtype=self.dtype)
+            _grad = asarray(grad, dtype=grad_dtype)
 
             if _grad.shape != self.shape:
                 try:
                     # See if grad can broadcast to `self`
                     # raises ValueError if not
                     _grad = np.multiply(
-                        np.full_like(self.data, fill_value=1.0),
+                        np.full_like(self.data, fill_value=1.0, dtype=grad_dtype),
                         _grad,
-                        dtype=self.dtype,
+                        dtype=grad_dtype,
                     )
                     if _grad.shape != self.shape:
                         # mutual broadcasting occurred
@@ -1306,7 +1473,7 @@ class Tensor:
                         f"Got `grad.shape={_grad.shape}`"
                     )
         else:
-            _grad = np.full_like(self.data, fill_value=1.0)
+            _grad = np.full_like(self.data, fill_value=1.0, dtype=grad_dtype)
 
         if self.creator is not None:
             # stores a set of all the operation-instances that participate in
@@ -1316,7 +1483,11 @@ class Tensor:
             # populates graph and clears all grads
             collect_all_operations_and_clear_grads(self, seen=graph)
             self._grad = _grad
-            self._backward(graph=graph)
+
+            if _sched.PARALLEL_BACKWARD:
+                _sched.parallel_backprop(self, graph=graph)
+            else:
+                self._backward(graph=graph)
         else:
             self._grad = _grad
 
@@ -1359,7 +1530,15 @@ class Tensor:
         self._ops.difference_update(self._accum_ops)
         self._accum_ops.clear()
         if self.creator is not None and self._ops.isdisjoint(graph):
-            self._creator.backward(self._grad, graph=graph)
+            if self._creator._outputs is None:
+                self._creator.backward(self._grad, graph=graph)
+                return
+
+            # an operation with multiple outputs back-propagates once all of
+            # its outputs have received their gradients
+            grads = self._creator._gather_output_grads(self, graph)
+            if grads is not None:
+                self._creator.backward(grads, graph=graph)
 
     def null_grad(self, *, _clear_view_info: bool = False) -> "Tensor":
         """Sets this tensor's gradient to be ``None``.
@@ -1478,6 +1657,9 @@ class Tensor:
         creator = self._creator
         self._creator = None  # marks tensor as "visited" during graph-traversal
 
+        if creator._outputs is not None:
+            creator._release_output_lock(self)
+
         for var in creator.variables:  # type: Tensor
             var.clear_graph()
 
@@ -1562,6 +1744,68 @@ class Tensor:
             raise TypeError("iteration over a 0-d tensor")
         return iter(self[n] for n in range(len(self)))
 
+    @contextmanager
+    def _unpacked_for_in_place_op(self) -> Iterator[np.ndarray]:
+        """*dev use only*
+
+        Prepares a base tensor, whose data is packed in a flat buffer (see
+        ``mygrad.optim.FlatParameters``), for an in-place operation on it or on
+        one of its views.
+
+        The computational graph that precedes the operation relies on the
+        un-mutated data, whereas the mutated data must be written into the flat
+        buffer. Thus ``self`` and its views are pointed to (the corresponding
+        regions of) a copy of the data, from which the graph's placeholders are
+        made, and the packed data is yielded for the operation to write into.
+
+        The tensors' original data is restored if the operation fails."""
+        grad_buffer = self._grad_buffer
+        packed_data = self.data
+        copied_data = packed_data.copy()
+        start = packed_data.__array_interface__["data"][0]
+
+        originals = [(self, packed_data)]
+        self.data = copied_data
+
+        views = list(self._view_children)
+        while views:
+            view = views.pop()
+            originals.append((view, view.data))
+            offset = view.data.__array_interface__["data"][0] - start
+            view.data = np.ndarray(
+                view.shape,
+                dtype=view.dtype,
+                buffer=copied_data,
+                offset=offset,
+                strides=view.data.strides,
+            )
+            views.extend(view._view_children)
+
+        # The flat buffer is locked while any of its tensors are involved in
+        # operations; this does not prevent `self`'s region from being mutated
+        buffer = packed_data.base if isinstance(packed_data.base, np.ndarray) else None
+        buffer_writeable = buffer is not None and buffer.flags.writeable
+        packed_writeable = packed_data.flags.writeable
+        if buffer is not None and _mem.array_is_tracked(buffer):
+            buffer.flags.writeable = True
+
+        try:
+            yield packed_data
+        except Exception:
+            for tensor, data in originals:
+                tensor.data = data
+            packed_data.flags.writeable = packed_writeable
+            raise
+        else:
+            # `self` was mirrored from the mutated tensor
+            self._grad_buffer = grad_buffer
+            # The views' original arrays are no longer held by any tensor
+            for _, data in originals[1:]:
+                _mem.release_all_writeability_locks(data)
+        finally:
+            if buffer is not None:
+                buffer.flags.writeable = buffer_writeable
+
     def _in_place_op(
         self,
         inplace_op: Type[Operation],
@@ -1569,6 +1813,7 @@ class Tensor:
         op_args: Optional[Sequence] = None,
         op_kwargs: Optional[Dict] = None,
         constant: bool = None,
+        _packed_data: Optional[np.ndarray] = None,
     ):
         if _track.TRACK_GRAPH is False:
             return self._op(
@@ -1667,14 +1912,49 @@ class Tensor:
         if self._base is not None and not self._base._view_children:
             self._base = None
 
+        packed_base = self if self.base is None else self.base
+        if _packed_data is None and packed_base._grad_buffer is not None:
+            # The data of the base tensor is packed in a flat buffer (see
+            # `mygrad.optim.FlatParameters`); the mutation must be written into
+            # that buffer
+            with packed_base._unpacked_for_in_place_op() as _packed_data:
+                return self._in_place_op(
+                    inplace_op,
+                    *input_vars,
+                    op_args=op_args,
+                    op_kwargs=op_kwargs,
+                    constant=constant,
+                    _packed_data=_packed_data,
+                )
+
+        if (
+            self._base is None
+            and not self._view_children
+            and all(op() is None for op in self._ops)
+            and (self._creator is None or self._creator._outputs is None)
+        ):
+            # `self` has no views and no operations depend on it, thus there is
+            # no view-graph to duplicate, reroute, or replay
+            return self._in_place_op_without_views(
+                inplace_op,
+                *input_vars,
+                op_args=op_args,
+                op_kwargs=op_kwargs,
+                constant=constant,
+                _packed_data=_packed_data,
+            )
+
         graph = _dup.DuplicatingGraph(self if self.base is None else self.base)
 
         # Create copy of base so that mutation has no impact on the
         # state of any ops depending on it or its views
         mutant_base = graph.base.tensor.copy()
+        original_data = graph.base.tensor.data
+        if _packed_data is not None:
+            # the graph was built on a copy of the packed data
+            mutant_base.data = original_data = _packed_data
         mutant_base.data.flags.writeable = (
-            graph.base.tensor.data.flags.writeable
-            or _mem.array_is_tracked(graph.base.tensor.data)
+            original_data.flags.writeable or _mem.array_is_tracked(original_data)
         )
 
         # Create view of base in correspondence to relationship
@@ -1820,6 +2100,71 @@ class Tensor:
             _dup.mirror_tensor(source=view, target=node.tensor)
             node.parent._view_children.append(node.tensor)
 
+    def _in_place_op_without_views(
+        self,
+        inplace_op: Type[Operation],
+        *input_vars: ArrayLike,
+        op_args: Optional[Sequence] = None,
+        op_kwargs: Optional[Dict] = None,
+        constant: bool = None,
+        _packed_data: Optional[np.ndarray] = None,
+    ):
+        """*dev use only*
+
+        Performs an in-place operation on a tensor that is not a view, that has
+        no views, and that no operations depend on.
+
+        This is the special case of ``Tensor._in_place_op`` in which the
+        view-graph consists only of ``self``. The graph is updated as:
+
+            ... --> | creator | --> self
+
+        Becomes:
+
+            ... --> | creator | --> placeholder --> | inplace | --> self
+        """
+        # stands in for the un-mutated `self` as an input to the operation
+        placeholder = _dup.make_placeholder_tensor(self)
+
+        # the mutation is written to a copy, so that it has no impact on the
+        # state of the operations that depend on the placeholder
+        if _packed_data is None:
+            original_data = self.data
+            mutant_data = original_data.copy()
+        else:
+            # the placeholder holds a copy of the packed data
+            original_data = mutant_data = _packed_data
+        mutant_data.flags.writeable = (
+            original_data.flags.writeable or _mem.array_is_tracked(original_data)
+        )
+
+        with _mem.mem_guard_off:
+            mutant = self._op(  # will raise if original data not writeable
+                inplace_op,
+                *(placeholder if t is self else t for t in input_vars),
+                op_args=op_args,
+                op_kwargs=op_kwargs,
+                constant=constant,
+                out=mutant_data,
+            )
+
+        mutant._constant = self._constant
+
+        if _mem.MEM_GUARD:
+            _mem.force_lock_tensor_and_creators(mutant)
+
+        if mutant.creator.where is not True:
+            # see `Tensor._in_place_op`
+            with _mem.mem_guard_off:
+                mutant = type(self)._op(
+                    _dup.ApplyMask,
+                    mutant,
+                    placeholder,
+                    op_kwargs={"mask": mutant.creator.where},
+                )
+
+        _dup.mirror_tensor(source=mutant, target=self)
+
     @property
     def shape(self) -> Shape:
         """Tuple of tensor dimension-sizes.
@@ -3131,7 +3476,7 @@ class Tensor:
 
     def clip(
         self, a_min: ArrayLike, a_max: ArrayLike, *, constant: Optional[bool] = None
-    ) -> "Tensor":  # pragma: no cover
+    ) -> "Tensor":
         """Clip (limit) the values in an array.
 
         Given an interval, values outside the interval are clipped to
@@ -3179,5 +3524,6 @@ class Tensor:
         Tensor([1, 1, 2, 3, 4, 5, 6, 7, 8, 8])
         >>> a.clip([3, 4, 1, 1, 1, 4, 4, 4, 4, 4], 8)
         Tensor([3, 4, 2, 3, 4, 5, 6, 7, 8, 8])"""
-        # set in added in mygrad.__init__
-        ...
+        from mygrad.math.misc.funcs import clip
+
+        return clip(self, a_min, a_max, constant=constant)
@@ -1,4 +1,4 @@
-from typing import Optional, Sequence, Union
+from typing import Any, Optional, Sequence, Union
 
 import numpy as np
 
@@ -19,6 +19,7 @@ __all__ = [
     "empty",
     "empty_like",
     "eye",
+    "from_dlpack",
     "geomspace",
     "identity",
     "linspace",
@@ -1020,3 +1021,61 @@ def geomspace(
         constant=constant,
         copy=False,
     )
+
+
+def from_dlpack(x: Any, *, constant: Optional[bool] = None) -> Tensor:
+    """Creates a tensor that shares memory with an array from another library,
+    via the DLPack protocol.
+
+    No copy is made. This supports any object that implements ``__dlpack__``
+    and ``__dlpack_device__`` for CPU memory (e.g. NumPy arrays, and PyTorch,
+    CuPy, or JAX CPU-arrays).
+
+    Parameters
+    ----------
+    x : Any
+        An object that implements the DLPack protocol.
+
+    constant : Optional[bool]
+        If ``True``, this tensor is a constant, and thus does not facilitate
+        back propagation.
+
+        Defaults to ``False`` for float-type data.
+        Defaults to ``True`` for integer-type data.
+
+        Integer-type tensors must be constant.
+
+    Returns
+    -------
+    Tensor
+        A tensor that shares memory with ``x``.
+
+    Notes
+    -----
+    Requires NumPy 1.22 or later.
+
+    NumPy (prior to version 2.0) marks arrays imported via DLPack as read-only;
+    thus the resulting tensor cannot be modified in-place.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import mygrad as mg
+    >>> x = np.arange(3.)
+    >>> t = mg.from_dlpack(x)
+    >>> t
+    Tensor([0., 1., 2.])
+    >>> np.shares_memory(t, x)
+    True
+
+    Tensors implement the DLPack protocol as well
+
+    >>> np.from_dlpack(mg.tensor([1.0, 2.0]))
+    array([1., 2.])
+    """
+    if not hasattr(np, "from_dlpack"):  # pragma: no cover
+        raise NotImplementedError(
+            "`mygrad.from_dlpack` requires NumPy 1.22 or later; the installed "
+            f"version is {np.__version__}"
+        )
+    return Tensor(np.from_dlpack(x), constant=constant, copy=False)
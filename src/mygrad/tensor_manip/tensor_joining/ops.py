@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
-from mygrad._utils.graph_tracking import TRACK_GRAPH
+import mygrad._utils.graph_tracking as _tracking
 from mygrad.operation_base import Operation
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -28,7 +28,7 @@ class Concatenate(Operation):
         out = np.concatenate(tuple(var.data for var in input_vars), **kwargs)
 
         self.variables = tuple(input_vars)
-        if TRACK_GRAPH:
+        if _tracking.TRACK_GRAPH:
             self.axis = axis
             if axis is not None:
                 # need to make sure axis is non-negative so that
@@ -71,7 +71,7 @@ class Stack(Operation):
 
         self.variables = tuple(input_vars)
 
-        if TRACK_GRAPH:
+        if _tracking.TRACK_GRAPH:
             # need to make sure axis is non-negative so that
             # axis checking during backprop is simplified
             self.axis = axis % out.ndim
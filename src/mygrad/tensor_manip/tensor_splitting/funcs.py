@@ -0,0 +1,170 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+from mygrad.tensor_base import Tensor, implements_numpy_override
+from mygrad.typing import ArrayLike
+
+from .ops import Split, Unstack
+
+__all__ = ["split", "unstack"]
+
+
+@implements_numpy_override()
+def split(
+    ary: ArrayLike,
+    indices_or_sections: Union[int, Sequence[int]],
+    axis: int = 0,
+    *,
+    constant: Optional[bool] = None,
+) -> List[Tensor]:
+    """
+    split(ary, indices_or_sections, axis=0, *, constant=None)
+
+    Split a tensor into multiple sub-tensors.
+
+    The sub-tensors are produced by a single operation: back-propagating
+    through them computes one gradient for ``ary``, rather than one per
+    sub-tensor.
+
+    This docstring was adapted from that of numpy.split [1]_
+
+    Parameters
+    ----------
+    ary : ArrayLike
+        Tensor to be divided into sub-tensors.
+
+    indices_or_sections : Union[int, Sequence[int]]
+        If ``indices_or_sections`` is an integer, N, the tensor will be divided
+        into N equal tensors along ``axis``.  If such a split is not possible,
+        an error is raised.
+
+        If ``indices_or_sections`` is a 1-D sequence of sorted integers, the
+        entries indicate where along ``axis`` the tensor is split. For example,
+        ``[2, 3]`` would, for ``axis=0``, result in ``ary[:2]``, ``ary[2:3]``,
+        and ``ary[3:]``.
+
+    axis : int, optional (default=0)
+        The axis along which to split.
+
+    constant : Optional[bool]
+        If ``True``, the resulting tensors are treated as constants, and thus do
+        not facilitate back propagation (i.e. ``constant.grad`` will always
+        return ``None``).
+
+        Defaults to ``False`` for float-type data.
+        Defaults to ``True`` for integer-type data.
+
+        Integer-type tensors must be constant.
+
+    Returns
+    -------
+    sub-tensors : List[Tensor]
+        A list of sub-tensors. Unlike NumPy's sub-arrays, these are not views
+        of ``ary``.
+
+    Raises
+    ------
+    ValueError
+        If ``indices_or_sections`` is given as an integer, but a split does not
+        result in equal division.
+
+    See Also
+    --------
+    unstack : Split a tensor into the sub-tensors along an axis.
+    concatenate : Join a sequence of tensors along an existing axis.
+
+    References
+    ----------
+    .. [1] Retrieved from https://numpy.org/doc/stable/reference/generated/numpy.split.html
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> x = mg.arange(9.0)
+    >>> mg.split(x, 3)
+    [Tensor([0., 1., 2.]), Tensor([3., 4., 5.]), Tensor([6., 7., 8.])]
+
+    >>> a, b, c = mg.split(x, [3, 5])
+    >>> a, b, c
+    (Tensor([0., 1., 2.]), Tensor([3., 4.]), Tensor([5., 6., 7., 8.]))
+
+    Sub-tensors that do not participate in the computation receive no gradient
+
+    >>> (2 * a.sum() + c.sum()).backward()
+    >>> x.grad
+    array([2., 2., 2., 0., 0., 1., 1., 1., 1.])
+    """
+    return list(
+        Tensor._op(
+            Split,
+            ary,
+            op_args=(indices_or_sections,),
+            op_kwargs={"axis": axis},
+            constant=constant,
+        )
+    )
+
+
+def unstack(
+    x: ArrayLike, axis: int = 0, *, constant: Optional[bool] = None
+) -> Tuple[Tensor, ...]:
+    """
+    unstack(x, axis=0, *, constant=None)
+
+    Split a tensor into the sequence of sub-tensors along an axis.
+
+    This is the inverse of ``stack``: ``mg.stack(mg.unstack(x, axis=axis), axis=axis)``
+    reproduces ``x``. The sub-tensors are produced by a single operation:
+    back-propagating through them computes one gradient for ``x``, rather than
+    one per sub-tensor. This makes it the efficient way to, e.g., unroll a
+    loop over the time-steps of a sequence.
+
+    Parameters
+    ----------
+    x : ArrayLike
+        The tensor to be split. It must have at least one dimension.
+
+    axis : int, optional (default=0)
+        The axis along which to split.
+
+    constant : Optional[bool]
+        If ``True``, the resulting tensors are treated as constants, and thus do
+        not facilitate back propagation (i.e. ``constant.grad`` will always
+        return ``None``).
+
+        Defaults to ``False`` for float-type data.
+        Defaults to ``True`` for integer-type data.
+
+        Integer-type tensors must be constant.
+
+    Returns
+    -------
+    sub-tensors : Tuple[Tensor, ...]
+        The ``x.shape[axis]`` sub-tensors, each of which has the shape of ``x``
+        with ``axis`` removed. These are not views of ``x``; iterating over ``x``
+        yields views of its rows, one ``x[i]`` operation per row.
+
+    See Also
+    --------
+    stack : Join a sequence of tensors along a new axis.
+    split : Split a tensor into multiple sub-tensors.
+
+    Examples
+    --------
+    >>> import mygrad as mg
+    >>> x = mg.tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    >>> mg.unstack(x)
+    (Tensor([1., 2., 3.]), Tensor([4., 5., 6.]))
+    >>> mg.unstack(x, axis=1)
+    (Tensor([1., 4.]), Tensor([2., 5.]), Tensor([3., 6.]))
+
+    Unrolling a loop over the time-steps of a shape-(T, N, D) sequence
+
+    >>> seq = mg.ones((4, 2, 3))
+    >>> h = mg.zeros((2, 3))
+    >>> for x_t in mg.unstack(seq):
+    ...     h = mg.tanh(h + x_t)
+    >>> h.backward()
+    >>> seq.grad.shape
+    (4, 2, 3)
+    """
+    return Tensor._op(Unstack, x, op_kwargs={"axis": axis}, constant=constant)
@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from mygrad.operation_base import Operation
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mygrad import Tensor
+
+__all__ = ["Split", "Unstack"]
+
+
+def _gradient_buffer(
+    grads: Tuple[Optional[np.ndarray], ...], shape: Tuple[int, ...]
+) -> np.ndarray:
+    """Allocates the gradient of the input of a splitting operation; it is
+    zero-filled only if the gradient of an output is missing."""
+    present = [g for g in grads if g is not None]
+    dtype = np.result_type(*present)
+    if len(present) == len(grads):
+        return np.empty(shape, dtype=dtype)
+    return np.zeros(shape, dtype=dtype)
+
+
+class Split(Operation):
+    """f(a) -> (a[..., i0:i1, ...], a[..., i1:i2, ...], ...)
+
+    The outputs are written to a single copy of ``a``, thus they do not
+    share memory with ``a``."""
+
+    def __call__(
+        self,
+        a: "Tensor",
+        indices_or_sections: Union[int, Sequence[int]],
+        axis: int = 0,
+    ) -> Tuple[np.ndarray, ...]:
+        self.variables = (a,)
+        out = self.forward(a.data, indices_or_sections, axis=axis)
+        self.axis = axis % a.ndim
+        self.bounds = np.cumsum([0] + [o.shape[self.axis] for o in out])
+        return out
+
+    @staticmethod
+    def forward(a, indices_or_sections, axis=0):
+        return tuple(np.split(np.array(a, copy=True), indices_or_sections, axis=axis))
+
+    def backward_var(self, grad, index, **kwargs):
+        (a,) = self.variables
+        dx = _gradient_buffer(grad, a.shape)
+        for g, start, stop in zip(grad, self.bounds[:-1], self.bounds[1:]):
+            if g is not None:
+                dx[(slice(None),) * self.axis + (slice(start, stop),)] = g
+        return dx
+
+
+class Unstack(Operation):
+    """f(a) -> (a[..., 0, ...], a[..., 1, ...], ...)
+
+    The outputs are written to a single copy of ``a``, thus they do not
+    share memory with ``a``."""
+
+    def __call__(self, a: "Tensor", axis: int = 0) -> Tuple[np.ndarray, ...]:
+        self.variables = (a,)
+        out = self.forward(a.data, axis=axis)
+        self.axis = axis % a.ndim
+        return out
+
+    @staticmethod
+    def forward(a, axis=0):
+        # the copy is laid out such that each of the outputs is contiguous
+        return tuple(np.moveaxis(a, axis, 0).copy(order="C"))
+
+    def backward_var(self, grad, index, **kwargs):
+        (a,) = self.variables
+        dx = _gradient_buffer(grad, a.shape)
+        rows = np.moveaxis(dx, self.axis, 0)
+        for n, g in enumerate(grad):
+            if g is not None:
+                rows[n] = g
+        return dx
@@ -0,0 +1,340 @@
+"""
+Provides utilities for testing the gradients computed by mygrad functions
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from mygrad._utils.graph_tracking import no_autodiff
+from mygrad.tensor_base import Tensor
+from mygrad.typing import ArrayLike
+
+__all__ = ["gradcheck"]
+
+
+# The maximum number of elements that the stacked, perturbed copies of an input
+# may occupy when a vectorized element-wise check is performed
+_MAX_BATCH_ELEMENTS = 2 ** 22
+
+
+def _projections(
+    func: Callable[..., Any],
+    args: List[np.ndarray],
+    kwargs: Dict[str, Any],
+    grad: np.ndarray,
+    batch: Optional[int] = None,
+) -> np.ndarray:
+    """Returns ``sum(grad * func(*args))``.
+
+    If ``batch`` is specified, the perturbed arguments are stacked along a
+    leading axis of this size, and the projection is computed for each entry
+    along that axis."""
+    with no_autodiff:
+        out = func(*args, **kwargs)
+    out = np.asarray(out.data if isinstance(out, Tensor) else out, dtype=np.float64)
+
+    if batch is None:
+        return np.sum(out * grad)
+
+    if out.shape != (batch,) + grad.shape:
+        raise ValueError(
+            f"`func` does not support a leading batch-axis: a stack of {batch} "
+            f"perturbed inputs produced an output of shape-{out.shape}, whereas "
+            f"shape-{(batch,) + grad.shape} was expected"
+        )
+    return out.reshape(batch, -1) @ grad.ravel()
+
+
+def gradcheck(
+    func: Callable[..., Tensor],
+    *inputs: ArrayLike,
+    kwargs: Optional[Dict[str, Any]] = None,
+    grad: Optional[ArrayLike] = None,
+    num_directions: int = 10,
+    elementwise: bool = False,
+    vectorized: bool = False,
+    batch_size: Optional[int] = None,
+    eps: float = 1e-6,
+    atol: float = 1e-5,
+    rtol: float = 1e-3,
+    seed: Optional[int] = None,
+) -> bool:
+    """Checks the gradients that ``func`` back-propagates to its floating-point
+    inputs against gradients that are computed numerically, via central
+    differences.
+
+    The numerical derivatives are computed along ``num_directions`` random
+    directions in the space of the inputs: each check costs two forward passes,
+    regardless of the sizes of the inputs. Optionally, the derivative with
+    respect to each element of each input is checked as well.
+
+    All of the computations are performed in float64 precision.
+
+    Parameters
+    ----------
+    func : Callable[..., Tensor]
+        The function whose gradients are checked: ``func(*inputs, **kwargs)``.
+
+    *inputs : ArrayLike
+        The inputs to ``func``. The gradients with respect to all of the
+        floating-point inputs are checked. Other inputs (e.g. integer-valued
+        indices) are passed to ``func`` unchanged.
+
+    kwargs : Optional[Dict[str, Any]]
+        Keyword arguments to be passed to ``func``.
+
+    grad : Optional[ArrayLike]
+        The gradient, ``dℒ/d(out)``, that is back-propagated through the output
+        of ``func``. By default, a random gradient is used.
+
+    num_directions : int, optional (default=10)
+        The number of random directions along which the directional derivative
+        of ``func`` is checked.
+
+    elementwise : bool, optional (default=False)
+        If ``True``, the derivative with respect to each element of each input is
+        checked as well. This requires two forward passes per element, unless
+        ``vectorized`` is ``True``.
+
+    vectorized : bool, optional (default=False)
+        If ``True``, ``func`` is assumed to broadcast over a leading axis of its
+        floating-point inputs; i.e. ``func`` is called on a stack of perturbed
+        inputs, and returns the corresponding stack of outputs. Thus all of the
+        directional derivatives are computed by a single call to ``func``, and the
+        element-wise derivatives are computed in batches.
+
+        So that they broadcast against one another, the stacked inputs are
+        padded with size-1 axes (following the batch-axis) to the
+        dimensionality of the highest-dimensional floating-point input.
+
+    batch_size : Optional[int]
+        The number of elements that are perturbed in a single call to ``func``
+        during a vectorized element-wise check. By default, this is chosen such
+        that the stacked inputs occupy a bounded amount of memory.
+
+    eps : float, optional (default=1e-6)
+        The step size of the central differences.
+
+    atol : float, optional (default=1e-5)
+        The absolute tolerance of the comparisons.
+
+    rtol : float, optional (default=1e-3)
+        The relative tolerance of the comparisons.
+
+    seed : Optional[int]
+        Seeds the random directions and the default ``grad``.
+
+    Returns
+    -------
+    bool
+        ``True`` if all of the checks pass.
+
+    Raises
+    ------
+    AssertionError
+        The gradients computed by ``func`` do not match the numerical gradients.
+
+    ValueError
+        ``func`` has no floating-point inputs, or it does not support a leading
+        batch-axis despite ``vectorized=True``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import mygrad as mg
+    >>> from mygrad.testing import gradcheck
+
+    Checking the gradients of ``matmul`` along random directions
+
+    >>> x = np.random.rand(100, 50)
+    >>> w = np.random.rand(50, 20)
+    >>> gradcheck(mg.matmul, x, w)
+    True
+
+    ``matmul`` broadcasts over leading axes, thus each of its 7000 partial
+    derivatives can be checked using a handful of batched forward passes
+
+    >>> gradcheck(mg.matmul, x, w, elementwise=True, vectorized=True)
+    True
+
+    Incorrect gradients raise an error
+
+    >>> bad_square = mg.custom_op(
+    ...     lambda x: x ** 2, backward=lambda grad, out, x: grad * x  # should be 2x
+    ... )
+    >>> gradcheck(bad_square, np.random.rand(10))  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    AssertionError: directional derivatives do not match the numerical derivatives
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    rng = np.random.default_rng(seed)
+
+    arrays = [np.asarray(x.data if isinstance(x, Tensor) else x) for x in inputs]
+    checked = [
+        n for n, arr in enumerate(arrays) if issubclass(arr.dtype.type, np.floating)
+    ]
+    if not checked:
+        raise ValueError("`gradcheck` requires at least one floating-point input")
+
+    arrays = [
+        arr.astype(np.float64) if n in checked else arr for n, arr in enumerate(arrays)
+    ]
+
+    # The analytical gradients
+    tensors = [Tensor(arr, constant=n not in checked) for n, arr in enumerate(arrays)]
+    out = func(*tensors, **kwargs)
+    if not isinstance(out, Tensor):
+        raise TypeError(
+            f"`func` must return a tensor, got an object of type: {type(out)}"
+        )
+
+    if grad is None:
+        grad = rng.standard_normal(out.shape)
+    else:
+        grad = np.broadcast_to(np.asarray(grad, dtype=np.float64), out.shape)
+    out.backward(grad)
+
+    analytic = {
+        n: np.zeros(arrays[n].shape)
+        if tensors[n].grad is None
+        else np.asarray(tensors[n].grad, dtype=np.float64)
+        for n in checked
+    }
+    del tensors, out
+
+    def with_args(replacements: Dict[int, np.ndarray]) -> List[np.ndarray]:
+        return [replacements.get(n, arr) for n, arr in enumerate(arrays)]
+
+    ndim = max(arrays[n].ndim for n in checked)
+
+    def stacked(n: int, perturbed: np.ndarray) -> np.ndarray:
+        # inserts size-1 axes after the batch-axis of the perturbed copies of
+        # input-n, so that they broadcast against the other inputs
+        return perturbed.reshape(
+            perturbed.shape[:1] + (1,) * (ndim - arrays[n].ndim) + arrays[n].shape
+        )
+
+    # Directional derivatives along random (unit) directions
+    if num_directions > 0:
+        directions = {
+            n: rng.standard_normal((num_directions,) + arrays[n].shape) for n in checked
+        }
+        norms = np.sqrt(
+            sum(
+                np.sum(v.reshape(num_directions, -1) ** 2, axis=1)
+                for v in directions.values()
+            )
+        )
+        for n, v in directions.items():
+            v /= np.maximum(norms, np.finfo(np.float64).tiny).reshape(
+                (-1,) + (1,) * arrays[n].ndim
+            )
+
+        expected = sum(
+            directions[n].reshape(num_directions, -1) @ analytic[n].ravel()
+            for n in checked
+        )
+
+        if vectorized:
+            # x + eps*v, for all directions, followed by x - eps*v
+            proj = _projections(
+                func,
+                with_args(
+                    {
+                        n: stacked(
+                            n,
+                            np.concatenate(
+                                [arrays[n] + eps * v, arrays[n] - eps * v], axis=0
+                            ),
+                        )
+                        for n, v in directions.items()
+                    }
+                ),
+                kwargs,
+                grad,
+                batch=2 * num_directions,
+            )
+            plus, minus = proj[:num_directions], proj[num_directions:]
+        else:
+            plus, minus = (
+                np.array(
+                    [
+                        _projections(
+                            func,
+                            with_args(
+                                {
+                                    n: arrays[n] + sign * eps * v[k]
+                                    for n, v in directions.items()
+                                }
+                            ),
+                            kwargs,
+                            grad,
+                        )
+                        for k in range(num_directions)
+                    ]
+                )
+                for sign in (1, -1)
+            )
+
+        assert_allclose(
+            actual=expected,
+            desired=(plus - minus) / (2 * eps),
+            atol=atol,
+            rtol=rtol,
+            err_msg="directional derivatives do not match the numerical derivatives",
+        )
+
+    if not elementwise:
+        return True
+
+    # The derivative with respect to each element of each input
+    for n in checked:
+        arr = arrays[n]
+        size = arr.size
+        numeric = np.empty(size)
+
+        if vectorized:
+            step = batch_size or max(1, min(size, _MAX_BATCH_ELEMENTS // (2 * size)))
+        else:
+            step = 1
+
+        for start in range(0, size, step):
+            index = np.arange(start, min(start + step, size))
+            num = len(index)
+
+            # a stack of copies of the input, the i-th of which has its i-th
+            # perturbed element incremented - followed by decremented - by eps
+            perturbed = np.tile(arr.ravel(), (2 * num, 1))
+            rows = np.arange(num)
+            perturbed[rows, index] += eps
+            perturbed[num + rows, index] -= eps
+            perturbed = perturbed.reshape((2 * num,) + arr.shape)
+
+            if vectorized:
+                proj = _projections(
+                    func,
+                    with_args({n: stacked(n, perturbed)}),
+                    kwargs,
+                    grad,
+                    batch=2 * num,
+                )
+            else:
+                proj = np.array(
+                    [
+                        _projections(func, with_args({n: x}), kwargs, grad)
+                        for x in perturbed
+                    ]
+                )
+            numeric[index] = (proj[:num] - proj[num:]) / (2 * eps)
+
+        assert_allclose(
+            actual=analytic[n],
+            desired=numeric.reshape(arr.shape),
+            atol=atol,
+            rtol=rtol,
+            err_msg=f"the gradient of input-{n} does not match the numerical gradient",
+        )
+    return True
@@ -16,6 +16,7 @@ from typing import (
 
 import numpy as np
 
+from mygrad.math.sequential.ops import MaxMin
 from mygrad.operation_base import BinaryUfunc, Operation, Ufunc, UnaryUfunc, _NoValue
 from mygrad.tensor_base import _REGISTERED_UFUNC, Tensor
 from mygrad.typing import ArrayLike, DTypeLikeReals, Index, Mask, Real
@@ -54,6 +55,154 @@ def _permitted_type_str(x: str) -> bool:
     return True
 
 
+def _data(x: ArrayLike) -> ArrayLike:
+    return x.data if isinstance(x, Tensor) else x
+
+
+def _normalize_axes(
+    axis: Optional[Union[int, Tuple[int, ...]]], ndim: int
+) -> Tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+
+    axes = tuple(axis) if isinstance(axis, tuple) else (axis,)
+    for i in axes:
+        if not -ndim <= i < ndim:
+            raise np.AxisError(i, ndim)
+    return tuple(i % ndim for i in axes)
+
+
+def _is_reorderable(numpy_ufunc: np.ufunc) -> bool:
+    """Returns `True` if numpy permits `numpy_ufunc` to reduce over multiple
+    axes at once; i.e. the order in which it combines elements does not matter"""
+    try:
+        numpy_ufunc.reduce(np.ones((1, 1)), axis=None)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_out(
+    result: Union[Tensor, np.ndarray],
+    out: Optional[Union[Tensor, np.ndarray]],
+    constant: Optional[bool],
+) -> Tensor:
+    """Writes the result of a ufunc-method, which was composed of several
+    operations, to `out`"""
+    if out is not None:
+        # The functions used by the ufunc-methods are imported as they are called:
+        # `mygrad.positive` is itself created by `ufunc_creator`, and the others
+        # need not be loaded along with each ufunc
+        from mygrad.math.arithmetic.funcs import positive
+
+        return positive(result, out=out, constant=constant)
+
+    if isinstance(result, Tensor):
+        return result
+    return Tensor(result, constant=constant, copy=False)
+
+
+def _unsupported_method(method: str, reason: str) -> Callable[..., Tensor]:
+    def unsupported(*args, **kwargs) -> Tensor:
+        raise ValueError(f"{method} {reason}")
+
+    unsupported.__name__ = method
+    return unsupported
+
+
+class UfuncAt(Operation):
+    """Performs ``numpy_ufunc.at(a, indices[, b])``: an unbuffered, in-place
+    application of a ufunc to the elements of ``a`` that are specified by
+    ``indices``.
+
+    This is the generic implementation of ``ufunc.at``; a subclass is made for
+    each ufunc, which sets ``ufunc_op``. Back-propagation is performed via
+    ``ufunc_op``, element-by-element; an element that is indexed multiple times
+    is updated, and thus back-propagated through, once per occurrence."""
+
+    ufunc_op: Type[Ufunc]
+    numpy_ufunc: np.ufunc
+
+    _saved_buffers = ("_grads",)
+
+    def __call__(self, a, *args, out=None):
+        """
+        Parameters
+        ----------
+        a : mygrad.Tensor
+            The tensor whose entries are being updated.
+
+        *args : Tuple[mygrad.Tensor, valid-array-index]
+            ``(b, indices)`` for a binary ufunc and ``(indices,)`` for a unary
+            ufunc. `b` must be broadcast-compatible with `a[indices]`.
+
+        out : Optional[numpy.ndarray]
+            The data to be mutated; must store the same values as `a`. A copy of
+            `a` is made if this is not specified."""
+        *operands, indices = args
+        self.variables = (a, *operands)
+        self.indices = indices
+        if out is None:
+            out = np.copy(a.data)
+        self.numpy_ufunc.at(out, indices, *(b.data for b in operands))
+        return out
+
+    def backward(self, grad, *, graph, **kwargs):
+        a, *operands = self.variables
+
+        # the flat position within `a` of each updated element, in the order in
+        # which `numpy_ufunc.at` applies the updates
+        targets = np.arange(a.size).reshape(a.shape)[self.indices]
+        selected_shape = targets.shape
+        targets = targets.ravel()
+        operands = [np.broadcast_to(b.data, selected_shape).ravel() for b in operands]
+
+        # the number of preceding updates to the same element; the updates of a
+        # given rank are made to distinct elements, and thus are vectorized
+        order = np.argsort(targets, kind="stable")
+        is_first = np.ones(targets.size, dtype=bool)
+        is_first[1:] = targets[order][1:] != targets[order][:-1]
+        first = np.maximum.accumulate(np.where(is_first, np.arange(targets.size), 0))
+        rank = np.empty_like(targets)
+        rank[order] = np.arange(targets.size) - first
+        updates = [np.flatnonzero(rank == r) for r in range(rank.max(initial=-1) + 1)]
+
+        # replay the updates to recover the value of each element prior to
+        # each of its updates
+        values = a.data.ravel().copy()
+        inputs = np.empty(targets.size, dtype=values.dtype)
+        for sel in updates:
+            inputs[sel] = values[targets[sel]]
+            values[targets[sel]] = self.numpy_ufunc(
+                inputs[sel], *(b[sel] for b in operands)
+            )
+
+        grad_a = np.array(grad).ravel()
+        grad_operands = [np.zeros(targets.size, dtype=grad_a.dtype) for _ in operands]
+        for sel in reversed(updates):
+            f = self.ufunc_op()
+            f(
+                Tensor(inputs[sel], copy=False),
+                *(Tensor(b[sel], copy=False) for b in operands),
+            )
+            grad_sel = grad_a[targets[sel]]
+            for n, grad_b in enumerate(grad_operands, 1):
+                grad_b[sel] = f.backward_var(grad_sel, index=n)
+            grad_a[targets[sel]] = f.backward_var(grad_sel, index=0)
+
+        self._grads = [grad_a.reshape(a.shape)]
+        for b, grad_b in zip(self.variables[1:], grad_operands):
+            grad_b = grad_b.reshape(selected_shape)
+            if grad_b.ndim < b.ndim:
+                # `b` contains excess leading singleton dimensions
+                grad_b = grad_b.reshape((1,) * (b.ndim - grad_b.ndim) + grad_b.shape)
+            self._grads.append(grad_b)
+        super().backward(grad, graph=graph, **kwargs)
+
+    def backward_var(self, grad, index, **kwargs):
+        return self._grads[index]
+
+
 class MyGradUfunc(type):
     _wrapped_op: Union[Type[UnaryUfunc], Type[BinaryUfunc]]
     _decorated_func: Callable
@@ -118,9 +267,42 @@ class ufunc(ABC, metaclass=FinalABC):
         b: Optional[ArrayLike] = None,
         *,
         constant: Optional[bool] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not implemented"""
-        raise NotImplementedError()
+    ) -> None:
+        """Performs an unbuffered, in-place operation on ``a`` for the elements
+        specified by ``indices``; e.g. ``add.at(a, indices, b)`` increments
+        ``a[indices]`` by ``b``, once for each occurrence of an index.
+
+        If ``a`` is a tensor, this is a differentiable scatter-update: it is
+        back-propagated through, like any other in-place operation. An element
+        that is indexed multiple times is updated, and back-propagated through,
+        once per occurrence.
+
+        Parameters
+        ----------
+        a : ArrayLike
+            The array or tensor that is updated in-place.
+
+        indices : Union[ArrayLike, Index, Tuple[ArrayLike, Index]]
+            Specifies the elements of ``a`` that are updated.
+
+        b : Optional[ArrayLike]
+            The second operand of the ufunc; must broadcast against ``a[indices]``.
+
+        constant : Optional[bool]
+            If ``True``, the updated tensor is a constant.
+
+        Examples
+        --------
+        >>> import mygrad as mg
+        >>> a = mg.tensor([0.0, 0.0, 0.0, 0.0])
+        >>> b = mg.tensor([1.0, 2.0, 3.0])
+        >>> mg.add.at(a, [0, 0, 2], b)
+        >>> a
+        Tensor([3., 0., 3., 0.])
+        >>> (a * mg.arange(4.0)).sum().backward()
+        >>> b.grad
+        array([0., 0., 2.])
+        """
 
     def accumulate(
         self,
@@ -130,20 +312,86 @@ class ufunc(ABC, metaclass=FinalABC):
         out: Optional[Union[Tensor, np.ndarray]] = None,
         *,
         constant: Optional[bool] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not implemented"""
-        raise NotImplementedError()
+    ) -> Tensor:
+        """Accumulates the result of applying the ufunc to all of the elements
+        along ``axis``; e.g. ``add.accumulate`` is a cumulative sum.
+
+        The accumulations of ``add``, ``multiply``, ``maximum``, and ``minimum``
+        are performed by a single operation. For all other ufuncs, this creates
+        one ufunc operation per element along ``axis``, thus the cost of building
+        - and back-propagating through - the computational graph scales with the
+        length of that axis.
+
+        Parameters
+        ----------
+        array : ArrayLike
+            The tensor to act on.
+
+        axis : int, optional (default=0)
+            The axis along which to apply the accumulation.
+
+        dtype : Optional[DTypeLikeReals]
+            The data type used to represent the intermediate results.
+
+        out : Optional[Union[Tensor, ndarray]]
+            A location into which the result is stored.
+
+        constant : Optional[bool]
+            If ``True``, the returned tensor is a constant.
+
+        Returns
+        -------
+        mygrad.Tensor
+            A tensor of the same shape as ``array``.
+
+        Examples
+        --------
+        >>> import mygrad as mg
+        >>> mg.maximum.accumulate([1.0, 3.0, 2.0, 4.0])
+        Tensor([1., 3., 3., 4.])
+        """
 
     def outer(
         self,
         a: ArrayLike,
         b: ArrayLike,
         *,
-        dtype: DTypeLikeReals,
-        out: Optional[Union[Tensor, np.ndarray]],
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        dtype: DTypeLikeReals = None,
+        out: Optional[Union[Tensor, np.ndarray]] = None,
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        """Applies the ufunc to all pairs ``(x, y)``, with ``x`` in ``a`` and ``y``
+        in ``b``.
+
+        The broadcast inputs are never materialized: back-propagation sums the
+        gradient directly into the shapes of ``a`` and ``b``.
+
+        Parameters
+        ----------
+        a, b : ArrayLike
+            The operands of the ufunc.
+
+        dtype : Optional[DTypeLikeReals]
+            Overrides the dtype of the calculation and output tensor.
+
+        out : Optional[Union[Tensor, ndarray]]
+            A location into which the result is stored.
+
+        constant : Optional[bool]
+            If ``True``, the returned tensor is a constant.
+
+        Returns
+        -------
+        mygrad.Tensor
+            A tensor of shape ``a.shape + b.shape``.
+
+        Examples
+        --------
+        >>> import mygrad as mg
+        >>> mg.add.outer([0.0, 10.0], [1.0, 2.0, 3.0])
+        Tensor([[ 1.,  2.,  3.],
+                [11., 12., 13.]])
+        """
 
     def reduce(
         self,
@@ -154,21 +402,118 @@ class ufunc(ABC, metaclass=FinalABC):
         keepdims: bool = False,
         initial: Real = _NoValue,
         where: Mask = True,
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        *,
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        """Reduces ``a`` along ``axis`` by repeatedly applying the ufunc; e.g.
+        ``add.reduce`` is a sum.
+
+        The reductions of ``add``, ``multiply``, ``maximum``, and ``minimum`` are
+        performed by a single operation. All other ufuncs are reduced via one
+        ufunc operation per element being reduced over, thus the cost of building
+        - and back-propagating through - the computational graph scales with the
+        number of these elements. As with NumPy, a ufunc that is not reorderable
+        (e.g. ``subtract``) can be reduced along at most one axis.
+
+        Parameters
+        ----------
+        a : ArrayLike
+            The tensor to act on.
+
+        axis : Optional[Union[int, Tuple[int, ...]]], optional (default=0)
+            The axis or axes along which the reduction is performed. ``None``
+            reduces along all of the axes.
+
+        dtype : Optional[DTypeLikeReals]
+            The data type used to represent the intermediate results.
+
+        out : Optional[Union[Tensor, ndarray]]
+            A location into which the result is stored.
+
+        keepdims : bool, optional (default=False)
+            If ``True``, the reduced axes are left in the result as size-one axes.
+
+        initial : Optional[Real]
+            The value with which to start the reduction.
+
+        where : Mask, optional (default=True)
+            A boolean array, broadcast against ``a``, which selects the elements
+            to include in the reduction.
+
+        constant : Optional[bool]
+            If ``True``, the returned tensor is a constant.
+
+        Returns
+        -------
+        mygrad.Tensor
+            The reduced tensor.
+
+        Examples
+        --------
+        >>> import mygrad as mg
+        >>> x = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+        >>> mg.multiply.reduce(x, axis=1)
+        Tensor([ 2., 12.])
+        >>> mg.subtract.reduce(x, axis=1)
+        Tensor([-1., -1.])
+        """
 
     @abstractmethod
     def reduceat(
         self,
         a: ArrayLike,
         indices: ArrayLike,
-        axis: Optional[Union[int, Tuple[int, ...]]] = 0,
+        axis: int = 0,
         dtype: DTypeLikeReals = None,
         out: Optional[Union[Tensor, np.ndarray]] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        *,
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        """Performs reductions over the segments of ``a``, along ``axis``, that
+        begin at each of ``indices``; e.g. ``add.reduceat`` computes segment-sums.
+
+        Segment-``i`` spans ``indices[i]:indices[i + 1]`` if
+        ``indices[i] < indices[i + 1]``; otherwise it consists solely of element
+        ``indices[i]``. The last segment extends to the end of ``axis``.
+
+        The segment-reductions of ``add`` are performed by a single operation.
+        For all other ufuncs, each segment is reduced separately via ``reduce``;
+        thus the cost of building the computational graph scales with the number
+        of segments or, for ufuncs reduced element-by-element, with the number
+        of elements.
+
+        Parameters
+        ----------
+        a : ArrayLike
+            The tensor to act on.
+
+        indices : ArrayLike
+            The integer-valued indices at which the segments begin.
+
+        axis : int, optional (default=0)
+            The axis along which the segments are reduced.
+
+        dtype : Optional[DTypeLikeReals]
+            The data type used to represent the intermediate results.
+
+        out : Optional[Union[Tensor, ndarray]]
+            A location into which the result is stored.
+
+        constant : Optional[bool]
+            If ``True``, the returned tensor is a constant.
+
+        Returns
+        -------
+        mygrad.Tensor
+            A tensor whose size along ``axis`` is ``len(indices)``.
+
+        Examples
+        --------
+        >>> import mygrad as mg
+        >>> x = mg.arange(8.0)
+        >>> mg.add.reduceat(x, [0, 4, 1, 5])
+        Tensor([ 6.,  4., 10., 18.])
+        """
 
 
 class MyGradUnaryUfunc(MyGradUfunc):
@@ -317,15 +662,33 @@ def _create_ufunc(
     reduce_op=None,
     reduceat_op=None,
 ) -> Type[ufunc]:
+    numpy_ufunc = op.numpy_ufunc
+    name = decorated_func.__name__
+
+    if at_op is None:
+        at_op = type(
+            f"{op.__name__}At",
+            (UfuncAt,),
+            {"ufunc_op": op, "numpy_ufunc": numpy_ufunc},
+        )
+
     def at(
         a: ArrayLike,
         indices: Union[ArrayLike, Index, Tuple[ArrayLike, Index]],
         b: Optional[ArrayLike] = None,
         *,
         constant: Optional[bool] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not implemented"""
-        raise NotImplementedError()
+    ) -> None:
+        if not isinstance(a, Tensor):
+            # there is no tensor to back-propagate through
+            numpy_ufunc.at(a, indices, *(() if b is None else (_data(b),)))
+            return
+
+        if b is None and numpy_ufunc.nin == 2:
+            raise ValueError("second operand needed for ufunc")
+
+        operands = () if b is None else (b,)
+        a._in_place_op(at_op, a, *operands, op_args=(indices,), constant=constant)
 
     def accumulate(
         array: ArrayLike,
@@ -334,9 +697,32 @@ def _create_ufunc(
         out: Optional[Union[Tensor, np.ndarray]] = None,
         *,
         constant: Optional[bool] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not implemented"""
-        raise NotImplementedError()
+    ) -> Tensor:
+        if accumulate_op is not None:
+            op_kwargs = {"axis": axis}
+            if dtype is not None:
+                op_kwargs["dtype"] = dtype
+            return Tensor._op(
+                accumulate_op, array, op_kwargs=op_kwargs, constant=constant, out=out
+            )
+
+        from mygrad.tensor_manip.tensor_joining.funcs import stack
+        from mygrad.tensor_manip.tensor_splitting.funcs import unstack
+
+        values = unstack(array, axis=axis, constant=constant)
+        if not values:
+            return _to_out(
+                numpy_ufunc.accumulate(_data(array), axis=axis, dtype=dtype),
+                out,
+                constant,
+            )
+
+        results = [values[0]]
+        for value in values[1:]:
+            results.append(
+                mygrad_ufunc(results[-1], value, dtype=dtype, constant=constant)
+            )
+        return _to_out(stack(results, axis=axis, constant=constant), out, constant)
 
     def outer(
         a: ArrayLike,
@@ -344,9 +730,19 @@ def _create_ufunc(
         *,
         dtype: Optional[DTypeLikeReals] = None,
         out: Optional[Union[Tensor, np.ndarray]] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        if outer_op is not None:
+            return Tensor._op(
+                outer_op, a, b, op_kwargs={"dtype": dtype}, constant=constant, out=out
+            )
+
+        from mygrad.tensor_manip.array_shape.funcs import reshape
+
+        # Trailing singleton dimensions broadcast `a` against `b`; back-propagating
+        # through the broadcast sums the gradient directly into the shape of `a`
+        a = reshape(a, np.shape(_data(a)) + (1,) * np.ndim(_data(b)))
+        return mygrad_ufunc(a, b, dtype=dtype, out=out, constant=constant)
 
     def reduce(
         a: ArrayLike,
@@ -356,19 +752,199 @@ def _create_ufunc(
         keepdims: bool = False,
         initial: Real = _NoValue,
         where: Mask = True,
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        *,
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        from mygrad.indexing_routines.funcs import where as _where
+        from mygrad.math.arithmetic.funcs import positive
+        from mygrad.tensor_manip.array_shape.funcs import reshape
+        from mygrad.tensor_manip.tensor_splitting.funcs import unstack
+        from mygrad.tensor_manip.transpose_like.funcs import moveaxis
+
+        shape = np.shape(_data(a))
+        axes = _normalize_axes(axis, len(shape))
+
+        if where is not True and initial is _NoValue and numpy_ufunc.identity is None:
+            raise ValueError(
+                f"reduction operation '{name}' does not have an identity, so to "
+                f"use a where mask one has to specify 'initial'"
+            )
+
+        if any(shape[i] == 0 for i in axes):
+            # there is nothing to back-propagate through
+            kwargs = {} if initial is _NoValue else {"initial": initial}
+            return _to_out(
+                numpy_ufunc.reduce(
+                    _data(a),
+                    axis=axes,
+                    dtype=dtype,
+                    keepdims=keepdims,
+                    where=where,
+                    **kwargs,
+                ),
+                out,
+                constant,
+            )
+
+        if reduce_op is not None:
+            if where is not True:
+                # masked elements are replaced by a value that does not affect
+                # the reduction; `initial` serves this purpose for idempotent
+                # reductions, like `maximum`, that have no identity
+                fill = numpy_ufunc.identity
+                a = _where(where, a, initial if fill is None else fill)
+
+            op_kwargs = {"axis": axes, "keepdims": keepdims}
+            cast = False
+            if issubclass(reduce_op, MaxMin):
+                # `numpy.max` and `numpy.min` do not accept a dtype (see
+                # `mygrad.max`); the result is cast instead, which commutes
+                # with taking a maximum or minimum
+                op_kwargs["dtype"] = _NoValue
+                cast = dtype is not None
+            elif dtype is not None:
+                op_kwargs["dtype"] = dtype
+
+            if initial is _NoValue and not cast:
+                return Tensor._op(
+                    reduce_op, a, op_kwargs=op_kwargs, constant=constant, out=out
+                )
+            result = Tensor._op(reduce_op, a, op_kwargs=op_kwargs, constant=constant)
+            if initial is _NoValue:
+                return positive(result, dtype=dtype, out=out, constant=constant)
+            return mygrad_ufunc(
+                initial, result, dtype=dtype, out=out, constant=constant
+            )
+
+        # Otherwise, the reduction is performed as a left-fold along a single
+        # axis. This creates one operation per element along that axis
+        fold_shape = shape
+        if len(axes) > 1:
+            if not _is_reorderable(numpy_ufunc):
+                raise ValueError(
+                    f"reduction operation '{name}' is not reorderable, so at most "
+                    f"one axis may be specified"
+                )
+            # the elements can be combined in any order: the reduced axes are
+            # merged into a single, leading axis to be folded along
+            front = tuple(range(len(axes)))
+            fold_shape = (int(np.prod([shape[i] for i in axes])),) + tuple(
+                n for i, n in enumerate(shape) if i not in axes
+            )
+            a = reshape(
+                moveaxis(a, axes, front, constant=constant),
+                fold_shape,
+                constant=constant,
+            )
+            if where is not True:
+                where = np.moveaxis(np.broadcast_to(where, shape), axes, front)
+                where = where.reshape(fold_shape)
+            axes_to_fold = (0,)
+        else:
+            axes_to_fold = axes
+
+        if axes_to_fold:
+            (axis,) = axes_to_fold
+            values = list(unstack(a, axis=axis, constant=constant))
+            masks = (
+                [True] * len(values)
+                if where is True
+                else np.moveaxis(np.broadcast_to(where, fold_shape), axis, 0)
+            )
+        else:
+            values = [a]
+            masks = [where]
+
+        if initial is not _NoValue:
+            result = initial
+        elif where is not True:
+            result = numpy_ufunc.identity
+        else:
+            result, values, masks = values[0], values[1:], masks[1:]
+
+        for value, mask in zip(values, masks):
+            step = mygrad_ufunc(result, value, dtype=dtype, constant=constant)
+            result = step if mask is True else _where(mask, step, result)
+
+        if result is a:
+            result = positive(a, constant=constant)
+
+        if keepdims:
+            result = reshape(
+                result, tuple(1 if i in axes else n for i, n in enumerate(shape))
+            )
+        return _to_out(result, out, constant)
 
     def reduceat(
         a: ArrayLike,
         indices: ArrayLike,
-        axis: Optional[Union[int, Tuple[int, ...]]] = 0,
+        axis: int = 0,
         dtype: Optional[DTypeLikeReals] = None,
         out: Optional[Union[Tensor, np.ndarray]] = None,
-    ) -> Tensor:  # pragma: no cover
-        """Not Implemented"""
-        raise NotImplementedError()
+        *,
+        constant: Optional[bool] = None,
+    ) -> Tensor:
+        if reduceat_op is not None:
+            return Tensor._op(
+                reduceat_op,
+                a,
+                op_args=(indices,),
+                op_kwargs={"axis": axis, "dtype": dtype},
+                constant=constant,
+                out=out,
+            )
+
+        from mygrad.tensor_manip.tensor_joining.funcs import concatenate
+
+        if not isinstance(a, Tensor):
+            a = Tensor(a, constant=True, copy=False)
+
+        indices = np.asarray(indices)
+        (axis,) = _normalize_axes(axis, a.ndim)
+        size = a.shape[axis]
+        bad = indices[(indices < 0) | (indices >= size)]
+        if bad.size:
+            raise IndexError(
+                f"index {bad[0]} out-of-bounds in {name}.reduceat [0, {size})"
+            )
+
+        # Per numpy, a segment whose start does not precede the next start
+        # consists of its first element alone, and the last segment extends
+        # to the end of the axis
+        stops = np.append(indices[1:], size)
+        stops = np.where(indices < stops, stops, indices + 1)
+
+        index = (slice(None),) * axis
+        segments = [
+            reduce(
+                a[index + (slice(start, stop),)],
+                axis=axis,
+                dtype=dtype,
+                keepdims=True,
+                constant=constant,
+            )
+            for start, stop in zip(indices, stops)
+        ]
+        return _to_out(
+            concatenate(segments, axis=axis, constant=constant), out, constant
+        )
+
+    methods = {
+        "at": at,
+        "accumulate": accumulate,
+        "outer": outer,
+        "reduce": reduce,
+        "reduceat": reduceat,
+    }
+    if op.numpy_ufunc.nin == 1 or op.numpy_ufunc.signature is not None:
+        # numpy supports these methods only for scalar-valued binary ufuncs
+        reason = (
+            "only supported for binary functions"
+            if op.numpy_ufunc.nin == 1
+            else "not defined on ufunc with signature"
+        )
+        for method_name in ("accumulate", "outer", "reduce", "reduceat"):
+            methods[method_name] = _unsupported_method(method_name, reason)
 
     if op.numpy_ufunc.nin == 1:
         MetaBuilder = MyGradUnaryUfunc
@@ -387,17 +963,13 @@ def _create_ufunc(
         for type_code in op.numpy_ufunc.types
         if _permitted_type_str(type_code)
     ]
-    out = MetaBuilder(
+    mygrad_ufunc = MetaBuilder(
         decorated_func.__name__,
         (object,),
         (
             {
                 "_wrapped_op": op,
-                "at": at,
-                "accumulate": accumulate,
-                "reduce": reduce,
-                "reduceat": reduceat,
-                "outer": outer,
+                **methods,
                 "signature": op.numpy_ufunc.signature,
                 "identity": op.numpy_ufunc.identity,
                 "nargs": op.numpy_ufunc.nargs,
@@ -414,8 +986,11 @@ def _create_ufunc(
             }
         ),
     )
-    ufunc.register(out)
-    return out
+    for method in methods.values():
+        if method.__doc__ is None:
+            method.__doc__ = getattr(ufunc, method.__name__).__doc__
+    ufunc.register(mygrad_ufunc)
+    return mygrad_ufunc
 
 
 class ufunc_creator:
@@ -466,18 +1041,40 @@ class ufunc_creator:
         mygrad_op : Type[Ufunc]
             An operation-based implementation of a ufunc that supports back-propagation
             through mygrad tensors.
+
+        at_op : Optional[Type[Operation]]
+            Performs ``ufunc.at(a, indices, b)`` in-place on ``out``; called as
+            ``at_op()(a, b, indices, out=out)``. Otherwise, ``numpy_ufunc.at`` is
+            back-propagated through via ``mygrad_op``, element-by-element.
+
+        accumulate_op : Optional[Type[Operation]]
+            Performs ``ufunc.accumulate(a, axis, dtype)``. Otherwise, the accumulation
+            is composed of ``ufunc`` operations along the axis.
+
+        outer_op : Optional[Type[Operation]]
+            Performs ``ufunc.outer(a, b, dtype=dtype)``. Otherwise, ``ufunc`` is
+            broadcast across a reshaped ``a`` and ``b``.
+
+        reduce_op : Optional[Type[Operation]]
+            A ``Sequential`` operation that performs ``ufunc.reduce``, (e.g. ``Sum``).
+            Otherwise, the reduction is performed as a left-fold of ``ufunc``
+            operations along a single axis.
+
+        reduceat_op : Optional[Type[Operation]]
+            Performs ``ufunc.reduceat(a, indices, axis, dtype)``. Otherwise, each
+            segment is reduced via ``ufunc.reduce``.
         """
         if not issubclass(mygrad_op, (UnaryUfunc, BinaryUfunc)):
             raise TypeError(
                 "ufunc_creator can only accept `UnaryUfunc` and `BinaryUfunc` operations"
             )
         self.op = mygrad_op
-        if any(
+        if issubclass(mygrad_op, UnaryUfunc) and any(
             item is not None
             for item in (at_op, accumulate_op, outer_op, reduce_op, reduceat_op)
         ):
             raise NotImplementedError(
-                "There isn't support for binding ufunc methods presently."
+                "There isn't support for binding methods to unary ufuncs presently."
             )
 
         self.at_op = at_op
@@ -378,7 +378,7 @@ def test_conv_ND_fwd(data, shape, num_filters, num_batch, num_channel):
     num_channel=st.integers(1, 3),
 )
 def test_conv_ND_bkwd(data, shape, num_filters, num_batch, num_channel):
-    """ Test conv-backprop 1D-3D with various strides and dilations."""
+    """Test conv-backprop 1D-3D with various strides and dilations."""
     img_shape = (num_batch, num_channel) + shape
 
     padding = data.draw(
@@ -445,3 +445,133 @@ def test_conv_ND_bkwd(data, shape, num_filters, num_batch, num_channel):
                 n
             ),
         )
+
+
+@settings(deadline=None, suppress_health_check=(HealthCheck.filter_too_much,))
+@given(
+    data=st.data(),
+    shape=hnp.array_shapes(min_dims=1, max_dims=3, max_side=8),
+    num_filters=st.integers(1, 3),
+    num_batch=st.integers(1, 3),
+    num_channel=st.integers(1, 3),
+    dtype=st.sampled_from(["float32", "float64"]),
+)
+def test_conv_ND_fft_matches_direct(
+    data, shape, num_filters, num_batch, num_channel, dtype
+):
+    """Ensure that the FFT-based convolution, and its backprop, agrees with the
+    direct convolution for various paddings, strides, and dilations."""
+    img_shape = (num_batch, num_channel) + shape
+
+    padding = data.draw(
+        st.integers(0, 2) | st.tuples(*[st.integers(0, 2)] * len(shape)),
+        label="padding",
+    )
+    pad_tuple = padding if isinstance(padding, tuple) else (padding,) * len(shape)
+    padded_shape = tuple(s + 2 * p for s, p in zip(shape, pad_tuple))
+
+    win_shape = data.draw(
+        st.tuples(*(st.integers(1, s) for s in padded_shape)), label="win_shape"
+    )
+    stride = data.draw(
+        st.tuples(*(st.integers(1, s) for s in padded_shape)), label="stride"
+    )
+    max_dilation = np.array(padded_shape) // win_shape
+    dilation = data.draw(
+        st.tuples(*(st.integers(1, s) for s in max_dilation)), label="dilation"
+    )
+    conf = dict(stride=stride, dilation=dilation, padding=padding)
+
+    # skip invalid data/kernel/stride/dilation combinations
+    assume(get_outshape(padded_shape, win_shape, stride, dilation) is not None)
+
+    kernels = data.draw(
+        hnp.arrays(
+            dtype=dtype,
+            shape=(num_filters, num_channel, *win_shape),
+            elements=st.floats(-10, 10, width=32),
+        ),
+        label="kernels",
+    )
+    x = data.draw(
+        hnp.arrays(dtype=dtype, shape=img_shape, elements=st.floats(-10, 10, width=32)),
+        label="x",
+    )
+    tol = 1e-3 if dtype == "float32" else 1e-7
+
+    x_direct, w_direct = Tensor(x), Tensor(kernels)
+    x_fft, w_fft = Tensor(x), Tensor(kernels)
+
+    direct = conv_nd(x_direct, w_direct, **conf)
+    fft = conv_nd(x_fft, w_fft, method="fft", **conf)
+
+    assert fft.dtype == direct.dtype
+    assert_allclose(actual=fft.data, desired=direct.data, atol=tol, rtol=tol)
+
+    grad = data.draw(
+        hnp.arrays(
+            shape=direct.shape, dtype=dtype, elements=st.floats(-10, 10, width=32)
+        ),
+        label="grad",
+    )
+    direct.backward(grad)
+    fft.backward(grad)
+
+    assert x_fft.grad.dtype == x_direct.grad.dtype
+    assert w_fft.grad.dtype == w_direct.grad.dtype
+    assert_allclose(actual=x_fft.grad, desired=x_direct.grad, atol=tol, rtol=tol)
+    assert_allclose(actual=w_fft.grad, desired=w_direct.grad, atol=tol, rtol=tol)
+
+
+@pytest.mark.parametrize("constant", [(True, False), (False, True)])
+def test_conv_fft_backprop_to_single_input(constant: Tuple[bool, bool]):
+    x = Tensor(np.random.rand(2, 3, 9, 7), constant=constant[0])
+    w = Tensor(np.random.rand(4, 3, 5, 3), constant=constant[1])
+    out = conv_nd(x, w, stride=(2, 1), padding=1, method="fft")
+    out.backward()
+
+    x_direct = Tensor(x.data, constant=constant[0])
+    w_direct = Tensor(w.data, constant=constant[1])
+    conv_nd(x_direct, w_direct, stride=(2, 1), padding=1).backward()
+
+    for actual, desired in [(x, x_direct), (w, w_direct)]:
+        if desired.constant:
+            assert actual.grad is None
+        else:
+            assert_allclose(actual.grad, desired.grad)
+
+
+def test_conv_fft_releases_transformed_grad():
+    x = Tensor(np.random.rand(1, 1, 16))
+    w = Tensor(np.random.rand(1, 1, 9))
+    out = conv_nd(x, w, stride=1, method="fft")
+    op = out.creator
+    out.backward()
+    assert op._grad_fft is None
+
+
+def test_conv_bad_method():
+    x = np.zeros((1, 2, 4, 4))
+    w = np.zeros((1, 2, 2, 2))
+    with raises(ValueError):
+        conv_nd(x, w, stride=1, method="winograd")
+
+
+@pytest.mark.parametrize("padding", [0, 1])
+def test_conv_channel_last_input(padding: int):
+    """Convolving a permuted view of channel-last data matches convolving a
+    contiguous copy"""
+    nhwc = np.random.rand(2, 7, 9, 3)
+    x = mg.moveaxis(Tensor(nhwc), -1, 1)  # (N, C, H, W), not C-contiguous
+    assert not x.data.flags["C_CONTIGUOUS"]
+    x_contig = Tensor(np.ascontiguousarray(x.data))
+    w = np.random.rand(4, 3, 3, 2)
+
+    out = conv_nd(x, w, stride=(2, 1), padding=padding)
+    expected = conv_nd(x_contig, w, stride=(2, 1), padding=padding)
+    assert_allclose(out.data, expected.data)
+
+    grad = np.random.rand(*out.shape)
+    out.backward(grad)
+    expected.backward(grad)
+    assert_allclose(x.grad, x_contig.grad)
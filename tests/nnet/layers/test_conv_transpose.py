@@ -0,0 +1,249 @@
+""" Test transposed-conv fwd-prop and back-prop for ND convs"""
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import assume, given, settings
+from numpy.testing import assert_allclose
+from pytest import raises
+
+import mygrad as mg
+from mygrad import Tensor
+from mygrad.nnet.layers import conv_nd, conv_transpose_nd
+
+from ...utils.numerical_gradient import numerical_gradient_full
+
+
+def conv_transpose_bank(x, w, stride, dilation, padding, output_padding):
+    """A simple loop-based reference implementation of a transposed convolution"""
+    num_conv = x.ndim - 2
+    full_shape = tuple(
+        (g - 1) * s + (k - 1) * d + 1 + op
+        for g, k, s, d, op in zip(
+            x.shape[2:], w.shape[2:], stride, dilation, output_padding
+        )
+    )
+    out = np.zeros(x.shape[:1] + w.shape[1:2] + full_shape)
+    for n in range(x.shape[0]):
+        for f in range(x.shape[1]):
+            for g in np.ndindex(x.shape[2:]):
+                slices = tuple(
+                    slice(i * s, i * s + (k - 1) * d + 1, d)
+                    for i, k, s, d in zip(g, w.shape[2:], stride, dilation)
+                )
+                out[(n, slice(None), *slices)] += x[(n, f, *g)] * w[f]
+    crop = tuple(slice(p, n - p) for p, n in zip(padding, out.shape[-num_conv:]))
+    return out[(..., *crop)]
+
+
+@st.composite
+def conv_transpose_configs(draw, max_side=4):
+    """Draws `x`, `w` shapes and a valid stride/dilation/padding/output-padding
+    for a transposed convolution"""
+    num_conv = draw(st.integers(1, 3), label="num_conv")
+
+    def per_axis(strat):
+        return st.tuples(*[strat] * num_conv)
+
+    x_shape = draw(
+        st.tuples(
+            st.integers(1, 2), st.integers(1, 3), *[st.integers(1, max_side)] * num_conv
+        ),
+        label="x_shape",
+    )
+    w_shape = draw(
+        st.tuples(
+            st.just(x_shape[1]), st.integers(1, 3), *[st.integers(1, 3)] * num_conv
+        ),
+        label="w_shape",
+    )
+    stride = draw(per_axis(st.integers(1, 3)), label="stride")
+    dilation = draw(per_axis(st.integers(1, 3)), label="dilation")
+    output_padding = draw(
+        st.tuples(*(st.integers(0, max(s, d) - 1) for s, d in zip(stride, dilation))),
+        label="output_padding",
+    )
+    full_shape = [
+        (g - 1) * s + (k - 1) * d + 1 + op
+        for g, k, s, d, op in zip(
+            x_shape[2:], w_shape[2:], stride, dilation, output_padding
+        )
+    ]
+    padding = draw(
+        st.tuples(*(st.integers(0, (n - 1) // 2) for n in full_shape)),
+        label="padding",
+    )
+    return (
+        x_shape,
+        w_shape,
+        dict(
+            stride=stride,
+            dilation=dilation,
+            padding=padding,
+            output_padding=output_padding,
+        ),
+    )
+
+
+@mg.no_autodiff
+def _conv_transpose_nd(x, w, **kwargs) -> np.ndarray:
+    """use mygrad-conv_transpose_nd forward pass for numerical derivative
+
+    Returns
+    -------
+    numpy.ndarray"""
+    return mg.asarray(conv_transpose_nd(x, w, constant=True, **kwargs))
+
+
+@settings(deadline=None)
+@given(config=conv_transpose_configs(), data=st.data())
+def test_conv_transpose_fwd(config, data: st.DataObject):
+    x_shape, w_shape, conf = config
+    x = data.draw(
+        hnp.arrays(dtype=float, shape=x_shape, elements=st.floats(-10, 10)), label="x"
+    )
+    w = data.draw(
+        hnp.arrays(dtype=float, shape=w_shape, elements=st.floats(-10, 10)), label="w"
+    )
+    out = conv_transpose_nd(x, w, **conf)
+    assert isinstance(out, Tensor)
+    assert_allclose(actual=out.data, desired=conv_transpose_bank(x, w, **conf))
+
+
+@settings(deadline=None)
+@given(config=conv_transpose_configs(max_side=3), data=st.data())
+def test_conv_transpose_bkwd(config, data: st.DataObject):
+    x_shape, w_shape, conf = config
+    x = Tensor(
+        data.draw(
+            hnp.arrays(dtype=float, shape=x_shape, elements=st.floats(-10, 10)),
+            label="x",
+        )
+    )
+    w = Tensor(
+        data.draw(
+            hnp.arrays(dtype=float, shape=w_shape, elements=st.floats(-10, 10)),
+            label="w",
+        )
+    )
+
+    out = conv_transpose_nd(x, w, **conf)
+    grad = data.draw(
+        hnp.arrays(shape=out.shape, dtype=float, elements=st.floats(-10, 10)),
+        label="grad",
+    )
+    out.backward(grad)
+
+    grads_numerical = numerical_gradient_full(
+        _conv_transpose_nd, x.data, w.data, back_grad=grad, kwargs=conf
+    )
+    for n, (arr, d_num) in enumerate(zip((x, w), grads_numerical)):
+        assert_allclose(
+            arr.grad,
+            d_num,
+            atol=1e-4,
+            rtol=1e-4,
+            err_msg=f"arr-{n}: numerical derivative and mygrad derivative do not match",
+        )
+
+
+@settings(deadline=None)
+@given(config=conv_transpose_configs(), data=st.data())
+def test_conv_transpose_is_gradient_of_conv(config, data: st.DataObject):
+    """conv_transpose_nd(grad, w) is dL/dx for conv_nd(x, w)"""
+    g_shape, w_shape, conf = config
+    conf.pop("output_padding")
+    # without output-padding, the padding can crop the entire output
+    assume(
+        all(
+            (g - 1) * s + (k - 1) * d + 1 > 2 * p
+            for g, k, s, d, p in zip(
+                g_shape[2:],
+                w_shape[2:],
+                conf["stride"],
+                conf["dilation"],
+                conf["padding"],
+            )
+        )
+    )
+
+    grad = data.draw(
+        hnp.arrays(dtype=float, shape=g_shape, elements=st.floats(-10, 10)),
+        label="grad",
+    )
+    w = data.draw(
+        hnp.arrays(dtype=float, shape=w_shape, elements=st.floats(-10, 10)), label="w"
+    )
+    out = conv_transpose_nd(grad, w, **conf)
+
+    # `conv_nd` requires that `window * dilation` fits within the padded data
+    assume(
+        all(
+            k * d <= n + 2 * p
+            for k, d, n, p in zip(
+                w_shape[2:], conf["dilation"], out.shape[2:], conf["padding"]
+            )
+        )
+    )
+    x = Tensor(np.zeros(out.shape))
+    y = conv_nd(x, w, **conf)
+
+    assert y.shape == grad.shape
+    y.backward(grad)
+    assert_allclose(actual=out.data, desired=x.grad, atol=1e-10)
+
+
+def test_conv_transpose_1d_simple():
+    x = Tensor([[[1.0, 2.0, 3.0]]])
+    w = Tensor([[[1.0, 10.0]]])
+    out = conv_transpose_nd(x, w, stride=2)
+    assert_allclose(out.data, [[[1.0, 10.0, 2.0, 20.0, 3.0, 30.0]]])
+
+    out.backward()
+    assert_allclose(x.grad, np.full(x.shape, 11.0))
+    assert_allclose(w.grad, np.full(w.shape, 6.0))
+
+
+@pytest.mark.parametrize("constant", [True, False])
+def test_conv_transpose_constant(constant: bool):
+    x = Tensor(np.random.rand(2, 3, 4, 4))
+    w = Tensor(np.random.rand(3, 2, 3, 3))
+    out = conv_transpose_nd(x, w, stride=2, padding=1, constant=constant)
+    assert out.constant is constant
+    assert out.shape == (2, 2, 7, 7)
+
+
+def test_conv_transpose_integer_inputs():
+    x = np.arange(6).reshape(1, 2, 3)
+    w = np.ones((2, 1, 2), dtype=int)
+    out = conv_transpose_nd(x, w, stride=1)
+    assert out.constant
+    assert out.dtype == np.result_type(x, w)
+    assert_allclose(out.data, [[[3, 8, 12, 7]]])
+
+
+def test_bad_conv_transpose_shapes():
+    x = np.zeros((1, 2, 2, 2))
+
+    with raises(ValueError):
+        # x has too few dims
+        conv_transpose_nd(np.zeros((2, 2)), np.zeros((2, 1, 2)), stride=1)
+
+    with raises(ValueError):
+        conv_transpose_nd(x, np.zeros((2, 1, 2)), stride=1)  # mismatched ndims
+
+    with raises(ValueError):
+        conv_transpose_nd(x, np.zeros((3, 1, 2, 2)), stride=1)  # mismatched channels
+
+    w = np.zeros((2, 1, 2, 2))
+    with raises(AssertionError):
+        conv_transpose_nd(x, w, stride=0)  # bad stride
+
+    with raises(AssertionError):
+        conv_transpose_nd(x, w, stride=1, padding=-1)  # bad pad
+
+    with raises(AssertionError):
+        conv_transpose_nd(x, w, stride=2, output_padding=2)  # bad output-padding
+
+    with raises(ValueError):
+        conv_transpose_nd(x, w, stride=1, padding=2)  # padding crops entire output
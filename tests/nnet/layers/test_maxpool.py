@@ -2,6 +2,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 from pytest import raises
 
+import mygrad as mg
 from mygrad.nnet.layers import max_pool
 from mygrad.tensor_base import Tensor
 
@@ -191,3 +192,21 @@ def test_bad_max_shapes():
 
     with raises(ValueError):
         max_pool(x, (1,) * 3, (3,) * 3)  # shape mismatch
+
+
+def test_channel_last_input():
+    """Pooling a permuted view of channel-last data matches pooling a
+    contiguous copy"""
+    nhwc = np.random.rand(2, 6, 8, 3)
+    x = mg.moveaxis(Tensor(nhwc), -1, 1)  # (N, C, H, W), not C-contiguous
+    assert not x.data.flags["C_CONTIGUOUS"]
+    x_contig = Tensor(np.ascontiguousarray(x.data))
+
+    out = max_pool(x, (2, 2), (2, 2))
+    expected = max_pool(x_contig, (2, 2), (2, 2))
+    assert_allclose(out.data, expected.data)
+
+    grad = np.random.rand(*out.shape)
+    out.backward(grad)
+    expected.backward(grad)
+    assert_allclose(x.grad, x_contig.grad)
@@ -113,6 +113,7 @@ def test_memory_details(dtype):
         ]
     )
     assert not y.flags["WRITEABLE"]
+    assert np.shares_memory(x, y)
     assert_allclose(actual=y, desired=soln)
 
     x = np.arange(20).reshape(2, 10)
@@ -121,3 +122,42 @@ def test_memory_details(dtype):
     assert not y.flags["WRITEABLE"]
     assert np.shares_memory(x, y)
     assert_allclose(actual=y, desired=soln)
+
+
+@settings(deadline=None)
+@given(
+    data=st.data(),
+    x=hnp.arrays(
+        dtype=dtype_strat_numpy,
+        shape=hnp.array_shapes(min_dims=1, max_dims=4, max_side=8),
+    ),
+)
+def test_strided_inputs_are_not_copied(data: st.DataObject, x: np.ndarray):
+    """Ensure that transposed and sliced views are windowed without
+    being copied, and that the windows match those of a contiguous copy"""
+    x = x.transpose(data.draw(st.permutations(range(x.ndim)), label="axes"))
+    x = x[
+        tuple(
+            slice(None, None, data.draw(st.sampled_from([-2, -1, 1, 2]), label="step"))
+            for _ in range(x.ndim)
+        )
+    ]
+
+    win_dim = data.draw(st.integers(1, x.ndim), label="win_dim")
+    win_shape = data.draw(
+        st.tuples(*(st.integers(1, s) for s in x.shape[-win_dim:])), label="win_shape"
+    )
+    step = data.draw(
+        st.tuples(*(st.integers(1, s) for s in x.shape[-win_dim:])), label="step"
+    )
+    max_dilation = np.array(x.shape[-win_dim:]) // win_shape
+    dilation = data.draw(
+        st.tuples(*(st.integers(1, s) for s in max_dilation)), label="dilation"
+    )
+
+    y = sliding_window_view(x, window_shape=win_shape, step=step, dilation=dilation)
+    expected = sliding_window_view(
+        np.ascontiguousarray(x), window_shape=win_shape, step=step, dilation=dilation
+    )
+    assert np.shares_memory(x, y)
+    assert_allclose(actual=y, desired=expected)
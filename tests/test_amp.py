@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+import mygrad._utils.precision as _precision
+from mygrad.amp import (
+    LossScaler,
+    copy_grads_to_master,
+    copy_master_to_model,
+    make_master_copies,
+)
+
+
+def test_mixed_precision_context_toggles_state():
+    assert _precision.FP32_ACCUMULATION is False
+    with mg.mixed_precision:
+        assert _precision.FP32_ACCUMULATION is True
+        with mg.mixed_precision:
+            assert _precision.FP32_ACCUMULATION is True
+        assert _precision.FP32_ACCUMULATION is True
+    assert _precision.FP32_ACCUMULATION is False
+
+
+@pytest.mark.parametrize("mixed", [True, False])
+def test_half_precision_grad_dtype(mixed: bool):
+    x = mg.tensor([1.0, 2.0, 3.0], dtype=np.float16)
+    y = mg.tensor([4.0, 5.0, 6.0], dtype=np.float16)
+
+    if mixed:
+        with mg.mixed_precision:
+            (x * y + x).sum().backward()
+    else:
+        (x * y + x).sum().backward()
+
+    assert x.dtype == np.float16
+    expected_dtype = np.float32 if mixed else np.float16
+    assert x.grad.dtype == expected_dtype
+    assert y.grad.dtype == expected_dtype
+    assert_allclose(x.grad, [5.0, 6.0, 7.0])
+    assert_allclose(y.grad, [1.0, 2.0, 3.0])
+
+
+def test_mixed_precision_does_not_affect_other_dtypes():
+    x = mg.tensor([1.0, 2.0], dtype=np.float32)
+    with mg.mixed_precision:
+        (2 * x).backward()
+    assert x.grad.dtype == np.float32
+
+
+def test_accumulation_in_float32_avoids_half_precision_rounding():
+    # 1 + 2**-12 is not representable in float16
+    x = mg.tensor(1.0, dtype=np.float16)
+    with mg.mixed_precision:
+        mg.add_sequence(*([x] * 4097)).backward(2.0 ** -12)
+
+    assert x.grad.dtype == np.float32
+    assert_allclose(x.grad, 4097 * 2.0 ** -12)
+
+
+def test_half_precision_reductions_computed_in_float32():
+    x = mg.full((4096,), fill_value=1.0, dtype=np.float16)
+    x.data[0] = 2048.0  # partial sums exceed float16's integer precision
+
+    with mg.mixed_precision:
+        out = mg.sum(x)
+    assert out.dtype == np.float16
+    assert out.item() == np.float16(np.sum(x.data, dtype=np.float32))
+
+
+class TestLossScaler:
+    def test_scale(self):
+        scaler = LossScaler(init_scale=8.0)
+        loss = mg.tensor(2.0, dtype=np.float16)
+        scaled = scaler.scale(loss)
+        assert scaled.item() == 16.0
+        scaled.backward()
+        assert loss.grad.item() == 8.0
+
+    def test_unscale_and_growth(self):
+        scaler = LossScaler(init_scale=4.0, growth_interval=2)
+        w = mg.tensor([1.0, 2.0], dtype=np.float16)
+
+        for n in range(2):
+            with mg.mixed_precision:
+                scaler.scale(mg.sum(w ** 2)).backward()
+            assert scaler.unscale([w]) is True
+            assert_allclose(w.grad, [2.0, 4.0])
+            scaler.update()
+
+        assert scaler.scale_factor == 8.0
+
+    def test_overflow_detection_and_backoff(self):
+        scaler = LossScaler(init_scale=2.0 ** 16)
+        w = mg.tensor([60000.0], dtype=np.float16)
+        with np.errstate(over="ignore"):
+            scaler.scale(mg.sum(w * w)).backward()  # overflows in float16
+
+        assert scaler.unscale([w, mg.tensor(1.0)]) is False
+        scaler.update()
+        assert scaler.scale_factor == 2.0 ** 15
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(init_scale=0.0),
+            dict(growth_factor=1.0),
+            dict(backoff_factor=1.0),
+            dict(growth_interval=0),
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(ValueError):
+            LossScaler(**kwargs)
+
+
+def test_master_copies_roundtrip():
+    params = [
+        mg.tensor([1.0, 2.0], dtype=np.float16),
+        mg.tensor([[3.0]], dtype=np.float16),
+    ]
+    masters = make_master_copies(params)
+    assert all(m.dtype == np.float32 for m in masters)
+    assert all(not np.shares_memory(m, p) for m, p in zip(masters, params))
+
+    with mg.mixed_precision:
+        (mg.sum(params[0] ** 2) + mg.sum(params[1])).backward()
+
+    copy_grads_to_master(params, masters)
+    assert masters[0].grad is params[0].grad  # already float32; no copy
+    assert_allclose(masters[1].grad, [[1.0]])
+
+    for m in masters:
+        m.data -= 0.5 * m.grad
+
+    copy_master_to_model(masters, params)
+    assert params[0].dtype == np.float16
+    assert_allclose(params[0].data, [0.0, 0.0])
+    assert_allclose(params[1].data, [[2.5]])
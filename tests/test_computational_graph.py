@@ -0,0 +1,150 @@
+import importlib.util
+import io
+import json
+from typing import List
+
+import numpy as np
+import pytest
+
+import mygrad as mg
+from mygrad.computational_graph import build_graph, export_graph, graph_summary
+
+HAS_GRAPHVIZ = importlib.util.find_spec("graphviz") is not None
+
+
+def _records(fin: mg.Tensor, **kwargs) -> List[dict]:
+    file = io.StringIO()
+    export_graph(fin, file, format="jsonl", **kwargs)
+    return [json.loads(line) for line in file.getvalue().splitlines()]
+
+
+def test_graph_summary():
+    x = mg.tensor([1.0, 2.0, 3.0])
+    y = x * x
+    a, b, c = mg.unstack(y)
+    f = mg.sum(a + b * c + x)
+
+    summary = graph_summary(f)
+    assert summary.num_tensors == 9  # x, y, a, b, c, b*c, a+bc, +x, sum
+    assert summary.num_ops == 6
+    assert summary.op_counts == {"Add": 2, "Sum": 1, "Multiply": 2, "Unstack": 1}
+    assert list(summary.op_counts.values())[0] == 2
+    assert summary.depth == 6  # x -> y -> (a, b, c) -> b*c -> a + bc -> +x -> sum
+    assert summary.max_fan_in == 2
+    assert summary.max_fan_out == 2  # x
+    assert summary.nbytes == 24 * 3 + 8 * 6
+    assert summary.max_nbytes == 24
+
+
+def test_graph_summary_of_leaf():
+    summary = graph_summary(mg.tensor(1.0))
+    assert (summary.num_tensors, summary.num_ops, summary.depth) == (1, 0, 0)
+    assert summary.max_fan_out == 0
+
+
+def test_very_deep_graph():
+    x = mg.tensor(1.0)
+    y = x
+    for _ in range(5000):
+        y = y + x
+    assert graph_summary(y).depth == 5000
+    assert len([r for r in _records(y) if r["kind"] == "op"]) == 5000
+
+
+def test_shared_subgraphs_are_visited_once():
+    # each level doubles the number of paths through the graph
+    y = mg.tensor(1.0)
+    for _ in range(64):
+        y = y * y
+    summary = graph_summary(y)
+    assert (summary.num_tensors, summary.num_ops, summary.depth) == (65, 64, 64)
+
+    records = _records(y)
+    assert len(records) == 65 + 64 + 64 + 64  # tensors, ops, in-edges, out-edges
+
+
+def test_export_jsonl():
+    x = mg.tensor([1.0, 2.0])
+    w = np.array([3.0, 4.0])
+    y = mg.sum(x * w)
+
+    records = _records(y, names={"x": x, "w": w, "y": y})
+    tensors = {r["id"]: r for r in records if r["kind"] == "tensor"}
+    ops = {r["id"]: r for r in records if r["kind"] == "op"}
+    edges = {(r["source"], r["target"]) for r in records if r["kind"] == "edge"}
+
+    assert sorted(r["label"] for r in tensors.values()) == ["Tensor", "w", "x", "y"]
+    assert sorted(r["type"] for r in ops.values()) == ["Multiply", "Sum"]
+    assert len(edges) == 5
+
+    by_label = {r["label"]: r for r in tensors.values()}
+    assert by_label["x"]["shape"] == [2]
+    assert by_label["x"]["nbytes"] == 16
+    assert by_label["w"]["constant"] is True
+    assert by_label["y"]["dtype"] == "float64"
+
+    # every edge is written after both of its endpoints
+    seen = set()
+    for r in records:
+        if r["kind"] == "edge":
+            assert r["source"] in seen and r["target"] in seen
+        else:
+            seen.add(r["id"])
+
+
+def test_export_dot():
+    x = mg.tensor([1.0, 2.0])
+    y = mg.exp(x)
+    file = io.StringIO()
+    assert export_graph(y, file, names={"x": x}) == 2
+
+    dot = file.getvalue()
+    assert dot.startswith("digraph {\n")
+    assert dot.endswith("}\n")
+    assert '"Exp"' in dot
+    assert dot.count("->") == 2
+
+
+def test_max_nodes():
+    y = mg.tensor(1.0)
+    for _ in range(100):
+        y = y + 1
+    records = _records(y, max_nodes=10)
+    tensor_ids = {r["id"] for r in records if r["kind"] == "tensor"}
+    assert len(tensor_ids) == 10
+    assert all(
+        r["source"] in tensor_ids or r["target"] in tensor_ids
+        for r in records
+        if r["kind"] == "edge"
+    )
+
+
+def test_collapse():
+    x = mg.tensor([1.0, 2.0])
+    hidden = mg.exp(mg.sin(x))
+    y = mg.sum(hidden * 2)
+
+    records = _records(y, collapse=[hidden])
+    ops = sorted(r["type"] for r in records if r["kind"] == "op")
+    assert ops == ["Multiply", "Sum"]
+
+    collapsed = [r for r in records if r["kind"] == "tensor" and r["collapsed"]]
+    assert len(collapsed) == 1
+    assert collapsed[0]["shape"] == [2]
+
+
+def test_bad_format_raises():
+    with pytest.raises(ValueError):
+        export_graph(mg.tensor(1.0), io.StringIO(), format="xml")
+
+
+@pytest.mark.skipif(not HAS_GRAPHVIZ, reason="requires graphviz")
+def test_build_graph_with_names():
+    x = mg.tensor([1.0, 2.0])
+    y = mg.tensor(3.0)
+    f = x * y + x
+    graph = build_graph(f, names={"x": x, "y": y, "f": f}, dims=True, dtypes=True)
+    source = graph.source
+    assert "Multiply" in source
+    assert "Add" in source
+    assert source.count("->") == 6
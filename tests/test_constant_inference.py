@@ -1,6 +1,8 @@
 import hypothesis.strategies as st
 import numpy as np
+import pytest
 from hypothesis import given
+from numpy.testing import assert_array_equal
 
 import mygrad as mg
 from mygrad.math.arithmetic.ops import Multiply
@@ -43,3 +45,37 @@ def test_simple_constant_behavior():
     assert mg.add(const, var).constant is False
     assert mg.add(const, var, constant=False).constant is False
     assert mg.add(const, var, constant=True).constant is True
+
+
+@pytest.mark.parametrize(
+    "x", [np.array([-1.0, 2.0]), mg.tensor([-1.0, 2.0], constant=True)]
+)
+def test_constant_inputs_skip_backprop_state(x):
+    from mygrad.nnet.activations.relu import ReLu
+
+    out = mg.nnet.relu(x)
+    assert out.constant is True
+    assert_array_equal(out, [0.0, 2.0])
+
+    # the operation is recorded, but its forward kernel was run in place of
+    # its `__call__`, thus it saved no state for back-propagation
+    assert isinstance(out.creator, ReLu)
+    assert out.creator.variables[0].constant is True
+    assert not hasattr(out.creator, "back")
+
+    # memory-locking semantics are unchanged
+    assert out.data.flags.writeable is False
+    assert np.asarray(x).flags.writeable is False
+    out.backward()
+    assert out.creator is None
+    assert np.asarray(x).flags.writeable is True
+
+
+def test_non_constant_inputs_save_backprop_state():
+    x = mg.tensor([-1.0, 2.0])
+    out = mg.nnet.relu(x)
+    assert hasattr(out.creator, "back")
+
+    out = mg.nnet.relu(x.data, constant=False)
+    assert out.constant is False
+    assert hasattr(out.creator, "back")
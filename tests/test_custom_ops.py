@@ -0,0 +1,167 @@
+import importlib.util
+
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+from numpy.testing import assert_allclose, assert_array_equal
+
+import mygrad as mg
+from mygrad.custom_ops import CustomOperation, custom_op
+from mygrad.errors import InvalidGradient
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def _x_sin_y_bkwd(grad, out, x, y):
+    _x_sin_y_bkwd.num_calls += 1
+    return grad * np.sin(y), grad * x * np.cos(y)
+
+
+_x_sin_y_bkwd.num_calls = 0
+
+
+@custom_op(backward=_x_sin_y_bkwd)
+def x_sin_y(x, y):
+    return x * np.sin(y)
+
+
+@given(
+    shapes=hnp.mutually_broadcastable_shapes(num_shapes=2, max_dims=3),
+    data=st.data(),
+)
+def test_custom_op_against_mygrad(shapes, data: st.DataObject):
+    x_arr, y_arr = (
+        data.draw(
+            hnp.arrays(dtype=float, shape=shape, elements=st.floats(-10, 10)),
+            label=name,
+        )
+        for shape, name in zip(shapes.input_shapes, "xy")
+    )
+    x, y = mg.tensor(x_arr), mg.tensor(y_arr)
+    out = x_sin_y(x, y)
+    assert isinstance(out.creator, CustomOperation)
+
+    x2, y2 = mg.tensor(x_arr), mg.tensor(y_arr)
+    expected = x2 * mg.sin(y2)
+    assert_allclose(out.data, expected.data)
+
+    grad = data.draw(
+        hnp.arrays(dtype=float, shape=out.shape, elements=st.floats(-10, 10)),
+        label="grad",
+    )
+    num_calls = _x_sin_y_bkwd.num_calls
+    out.backward(grad)
+    expected.backward(grad)
+
+    # the backward kernel computes the gradients for both inputs at once
+    assert _x_sin_y_bkwd.num_calls == num_calls + 1
+    assert_allclose(x.grad, x2.grad)
+    assert_allclose(y.grad, y2.grad)
+
+
+@pytest.mark.parametrize("constant", [None, True, False])
+def test_constant(constant):
+    out = x_sin_y(mg.tensor(1.0), np.array(2.0), constant=constant)
+    assert out.constant is bool(constant)
+    assert x_sin_y(1, 2).constant is True  # integer inputs
+
+
+def test_memory_locking():
+    x = np.array([1.0, 2.0])
+    out = x_sin_y(x, mg.tensor(3.0))
+    assert x.flags.writeable is False
+    assert out.data.flags.writeable is False
+    out.backward()
+    assert x.flags.writeable is True
+
+
+def test_without_graph_tracking():
+    x = mg.tensor([1.0, 2.0])
+    with mg.no_autodiff:
+        out = x_sin_y(x, np.pi / 2)
+    assert out.creator is None
+    assert_allclose(out.data, [1.0, 2.0])
+
+
+def test_none_gradient_is_skipped():
+    op = custom_op(lambda x, y: x + y, backward=lambda grad, out, x, y: (grad, None))
+    x = mg.tensor([1.0, 2.0])
+    y = mg.tensor([3.0, 4.0])
+    op(x, y).backward()
+    assert_array_equal(x.grad, [1.0, 1.0])
+    assert y.grad is None
+
+
+def test_single_input_op_can_return_bare_gradient():
+    square = custom_op(lambda x: x ** 2, backward=lambda grad, out, x: 2 * grad * x)
+    x = mg.tensor([1.0, -3.0])
+    square(x).backward()
+    assert_array_equal(x.grad, [2.0, -6.0])
+
+
+def test_bad_gradients_raise():
+    op = custom_op(lambda x, y: x * y, backward=lambda grad, out, x, y: (grad,))
+    with pytest.raises(InvalidGradient):
+        op(mg.tensor(1.0), mg.tensor(2.0)).backward()
+
+
+def test_wrong_number_of_inputs_raises():
+    with pytest.raises(TypeError):
+        x_sin_y(1.0)
+
+
+def test_output_is_not_a_view_of_input():
+    identity = custom_op(lambda x: x, backward=lambda grad, out, x: grad)
+    x = mg.tensor([1.0, 2.0])
+    out = identity(x)
+    assert not np.shares_memory(out.data, x.data)
+    out.backward()
+    assert_array_equal(x.grad, [1.0, 1.0])
+
+
+def test_without_broadcasting():
+    def outer_bkwd(grad, out, x, y):
+        return grad @ y, x @ grad
+
+    outer = custom_op(np.outer, backward=outer_bkwd, broadcast=False)
+    x = mg.tensor([1.0, 2.0])
+    y = mg.tensor([3.0, 4.0, 5.0])
+    out = outer(x, y)
+    assert out.shape == (2, 3)
+    out.backward()
+    assert_array_equal(x.grad, [12.0, 12.0])
+    assert_array_equal(y.grad, [3.0, 3.0, 3.0])
+
+
+@pytest.mark.skipif(HAS_NUMBA, reason="numba is installed")
+def test_jit_without_numba_raises():
+    with pytest.raises(ImportError):
+        custom_op(lambda x: x, backward=lambda grad, out, x: grad, jit=True)
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="requires numba")
+def test_jit_compiles_a_specialization_per_signature():
+    def clip_bkwd(grad, out, x):
+        dx = np.empty_like(grad)
+        for i in range(x.size):
+            dx.flat[i] = grad.flat[i] if abs(x.flat[i]) < 1 else 0.0
+        return dx
+
+    @custom_op(backward=clip_bkwd, jit=True)
+    def clip(x):
+        out = np.empty_like(x)
+        for i in range(x.size):
+            out.flat[i] = min(max(x.flat[i], -1.0), 1.0)
+        return out
+
+    for dtype in ("float32", "float64", "float64"):
+        x = mg.tensor([-2.0, 0.5, 3.0], dtype=dtype)
+        out = clip(x)
+        assert out.dtype == x.dtype
+        assert_allclose(out.data, [-1.0, 0.5, 1.0])
+        out.backward()
+        assert_allclose(x.grad, [0.0, 1.0, 0.0])
+
+    assert len(clip.Op._forward_kernel.specializations) == 2
@@ -0,0 +1,183 @@
+import gc
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import mygrad as mg
+from mygrad.data import DataLoader, NpyDataset
+
+
+@pytest.fixture()
+def npy_files(tmp_path):
+    x = np.arange(44.0).reshape(22, 2)
+    y = np.arange(22)
+    np.save(tmp_path / "x.npy", x)
+    np.save(tmp_path / "y.npy", y)
+    return tmp_path / "x.npy", tmp_path / "y.npy"
+
+
+def test_dataset_is_memory_mapped(npy_files):
+    dataset = NpyDataset(*npy_files)
+    assert len(dataset) == 22
+    assert all(isinstance(arr, np.memmap) for arr in dataset.arrays)
+    assert all(not arr.flags.writeable for arr in dataset.arrays)
+
+    x, y = dataset[3]
+    assert_array_equal(x, [6.0, 7.0])
+    assert y == 3
+
+
+def test_dataset_take(npy_files):
+    dataset = NpyDataset(*npy_files)
+    x, y = dataset.take([5, 0, -1])
+    assert_array_equal(x, [[10.0, 11.0], [0.0, 1.0], [42.0, 43.0]])
+    assert_array_equal(y, [5, 0, 21])
+
+    out = (np.empty((3, 2)), np.empty(3, dtype=y.dtype))
+    results = dataset.take([5, 0, -1], out=out)
+    assert all(r is o for r, o in zip(results, out))
+    assert_array_equal(out[0], x)
+    assert_array_equal(out[1], y)
+
+    with pytest.raises(IndexError):
+        dataset.take([22], out=out[:1])
+
+
+@pytest.mark.parametrize(
+    "sources, error",
+    [
+        ((), ValueError),
+        ((np.arange(3), np.arange(4)), ValueError),
+        ((np.array(1.0),), ValueError),
+        (([1, 2, 3],), TypeError),
+    ],
+)
+def test_dataset_validation(sources, error):
+    with pytest.raises(error):
+        NpyDataset(*sources)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+@pytest.mark.parametrize("drop_last", [True, False])
+def test_loader_ordered(npy_files, prefetch, drop_last):
+    dataset = NpyDataset(*npy_files)
+    loader = DataLoader(
+        dataset, batch_size=5, shuffle=False, drop_last=drop_last, prefetch=prefetch
+    )
+    assert len(loader) == (4 if drop_last else 5)
+
+    labels = []
+    for x, y in loader:
+        assert isinstance(x, mg.Tensor) and isinstance(y, mg.Tensor)
+        assert x.constant and y.constant
+        assert_array_equal(x.data, dataset.arrays[0][y.data])
+        labels.extend(y.data.tolist())
+
+    assert labels == list(range(20 if drop_last else 22))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_loader_shuffled_epochs(npy_files, prefetch):
+    dataset = NpyDataset(*npy_files)
+    loader = DataLoader(dataset, batch_size=4, seed=0, prefetch=prefetch)
+
+    epochs = []
+    for _ in range(2):
+        labels = []
+        for x, y in loader:
+            assert_array_equal(x.data, dataset.arrays[0][y.data])
+            assert np.all(np.diff(y.data) > 0)  # sorted within batch
+            labels.extend(y.data.tolist())
+        assert sorted(labels) == list(range(22))
+        epochs.append(labels)
+
+    assert epochs[0] != epochs[1]
+
+    replay = DataLoader(dataset, batch_size=4, seed=0, prefetch=prefetch)
+    assert [y.data.tolist() for _, y in replay] == [
+        epochs[0][i : i + 4] for i in range(0, 22, 4)
+    ]
+
+
+def test_loader_single_source_yields_tensor():
+    loader = DataLoader(NpyDataset(np.arange(6.0)), batch_size=4, shuffle=False)
+    batches = [b.data.copy() for b in loader]
+    assert_array_equal(batches[0], [0.0, 1.0, 2.0, 3.0])
+    assert_array_equal(batches[1], [4.0, 5.0])
+
+
+def test_loader_reuses_buffers_without_copying():
+    dataset = NpyDataset(np.arange(40.0).reshape(20, 2))
+    loader = DataLoader(dataset, batch_size=4, shuffle=False, prefetch=1)
+    buffers = {id(b[0]) for b in loader._buffers}
+
+    for batch in loader:
+        assert id(batch.data.base) in buffers
+        assert batch.data.base is not None
+
+    assert {id(b[0]) for b in loader._buffers} == buffers
+
+
+def test_loader_does_not_overwrite_locked_batch():
+    dataset = NpyDataset(np.arange(40.0).reshape(20, 2))
+    loader = DataLoader(dataset, batch_size=2, shuffle=False, prefetch=1)
+
+    original_buffers = [b[0] for b in loader._buffers]
+
+    w = mg.tensor([1.0, -1.0])
+    products = []
+    expected = []
+    for x in loader:
+        # the graph is not cleared, keeping the batch's memory locked
+        products.append(x * w)
+        expected.append(x.data.copy())
+
+    # locked buffers were replaced rather than overwritten
+    assert all(b[0] is not a for b, a in zip(loader._buffers, original_buffers))
+
+    for product, desired in zip(products, expected):
+        assert_array_equal(product.creator.variables[0].data, desired)
+        product.clear_graph()
+
+
+def test_loader_abandoned_iteration_stops_thread():
+    dataset = NpyDataset(np.arange(40.0).reshape(20, 2))
+    loader = DataLoader(dataset, batch_size=2, prefetch=2)
+
+    it = iter(loader)
+    next(it)
+    thread = it._thread
+    del it
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+    # a subsequent iteration is unaffected
+    assert sum(len(x) for x in loader) == 20
+
+
+def test_loader_propagates_errors():
+    class BadDataset(NpyDataset):
+        def take(self, indices, out=None):
+            raise RuntimeError("bad read")
+
+    loader = DataLoader(BadDataset(np.arange(4.0)), batch_size=2, prefetch=1)
+    with pytest.raises(RuntimeError, match="bad read"):
+        list(loader)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        (dict(dataset=np.arange(3.0), batch_size=1), TypeError),
+        (dict(dataset=NpyDataset(np.arange(3.0)), batch_size=0), ValueError),
+        (
+            dict(dataset=NpyDataset(np.arange(3.0)), batch_size=1, prefetch=-1),
+            ValueError,
+        ),
+    ],
+)
+def test_loader_validation(kwargs, error):
+    with pytest.raises(error):
+        DataLoader(**kwargs)
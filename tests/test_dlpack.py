@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import mygrad as mg
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(np, "from_dlpack"), reason="DLPack requires NumPy 1.22 or later"
+)
+
+
+class DLPackOnly:
+    """Exposes an array solely through the DLPack protocol"""
+
+    def __init__(self, arr):
+        self._arr = arr
+
+    def __dlpack__(self, stream=None):
+        return self._arr.__dlpack__(stream=stream)
+
+    def __dlpack_device__(self):
+        return self._arr.__dlpack_device__()
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+def test_from_dlpack_shares_memory(dtype):
+    x = np.arange(6, dtype=dtype).reshape(2, 3)
+    t = mg.from_dlpack(DLPackOnly(x))
+    assert isinstance(t, mg.Tensor)
+    assert t.dtype == dtype
+    assert t.constant is False
+    assert np.shares_memory(t, x)
+    assert_array_equal(t, x)
+
+
+def test_from_dlpack_constant():
+    assert mg.from_dlpack(np.arange(3)).constant is True
+    assert mg.from_dlpack(np.arange(3.0), constant=True).constant is True
+
+
+def test_from_dlpack_tensor_backprop():
+    x = np.array([1.0, 2.0, 3.0])
+    t = mg.from_dlpack(x)
+    (t ** 2).sum().backward()
+    assert_array_equal(t.grad, 2 * x)
+    assert x.flags.writeable
+
+
+def test_tensor_export_shares_memory():
+    t = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+    assert t.__dlpack_device__() == (1, 0)  # CPU
+
+    arr = np.from_dlpack(t)
+    assert np.shares_memory(arr, t.data)
+
+    # round trip
+    t2 = mg.from_dlpack(t)
+    assert np.shares_memory(t2, t)
+
+
+def test_export_of_view_shares_memory():
+    t = mg.arange(6.0)
+    with mg.mem_guard_off:
+        arr = np.from_dlpack(t[::2])
+    assert_array_equal(arr, [0.0, 2.0, 4.0])
+    assert np.shares_memory(arr, t.data)
+
+
+def test_tensor_in_graph_exports_copy():
+    t = mg.tensor([1.0, 2.0])
+    y = 2 * t
+    assert not t.data.flags.writeable  # locked by memory guard
+
+    arr = np.from_dlpack(t)
+    assert_array_equal(arr, [1.0, 2.0])
+    assert not np.shares_memory(arr, t.data)
+
+    y.backward()
+    assert np.shares_memory(np.from_dlpack(t), t.data)
@@ -0,0 +1,214 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+from mygrad.optim import SGD, Adam, FlatParameters
+
+
+def _make_tensors():
+    return [
+        mg.tensor(np.arange(6.0).reshape(2, 3)),
+        mg.tensor([-1.0, -2.0]),
+        mg.tensor(3.0),
+    ]
+
+
+def test_tensors_are_packed_in_place():
+    tensors = _make_tensors()
+    expected = [t.data.copy() for t in tensors]
+    params = FlatParameters(tensors)
+
+    assert len(params) == 3
+    assert all(a is b for a, b in zip(params, tensors))
+    assert params.data.shape == (9,)
+    assert params.data.flags.c_contiguous
+
+    for t, sl, desired in zip(tensors, params.slices, expected):
+        assert t.base is None
+        assert t.creator is None
+        assert np.shares_memory(t.data, params.data)
+        assert_allclose(t.data, desired)
+        assert_allclose(params.data[sl], desired.ravel())
+
+
+def test_grads_are_written_into_flat_buffer():
+    w, b, c = tensors = _make_tensors()
+    params = FlatParameters(tensors)
+
+    (mg.sum(w ** 2) + mg.sum(b * c)).backward()
+
+    for t in tensors:
+        assert np.shares_memory(t.grad, params.grad)
+
+    assert_allclose(w.grad, 2 * w.data)
+    assert_allclose(b.grad, [3.0, 3.0])
+    assert_allclose(c.grad, -3.0)
+    assert_allclose(
+        params.grad, np.concatenate([2 * w.data.ravel(), [3.0, 3.0], [-3.0]])
+    )
+
+
+def test_grad_accumulation_within_buffer():
+    (x,) = params = FlatParameters([mg.tensor([1.0, 2.0])])
+    (x * x + 3 * x).backward()
+    assert_allclose(params.grad, [5.0, 7.0])
+    assert x.grad.base is params.grad
+
+
+def test_missing_grads_are_zero_filled():
+    w, b, c = tensors = _make_tensors()
+    params = FlatParameters(tensors)
+    params.grad[:] = -1.0
+
+    mg.sum(w).backward()
+    assert b.grad is None and c.grad is None
+    assert_allclose(params.grad, [1.0] * 6 + [0.0] * 3)
+
+
+def test_view_semantics_preserved():
+    w, b, c = tensors = _make_tensors()
+    params = FlatParameters(tensors)
+
+    view = w[0]
+    assert view.base is w
+    assert np.shares_memory(view.data, params.data)
+
+    mg.sum(view * w).backward()
+    assert_allclose(w.grad, [[3.0, 6.0, 9.0], [0.0, 1.0, 2.0]])
+    assert_allclose(view.grad, w.grad[0])
+    assert np.shares_memory(view.grad, params.grad)
+
+
+def _iadd(x: mg.Tensor):
+    x += 1
+
+
+def _setitem(x: mg.Tensor):
+    x[...] = [10.0, 20.0]
+
+
+def _setitem_via_view(x: mg.Tensor):
+    view = x[:1]
+    view[...] = 10.0
+
+
+@pytest.mark.parametrize(
+    "inplace_op, expected",
+    [(_iadd, [2.0, 3.0]), (_setitem, [10.0, 20.0]), (_setitem_via_view, [10.0, 2.0])],
+)
+def test_in_place_updates_are_written_into_flat_buffer(inplace_op, expected):
+    w, b = params = FlatParameters([mg.tensor([1.0, 2.0]), mg.tensor([3.0])])
+    inplace_op(w)
+
+    assert_allclose(w, expected)
+    assert_allclose(params.data, expected + [3.0])
+    assert np.shares_memory(w.data, params.data)
+
+    (w * b).sum().backward()
+    assert_allclose(params.grad, [3.0, 3.0, sum(expected)])
+    assert np.shares_memory(w.grad, params.grad)
+
+    SGD(params, lr=1.0).step()
+    assert_allclose(w, [e - 3.0 for e in expected])
+    assert_allclose(b, [3.0 - sum(expected)])
+
+
+def test_in_place_update_preserves_prior_graph():
+    w, b = params = FlatParameters([mg.tensor([1.0, 2.0]), mg.tensor([3.0])])
+    y = (w * b).sum()
+    w *= 2
+
+    y.backward()
+    assert_allclose(b.grad, [3.0])
+    assert_allclose(params.grad, [0.0, 0.0, 3.0])
+    assert_allclose(w, [2.0, 4.0])
+    assert np.shares_memory(w.data, params.data)
+
+
+def test_mismatched_grad_dtype_is_copied_into_buffer():
+    x = mg.tensor([1.0, 2.0], dtype=np.float16)
+    params = FlatParameters([x], grad_dtype=np.float32)
+    (2 * x).backward()
+    assert x.grad.dtype == np.float16
+    assert params.grad.dtype == np.float32
+    assert_allclose(params.grad, [2.0, 2.0])
+
+    with mg.mixed_precision:
+        (3 * x).backward()
+    assert x.grad.base is params.grad
+    assert_allclose(params.grad, [3.0, 3.0])
+
+
+def test_clip_grad_norm():
+    x, y = params = FlatParameters([mg.tensor([1.0, 2.0]), mg.tensor([[1.0]])])
+    (mg.sum(3 * x) + 4 * y).backward()  # grad: [3, 3, 4]
+
+    total_norm = params.clip_grad_norm(1.0)
+    assert_allclose(total_norm, np.sqrt(34))
+    assert_allclose(params.grad_norm(), 1.0, rtol=1e-5)
+    assert_allclose(x.grad, [3 / np.sqrt(34)] * 2, rtol=1e-5)
+
+    # no clipping needed
+    assert_allclose(params.clip_grad_norm(10.0), 1.0, rtol=1e-5)
+    assert_allclose(params.grad_norm(), 1.0, rtol=1e-5)
+
+
+@pytest.mark.parametrize("optim_type", [SGD, Adam])
+def test_optimizer_on_flat_group_matches_unpacked(optim_type):
+    unpacked = _make_tensors()
+    packed = FlatParameters(_make_tensors())
+
+    optims = [optim_type(unpacked, lr=0.1), optim_type(packed, lr=0.1)]
+
+    for _ in range(3):
+        for tensors, optim in zip([unpacked, packed], optims):
+            w, b, c = tensors
+            (mg.sum(mg.sin(w)) + mg.sum(b ** 2 * c)).backward()
+            optim.step()
+
+    for actual, desired in zip(packed, unpacked):
+        assert_allclose(actual, desired)
+        assert np.shares_memory(actual.data, packed.data)
+
+
+def test_optimizer_on_locked_flat_group_raises():
+    x, z = params = FlatParameters([mg.tensor([1.0, 2.0]), mg.tensor([3.0])])
+    optim = SGD(params, lr=1.0)
+    mg.sum(z).backward()
+
+    y = 2 * x  # locks the flat buffer
+    assert not params.data.flags.writeable
+    with pytest.raises(ValueError):
+        optim.step()
+    assert_allclose(params.data, [1.0, 2.0, 3.0])
+
+    y.clear_graph()
+    optim.step()
+    assert_allclose(params.data, [1.0, 2.0, 2.0])
+
+
+@pytest.mark.parametrize(
+    "tensors, error",
+    [
+        ([], ValueError),
+        ([np.array([1.0])], TypeError),
+        ([mg.tensor([1, 2])], TypeError),
+        ([mg.tensor([1.0]), mg.tensor([1.0], dtype="float32")], ValueError),
+        ([+mg.tensor([1.0])], ValueError),
+    ],
+)
+def test_validation(tensors, error):
+    with pytest.raises(error):
+        FlatParameters(tensors)
+
+
+def test_cannot_pack_tensor_twice_or_with_views():
+    x = mg.tensor([1.0, 2.0])
+    with pytest.raises(ValueError):
+        FlatParameters([x, x])
+
+    view = x[:1]
+    with pytest.raises(ValueError):
+        FlatParameters([x])
+    del view
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+import mygrad as mg
+from mygrad.memory import GraphMemory, graph_memory
+from mygrad.nnet.activations.relu import ReLu
+from mygrad.nnet.activations.softmax import Softmax
+from mygrad.operation_base import Operation
+
+
+def test_leaf_tensor():
+    x = mg.tensor(np.ones((3, 4)))
+    mem = graph_memory(x)
+    assert isinstance(mem, GraphMemory)
+    assert mem.tensors == mem.total == x.data.nbytes
+    assert mem.saved == 0
+    assert mem.by_op == {}
+    assert len(mem.by_tensor) == 1 and mem.by_tensor[0][0] is x
+
+
+def test_exposed_via_mygrad():
+    assert mg.graph_memory is graph_memory
+
+
+def test_views_are_deduplicated():
+    x = mg.tensor(np.ones((10, 10)))
+    y = x[:5]  # view of x
+    z = x.T  # view of x
+    out = mg.sum(y) + mg.sum(z)
+
+    mem = graph_memory(out)
+    by_tensor = {id(t): n for t, n in mem.by_tensor}
+    assert by_tensor[id(x)] == x.data.nbytes
+    assert by_tensor[id(y)] == 0
+    assert by_tensor[id(z)] == 0
+    assert mem.tensors == x.data.nbytes + 3 * np.dtype(float).itemsize
+
+
+def test_shared_base_not_in_graph_is_counted_once():
+    base = np.ones((4, 4))
+    x = mg.tensor(base[:2], copy=False)
+    y = mg.tensor(base[2:], copy=False)
+    mem = graph_memory(x * y)
+    assert mem.tensors == base.nbytes + (x * y).data.nbytes
+
+
+def test_tensors_sorted_by_size():
+    x = mg.tensor(np.ones(100))
+    out = mg.sum(x)
+    mem = graph_memory(out)
+    assert [t for t, _ in mem.by_tensor] == [x, out]
+
+
+def test_saved_buffers_are_attributed_to_ops():
+    x = mg.tensor(np.random.rand(5, 3))
+    y = mg.nnet.relu(x)
+    out = mg.sum(y)
+
+    relu_op = y.creator
+    assert isinstance(relu_op, ReLu)
+    assert set(relu_op.saved_buffers()) == {"back"}
+
+    mem = graph_memory(out)
+    assert mem.by_op["ReLu"] == relu_op.back.nbytes
+    assert mem.by_op["Sum"] == 0
+    assert mem.saved == relu_op.back.nbytes
+    assert mem.total == mem.tensors + mem.saved
+
+
+def test_saved_buffer_aliasing_tensor_data_is_not_double_counted():
+    x = mg.tensor(np.random.rand(5, 3))
+    y = mg.nnet.softmax(x)
+    assert isinstance(y.creator, Softmax)
+
+    mem = graph_memory(mg.sum(y))
+    assert np.shares_memory(y.creator._cached_output, y.data)
+    assert mem.by_op["Softmax"] == 0
+
+
+def test_shared_subgraph_counted_once():
+    x = mg.tensor(np.random.rand(5, 3))
+    y = mg.nnet.relu(x)
+    out = y * y + y
+
+    mem = graph_memory(out)
+    assert mem.by_op["ReLu"] == y.creator.back.nbytes
+    assert len(mem.by_tensor) == 4  # x, y, y * y, out
+
+
+class _Undeclared(Operation):
+    def __call__(self, a):
+        self.variables = (a,)
+        self.cache = 2 * a.data
+        self.index = (np.arange(2), slice(None), np.arange(3))
+        self.scalar = 2.0
+        return a.data.copy()
+
+    def backward_var(self, grad, index, **kwargs):  # pragma: no cover
+        return grad
+
+
+def test_saved_buffers_default_to_all_array_attributes():
+    x = mg.tensor([1.0, 2.0])
+    y = mg.Tensor._op(_Undeclared, x)
+    buffers = y.creator.saved_buffers()
+    assert set(buffers) == {"cache", "index[0]", "index[2]"}
+    assert buffers["cache"] is y.creator.cache
+
+    mem = graph_memory(y)
+    assert mem.by_op == {
+        "_Undeclared": y.creator.cache.nbytes
+        + y.creator.index[0].nbytes
+        + y.creator.index[2].nbytes
+    }
+
+
+def test_declared_saved_buffers_skip_unset_attributes():
+    class Op(_Undeclared):
+        _saved_buffers = ("cache", "missing")
+
+    x = mg.tensor([1.0, 2.0])
+    y = mg.Tensor._op(Op, x)
+    assert set(y.creator.saved_buffers()) == {"cache"}
+
+
+@pytest.mark.parametrize("constant", [True, False])
+def test_cleared_graph_only_reports_tensor(constant: bool):
+    x = mg.tensor(np.random.rand(5, 3), constant=constant)
+    out = mg.sum(mg.nnet.relu(x))
+    out.backward()
+    mem = graph_memory(out)
+    assert mem.total == out.data.nbytes
+    assert mem.by_op == {}
@@ -0,0 +1,120 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import mygrad
+
+# Modules that must not be imported by `import mygrad`; these are imported
+# lazily, upon first use.
+LAZY = [
+    "concurrent.futures",
+    "multiprocessing",
+    "subprocess",
+    "mygrad._version",
+    "mygrad.data",
+    "mygrad.linalg.funcs",
+    "mygrad.math.arithmetic.funcs",
+    "mygrad.math.sequential.funcs",
+    "mygrad.math.trigonometric.funcs",
+    "mygrad.nnet",
+    "mygrad.optim",
+    "mygrad.parallel",
+    "mygrad.random",
+    "mygrad.tensor_creation.funcs",
+]
+
+# `mygrad.parallel` relies on `multiprocessing.shared_memory`
+_requires_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="requires Python 3.8 or later"
+)
+
+
+def _mark_parallel(names, parallel_name: str):
+    return [
+        pytest.param(name, marks=_requires_shared_memory)
+        if name == parallel_name
+        else name
+        for name in names
+    ]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _importtime() -> dict:
+    """module -> cumulative import time (us), from `python -X importtime`"""
+    out = _run("import mygrad", "-X", "importtime").stderr
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_is_lazy():
+    times = _importtime()
+    print(
+        f"\n`import mygrad`: {times['mygrad'] / 1e3:.1f} ms "
+        f"(numpy: {times['numpy'] / 1e3:.1f} ms)"
+    )
+
+    imported = [name for name in LAZY if name in times]
+    assert not imported, f"`import mygrad` eagerly imports: {imported}"
+
+
+def test_numpy_overrides_available_without_accessing_lazy_names():
+    _run(
+        "import numpy as np\n"
+        "import mygrad as mg\n"
+        "x = mg.tensor([1.0, 2.0])\n"
+        "assert isinstance(np.sin(x), mg.Tensor)\n"
+        "assert isinstance(np.sum(x), mg.Tensor)\n"
+    )
+
+
+def test_star_import():
+    _run("from mygrad import *\nassert sum(tensor([1.0, 2.0])) == 3")
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    sorted(
+        set(mygrad._LAZY_FUNCTION_MODULES)
+        # only some of these modules' names are exposed by mygrad
+        - {"mygrad.linalg.funcs", "mygrad.ufuncs._ufunc_creators"}
+    ),
+)
+def test_lazy_names_match_module(module_name):
+    module = import_module(module_name)
+    names = mygrad._LAZY_FUNCTION_MODULES[module_name]
+    assert sorted(names) == sorted(module.__all__)
+
+
+@pytest.mark.parametrize(
+    "name", _mark_parallel(sorted(mygrad._LAZY_NAMES), "data_parallel")
+)
+def test_lazy_names_resolve(name):
+    module = import_module(mygrad._LAZY_NAMES[name])
+    assert getattr(mygrad, name) is getattr(module, name)
+    assert name in dir(mygrad)
+    assert name in mygrad.__all__
+
+
+@pytest.mark.parametrize("name", _mark_parallel(mygrad._LAZY_SUBMODULES, "parallel"))
+def test_lazy_submodules_resolve(name):
+    assert getattr(mygrad, name) is import_module(f"mygrad.{name}")
+
+
+def test_missing_attribute_raises():
+    with pytest.raises(AttributeError):
+        mygrad.not_an_attribute
@@ -593,3 +593,88 @@ def test_op_wrapper_supports_inplace_target():
     assert_allclose(x, mg.arange(3) ** 2)
     x.backward()
     assert_allclose(x_orig.grad, 2 * np.arange(3.0))
+
+
+@pytest.fixture
+def forbid_duplicating_graph(monkeypatch: pytest.MonkeyPatch):
+    from mygrad._utils import duplicating_graph
+
+    def raises(*args, **kwargs):
+        raise AssertionError("a duplicating graph was created")
+
+    monkeypatch.setattr(duplicating_graph.DuplicatingGraph, "__init__", raises)
+
+
+@pytest.mark.usefixtures("forbid_duplicating_graph")
+@pytest.mark.parametrize("constant", [False, True])
+def test_in_place_op_on_tensor_without_views_or_dependents(constant: bool):
+    x_orig = mg.tensor([1.0, 2.0, 3.0], constant=constant)
+    y = mg.tensor([4.0, 5.0, 6.0])
+
+    x = +x_orig  # x has a creator, but nothing depends on it
+    for _ in range(3):
+        x *= y
+    x[0] = -1.0
+
+    assert x.constant is constant
+    assert_array_equal(x, [-1.0, 250.0, 648.0])
+    assert x.data.flags.writeable is False
+
+    x.backward()
+    if constant:
+        # the constant-ness of an in-place update is dictated by its target
+        assert y.grad is None
+    else:
+        assert_array_equal(y.grad, [0.0, 3 * 2 * 25.0, 3 * 3 * 36.0])
+        assert_array_equal(x_orig.grad, [0.0, 125.0, 216.0])
+    assert x.data.flags.writeable is True
+
+
+@pytest.mark.usefixtures("forbid_duplicating_graph")
+def test_in_place_op_without_views_with_where():
+    x = mg.tensor([1.0, 2.0])
+    y = mg.tensor([3.0, 4.0])
+    z = +x
+    mg.multiply(z, y, out=z, where=[True, False])
+    assert_array_equal(z, [3.0, 2.0])
+    z.backward()
+    assert_array_equal(x.grad, [3.0, 1.0])
+    assert_array_equal(y.grad, [1.0, 0.0])
+
+
+@pytest.mark.usefixtures("forbid_duplicating_graph")
+def test_raising_during_in_place_op_without_views_doesnt_corrupt_tensor():
+    x_orig = mg.arange(1.0, 5.0)
+    x = 2 * x_orig
+    creator = x.creator
+    with pytest.raises(ValueError):
+        x[:2] = mg.ones(3)  # shape mismatch
+
+    assert x.creator is creator
+    assert_array_equal(x, [2.0, 4.0, 6.0, 8.0])
+    x.backward()
+    assert_array_equal(x_orig.grad, np.full(4, 2.0))
+
+
+def test_in_place_op_with_dead_dependents_skips_duplicating_graph(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    x = mg.tensor([1.0, 2.0])
+    _ = x * 2
+    del _
+
+    from mygrad._utils import duplicating_graph
+
+    def raises(*args, **kwargs):
+        raise AssertionError("a duplicating graph was created")
+
+    monkeypatch.setattr(duplicating_graph.DuplicatingGraph, "__init__", raises)
+    x += 1
+    assert_array_equal(x, [2.0, 3.0])
+
+    y = x * 2  # `x` now has a dependent, which is preserved
+    with pytest.raises(AssertionError):
+        x += 1
+    monkeypatch.undo()
+    x += 1
+    assert_array_equal(y, [4.0, 6.0])
@@ -6,6 +6,7 @@ import pytest
 from hypothesis import given, note
 from numpy.testing import assert_array_equal
 
+import mygrad as mg
 import mygrad._utils.graph_tracking as _tracking
 from mygrad import Tensor, amax, no_autodiff
 from mygrad.nnet.activations import soft_sign
@@ -220,3 +221,55 @@ def test_graph_tracking_through_multiple_context_depths(depth: int):
     assert _tracking.TRACK_GRAPH is True
     f(Tensor([1.0]))
     assert _tracking.TRACK_GRAPH is True
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda x: mg.exp(x),
+        lambda x: mg.negative(x, where=x > 0, out=np.zeros_like(x.data)),
+        lambda x: x * 2 + 1,
+        lambda x: mg.add(x, 1, dtype="float32"),
+        lambda x: x @ x.T,
+        lambda x: mg.sum(x, axis=1, keepdims=True),
+        lambda x: mg.mean(x, axis=(0, 1)),
+        lambda x: mg.var(x, ddof=1),
+        lambda x: mg.max(x, axis=0),
+        lambda x: mg.cumsum(x, axis=1),
+        lambda x: mg.nnet.relu(x),
+        lambda x: mg.nnet.softmax(x, axis=0),
+        lambda x: mg.nnet.sigmoid(x),
+        lambda x: mg.nnet.softmax_crossentropy(x, [0, 2]),
+    ],
+)
+def test_forward_kernels_match_tracked_forward_pass(func):
+    x = mg.tensor([[1.0, -2.0, 3.0], [-4.0, 5.0, 0.5]])
+    expected = func(x)
+
+    with no_autodiff:
+        out = func(x)
+
+    assert isinstance(out, Tensor)
+    assert out.creator is None
+    assert out.dtype == expected.dtype
+    assert_array_equal(out, expected)
+
+
+@pytest.mark.usefixtures("seal_graph_tracking")
+def test_forward_kernels_bypass_operations(monkeypatch: pytest.MonkeyPatch):
+    from mygrad.nnet.activations.relu import ReLu
+    from mygrad.operation_base import Operation
+
+    def raises(*args, **kwargs):
+        raise AssertionError("operation was instantiated")
+
+    monkeypatch.setattr(Operation, "__init__", raises)
+
+    x = np.array([-1.0, 2.0])
+    with no_autodiff:
+        out = mg.nnet.relu(mg.sum(x * x) - x)
+    assert_array_equal(out, [6.0, 3.0])
+
+    assert ReLu.forward is not None
+    with pytest.raises(AssertionError):
+        mg.nnet.relu(x)  # tracked -> operation is instantiated
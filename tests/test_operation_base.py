@@ -84,3 +84,133 @@ def test_simple_sequential_func_with_where():
 
     sum_ = Sum()
     assert sum_(mg.ones((3,)), where=np.array([True, False, True])).item() == 2.0
+
+
+class _SavesBuffer(Operation):
+    _saved_buffers = ("cache",)
+
+    def __call__(self, a):
+        self.variables = (a,)
+        self.cache = 2 * a.data
+        return a.data * 1
+
+    def backward_var(self, grad, index, **kwargs):
+        assert self.cache is not None
+        return grad * self.cache
+
+
+class _RecordsReleasedBuffers(Operation):
+    """Records, upon backprop, whether the buffers of the operations
+    downstream of it have already been released"""
+
+    downstream = ()
+
+    def __call__(self, a):
+        self.variables = (a,)
+        self.released = None
+        return a.data * 1
+
+    def backward_var(self, grad, index, **kwargs):
+        self.released = [op.cache is None for op in self.downstream]
+        return grad
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_saved_buffers_are_released_progressively_during_backprop(parallel: bool):
+    x = mg.tensor([1.0, 2.0])
+    y = Tensor._op(_RecordsReleasedBuffers, x)
+    z1 = Tensor._op(_SavesBuffer, y)
+    z2 = Tensor._op(_SavesBuffer, y)
+    out = mg.sum(z1 + z2)
+
+    observer = y.creator
+    observer.downstream = (z1.creator, z2.creator)
+    assert all(op.cache is not None for op in observer.downstream)
+
+    with (mg.parallel_backward if parallel else does_not_raise()):
+        out.backward()
+
+    # the downstream operations released their buffers as soon as they
+    # finished back-propagating, before the upstream operation ran
+    assert observer.released == [True, True]
+    assert_allclose(x.grad, [4.0, 8.0])
+
+
+def test_undeclared_buffers_are_not_released():
+    class Op(_SavesBuffer):
+        _saved_buffers = None
+
+    x = mg.tensor([1.0, 2.0])
+    y = Tensor._op(Op, x)
+    op = y.creator
+    y.backward()
+    assert op.cache is not None
+    assert_allclose(x.grad, [2.0, 4.0])
+
+
+class _SinCos(Operation):
+    """f(a, b) -> (a * sin(b), a * cos(b)); records the gradients that it
+    receives during backprop"""
+
+    def __call__(self, a, b):
+        self.variables = (a, b)
+        self.received = []
+        return a.data * np.sin(b.data), a.data * np.cos(b.data)
+
+    def backward_var(self, grad, index, **kwargs):
+        self.received.append(grad)
+        a, b = (var.data for var in self.variables)
+        d_sin, d_cos = (np.zeros_like(b) if g is None else g for g in grad)
+        if index == 0:
+            return d_sin * np.sin(b) + d_cos * np.cos(b)
+        return a * (d_sin * np.cos(b) - d_cos * np.sin(b))
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_multi_output_op_backprops_once_with_all_grads(parallel: bool):
+    a = mg.tensor([1.0, 2.0])
+    b = mg.tensor([0.5, -1.0])
+    s, c = Tensor._op(_SinCos, a, b)
+    assert s.creator is c.creator
+    assert_allclose(s.data, a.data * np.sin(b.data))
+    assert_allclose(c.data, a.data * np.cos(b.data))
+
+    op = s.creator
+    with (mg.parallel_backward if parallel else does_not_raise()):
+        mg.sum(s * s + 3 * c).backward()
+
+    # backprop to `a` and `b` received both gradients, in a single pass
+    assert len(op.received) == 2
+    assert all(grad is op.received[0] for grad in op.received)
+    assert_allclose(op.received[0][0], 2 * s.data)
+    assert_allclose(op.received[0][1], [3.0, 3.0])
+
+    sin, cos = np.sin(b.data), np.cos(b.data)
+    assert_allclose(a.grad, 2 * a.data * sin ** 2 + 3 * cos)
+    assert_allclose(b.grad, 2 * a.data ** 2 * sin * cos - 3 * a.data * sin)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_multi_output_op_with_unused_output(parallel: bool):
+    a = mg.tensor([1.0, 2.0])
+    b = mg.tensor([0.5, -1.0])
+    s, c = Tensor._op(_SinCos, a, b)
+    op = s.creator
+
+    with (mg.parallel_backward if parallel else does_not_raise()):
+        mg.sum(c).backward()
+
+    # `s` does not participate in the computation of the terminal node
+    ((d_sin, d_cos),) = set((g[0] is None, g[1] is None) for g in op.received)
+    assert d_sin and not d_cos
+    assert_allclose(a.grad, np.cos(b.data))
+    assert_allclose(b.grad, -a.data * np.sin(b.data))
+
+
+def test_multi_output_op_without_graph_tracking():
+    a = mg.tensor([1.0, 2.0])
+    with mg.no_autodiff:
+        s, c = Tensor._op(_SinCos, a, 0.0)
+    assert s.creator is None and c.creator is None
+    assert_allclose(s.data, [0.0, 0.0])
+    assert_allclose(c.data, [1.0, 2.0])
@@ -0,0 +1,202 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+from mygrad.optim import SGD, Adam, FlatParameters, RMSProp
+
+
+def _make_params(seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        mg.tensor(rng.normal(size=(3, 4))),
+        mg.tensor(rng.normal(size=(4,))),
+        mg.tensor(rng.normal()),
+    ]
+
+
+def _loss(params):
+    w, b, c = params
+    return mg.sum(mg.tanh(w @ b + c) ** 2) + mg.sum(w ** 2)
+
+
+def _sgd_reference(params, grads, state, lr, momentum, nesterov, weight_decay):
+    out = []
+    for n, (p, g) in enumerate(zip(params, grads)):
+        g = g + weight_decay * p
+        if momentum:
+            v = state.setdefault(n, np.zeros_like(p))
+            v *= momentum
+            v += g
+            g = g + momentum * v if nesterov else v
+        out.append(p - lr * g)
+    return out
+
+
+def _adam_reference(params, grads, state, lr, betas, eps, t):
+    out = []
+    for n, (p, g) in enumerate(zip(params, grads)):
+        m, v = state.setdefault(n, (np.zeros_like(p), np.zeros_like(p)))
+        m[...] = betas[0] * m + (1 - betas[0]) * g
+        v[...] = betas[1] * v + (1 - betas[1]) * g ** 2
+        m_hat = m / (1 - betas[0] ** t)
+        v_hat = v / (1 - betas[1] ** t)
+        out.append(p - lr * m_hat / (np.sqrt(v_hat) + eps))
+    return out
+
+
+def _rmsprop_reference(params, grads, state, lr, alpha, eps, momentum):
+    out = []
+    for n, (p, g) in enumerate(zip(params, grads)):
+        s, buf = state.setdefault(n, (np.zeros_like(p), np.zeros_like(p)))
+        s[...] = alpha * s + (1 - alpha) * g ** 2
+        step = g / (np.sqrt(s) + eps)
+        if momentum:
+            buf[...] = momentum * buf + step
+            step = buf
+        out.append(p - lr * step)
+    return out
+
+
+def _check_against_reference(optim_type, kwargs, reference, num_steps=5):
+    params = _make_params()
+    expected = [p.data.copy() for p in params]
+    optim = optim_type(params, **kwargs)
+    state = {}
+
+    for t in range(1, num_steps + 1):
+        _loss(params).backward()
+        grads = [p.grad.copy() for p in params]
+        optim.step()
+        expected = reference(expected, grads, state, t)
+        for actual, desired in zip(params, expected):
+            assert_allclose(actual.data, desired, rtol=1e-6, atol=1e-9)
+        # keep the reference in lockstep with the optimizer
+        expected = [p.data.copy() for p in params]
+
+
+@pytest.mark.parametrize(
+    "momentum, nesterov, weight_decay",
+    [(0.0, False, 0.0), (0.9, False, 0.0), (0.9, True, 0.0), (0.5, False, 0.1)],
+)
+def test_sgd_matches_reference(momentum, nesterov, weight_decay):
+    kwargs = dict(lr=0.1, momentum=momentum, nesterov=nesterov)
+    kwargs["weight_decay"] = weight_decay
+
+    _check_against_reference(
+        SGD,
+        kwargs,
+        lambda p, g, s, t: _sgd_reference(
+            p, g, s, 0.1, momentum, nesterov, weight_decay
+        ),
+    )
+
+
+def test_adam_matches_reference():
+    _check_against_reference(
+        Adam,
+        dict(lr=0.01, betas=(0.8, 0.9), eps=1e-6),
+        lambda p, g, s, t: _adam_reference(p, g, s, 0.01, (0.8, 0.9), 1e-6, t),
+    )
+
+
+@pytest.mark.parametrize("momentum", [0.0, 0.9])
+def test_rmsprop_matches_reference(momentum):
+    _check_against_reference(
+        RMSProp,
+        dict(lr=0.01, alpha=0.9, eps=1e-6, momentum=momentum),
+        lambda p, g, s, t: _rmsprop_reference(p, g, s, 0.01, 0.9, 1e-6, momentum),
+    )
+
+
+@pytest.mark.parametrize(
+    "optim_type, kwargs",
+    [(SGD, dict(lr=0.1, momentum=0.9)), (Adam, dict(lr=0.1)), (RMSProp, {})],
+)
+@pytest.mark.parametrize("packed", [False, True])
+def test_params_without_grads_are_untouched(optim_type, kwargs, packed: bool):
+    x = mg.tensor([1.0, 2.0])
+    y = mg.tensor([3.0, 4.0, 5.0])
+    params = FlatParameters([x, y]) if packed else [x, y]
+    optim = optim_type(params, **kwargs)
+
+    mg.sum(x ** 2).backward()
+    assert y.grad is None
+    optim.step()
+
+    assert_allclose(y, [3.0, 4.0, 5.0])
+    assert not np.allclose(x, [1.0, 2.0])
+    for buffer in optim.state.values():
+        assert_allclose(buffer[2:], 0.0)
+
+
+def test_update_is_in_place():
+    x = mg.tensor([1.0, 2.0])
+    data = x.data
+    optim = SGD([x], lr=0.5)
+    mg.sum(x ** 2).backward()
+    optim.step()
+    assert x.data is data
+    assert_allclose(x, [0.0, 0.0])
+
+
+def test_locked_parameter_raises():
+    x = mg.tensor([1.0, 2.0])
+    optim = SGD([x], lr=0.5)
+    mg.sum(x).backward()
+
+    y = mg.sum(2 * x)  # locks x's memory
+    with pytest.raises(ValueError):
+        optim.step()
+    assert_allclose(x, [1.0, 2.0])
+
+    y.backward()
+    optim.step()
+    assert_allclose(x, [0.0, 1.0])
+
+
+def test_half_precision_params_use_float32_state():
+    x = mg.tensor([1.0, 2.0], dtype=np.float16)
+    optim = Adam([x], lr=0.1)
+    assert all(v.dtype == np.float32 for v in optim.state.values())
+    mg.sum(x ** 2).backward()
+    optim.step()
+    assert x.dtype == np.float16
+    assert_allclose(x, [0.9, 1.9], rtol=1e-3)
+
+
+def test_null_grads():
+    x = mg.tensor([1.0, 2.0])
+    optim = SGD([x], lr=0.1)
+    mg.sum(x).backward()
+    optim.null_grads()
+    assert x.grad is None
+
+
+@pytest.mark.parametrize(
+    "params, kwargs, error",
+    [
+        ([], dict(lr=0.1), ValueError),
+        ([np.array(1.0)], dict(lr=0.1), TypeError),
+        ([mg.tensor(1.0, constant=True)], dict(lr=0.1), ValueError),
+        ([mg.tensor(1.0)], dict(lr=-0.1), ValueError),
+        ([mg.tensor(1.0)], dict(lr=0.1, nesterov=True), ValueError),
+    ],
+)
+def test_sgd_validation(params, kwargs, error):
+    with pytest.raises(error):
+        SGD(params, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "optim_type, kwargs",
+    [
+        (Adam, dict(betas=(0.9, 1.0))),
+        (Adam, dict(eps=0.0)),
+        (RMSProp, dict(alpha=1.0)),
+        (RMSProp, dict(momentum=-1.0)),
+    ],
+)
+def test_adaptive_validation(optim_type, kwargs):
+    with pytest.raises(ValueError):
+        optim_type([mg.tensor(1.0)], **kwargs)
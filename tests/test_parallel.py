@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+from mygrad.optim import FlatParameters
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+import mygrad.parallel as parallel  # noqa: E402
+from mygrad.parallel import DataParallel  # noqa: E402
+
+
+def mse(w, b, x, y):
+    return mg.mean((mg.tanh(x @ w) + b - y) ** 2)
+
+
+def summed_mse(w, b, x, y):
+    return mg.sum((mg.tanh(x @ w) + b - y) ** 2)
+
+
+def ignores_b(w, b, x, y):
+    return mg.mean((x @ w - y) ** 2)
+
+
+def fails_on_negative(w, b, x, y):
+    if np.any(y.data < 0):
+        raise ValueError("negative target")
+    return mg.mean((x @ w - y) ** 2)
+
+
+def _make_data(batch_size=13, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(batch_size, 4))
+    y = rng.normal(size=(batch_size, 2))
+    return x, y
+
+
+def _make_params():
+    return [mg.tensor(np.linspace(-1, 1, 8).reshape(4, 2)), mg.tensor([0.5, -0.5])]
+
+
+def _serial(fn, params, x, y):
+    loss = fn(*params, mg.tensor(x, constant=True), mg.tensor(y, constant=True))
+    loss.backward()
+    return loss.item(), [p.grad.copy() for p in params]
+
+
+@pytest.mark.parametrize("n_workers", [1, 3, 16])
+@pytest.mark.parametrize("fn, reduction", [(mse, "mean"), (summed_mse, "sum")])
+def test_matches_serial_computation(n_workers, fn, reduction):
+    x, y = _make_data()
+    expected_loss, expected_grads = _serial(fn, _make_params(), x, y)
+
+    params = _make_params()
+    with DataParallel(fn, params, n_workers=n_workers, reduction=reduction) as dp:
+        for _ in range(2):  # workers are reused across steps
+            loss = dp((x, y))
+            assert_allclose(loss, expected_loss)
+            for p, grad in zip(params, expected_grads):
+                assert_allclose(p.grad, grad)
+
+
+def test_parameters_are_broadcast_each_step():
+    x, y = _make_data()
+    params = _make_params()
+    reference = _make_params()
+
+    with DataParallel(mse, params, n_workers=2) as dp:
+        for _ in range(3):
+            dp((x, y))
+            _serial(mse, reference, x, y)
+            for p, r in zip(params, reference):
+                assert_allclose(p.grad, r.grad)
+                p.data -= 0.1 * p.grad
+                r.data -= 0.1 * r.grad
+
+
+def test_unused_parameter_gets_zero_grad():
+    x, y = _make_data()
+    w, b = params = _make_params()
+    with DataParallel(ignores_b, params, n_workers=2) as dp:
+        dp((x, y))
+    assert_allclose(b.grad, np.zeros_like(b.data))
+
+
+def test_grads_written_into_flat_parameters():
+    x, y = _make_data()
+    group = FlatParameters(_make_params())
+    _, expected_grads = _serial(mse, _make_params(), x, y)
+
+    with DataParallel(mse, group, n_workers=3) as dp:
+        dp((x, y))
+
+    assert_allclose(group.grad, np.concatenate([g.ravel() for g in expected_grads]))
+    for p in group:
+        assert np.shares_memory(p.grad, group.grad)
+
+
+def test_worker_errors_are_raised_and_pool_recovers():
+    x, y = _make_data(batch_size=8)
+    params = _make_params()
+
+    with DataParallel(fails_on_negative, params, n_workers=2) as dp:
+        bad_y = np.abs(y)
+        bad_y[-1] = -1.0  # only the final worker's shard is bad
+        with pytest.raises(RuntimeError, match="negative target"):
+            dp((x, bad_y))
+
+        dp((x, np.abs(y)))
+        assert params[0].grad is not None
+
+
+def test_data_parallel_reuses_pool():
+    x, y = _make_data()
+    params = _make_params()
+    try:
+        loss = mg.data_parallel(mse, (x, y), 2, params=params)
+        pool = parallel._pool
+        expected_loss, expected_grads = _serial(mse, _make_params(), x, y)
+        assert_allclose(loss, expected_loss)
+        for p, grad in zip(params, expected_grads):
+            assert_allclose(p.grad, grad)
+
+        mg.data_parallel(mse, (x, y), 2, params=params)
+        assert parallel._pool is pool
+
+        mg.data_parallel(summed_mse, (x, y), 2, params=params, reduction="sum")
+        assert parallel._pool is not pool
+        assert pool._closed
+    finally:
+        parallel._close_pool()
+
+
+def test_closed_pool_raises():
+    dp = DataParallel(mse, _make_params(), n_workers=1)
+    dp.close()
+    dp.close()  # idempotent
+    with pytest.raises(RuntimeError):
+        dp(_make_data())
+
+
+@pytest.mark.parametrize(
+    "params, kwargs, error",
+    [
+        ([], {}, ValueError),
+        ([mg.tensor(1.0, constant=True)], {}, TypeError),
+        ([mg.tensor(1.0)], dict(n_workers=0), ValueError),
+        ([mg.tensor(1.0)], dict(reduction="max"), ValueError),
+    ],
+)
+def test_validation(params, kwargs, error):
+    with pytest.raises(error):
+        DataParallel(mse, params, **kwargs)
+
+
+def test_tensor_over_foreign_buffer_is_unlocked_after_backward():
+    # shared-memory arrays have a `memoryview` - not an array - as their base
+    buf = bytearray(np.arange(4.0).tobytes())
+    arr = np.frombuffer(buf, dtype=np.float64)
+    assert not isinstance(arr.base, np.ndarray)
+    arr.flags.writeable = True
+
+    x = mg.Tensor(arr, copy=False)
+    (x ** 2).backward()
+    assert_allclose(x.grad, 2 * np.arange(4.0))
+    assert arr.flags.writeable
@@ -0,0 +1,162 @@
+import threading
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+import mygrad._utils.backward_scheduling as _sched
+from mygrad.operation_base import Operation
+from mygrad.optim import FlatParameters
+
+
+class RecordThread(Operation):
+    """Identity operation that records the thread that back-propagates
+    through it"""
+
+    threads = set()
+
+    def __call__(self, a):
+        self.variables = (a,)
+        return np.copy(a.data)
+
+    def backward_var(self, grad, index, **kwargs):
+        RecordThread.threads.add(threading.get_ident())
+        return grad
+
+
+class Fails(Operation):
+    def __call__(self, a):
+        self.variables = (a,)
+        return np.copy(a.data)
+
+    def backward_var(self, grad, index, **kwargs):
+        raise ValueError("backward failed")
+
+
+def ensemble_loss(x, weights):
+    """Independent branches that share an input and merge in a loss"""
+    branches = [mg.tanh(x @ w) @ w.T for w in weights]
+    total = branches[0]
+    for b in branches[1:]:
+        total = total + b
+    return mg.sum(total * x[::-1]) + mg.mean(x ** 2)
+
+
+def _make_inputs(seed=0):
+    rng = np.random.default_rng(seed)
+    x = mg.tensor(rng.normal(size=(32, 16)))
+    weights = [mg.tensor(rng.normal(size=(16, 16))) for _ in range(6)]
+    return x, weights
+
+
+def test_parallel_backward_is_off_by_default():
+    assert _sched.PARALLEL_BACKWARD is False
+    with mg.parallel_backward:
+        assert _sched.PARALLEL_BACKWARD is True
+    assert _sched.PARALLEL_BACKWARD is False
+
+
+def test_parallel_backward_is_thread_local():
+    seen = []
+    with mg.parallel_backward:
+        thread = threading.Thread(target=lambda: seen.append(_sched.PARALLEL_BACKWARD))
+        thread.start()
+        thread.join()
+    assert seen == [False]
+
+
+def test_matches_sequential_backward():
+    x, weights = _make_inputs()
+    ensemble_loss(x, weights).backward()
+    expected = [x.grad] + [w.grad for w in weights]
+
+    x, weights = _make_inputs()
+    with mg.parallel_backward:
+        loss = ensemble_loss(x, weights)
+        loss.backward()
+
+    for t, grad in zip([x] + weights, expected):
+        assert_allclose(t.grad, grad, rtol=1e-10)
+
+    # graph is cleared and memory is unlocked as usual
+    assert loss.creator is None
+    assert x.data.flags.writeable
+
+
+def test_accumulation_is_deterministic():
+    grads = []
+    for _ in range(10):
+        x, weights = _make_inputs()
+        with mg.parallel_backward:
+            ensemble_loss(x, weights).backward()
+        grads.append(x.grad)
+
+    for grad in grads[1:]:
+        assert np.array_equal(grad, grads[0])
+
+
+def test_independent_branches_run_on_multiple_threads():
+    RecordThread.threads.clear()
+    x = mg.tensor(np.ones(3))
+    with mg.parallel_backward:
+        branches = [mg.Tensor._op(RecordThread, x * i) for i in range(8)]
+        loss = branches[0]
+        for b in branches[1:]:
+            loss = loss + b
+        loss.backward()
+
+    assert_allclose(x.grad, np.full(3, sum(range(8))))
+    assert len(RecordThread.threads) > 1
+
+
+@pytest.mark.parametrize("n", [1, 3])
+def test_chains_run_on_calling_thread(n):
+    RecordThread.threads.clear()
+    x = mg.tensor(2.0)
+    y = x
+    for _ in range(n):
+        y = mg.Tensor._op(RecordThread, y) * 2
+    with mg.parallel_backward:
+        y.backward()
+    assert x.grad == 2 ** n
+    assert RecordThread.threads == {threading.get_ident()}
+
+
+def test_views_and_constants():
+    x = mg.arange(6.0).reshape(2, 3)
+    c = mg.tensor([1.0, 2.0, 3.0], constant=True)
+    with mg.parallel_backward:
+        (mg.sum(x[0] * c) + mg.sum(x[1] ** 2) + mg.sum(x * x)).backward()
+    assert_allclose(x.grad, [[1.0, 4.0, 7.0], [12.0, 16.0, 20.0]])
+    assert c.grad is None
+
+
+def test_grads_written_into_grad_buffer():
+    x, weights = _make_inputs()
+    ensemble_loss(x, weights).backward()
+    expected = np.concatenate([w.grad.ravel() for w in weights])
+
+    x, weights = _make_inputs()
+    group = FlatParameters(weights)
+    with mg.parallel_backward:
+        ensemble_loss(x, weights).backward()
+
+    assert all(np.shares_memory(w.grad, group.grad) for w in weights)
+    assert_allclose(group.grad, expected, rtol=1e-10)
+
+
+def test_mixed_precision_accumulation_dtype():
+    x = mg.tensor([1.0, 2.0], dtype=np.float16)
+    with mg.mixed_precision, mg.parallel_backward:
+        (mg.sum(x * 2) + mg.sum(x ** 2)).backward()
+    assert x.grad.dtype == np.float32
+    assert_allclose(x.grad, [4.0, 6.0])
+
+
+def test_errors_are_raised():
+    x = mg.tensor([1.0, 2.0])
+    with mg.parallel_backward:
+        loss = mg.sum(mg.Tensor._op(Fails, x)) + mg.sum(x ** 2) + mg.sum(2 * x)
+        with pytest.raises(ValueError, match="backward failed"):
+            loss.backward()
@@ -0,0 +1,126 @@
+import os
+import tempfile
+
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from numpy.testing import assert_array_equal
+
+import mygrad as mg
+from mygrad.serialization import ALIGNMENT
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return tmp_path / "checkpoint.mg"
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    arrays=st.lists(
+        hnp.arrays(
+            dtype=st.sampled_from(
+                [np.float16, np.float32, np.float64, np.int8, np.int64, np.bool_, ">f4"]
+            ),
+            shape=hnp.array_shapes(min_dims=0, min_side=0, max_side=4),
+        ),
+        max_size=4,
+    ),
+    mmap=st.booleans(),
+)
+def test_round_trip(arrays, mmap):
+    tensors = {f"t{n}": mg.Tensor(arr, constant=True) for n, arr in enumerate(arrays)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoint.mg")
+        mg.save(path, tensors)
+        loaded = mg.load(path, mmap=mmap)
+
+        assert list(loaded) == list(tensors)
+        for name, tensor in tensors.items():
+            assert loaded[name].dtype == tensor.dtype
+            assert_array_equal(loaded[name], tensor)
+            assert loaded[name].constant is True
+        del loaded
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_constant_flags_are_preserved(checkpoint, mmap):
+    mg.save(
+        checkpoint,
+        {
+            "var": mg.tensor([1.0, 2.0]),
+            "const": mg.tensor([1.0, 2.0], constant=True),
+            "int": mg.tensor([1, 2]),
+            "array": np.array([1.0, 2.0]),
+        },
+    )
+    loaded = mg.load(checkpoint, mmap=mmap)
+    assert loaded["var"].constant is False
+    assert loaded["const"].constant is True
+    assert loaded["int"].constant is True
+    assert loaded["array"].constant is False  # inferred from dtype
+
+
+def test_only_data_is_saved(checkpoint):
+    x = mg.tensor([1.0, 2.0, 3.0])
+    y = (2 * x)[::2]  # non-contiguous view with a graph
+    mg.save(checkpoint, {"y": y})
+
+    (loaded,) = mg.load(checkpoint).values()
+    assert_array_equal(loaded, [2.0, 6.0])
+    assert loaded.creator is None and loaded.base is None
+    assert x.data.flags.writeable is False  # `y`'s graph is unaffected
+
+
+def test_data_blocks_are_aligned(checkpoint):
+    mg.save(checkpoint, {"a": np.arange(3, dtype=np.int8), "b": np.ones(5)})
+    loaded = mg.load(checkpoint, mmap=True)
+    for tensor in loaded.values():
+        assert tensor.data.ctypes.data % ALIGNMENT == 0
+    assert os.path.getsize(checkpoint) % ALIGNMENT == 0
+
+
+def test_mmap_load_is_zero_copy_and_copy_on_write(checkpoint):
+    mg.save(checkpoint, {"w": np.arange(4.0), "b": np.zeros(2)})
+    w1 = mg.load(checkpoint, mmap=True)["w"]
+    assert isinstance(w1.data.base, np.memmap)
+
+    # loaded tensors are ordinary, writeable tensors
+    (w1 ** 2).sum().backward()
+    assert_array_equal(w1.grad, 2 * np.arange(4.0))
+    w1.data *= 10
+    assert_array_equal(w1, 10 * np.arange(4.0))
+
+    # ...but modifying them does not modify the file
+    assert_array_equal(mg.load(checkpoint)["w"], np.arange(4.0))
+    assert_array_equal(mg.load(checkpoint, mmap=True)["w"], np.arange(4.0))
+
+
+def test_empty_checkpoint(checkpoint):
+    mg.save(checkpoint, {})
+    assert mg.load(checkpoint) == {}
+    assert mg.load(checkpoint, mmap=True) == {}
+
+
+def test_save_validation(checkpoint):
+    with pytest.raises(TypeError):
+        mg.save(checkpoint, {0: mg.tensor(1.0)})
+
+    with pytest.raises(TypeError):
+        mg.save(checkpoint, {"x": np.array([None])})
+
+
+def test_load_validation(checkpoint):
+    with open(checkpoint, "wb") as f:
+        np.save(f, np.arange(3))
+    with pytest.raises(ValueError, match="not a file written by"):
+        mg.load(checkpoint)
+
+    mg.save(checkpoint, {"x": np.arange(100.0)})
+    with open(checkpoint, "r+b") as f:
+        f.truncate(os.path.getsize(checkpoint) - 100 * 8)
+    with pytest.raises(ValueError, match="truncated"):
+        mg.load(checkpoint)
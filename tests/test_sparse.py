@@ -0,0 +1,176 @@
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+
+sp = pytest.importorskip("scipy.sparse")
+
+from mygrad.sparse import gather_rows, matmul, sum as sparse_sum  # noqa: E402
+
+formats = st.sampled_from(["csr", "csc", "coo"])
+
+
+@st.composite
+def sparse_matrices(draw, shape=hnp.array_shapes(min_dims=2, max_dims=2, min_side=0)):
+    shape = draw(shape)
+    dense = draw(
+        hnp.arrays(
+            dtype=float,
+            shape=shape,
+            elements=st.sampled_from([0.0, 0.0, 0.0, -1.5, 1.0, 2.0]),
+        )
+    )
+    return sp.coo_matrix(dense).asformat(draw(formats))
+
+
+def dense_grad_at_pattern(a, dense_grad: np.ndarray) -> np.ndarray:
+    coo = a.tocoo()
+    return dense_grad[coo.row, coo.col]
+
+
+@given(a=sparse_matrices(), data=st.data(), vector=st.booleans())
+def test_matmul_against_dense(a, data: st.DataObject, vector: bool):
+    shape = (a.shape[1],) if vector else (a.shape[1], data.draw(st.integers(0, 3)))
+    x_arr = data.draw(hnp.arrays(dtype=float, shape=shape, elements=st.floats(-5, 5)))
+
+    x = mg.tensor(x_arr)
+    values = mg.tensor(a.tocoo().data)
+    out = matmul(a, x, values=values)
+
+    dense = mg.tensor(a.toarray())
+    dense_x = mg.tensor(x_arr)
+    expected = mg.matmul(dense, dense_x)
+    assert_allclose(out.data, expected.data, atol=1e-10)
+
+    grad = np.arange(out.size, dtype=float).reshape(out.shape)
+    out.backward(grad)
+    expected.backward(grad)
+    assert_allclose(x.grad, dense_x.grad, atol=1e-10)
+    assert_allclose(values.grad, dense_grad_at_pattern(a, dense.grad), atol=1e-10)
+
+
+def test_matmul_with_duplicate_entries():
+    a = sp.coo_matrix(([1.0, 2.0, 3.0], ([0, 0, 1], [1, 1, 0])), shape=(2, 2))
+    x = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+    values = mg.tensor([1.0, 2.0, 3.0])
+    out = matmul(a, x, values=values)
+    assert_allclose(out.data, a.toarray() @ x.data)
+
+    out.backward()
+    # duplicate entries are summed, so they receive the same gradient
+    assert_allclose(values.grad, [7.0, 7.0, 3.0])
+
+
+def test_matmul_without_values_treats_sparse_matrix_as_constant():
+    a = sp.csr_matrix(np.array([[0.0, 2.0], [1.0, 0.0]]))
+    x = mg.tensor([1.0, 3.0])
+    out = matmul(a, x)
+    assert out.creator.variables[0].constant
+    assert_allclose(out.data, [6.0, 1.0])
+    out.backward()
+    assert_allclose(x.grad, [1.0, 2.0])
+
+
+def test_matmul_supports_integer_pattern():
+    adjacency = sp.csr_matrix(np.array([[0, 1], [1, 1]], dtype=np.int8))
+    x = mg.tensor([[1.0], [2.0]])
+    out = matmul(adjacency, x)
+    assert_allclose(out.data, [[2.0], [3.0]])
+
+
+def test_matmul_releases_sparse_matrix_after_backprop():
+    a = sp.csr_matrix(np.eye(3))
+    out = matmul(a, mg.tensor(np.ones((3, 2))))
+    op = out.creator
+    assert op._mat is not None
+    out.backward()
+    assert op._mat is None
+
+
+@pytest.mark.parametrize(
+    "values", [[1.0], np.ones((3, 1)), mg.ones(4)], ids=["short", "2D", "long"]
+)
+def test_mismatched_values_raise(values):
+    a = sp.csr_matrix(np.eye(3))
+    with pytest.raises(ValueError):
+        matmul(a, np.ones(3), values=values)
+
+
+@pytest.mark.parametrize("func", [matmul, sparse_sum])
+def test_dense_matrix_raises(func):
+    with pytest.raises(TypeError):
+        func(np.eye(3), np.ones(3))
+
+
+@given(a=sparse_matrices(), axis=st.sampled_from([None, 0, 1, -1, -2]))
+def test_sum_against_dense(a, axis):
+    values = mg.tensor(a.tocoo().data)
+    out = sparse_sum(a, axis=axis, values=values)
+
+    dense = mg.tensor(a.toarray())
+    expected = mg.sum(dense, axis=axis)
+    assert out.shape == expected.shape
+    assert_allclose(out.data, expected.data, atol=1e-10)
+
+    grad = np.arange(1, out.size + 1, dtype=float).reshape(out.shape)
+    out.backward(grad)
+    expected.backward(grad)
+    assert_allclose(values.grad, dense_grad_at_pattern(a, dense.grad), atol=1e-10)
+
+
+def test_sum_of_integer_matrix():
+    a = sp.csr_matrix(np.array([[0, 1], [2, 3]], dtype=np.int32))
+    out = sparse_sum(a, axis=0)
+    assert out.constant
+    assert out.dtype == np.sum(a.data).dtype
+    assert_allclose(out.data, [2, 4])
+
+
+def test_sum_bad_axis_raises():
+    with pytest.raises(ValueError):
+        sparse_sum(sp.csr_matrix(np.eye(2)), axis=2)
+
+
+@given(a=sparse_matrices(), data=st.data())
+def test_gather_rows_against_dense(a, data: st.DataObject):
+    num_rows = a.shape[0]
+    rows = data.draw(
+        st.lists(st.integers(-num_rows, num_rows - 1), max_size=6)
+        if num_rows
+        else st.just([])
+    )
+    values = mg.tensor(a.tocoo().data)
+    gathered, gathered_values = gather_rows(a, rows, values=values)
+
+    assert gathered.shape == (len(rows), a.shape[1])
+    assert_allclose(gathered.toarray(), a.toarray()[np.array(rows, dtype=int)])
+    assert_allclose(gathered_values.data, gathered.data)
+
+    # the gathered values are differentiable w.r.t. the original values
+    x = np.arange(1, a.shape[1] + 1, dtype=float)
+    out = matmul(gathered, x, values=gathered_values)
+    out.backward()
+
+    dense = mg.tensor(a.toarray())
+    dense_out = mg.matmul(dense[np.array(rows, dtype=int)], x)
+    dense_out.backward()
+    if values.size:
+        assert_allclose(values.grad, dense_grad_at_pattern(a, dense.grad))
+
+
+def test_gather_rows_without_values_are_constant():
+    a = sp.csr_matrix(np.array([[0.0, 1.0], [2.0, 3.0]]))
+    gathered, gathered_values = gather_rows(a, [1])
+    assert gathered_values.constant
+    assert_allclose(gathered_values.data, [2.0, 3.0])
+
+
+@pytest.mark.parametrize("rows", [[3], [-4], [[0]], [0.5]])
+def test_gather_rows_bad_indices_raise(rows):
+    a = sp.csr_matrix(np.eye(3))
+    with pytest.raises((IndexError, TypeError)):
+        gather_rows(a, rows)
@@ -0,0 +1,227 @@
+import gc
+from typing import List, Union
+
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+from numpy.testing import assert_array_equal
+
+import mygrad as mg
+import mygrad._utils.lock_management as mem
+from tests.custom_strategies import tensors
+from tests.utils.errors import does_not_raise
+
+
+@st.composite
+def split_args(draw, x: mg.Tensor):
+    """draws a valid axis and `indices_or_sections` for splitting `x`"""
+    axis = draw(st.integers(-x.ndim, x.ndim - 1))
+    size = x.shape[axis]
+    if draw(st.booleans()):
+        divisors = [n for n in range(1, size + 1) if size % n == 0] or [1]
+        return draw(st.sampled_from(divisors)), axis
+    return sorted(draw(st.lists(st.integers(0, size), max_size=4))), axis
+
+
+@given(
+    x=tensors(
+        shape=hnp.array_shapes(min_dims=1, max_dims=3, min_side=0),
+        elements=st.floats(-10, 10),
+        constant=False,
+    ),
+    data=st.data(),
+    constant=st.booleans(),
+)
+def test_split(x: mg.Tensor, data: st.DataObject, constant: bool):
+    indices_or_sections, axis = data.draw(split_args(x))
+    out = mg.split(x, indices_or_sections, axis=axis, constant=constant)
+    expected = np.split(x.data, indices_or_sections, axis=axis)
+
+    assert isinstance(out, list)
+    assert len(out) == len(expected)
+    assert len(set(id(t.creator) for t in out)) == 1
+
+    for t, arr in zip(out, expected):
+        assert isinstance(t, mg.Tensor)
+        assert t.constant is constant
+        assert t.base is None
+        assert not np.shares_memory(t.data, x.data)
+        assert_array_equal(t.data, arr)
+
+    if constant or not out:
+        return
+
+    grads = [np.full(t.shape, float(n)) for n, t in enumerate(out)]
+    mg.sum(mg.concatenate([t * g for t, g in zip(out, grads)], axis=axis)).backward()
+    assert_array_equal(x.grad, np.concatenate(grads, axis=axis))
+
+
+@given(
+    x=tensors(
+        shape=hnp.array_shapes(min_dims=1, max_dims=3, min_side=0),
+        elements=st.floats(-10, 10),
+        constant=False,
+    ),
+    data=st.data(),
+    constant=st.booleans(),
+)
+def test_unstack(x: mg.Tensor, data: st.DataObject, constant: bool):
+    axis = data.draw(st.integers(-x.ndim, x.ndim - 1), label="axis")
+    out = mg.unstack(x, axis=axis, constant=constant)
+
+    assert isinstance(out, tuple)
+    assert len(out) == x.shape[axis]
+    assert len(set(id(t.creator) for t in out)) <= 1
+
+    for n, t in enumerate(out):
+        assert t.constant is constant
+        assert t.base is None
+        assert not np.shares_memory(t.data, x.data)
+        assert_array_equal(t.data, np.take(x.data, n, axis=axis))
+
+    if constant or not out:
+        return
+
+    mg.sum(mg.stack([n * t for n, t in enumerate(out)], axis=axis)).backward()
+    expected = np.broadcast_to(
+        np.arange(len(out), dtype=float).reshape(
+            [-1 if n == axis % x.ndim else 1 for n in range(x.ndim)]
+        ),
+        x.shape,
+    )
+    assert_array_equal(x.grad, expected)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize(
+    "func",
+    [lambda x: mg.split(x, 3), mg.unstack],
+    ids=["split", "unstack"],
+)
+def test_unused_outputs_get_zero_grad(func, parallel: bool):
+    x = mg.tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    a, b, c = func(x)
+    with (mg.parallel_backward if parallel else does_not_raise()):
+        mg.sum(a * c).backward()
+    assert_array_equal(x.grad, [[5.0, 6.0], [0.0, 0.0], [1.0, 2.0]])
+    assert b.grad is None
+
+
+def test_unstack_is_a_single_operation():
+    x = mg.tensor(np.arange(24.0).reshape(4, 2, 3))
+    rows = mg.unstack(x)
+
+    assert len(rows) == 4
+    assert len(set(id(row.creator) for row in rows)) == 1
+    assert_array_equal(np.stack([row.data for row in rows]), x.data)
+
+    h = mg.zeros((2, 3))
+    for row in rows:
+        h = h + row ** 2
+    h.backward()
+    assert_array_equal(x.grad, 2 * x.data)
+
+
+def test_iteration_produces_views():
+    x = mg.tensor(np.arange(6.0).reshape(3, 2))
+    for n, row in enumerate(x):
+        assert row.base is x
+        assert np.shares_memory(row, x)
+        assert_array_equal(row, x.data[n])
+
+
+@pytest.mark.parametrize(
+    "func", [lambda x: mg.split(x, 3), mg.unstack], ids=["split", "unstack"]
+)
+def test_output_locks_are_released_with_op(func):
+    x = mg.arange(6.0).reshape(3, 2)
+    # the outputs are released one-by-one, before their op is
+    out = sum(func(x))
+    out.backward()
+    del out
+    gc.collect()
+
+    assert x.data.flags.writeable
+    assert not mem._array_counter
+    assert not mem._array_tracker
+
+
+@pytest.mark.parametrize(
+    "func", [lambda x: mg.split(x, [1]), mg.unstack], ids=["split", "unstack"]
+)
+def test_output_lock_is_released_when_its_graph_is_cleared(func):
+    x = mg.arange(4.0)
+    a, b, *_ = func(x)
+    assert not a.data.flags.writeable
+
+    a.sum().backward()
+    assert a.data.flags.writeable
+    # `b` remains in the computational graph
+    assert not b.data.flags.writeable
+
+    del a, b, _
+    gc.collect()
+
+    assert x.data.flags.writeable
+    assert not mem._array_counter
+    assert not mem._array_tracker
+
+
+@pytest.mark.parametrize("constant", [False, True])
+def test_0d_outputs_are_locked(constant: bool):
+    # numpy produces scalars, rather than 0D arrays, when unstacking a 1D array
+    x = mg.arange(3.0, constant=constant)
+    outs = mg.unstack(x)
+    assert not any(out.data.flags.writeable for out in outs)
+
+    out = mg.reshape(mg.add(*outs[:2]), (1,))
+    del outs, out
+    gc.collect()
+
+    assert x.data.flags.writeable
+    assert not mem._array_counter
+    assert not mem._array_tracker
+
+
+def test_split_override():
+    x = mg.arange(6.0)
+    out = np.split(x, [1, 4])
+    assert all(isinstance(t, mg.Tensor) for t in out)
+    assert len(set(id(t.creator) for t in out)) == 1
+    out[1].backward()
+    assert_array_equal(x.grad, [0.0, 1.0, 1.0, 1.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize("x", [mg.tensor(1.0), np.ones((3,))])
+def test_split_raises_like_numpy(x: Union[mg.Tensor, np.ndarray]):
+    with pytest.raises(Exception) as mygrad_err:
+        mg.split(x, 2)
+
+    with pytest.raises(type(mygrad_err.value)):
+        np.split(np.asarray(x), 2)
+
+
+def test_unstack_0d_raises():
+    with pytest.raises(ValueError):
+        mg.unstack(mg.tensor(1.0))
+
+
+def test_outputs_participate_in_inplace_ops():
+    x = mg.tensor([1.0, 2.0, 3.0, 4.0])
+    a, b = mg.split(x, 2)
+    c = a * b
+    a[0] = 10.0  # `c` depends on the original value of `a`
+    mg.sum(c + a * b).backward()
+
+    assert_array_equal(a, [10.0, 2.0])
+    assert_array_equal(x.grad, [3.0, 8.0, 11.0, 4.0])
+
+
+def test_split_without_graph_tracking():
+    x = mg.arange(4.0)
+    with mg.no_autodiff:
+        out: List[mg.Tensor] = mg.split(x, 2)
+    assert all(t.creator is None for t in out)
+    assert_array_equal(out[1], [2.0, 3.0])
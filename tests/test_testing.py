@@ -0,0 +1,111 @@
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given, settings
+
+import mygrad as mg
+from mygrad.testing import gradcheck
+
+bad_square = mg.custom_op(lambda x: x ** 2, backward=lambda grad, out, x: grad * x)
+
+
+def _counted(func):
+    def wrapper(*args, **kwargs):
+        wrapper.num_calls += 1
+        return func(*args, **kwargs)
+
+    wrapper.num_calls = 0
+    return wrapper
+
+
+@settings(deadline=None, max_examples=20)
+@given(
+    shapes=hnp.mutually_broadcastable_shapes(num_shapes=2, max_dims=3),
+    data=st.data(),
+    func=st.sampled_from([mg.multiply, mg.add, mg.arctan2]),
+    elementwise=st.booleans(),
+    vectorized=st.booleans(),
+)
+def test_gradcheck_passes_for_correct_gradients(
+    shapes, data: st.DataObject, func, elementwise: bool, vectorized: bool
+):
+    x, y = (
+        data.draw(
+            hnp.arrays(dtype=float, shape=shape, elements=st.floats(0.5, 10)),
+            label=name,
+        )
+        for shape, name in zip(shapes.input_shapes, "xy")
+    )
+    assert gradcheck(func, x, y, elementwise=elementwise, vectorized=vectorized)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_gradcheck_matmul(vectorized: bool):
+    x = np.random.rand(4, 3)
+    w = np.random.rand(3, 2)
+    assert gradcheck(mg.matmul, x, w, elementwise=True, vectorized=vectorized)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(), dict(num_directions=0, elementwise=True)],
+    ids=["directional", "elementwise"],
+)
+def test_gradcheck_catches_incorrect_gradients(kwargs: dict, vectorized: bool):
+    with pytest.raises(AssertionError):
+        gradcheck(bad_square, np.random.rand(5) + 1, vectorized=vectorized, **kwargs)
+
+
+def test_vectorized_check_uses_few_forward_passes():
+    x = np.random.rand(10, 10)
+    y = np.random.rand(10)
+
+    func = _counted(mg.multiply)
+    assert gradcheck(func, x, y, num_directions=10, elementwise=True)
+    # 1 analytical pass, 2 per direction, 2 per element
+    assert func.num_calls == 1 + 20 + 2 * (x.size + y.size)
+
+    func = _counted(mg.multiply)
+    assert gradcheck(func, x, y, num_directions=10, elementwise=True, vectorized=True)
+    # 1 analytical pass, 1 for the directions, 1 per input for the elements
+    assert func.num_calls == 1 + 1 + 2
+
+
+def test_batch_size():
+    func = _counted(mg.multiply)
+    x = np.random.rand(10)
+    assert gradcheck(
+        func, x, 2, num_directions=0, elementwise=True, vectorized=True, batch_size=3
+    )
+    assert func.num_calls == 1 + 4
+
+
+def test_non_float_inputs_are_not_checked():
+    x = np.random.rand(5, 3)
+    assert gradcheck(lambda x, n: x[n], x, np.array([0, 2, 2]), elementwise=True)
+
+
+def test_no_float_inputs_raises():
+    with pytest.raises(ValueError):
+        gradcheck(mg.add, np.arange(3), np.arange(3))
+
+
+def test_non_tensor_output_raises():
+    with pytest.raises(TypeError):
+        gradcheck(lambda x: np.sum(x.data), np.random.rand(3))
+
+
+def test_unbatchable_func_raises_when_vectorized():
+    # `sum` reduces the batch-axis along with all of the others
+    with pytest.raises(ValueError):
+        gradcheck(mg.sum, np.random.rand(3), vectorized=True)
+    assert gradcheck(mg.sum, np.random.rand(3))
+
+
+def test_explicit_grad():
+    x = np.random.rand(3)
+    assert gradcheck(mg.exp, x, grad=1.0, elementwise=True)
+    with pytest.raises(AssertionError):
+        gradcheck(bad_square, x + 1, grad=np.ones(3))
@@ -0,0 +1,128 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import mygrad as mg
+import mygrad._utils.graph_tracking as _tracking
+import mygrad._utils.lock_management as mem
+import mygrad._utils.precision as _precision
+
+
+def _run_in_thread(func):
+    """Runs `func` in a new thread and returns its output, re-raising any
+    exception in the calling thread"""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func).result()
+
+
+@pytest.mark.parametrize(
+    "context, module, attr",
+    [
+        (mg.no_autodiff, _tracking, "TRACK_GRAPH"),
+        (mg.mem_guard_off, mem, "MEM_GUARD"),
+        (mg.mixed_precision, _precision, "FP32_ACCUMULATION"),
+    ],
+)
+def test_context_state_is_local_to_thread(context, module, attr):
+    initial = getattr(module, attr)
+    entered = threading.Event()
+    checked = threading.Event()
+    states = []
+
+    def enter_context():
+        with context:
+            states.append(getattr(module, attr))
+            entered.set()
+            checked.wait(timeout=10)
+        states.append(getattr(module, attr))
+
+    thread = threading.Thread(target=enter_context)
+    thread.start()
+    assert entered.wait(timeout=10)
+
+    # the other thread's context does not leak into this thread
+    assert getattr(module, attr) is initial
+    checked.set()
+    thread.join()
+
+    assert states == [not initial, initial]
+    assert getattr(module, attr) is initial
+
+
+def test_graph_built_while_other_thread_is_in_no_autodiff():
+    entered = threading.Event()
+    done = threading.Event()
+
+    def inference():
+        with mg.no_autodiff:
+            entered.set()
+            done.wait(timeout=10)
+            return (2 * mg.tensor([1.0, 2.0])).creator
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(inference)
+        assert entered.wait(timeout=10)
+
+        x = mg.tensor([1.0, 2.0])
+        y = mg.sum(x ** 2)
+        assert y.creator is not None
+        assert not x.data.flags.writeable
+        y.backward()
+        assert_allclose(x.grad, [2.0, 4.0])
+
+        done.set()
+        assert future.result() is None
+
+
+def test_turn_memory_guarding_off_sets_default_for_all_threads():
+    try:
+        mg.turn_memory_guarding_off()
+        assert _run_in_thread(mg.mem_guard_active) is False
+
+        with mg.mem_guard_on:
+            assert mg.mem_guard_active() is True
+            assert _run_in_thread(mg.mem_guard_active) is False
+    finally:
+        mg.turn_memory_guarding_on()
+
+    assert _run_in_thread(mg.mem_guard_active) is True
+
+
+def test_concurrent_graphs_over_shared_memory_release_their_locks():
+    shared = np.arange(100.0)
+
+    def train(seed: int):
+        rng = np.random.default_rng(seed)
+        for _ in range(50):
+            w = mg.tensor(rng.normal(size=100))
+            x = mg.Tensor(shared, constant=True, copy=False)
+            loss = mg.sum(mg.tanh(w * x) ** 2) + mg.sum(x[::2] * w[1::2])
+            loss.backward()
+            assert w.grad is not None
+        return True
+
+    def infer(_):
+        with mg.no_autodiff:
+            for _ in range(50):
+                out = mg.sum(mg.tanh(mg.Tensor(shared, copy=False)))
+                assert out.creator is None
+        return True
+
+    # force frequent thread switches to expose races
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(train, range(8)))
+            results += list(executor.map(infer, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert all(results)
+    assert shared.flags.writeable
+    assert not mem._array_counter
+    assert not mem._array_tracker
@@ -148,3 +148,14 @@ def test_hybrid_broadcasting(grad):
     reduced = reduce_broadcast(grad=grad, var_shape=var_shape)
     answer = grad.sum(axis=0).sum(axis=-2, keepdims=True)
     assert_allclose(actual=reduced, desired=answer)
+
+
+def test_reduce_broadcast_memoizes_reduction_plans():
+    from mygrad._utils import _reduction_plan
+
+    grad = np.ones((4, 3, 2))
+    reduce_broadcast(grad, (3, 1))
+    hits = _reduction_plan.cache_info().hits
+    reduced = reduce_broadcast(2 * grad, (3, 1))
+    assert _reduction_plan.cache_info().hits == hits + 1
+    assert_allclose(reduced, np.full((3, 1), 16.0))
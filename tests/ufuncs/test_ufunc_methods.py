@@ -0,0 +1,354 @@
+import hypothesis.extra.numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from numpy.testing import assert_allclose, assert_array_equal
+
+import mygrad as mg
+from mygrad.testing import gradcheck
+
+reorderable_ufuncs = [mg.add, mg.multiply, mg.maximum, mg.minimum]
+other_ufuncs = [mg.subtract, mg.true_divide, mg.logaddexp]
+binary_ufuncs = reorderable_ufuncs + other_ufuncs
+
+
+def _numpy_reduce(
+    ufunc, x: np.ndarray, axis: int, keepdims: bool = False, **kwargs
+) -> np.ndarray:
+    # numpy reorders some non-reorderable reductions (e.g. `power`) along a
+    # contiguous axis; reducing along the leading axis of a copy is a left-fold
+    x = np.ascontiguousarray(np.moveaxis(x, axis, 0))
+    out = getattr(np, ufunc.__name__).reduce(x, axis=0, **kwargs)
+    return np.expand_dims(out, axis) if keepdims else out
+
+
+# `maximum` and `minimum` are not differentiable at ties; elements are drawn
+# such that they are separated by much more than the step size of `gradcheck`
+positive_arrays = hnp.arrays(
+    dtype=float,
+    shape=hnp.array_shapes(min_dims=1, max_dims=3, max_side=4),
+    elements=st.integers(50, 200).map(lambda n: n / 100),
+    unique=True,
+)
+
+
+@settings(deadline=None, max_examples=20)
+@pytest.mark.parametrize("ufunc", binary_ufuncs)
+@given(x=positive_arrays, data=st.data(), keepdims=st.booleans())
+def test_reduce(ufunc, x: np.ndarray, data: st.DataObject, keepdims: bool):
+    axis = data.draw(st.integers(-x.ndim, x.ndim - 1), label="axis")
+    out = ufunc.reduce(x, axis=axis, keepdims=keepdims)
+    assert isinstance(out, mg.Tensor)
+    assert_allclose(out.data, _numpy_reduce(ufunc, x, axis, keepdims=keepdims))
+    assert gradcheck(ufunc.reduce, x, kwargs=dict(axis=axis, keepdims=keepdims))
+
+
+@pytest.mark.parametrize("ufunc", reorderable_ufuncs)
+@pytest.mark.parametrize("axis", [None, (0, 2), ()])
+def test_reduce_multiple_axes(ufunc, axis):
+    x = np.random.rand(2, 3, 4) + 0.5
+    out = ufunc.reduce(x, axis=axis)
+    assert_allclose(out.data, getattr(np, ufunc.__name__).reduce(x, axis=axis))
+    assert gradcheck(ufunc.reduce, x, kwargs=dict(axis=axis), elementwise=True)
+
+
+@pytest.mark.parametrize("ufunc", [mg.logaddexp, mg.logaddexp2])
+@pytest.mark.parametrize("axis", [None, (0, 2), (2, 0)])
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, dict(keepdims=True), dict(where=[[True], [False], [True]], initial=0.75)],
+)
+def test_reduce_multiple_axes_by_fold(ufunc, axis, kwargs):
+    # these are reorderable, but are reduced element-by-element
+    x = np.random.rand(2, 3, 2) + 0.5
+    out = ufunc.reduce(x, axis=axis, **kwargs)
+    expected = getattr(np, ufunc.__name__).reduce(x, axis=axis, **kwargs)
+    assert out.shape == expected.shape
+    assert_allclose(out.data, expected)
+    assert gradcheck(
+        ufunc.reduce, x, kwargs=dict(axis=axis, **kwargs), elementwise=True
+    )
+
+
+@pytest.mark.parametrize("ufunc", [mg.subtract, mg.true_divide])
+@pytest.mark.parametrize("axis", [None, (0, 1)])
+def test_non_reorderable_reduce_requires_single_axis(ufunc, axis):
+    with pytest.raises(ValueError):
+        getattr(np, ufunc.__name__).reduce(np.ones((2, 3)), axis=axis)
+
+    with pytest.raises(ValueError):
+        ufunc.reduce(np.ones((2, 3)), axis=axis)
+
+
+@pytest.mark.parametrize("ufunc", [mg.subtract, mg.true_divide])
+def test_non_reorderable_reduce_over_all_axes_of_1d_input(ufunc):
+    x = np.random.rand(4) + 0.5
+    out = ufunc.reduce(x, axis=None)
+    assert_allclose(out.data, getattr(np, ufunc.__name__).reduce(x, axis=None))
+
+
+@pytest.mark.parametrize("ufunc", binary_ufuncs)
+def test_reduce_with_where_and_initial(ufunc):
+    x = np.random.rand(3, 4) + 0.5
+    where = np.array([True, False, True, True])
+    kwargs = dict(axis=0, initial=0.75, where=where)
+
+    out = ufunc.reduce(x, **kwargs)
+    assert_allclose(out.data, _numpy_reduce(ufunc, x, **kwargs))
+    assert gradcheck(ufunc.reduce, x, kwargs=kwargs, elementwise=True)
+
+
+def test_reduce_with_where_requires_initial():
+    with pytest.raises(ValueError):
+        mg.maximum.reduce(np.ones(3), where=np.array([True, False, True]))
+
+
+@pytest.mark.parametrize("ufunc", [mg.maximum, mg.minimum])
+@pytest.mark.parametrize("dtype", [None, np.float32])
+def test_max_min_reduce_with_mixed_precision(ufunc, dtype):
+    x = mg.tensor([[1.0, 4.0], [3.0, 2.0]], dtype=np.float16)
+    with mg.mixed_precision:
+        out = ufunc.reduce(x, axis=0, dtype=dtype)
+        out.backward()
+
+    expected = getattr(np, ufunc.__name__).reduce(x.data, axis=0, dtype=dtype)
+    assert out.dtype == expected.dtype
+    assert_array_equal(out, expected)
+    assert_array_equal(x.grad, (x.data == expected).astype(float))
+
+
+@pytest.mark.parametrize("ufunc", [mg.add, mg.multiply])
+def test_reduce_over_empty_axis(ufunc):
+    out = ufunc.reduce(np.ones((0, 3)), axis=0)
+    assert_array_equal(out.data, getattr(np, ufunc.__name__).reduce(np.ones((0, 3))))
+
+
+@settings(deadline=None, max_examples=20)
+@pytest.mark.parametrize("ufunc", binary_ufuncs)
+@given(x=positive_arrays, data=st.data())
+def test_accumulate(ufunc, x: np.ndarray, data: st.DataObject):
+    axis = data.draw(st.integers(-x.ndim, x.ndim - 1), label="axis")
+    out = ufunc.accumulate(x, axis=axis)
+    assert_allclose(out.data, getattr(np, ufunc.__name__).accumulate(x, axis=axis))
+    assert gradcheck(ufunc.accumulate, x, kwargs=dict(axis=axis))
+
+
+@pytest.mark.parametrize("ufunc", [mg.maximum, mg.minimum])
+def test_max_min_accumulate_backprops_to_first_occurrence(ufunc):
+    x = mg.tensor([2.0, 2.0, 1.0, 3.0] if ufunc is mg.maximum else [1.0, 1.0, 2.0, 0.0])
+    ufunc.accumulate(x).backward()
+    assert_array_equal(x.grad, [3.0, 0.0, 0.0, 1.0])
+
+
+@settings(deadline=None, max_examples=20)
+@pytest.mark.parametrize("ufunc", binary_ufuncs)
+@given(
+    a=hnp.arrays(
+        dtype=float,
+        shape=hnp.array_shapes(min_dims=0, max_dims=2),
+        elements=st.floats(0.5, 1.0),
+    ),
+    b=hnp.arrays(
+        dtype=float,
+        shape=hnp.array_shapes(min_dims=0, max_dims=2),
+        elements=st.floats(1.5, 2.0),
+    ),
+)
+def test_outer(ufunc, a: np.ndarray, b: np.ndarray):
+    out = ufunc.outer(a, b)
+    assert out.shape == a.shape + b.shape
+    assert_allclose(out.data, getattr(np, ufunc.__name__).outer(a, b))
+    assert gradcheck(ufunc.outer, a, b, elementwise=True)
+
+
+def test_multiply_outer_does_not_materialize_broadcast_inputs():
+    a = mg.tensor(np.random.rand(3))
+    b = mg.tensor(np.random.rand(4))
+    mg.multiply.outer(a, b).backward(np.ones((3, 4)))
+    assert_allclose(a.grad, np.full(3, b.data.sum()))
+    assert_allclose(b.grad, np.full(4, a.data.sum()))
+
+
+@pytest.mark.parametrize("ufunc", binary_ufuncs)
+@pytest.mark.parametrize(
+    "indices", [[0, 2, 5], [0, 3, 1, 5], [4, 4, 2], [5], [1, 0, 0, 3]]
+)
+@pytest.mark.parametrize("axis", [0, 1, -1])
+def test_reduceat(ufunc, indices, axis):
+    x = np.random.rand(6, 6) + 0.5
+    if ufunc in reorderable_ufuncs:
+        expected = getattr(np, ufunc.__name__).reduceat(x, indices, axis=axis)
+    else:
+        # numpy's `reduceat` is not a left-fold for all non-reorderable ufuncs
+        # (e.g. `arctan2`); reduce each segment instead
+        stops = [
+            stop if start < stop else start + 1
+            for start, stop in zip(indices, indices[1:] + [6])
+        ]
+        expected = np.stack(
+            [
+                _numpy_reduce(ufunc, np.moveaxis(x, axis, 0)[start:stop], axis=0)
+                for start, stop in zip(indices, stops)
+            ],
+            axis=axis,
+        )
+
+    out = ufunc.reduceat(x, indices, axis=axis)
+    assert_allclose(out.data, expected)
+    assert gradcheck(
+        ufunc.reduceat, x, indices, kwargs=dict(axis=axis), elementwise=True
+    )
+
+
+def test_add_reduceat_computes_segment_sums():
+    x = mg.arange(8.0)
+    out = mg.add.reduceat(x, [0, 4, 1, 5])
+    assert_array_equal(out, [6.0, 4.0, 10.0, 18.0])
+
+    out.backward([1.0, 10.0, 100.0, 1000.0])
+    assert_array_equal(x.grad, [1, 101, 101, 101, 110, 1000, 1000, 1000])
+
+
+@pytest.mark.parametrize("ufunc", [mg.add, mg.subtract])
+def test_reduceat_out_of_bounds_raises(ufunc):
+    with pytest.raises(IndexError):
+        ufunc.reduceat(np.arange(3.0), [0, 3])
+
+
+@pytest.mark.parametrize("ufunc", binary_ufuncs + [mg.power])
+@pytest.mark.parametrize(
+    "indices",
+    [
+        [0, 0, 3],
+        np.array([True, False, True, False, False]),
+        slice(1, 4),
+        (np.array([4, 4]),),
+    ],
+)
+def test_at(ufunc, indices):
+    a = np.random.rand(5)
+    b = np.random.rand(*np.asarray(a[indices]).shape)
+
+    expected = a.copy()
+    getattr(np, ufunc.__name__).at(expected, indices, b)
+
+    x = mg.tensor(a)
+    y = mg.tensor(b)
+    assert ufunc.at(x, indices, y) is None
+    assert_allclose(x.data, expected)
+
+    def f(x, y):
+        x = +x
+        ufunc.at(x, indices, y)
+        return x
+
+    assert gradcheck(f, a, b, elementwise=True)
+
+
+def test_add_at_is_differentiable_through_views():
+    x = mg.arange(6.0)
+    y = 2 * x
+    view = y[:3]
+    mg.add.at(view, [0, 0, 2], mg.tensor([1.0, 1.0, 5.0]))
+    assert_array_equal(y, [2.0, 2.0, 9.0, 6.0, 8.0, 10.0])
+    assert_array_equal(view, [2.0, 2.0, 9.0])
+
+    (y * mg.arange(6.0)).sum().backward()
+    assert_array_equal(x.grad, 2 * np.arange(6.0))
+
+
+def test_at_dispatches_from_numpy():
+    a = np.zeros(3)
+    np.add.at(a, [1, 1], mg.tensor(1.0))
+    assert_array_equal(a, [0.0, 2.0, 0.0])
+
+    x = mg.zeros(3)
+    np.subtract.at(x, [1, 1], 1.0)
+    assert_array_equal(x, [0.0, -2.0, 0.0])
+
+
+@pytest.mark.parametrize("ufunc", [mg.sin, mg.exp, mg.square])
+@pytest.mark.parametrize("indices", [[0, 0, 3], slice(1, 4), [2, 2, 2]])
+def test_unary_at(ufunc, indices):
+    a = np.random.rand(5)
+
+    expected = a.copy()
+    getattr(np, ufunc.__name__).at(expected, indices)
+
+    x = mg.tensor(a)
+    assert ufunc.at(x, indices) is None
+    assert_allclose(x.data, expected)
+
+    def f(x):
+        x = +x
+        ufunc.at(x, indices)
+        return x
+
+    assert gradcheck(f, a, elementwise=True)
+
+
+def test_at_back_propagates_through_repeated_indices_sequentially():
+    x = mg.tensor([1.0, 2.0, 3.0])
+    y = mg.tensor([2.0, 3.0, 4.0, 5.0])
+    z = +x
+    mg.multiply.at(z, [0, 2, 0, 0], y)
+    assert_array_equal(z, [40.0, 2.0, 9.0])
+
+    z.backward([1.0, 10.0, 100.0])
+    assert_array_equal(x.grad, [40.0, 10.0, 300.0])
+    assert_array_equal(y.grad, [20.0, 300.0, 10.0, 8.0])
+
+
+def test_at_broadcasts_operand():
+    x = mg.arange(1.0, 7.0).reshape(2, 3)
+    y = mg.tensor([[2.0, 3.0, 4.0]])
+    z = +x
+    mg.multiply.at(z, ([1, 1],), y)
+    assert_array_equal(z, [[1.0, 2.0, 3.0], [16.0, 45.0, 96.0]])
+
+    z.sum().backward()
+    assert_array_equal(x.grad, [[1.0, 1.0, 1.0], [4.0, 9.0, 16.0]])
+    assert_array_equal(y.grad, [[16.0, 30.0, 48.0]])
+
+
+def test_at_with_no_indices():
+    x = mg.tensor([1.0, 2.0])
+    z = +x
+    mg.multiply.at(z, [], 3.0)
+    z.backward()
+    assert_array_equal(z, [1.0, 2.0])
+    assert_array_equal(x.grad, [1.0, 1.0])
+
+
+def test_numpy_methods_dispatch_to_mygrad():
+    x = mg.tensor([[1.0, 2.0], [3.0, 4.0]])
+    out = np.maximum.reduce(x, axis=1)
+    assert isinstance(out, mg.Tensor)
+    out.backward()
+    assert_array_equal(x.grad, [[0.0, 1.0], [0.0, 1.0]])
+
+    assert isinstance(np.add.accumulate(x), mg.Tensor)
+    assert isinstance(np.multiply.outer(x, x), mg.Tensor)
+
+
+@pytest.mark.parametrize("method", ["reduce", "accumulate", "reduceat", "outer"])
+def test_out(method):
+    x = mg.tensor([1.0, 2.0, 3.0])
+    args = {"reduce": (), "accumulate": (), "reduceat": ([0, 1],), "outer": (x,)}[
+        method
+    ]
+    expected = getattr(mg.add, method)(x, *args)
+
+    out = mg.zeros(expected.shape, dtype=float)
+    assert getattr(mg.subtract, method)(x, *args, out=out) is out
+    assert_allclose(out, getattr(np.subtract, method)(x.data, *args))
+    out.backward()
+    assert x.grad is not None
+
+
+@pytest.mark.parametrize("method", ["reduce", "accumulate", "reduceat", "outer"])
+@pytest.mark.parametrize("ufunc", [mg.exp, mg.negative, mg.matmul])
+def test_unsupported_methods_raise(ufunc, method):
+    with pytest.raises(ValueError):
+        getattr(ufunc, method)(np.ones((2, 2)), np.ones((2, 2)))